@@ -3502,6 +3502,7 @@ from akshare.stock_fundamental.stock_profit_forecast_hk_etnet import stock_hk_pr
 from akshare.stock_feature.stock_disclosure_cninfo import (
     stock_zh_a_disclosure_relation_cninfo,
     stock_zh_a_disclosure_report_cninfo,
+    stock_zh_a_disclosure_report_cninfo_stream,
 )
 
 """
@@ -4110,6 +4111,14 @@ from akshare.stock_feature.stock_technology_ths import (
     stock_rank_xzjp_ths,
 )
 
+"""
+技术选股-本地计算
+"""
+from akshare.stock_feature.stock_technology_local import (
+    stock_rank_local,
+    stock_rank_all_local,
+)
+
 """
 沪深港通持股
 """
@@ -4455,6 +4464,7 @@ from akshare.stock_feature.stock_ztb_em import (
     stock_zt_pool_zbgc_em,
     stock_zt_pool_strong_em,
     stock_zt_pool_sub_new_em,
+    stock_zt_pool_hist_em,
 )
 
 """
@@ -4659,6 +4669,8 @@ from akshare.fund.fund_portfolio_em import (
     fund_portfolio_change_em,
     fund_portfolio_bond_hold_em,
     fund_portfolio_industry_allocation_em,
+    fund_portfolio_hold_all_em,
+    fund_portfolio_stock_holders,
 )
 
 """
@@ -5285,6 +5297,8 @@ from akshare.index.index_cons import (
     index_stock_cons_sina,
     index_stock_cons_csindex,
     index_stock_cons_weight_csindex,
+    index_stock_cons_csindex_batch,
+    index_stock_cons_weight_csindex_batch,
     stock_a_code_to_symbol,
 )
 
@@ -5740,6 +5754,8 @@ from akshare.futures.futures_basis import (
     futures_spot_price_daily,
     futures_spot_price,
     futures_spot_price_previous,
+    futures_basis_panel,
+    futures_roll_yield_basis_daily,
 )
 
 """
@@ -5760,7 +5776,7 @@ from akshare.futures.cot import (
 """
 大宗商品期货仓单数据
 """
-from akshare.futures.receipt import get_receipt
+from akshare.futures.receipt import get_receipt, futures_receipt_collect
 
 """
 大宗商品期货展期收益率数据
@@ -5770,6 +5786,15 @@ from akshare.futures.futures_roll_yield import (
     get_roll_yield,
 )
 
+"""
+期货主力合约连续数据
+"""
+from akshare.futures.futures_continuous import (
+    futures_main_contract_daily,
+    futures_continuous_daily,
+    futures_roll_yield_term_structure,
+)
+
 """
 交易所日线行情数据
 """
@@ -5779,6 +5804,7 @@ from akshare.futures.futures_daily_bar import (
     get_shfe_daily,
     get_dce_daily,
     get_futures_daily,
+    get_futures_daily_markets,
     get_ine_daily,
     get_gfex_daily,
 )
@@ -5795,6 +5821,31 @@ from akshare.fund.fund_xq import (
     fund_individual_detail_hold_xq,
 )
 
+"""
+东方财富网-多标的历史行情批量下载
+"""
+from akshare.stock_feature.stock_hist_universe_em import stock_hist_universe_em
+
+"""
+东方财富网-沪深京 A 股-历史行情增量更新
+"""
+from akshare.stock_feature.stock_hist_incremental_em import stock_zh_a_hist_incremental
+
+"""
+金十数据中心-经济指标-本地仓库
+"""
+from akshare.economic.macro_jin10 import macro_refresh_jin10, set_macro_store_jin10
+
+"""
+证券主数据
+"""
+from akshare.utils.security_master import security_master, security_resolve
+
+"""
+性能统计
+"""
+from akshare.utils.instrument import instrument, add_hook, remove_hook
+
 """
 异常处理模块
 """
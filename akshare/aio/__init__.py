@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 20:00
+Desc: 异步接口
+import akshare.aio as ak_aio 后以 await ak_aio.stock_zh_a_spot_em() 的方式调用;
+同一事件循环中的调用共用一个会话, 事件循环结束前调用 await ak_aio.close_session()
+"""
+
+from akshare.aio.client import close_session, set_session_limits
+from akshare.aio.stock import (
+    stock_board_concept_cons_em,
+    stock_board_industry_cons_em,
+    stock_individual_fund_flow,
+    stock_individual_fund_flow_rank,
+    stock_yjbb_em,
+    stock_zh_a_hist,
+    stock_zh_a_spot_em,
+)
+
+__all__ = [
+    "close_session",
+    "set_session_limits",
+    "stock_board_concept_cons_em",
+    "stock_board_industry_cons_em",
+    "stock_individual_fund_flow",
+    "stock_individual_fund_flow_rank",
+    "stock_yjbb_em",
+    "stock_zh_a_hist",
+    "stock_zh_a_spot_em",
+]
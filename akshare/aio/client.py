@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 20:00
+Desc: 异步接口-共享的 HTTP 客户端
+每个事件循环共用一个长期存在的 aiohttp.ClientSession, 连接数通过 TCPConnector 限制
+"""
+
+import asyncio
+import math
+import threading
+import weakref
+from typing import Any, Callable, Dict, List, Optional
+
+import aiohttp
+import pandas as pd
+
+from akshare.utils.instrument import incr, phase
+
+_lock = threading.Lock()
+_sessions = weakref.WeakKeyDictionary()
+_limits = {"limit": 100, "limit_per_host": 10, "timeout": 15}
+_headers = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/81.0.4044.138 Safari/537.36",
+}
+
+
+def set_session_limits(
+    limit: int = 100, limit_per_host: int = 10, timeout: float = 15
+) -> None:
+    """
+    设置连接数限制和超时时间, 对之后新建的会话生效
+    :param limit: 总连接数
+    :type limit: int
+    :param limit_per_host: 每个域名的连接数
+    :type limit_per_host: int
+    :param timeout: 请求超时时间(秒)
+    :type timeout: float
+    :return: None
+    :rtype: None
+    """
+    with _lock:
+        _limits.update(
+            {"limit": limit, "limit_per_host": limit_per_host, "timeout": timeout}
+        )
+
+
+def get_session() -> aiohttp.ClientSession:
+    """
+    当前事件循环共享的会话, 不存在或者已关闭时新建
+    :return: 会话
+    :rtype: aiohttp.ClientSession
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        session = _sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=_limits["limit"], limit_per_host=_limits["limit_per_host"]
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                headers=_headers,
+                timeout=aiohttp.ClientTimeout(total=_limits["timeout"]),
+            )
+            _sessions[loop] = session
+        return session
+
+
+async def close_session() -> None:
+    """
+    关闭当前事件循环的会话, 在事件循环结束前调用
+    :return: None
+    :rtype: None
+    """
+    with _lock:
+        session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+def run_coroutine(func: Callable, *args, **kwargs) -> Any:
+    """
+    在同步代码中执行异步接口
+    没有运行中的事件循环时新建一个, 结束前关闭该循环的会话; 在 Jupyter 等已有事件循环的环境中通过 nest_asyncio 在当前循环中执行,
+    会话保留给该循环继续使用
+    :param func: 异步接口, 例如 akshare.aio.stock_zh_a_spot_em
+    :type func: callable
+    :return: 异步接口的返回值
+    :rtype: Any
+    """
+
+    async def _main():
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            await close_session()
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_main())
+    import nest_asyncio
+
+    nest_asyncio.apply()
+    return asyncio.get_event_loop().run_until_complete(func(*args, **kwargs))
+
+
+async def get_json(
+    url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None
+) -> Dict:
+    """
+    GET 请求并解析 JSON
+    :param url: 网址
+    :type url: str
+    :param params: 请求参数
+    :type params: dict
+    :param headers: 请求头
+    :type headers: dict
+    :return: 解析后的数据
+    :rtype: dict
+    """
+    session = get_session()
+    with phase("network"):
+        async with session.get(url, params=params, headers=headers) as response:
+            response.raise_for_status()
+            body = await response.read()
+    incr("requests")
+    incr("bytes", len(body))
+    with phase("parse"):
+        # 东方财富部分接口返回的 Content-Type 不是 application/json
+        return await response.json(content_type=None)
+
+
+async def fetch_clist_pages(url: str, base_params: Dict) -> List[pd.DataFrame]:
+    """
+    东方财富-并发获取 clist 接口的所有分页数据
+    :param url: 网址
+    :type url: str
+    :param base_params: 基础请求参数
+    :type base_params: dict
+    :return: 每一页的数据, 没有数据时为空列表
+    :rtype: list
+    """
+    data_json = await get_json(url, params=base_params)
+    # 没有数据时 data 为 null 或者 diff 为空
+    if not data_json.get("data") or not data_json["data"].get("diff"):
+        return []
+    per_page_num = len(data_json["data"]["diff"])
+    total_page = math.ceil(data_json["data"]["total"] / per_page_num)
+    page_json_list = await asyncio.gather(
+        *[
+            get_json(url, params={**base_params, "pn": page})
+            for page in range(2, total_page + 1)
+        ]
+    )
+    incr("pages", total_page)
+    return [pd.DataFrame(item["data"]["diff"]) for item in [data_json, *page_json_list]]
+
+
+async def fetch_datacenter_pages(url: str, base_params: Dict) -> List[pd.DataFrame]:
+    """
+    东方财富-并发获取数据中心(datacenter-web)接口的所有分页数据
+    :param url: 网址
+    :type url: str
+    :param base_params: 基础请求参数
+    :type base_params: dict
+    :return: 每一页的数据, 没有数据时为空列表
+    :rtype: list
+    """
+    data_json = await get_json(url, params={**base_params, "pageNumber": 1})
+    if not data_json.get("result"):
+        return []
+    page_json_list = await asyncio.gather(
+        *[
+            get_json(url, params={**base_params, "pageNumber": page})
+            for page in range(2, data_json["result"]["pages"] + 1)
+        ]
+    )
+    incr("pages", data_json["result"]["pages"])
+    return [
+        pd.DataFrame(item["result"]["data"]) for item in [data_json, *page_json_list]
+    ]
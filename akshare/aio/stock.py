@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 20:00
+Desc: 异步接口-股票
+与同步接口使用相同的请求参数和数据整理函数, 分页并发获取
+"""
+
+import asyncio
+
+import pandas as pd
+
+from akshare.aio.client import (
+    close_session,
+    fetch_clist_pages,
+    fetch_datacenter_pages,
+    get_json,
+)
+from akshare.stock.stock_board_concept_em import (
+    _stock_board_concept_cons_em_clean,
+    _stock_board_concept_cons_em_request,
+)
+from akshare.stock.stock_board_industry_em import (
+    _stock_board_industry_cons_em_clean,
+    _stock_board_industry_cons_em_request,
+)
+from akshare.stock.stock_fund_em import (
+    _stock_individual_fund_flow_clean,
+    _stock_individual_fund_flow_rank_clean,
+    _stock_individual_fund_flow_rank_request,
+    _stock_individual_fund_flow_request,
+)
+from akshare.stock_feature.stock_hist_em import (
+    _stock_zh_a_hist_clean,
+    _stock_zh_a_hist_request,
+    _stock_zh_a_spot_em_clean,
+    _stock_zh_a_spot_em_request,
+)
+from akshare.stock_feature.stock_yjbb_em import (
+    _stock_yjbb_em_clean,
+    _stock_yjbb_em_request,
+)
+from akshare.utils.func import paginated_data_to_df
+from akshare.utils.single_flight import single_flight
+
+
+async def _run_sync(func, *args):
+    """
+    在线程池中执行同步函数, 板块名称和证券代码的解析可能需要请求网络
+    :param func: 同步函数
+    :type func: callable
+    :return: 函数的返回值
+    :rtype: Any
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, func, *args)
+
+
+@single_flight
+async def stock_zh_a_spot_em() -> pd.DataFrame:
+    """
+    东方财富网-沪深京 A 股-实时行情
+    https://quote.eastmoney.com/center/gridlist.html#hs_a_board
+    :return: 实时行情
+    :rtype: pandas.DataFrame
+    """
+    url, params = _stock_zh_a_spot_em_request()
+    temp_list = await fetch_clist_pages(url, params)
+    if not temp_list:
+        return pd.DataFrame()
+    return _stock_zh_a_spot_em_clean(paginated_data_to_df(temp_list))
+
+
+async def stock_zh_a_hist(
+    symbol: str = "000001",
+    period: str = "daily",
+    start_date: str = "19700101",
+    end_date: str = "20500101",
+    adjust: str = "",
+) -> pd.DataFrame:
+    """
+    东方财富网-行情首页-沪深京 A 股-每日行情
+    https://quote.eastmoney.com/concept/sh603777.html?from=classic
+    :param symbol: 股票代码
+    :type symbol: str
+    :param period: choice of {'daily', 'weekly', 'monthly'}
+    :type period: str
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :return: 每日行情
+    :rtype: pandas.DataFrame
+    """
+    url, params = await _run_sync(
+        _stock_zh_a_hist_request, symbol, period, start_date, end_date, adjust
+    )
+    data_json = await get_json(url, params=params)
+    return _stock_zh_a_hist_clean(data_json, symbol)
+
+
+async def stock_individual_fund_flow(
+    stock: str = "600094", market: str = "sh"
+) -> pd.DataFrame:
+    """
+    东方财富网-数据中心-资金流向-个股
+    https://data.eastmoney.com/zjlx/detail.html
+    :param stock: 股票代码
+    :type stock: str
+    :param market: 股票市场; 上海证券交易所: sh, 深证证券交易所: sz, 北京证券交易所: bj;
+    :type market: str
+    :return: 近期个股的资金流数据
+    :rtype: pandas.DataFrame
+    """
+    url, params = _stock_individual_fund_flow_request(stock, market)
+    data_json = await get_json(url, params=params)
+    return _stock_individual_fund_flow_clean(data_json)
+
+
+@single_flight
+async def stock_individual_fund_flow_rank(indicator: str = "5日") -> pd.DataFrame:
+    """
+    东方财富网-数据中心-资金流向-排名
+    https://data.eastmoney.com/zjlx/detail.html
+    :param indicator: choice of {"今日", "3日", "5日", "10日"}
+    :type indicator: str
+    :return: 指定 indicator 资金流向排行
+    :rtype: pandas.DataFrame
+    """
+    url, params = _stock_individual_fund_flow_rank_request(indicator)
+    temp_list = await fetch_clist_pages(url, params)
+    if not temp_list:
+        return pd.DataFrame()
+    temp_df = pd.concat(temp_list, ignore_index=True)
+    return _stock_individual_fund_flow_rank_clean(temp_df, indicator)
+
+
+@single_flight
+async def stock_board_concept_cons_em(symbol: str = "融资融券") -> pd.DataFrame:
+    """
+    东方财富-沪深板块-概念板块-板块成份
+    https://quote.eastmoney.com/center/boardlist.html#boards-BK06551
+    :param symbol: 板块名称或者板块代码
+    :type symbol: str
+    :return: 板块成份
+    :rtype: pandas.DataFrame
+    """
+    url, params = await _run_sync(_stock_board_concept_cons_em_request, symbol)
+    temp_list = await fetch_clist_pages(url, params)
+    if not temp_list:
+        return pd.DataFrame()
+    return _stock_board_concept_cons_em_clean(paginated_data_to_df(temp_list))
+
+
+@single_flight
+async def stock_board_industry_cons_em(symbol: str = "小金属") -> pd.DataFrame:
+    """
+    东方财富网-沪深板块-行业板块-板块成份
+    https://data.eastmoney.com/bkzj/BK1027.html
+    :param symbol: 板块名称或者板块代码
+    :type symbol: str
+    :return: 板块成份
+    :rtype: pandas.DataFrame
+    """
+    url, params = await _run_sync(_stock_board_industry_cons_em_request, symbol)
+    temp_list = await fetch_clist_pages(url, params)
+    if not temp_list:
+        return pd.DataFrame()
+    return _stock_board_industry_cons_em_clean(paginated_data_to_df(temp_list))
+
+
+@single_flight
+async def stock_yjbb_em(date: str = "20200331") -> pd.DataFrame:
+    """
+    东方财富-数据中心-年报季报-业绩快报-业绩报表
+    https://data.eastmoney.com/bbsj/202003/yjbb.html
+    :param date: "20200331", "20200630", "20200930", "20201231"; 从 20100331 开始
+    :type date: str
+    :return: 业绩报表
+    :rtype: pandas.DataFrame
+    """
+    url, params = _stock_yjbb_em_request(date)
+    temp_list = await fetch_datacenter_pages(url, params)
+    if not temp_list:
+        return pd.DataFrame()
+    big_df = pd.concat(temp_list, ignore_index=True)
+    return _stock_yjbb_em_clean(big_df)
+
+
+if __name__ == "__main__":
+
+    async def main():
+        stock_zh_a_spot_em_df = await stock_zh_a_spot_em()
+        print(stock_zh_a_spot_em_df)
+
+        stock_zh_a_hist_df = await stock_zh_a_hist(symbol="000001", adjust="qfq")
+        print(stock_zh_a_hist_df)
+
+        await close_session()
+
+    asyncio.run(main())
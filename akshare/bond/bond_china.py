@@ -15,6 +15,7 @@ import requests
 
 from akshare.bond.bond_china_money import bond_china_close_return_map
 from akshare.utils.cons import headers
+from akshare.utils.date_window import date_window
 
 
 def bond_spot_quote() -> pd.DataFrame:
@@ -139,6 +140,12 @@ def bond_spot_deal() -> pd.DataFrame:
     return temp_df
 
 
+@date_window(
+    max_days=365,
+    key_columns=["曲线名称", "日期"],
+    sort_columns=["日期"],
+    host="yield.chinabond.com.cn",
+)
 def bond_china_yield(
     start_date: str = "20200204", end_date: str = "20210124"
 ) -> pd.DataFrame:
@@ -146,7 +153,7 @@ def bond_china_yield(
     中国债券信息网-国债及其他债券收益率曲线
     https://www.chinabond.com.cn/
     https://yield.chinabond.com.cn/cbweb-pbc-web/pbc/historyQuery?startDate=2019-02-07&endDate=2020-02-04&gjqx=0&qxId=ycqx&locale=cn_ZH
-    注意: end_date - start_date 应该小于一年
+    注意: 单次请求的 end_date - start_date 应该小于一年, 超过一年时自动拆分为多个请求
     :param start_date: 需要查询的日期, 返回在该日期之后一年内的数据
     :type start_date: str
     :param end_date: 需要查询的日期, 返回在该日期之前一年内的数据
@@ -10,6 +10,8 @@ from functools import lru_cache
 
 import pandas as pd
 import requests
+from akshare.utils.date_window import date_window
+from akshare.utils.session_cache import session_cache
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -89,6 +91,33 @@ def __bond_register_service() -> requests.Session:
     return session
 
 
+# 注册后 24 小时内有效, 提前一小时重新注册
+session_cache.register(
+    site="chinamoney", factory=__bond_register_service, ttl=23 * 60 * 60
+)
+
+
+def _chinamoney_request_json(method: str, url: str, **kwargs) -> dict:
+    """
+    中国外汇交易中心-请求 JSON 数据; 直接请求失败时使用已注册的 Session,
+    仍然失败时重新注册并重试一次
+    :param method: choice of {"get", "post"}
+    :type method: str
+    :param url: 网址
+    :type url: str
+    :return: JSON 数据
+    :rtype: dict
+    """
+    try:
+        r = requests.request(method, url, **kwargs)
+        return r.json()
+    except:  # noqa: E722
+        return session_cache.call(
+            site="chinamoney",
+            func=lambda session: session.request(method, url, **kwargs).json(),
+        )
+
+
 @lru_cache()
 def bond_china_close_return_map() -> pd.DataFrame:
     """
@@ -113,17 +142,17 @@ def bond_china_close_return_map() -> pd.DataFrame:
         "X-Requested-With": "XMLHttpRequest",
     }
     url = "https://www.chinamoney.com.cn/ags/ms/cm-u-bk-currency/ClsYldCurvCurvGO"
-    try:
-        r = requests.get(url, headers=headers)
-        data_json = r.json()
-    except:  # noqa: E722
-        session = __bond_register_service()
-        r = session.get(url, headers=headers)
-        data_json = r.json()
+    data_json = _chinamoney_request_json("get", url, headers=headers)
     temp_df = pd.DataFrame(data_json["records"])
     return temp_df
 
 
+@date_window(
+    max_days=30,
+    key_columns=["日期", "期限"],
+    sort_columns=["日期"],
+    host="www.chinamoney.com.cn",
+)
 def bond_china_close_return(
     symbol: str = "国债",
     period: str = "1",
@@ -137,9 +166,9 @@ def bond_china_close_return(
     :type period: choice of {'0.1', '0.5', '1'}
     :param period: 期限间隔
     :type symbol: str
-    :param start_date: 开始日期, 结束日期和开始日期不要超过 1 个月
+    :param start_date: 开始日期, 结束日期和开始日期超过 1 个月时自动拆分为多个请求
     :type start_date: str
-    :param end_date: 结束日期, 结束日期和开始日期不要超过 1 个月
+    :param end_date: 结束日期, 结束日期和开始日期超过 1 个月时自动拆分为多个请求
     :type end_date: str
     :return: 收盘收益率曲线历史数据
     :rtype: pandas.DataFrame
@@ -161,8 +190,7 @@ def bond_china_close_return(
         "pageNum": "1",
         "pageSize": "50",
     }
-    r = requests.get(url, params=params, headers=headers)
-    data_json = r.json()
+    data_json = _chinamoney_request_json("get", url, params=params, headers=headers)
     temp_df = pd.DataFrame(data_json["records"])
     del temp_df["newDateValue"]
     temp_df.columns = [
@@ -189,15 +217,21 @@ def bond_china_close_return(
     return temp_df
 
 
+@date_window(
+    max_days=30,
+    key_columns=["日期", "曲线名称", "时刻", "价格类型"],
+    sort_columns=["日期"],
+    host="www.chinamoney.com.cn",
+)
 def macro_china_swap_rate(
     start_date: str = "20231101", end_date: str = "20231204"
 ) -> pd.DataFrame:
     """
     FR007 利率互换曲线历史数据; 只能获取近一年的数据
     https://www.chinamoney.com.cn/chinese/bkcurvfxhis/?cfgItemType=72&curveType=FR007
-    :param start_date: 开始日期, 开始和结束日期不得超过一个月
+    :param start_date: 开始日期, 开始和结束日期超过一个月时自动拆分为多个请求
     :type start_date: str
-    :param end_date: 结束日期, 开始和结束日期不得超过一个月
+    :param end_date: 结束日期, 开始和结束日期超过一个月时自动拆分为多个请求
     :type end_date: str
     :return: FR007利率互换曲线历史数据
     :rtype: pandas.DataFrame
@@ -20,8 +20,9 @@ from akshare.bond.cons import (
     zh_sina_bond_hs_cov_hist_url,
 )
 from akshare.stock.cons import hk_js_decode
-from akshare.utils import demjson
+from akshare.utils import lenient_json
 from akshare.utils.func import fetch_paginated_data
+from akshare.utils.security_master import get_code_id_dict_em
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -57,7 +58,7 @@ def bond_zh_hs_cov_spot() -> pd.DataFrame:
     for page in tqdm(range(1, page_count + 1), leave=False):
         zh_sina_bond_hs_payload_copy.update({"page": page})
         res = requests.get(zh_sina_bond_hs_cov_url, params=zh_sina_bond_hs_payload_copy)
-        data_json = demjson.decode(res.text)
+        data_json = lenient_json.decode(res.text)
         big_df = pd.concat(objs=[big_df, pd.DataFrame(data_json)], ignore_index=True)
     return big_df
 
@@ -93,39 +94,7 @@ def _code_id_map() -> dict:
     :return: 股票和市场代码
     :rtype: dict
     """
-    url = "https://80.push2.eastmoney.com/api/qt/clist/get"
-    params = {
-        "pn": "1",
-        "pz": "100",
-        "po": "1",
-        "np": "1",
-        "ut": "bd1d9ddb04089700cf9c27f6f7426281",
-        "fltt": "2",
-        "invt": "2",
-        "fid": "f12",
-        "fs": "m:1 t:2,m:1 t:23",
-        "fields": "f3,f12",
-    }
-    temp_df = fetch_paginated_data(url, params)
-    temp_df["market_id"] = 1
-    temp_df.rename(columns={"f12": "sh_code", "market_id": "sh_id"}, inplace=True)
-    code_id_dict = dict(zip(temp_df["sh_code"], temp_df["sh_id"]))
-    params = {
-        "pn": "1",
-        "pz": "100",
-        "po": "1",
-        "np": "1",
-        "ut": "bd1d9ddb04089700cf9c27f6f7426281",
-        "fltt": "2",
-        "invt": "2",
-        "fid": "f3",
-        "fs": "m:0 t:6,m:0 t:80",
-        "fields": "f3,f12",
-    }
-    temp_df_sz = fetch_paginated_data(url, params)
-    temp_df_sz["sz_id"] = 0
-    code_id_dict.update(dict(zip(temp_df_sz["f12"], temp_df_sz["sz_id"])))
-    return code_id_dict
+    return get_code_id_dict_em("stock")
 
 
 def bond_zh_hs_cov_min(
@@ -18,12 +18,11 @@ https://datacenter.jin10.com/economic
 巴西央行决议报告
 """
 
-import datetime
-import time
-
 import pandas as pd
 import requests
 
+from akshare.economic.macro_jin10 import macro_jin10_base_values
+
 
 def __get_interest_rate_data(attr_id: str, name: str = "利率") -> pd.DataFrame:
     """
@@ -36,50 +35,13 @@ def __get_interest_rate_data(attr_id: str, name: str = "利率") -> pd.DataFrame
     :return: 利率决议报告数据
     :rtype: pandas.Series
     """
-    t = time.time()
-    headers = {
-        "Accept": "*/*",
-        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0.0.0 Safari/537.36",
-        "Origin": "https://datacenter.jin10.com",
-        "Referer": "https://datacenter.jin10.com/",
-        "x-app-id": "rU6QIu7JHe2gOUeR",
-        "x-version": "1.0.0",
-    }
-    base_url = "https://datacenter-api.jin10.com/reports/list_v2"
-    params = {
-        "max_date": "",
-        "category": "ec",
-        "attr_id": attr_id,
-        "_": str(int(round(t * 1000))),
-    }
-    interest_rate_data = []
+    params = {"category": "ec", "attr_id": attr_id}
     try:
-        while True:
-            response = requests.get(
-                url=base_url, params=params, headers=headers, timeout=10
-            )
-            data = response.json()
-            if not data.get("data", {}).get("values"):
-                break
-            interest_rate_data.extend(data["data"]["values"])
-
-            # Update max_date for pagination
-            last_date = data["data"]["values"][-1][0]
-            next_date = (
-                datetime.datetime.strptime(last_date, "%Y-%m-%d").date()
-                - datetime.timedelta(days=1)
-            ).isoformat()
-            params["max_date"] = next_date
-
+        big_df = macro_jin10_base_values(params)
     except requests.exceptions.RequestException as e:
         print(f"Error fetching data: {e}")
         return pd.DataFrame()
 
-    # Convert to DataFrame
-    big_df = pd.DataFrame(interest_rate_data)
-
     if big_df.empty:
         return pd.DataFrame()
 
@@ -6,13 +6,14 @@ Desc: 金十数据-数据中心-主要机构-宏观经济
 https://datacenter.jin10.com/
 """
 
-import datetime
 import time
 
 import pandas as pd
 import requests
 from tqdm import tqdm
 
+from akshare.economic.macro_jin10 import macro_jin10_base_values
+
 
 def macro_cons_gold() -> pd.DataFrame:
     """
@@ -21,39 +22,7 @@ def macro_cons_gold() -> pd.DataFrame:
     :return: 持仓报告
     :rtype: pandas.DataFrame
     """
-    t = time.time()
-    headers = {
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/107.0.0.0 Safari/537.36",
-        "x-app-id": "rU6QIu7JHe2gOUeR",
-        "x-csrf-token": "x-csrf-token",
-        "x-version": "1.0.0",
-    }
-    url = "https://datacenter-api.jin10.com/reports/list_v2"
-    params = {
-        "category": "etf",
-        "attr_id": "1",
-        "max_date": "",
-        "_": str(int(round(t * 1000))),
-    }
-    big_df = pd.DataFrame()
-    while True:
-        r = requests.get(url, params=params, headers=headers)
-        data_json = r.json()
-        if not data_json["data"]["values"]:
-            break
-        temp_df = pd.DataFrame(data_json["data"]["values"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-        last_date_str = temp_df.iat[-1, 0]
-        last_date_str = (
-            (
-                datetime.datetime.strptime(last_date_str, "%Y-%m-%d")
-                - datetime.timedelta(days=1)
-            )
-            .date()
-            .isoformat()
-        )
-        params.update({"max_date": f"{last_date_str}"})
+    big_df = macro_jin10_base_values({"category": "etf", "attr_id": "1"})
     big_df.columns = [
         "日期",
         "总库存",
@@ -86,39 +55,7 @@ def macro_cons_silver() -> pd.DataFrame:
     :return: 持仓报告
     :rtype: pandas.DataFrame
     """
-    t = time.time()
-    headers = {
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/107.0.0.0 Safari/537.36",
-        "x-app-id": "rU6QIu7JHe2gOUeR",
-        "x-csrf-token": "x-csrf-token",
-        "x-version": "1.0.0",
-    }
-    url = "https://datacenter-api.jin10.com/reports/list_v2"
-    params = {
-        "category": "etf",
-        "attr_id": "2",
-        "max_date": "",
-        "_": str(int(round(t * 1000))),
-    }
-    big_df = pd.DataFrame()
-    while True:
-        r = requests.get(url, params=params, headers=headers)
-        data_json = r.json()
-        if not data_json["data"]["values"]:
-            break
-        temp_df = pd.DataFrame(data_json["data"]["values"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-        last_date_str = temp_df.iat[-1, 0]
-        last_date_str = (
-            (
-                datetime.datetime.strptime(last_date_str, "%Y-%m-%d")
-                - datetime.timedelta(days=1)
-            )
-            .date()
-            .isoformat()
-        )
-        params.update({"max_date": f"{last_date_str}"})
+    big_df = macro_jin10_base_values({"category": "etf", "attr_id": "2"})
     big_df.columns = [
         "日期",
         "总库存",
@@ -15,7 +15,8 @@ import time
 
 import pandas as pd
 import requests
-from tqdm import tqdm
+
+from akshare.economic.macro_jin10 import macro_jin10_base_values
 
 
 # 金十数据中心-经济指标-欧元区-国民经济运行状况
@@ -29,42 +30,8 @@ def macro_euro_gdp_yoy() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     ec = 84
-    url = "https://datacenter-api.jin10.com/reports/dates"
-    params = {"category": "ec", "attr_id": ec}
-    headers = {
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/107.0.0.0 Safari/537.36",
-        "x-app-id": "rU6QIu7JHe2gOUeR",
-        "x-csrf-token": "x-csrf-token",
-        "x-version": "1.0.0",
-    }
-
-    r = requests.get(url, headers=headers, params=params)
-    data_json = r.json()
-    date_list = data_json["data"]
-    date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
-    for date in tqdm(date_point_list, leave=False):
-        url = "https://datacenter-api.jin10.com/reports/list_v2"
-        params = {
-            "max_date": f"{date}",
-            "category": "ec",
-            "attr_id": ec,
-        }
-        headers = {
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/107.0.0.0 Safari/537.36",
-            "x-app-id": "rU6QIu7JHe2gOUeR",
-            "x-csrf-token": "x-csrf-token",
-            "x-version": "1.0.0",
-        }
-        r = requests.get(url, headers=headers, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(
-            data_json["data"]["values"],
-            columns=[item["name"] for item in data_json["data"]["keys"]],
-        )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+    big_df = macro_jin10_base_values({"category": "ec", "attr_id": ec})
+    big_df.columns = ["日期", "今值", "预测值", "前值"]
 
     big_df["商品"] = "欧元区季度GDP年率"
 
@@ -87,42 +54,8 @@ def macro_euro_cpi_mom() -> pd.DataFrame:
     :rtype: pandas.Series
     """
     ec = 84
-    url = "https://datacenter-api.jin10.com/reports/dates"
-    params = {"category": "ec", "attr_id": ec}
-    headers = {
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/107.0.0.0 Safari/537.36",
-        "x-app-id": "rU6QIu7JHe2gOUeR",
-        "x-csrf-token": "x-csrf-token",
-        "x-version": "1.0.0",
-    }
-
-    r = requests.get(url, headers=headers, params=params)
-    data_json = r.json()
-    date_list = data_json["data"]
-    date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
-    for date in tqdm(date_point_list, leave=False):
-        url = "https://datacenter-api.jin10.com/reports/list_v2"
-        params = {
-            "max_date": f"{date}",
-            "category": "ec",
-            "attr_id": ec,
-        }
-        headers = {
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/107.0.0.0 Safari/537.36",
-            "x-app-id": "rU6QIu7JHe2gOUeR",
-            "x-csrf-token": "x-csrf-token",
-            "x-version": "1.0.0",
-        }
-        r = requests.get(url, headers=headers, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(
-            data_json["data"]["values"],
-            columns=[item["name"] for item in data_json["data"]["keys"]],
-        )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+    big_df = macro_jin10_base_values({"category": "ec", "attr_id": ec})
+    big_df.columns = ["日期", "今值", "预测值", "前值"]
     big_df["商品"] = "欧元区CPI月率"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -143,45 +76,8 @@ def macro_euro_cpi_yoy() -> pd.DataFrame:
     :rtype: pandas.Series
     """
     ec = 8
-    url = "https://datacenter-api.jin10.com/reports/dates"
-    params = {
-        "category": "ec",
-        "attr_id": ec,
-    }
-    headers = {
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/107.0.0.0 Safari/537.36",
-        "x-app-id": "rU6QIu7JHe2gOUeR",
-        "x-csrf-token": "x-csrf-token",
-        "x-version": "1.0.0",
-    }
-
-    r = requests.get(url, headers=headers, params=params)
-    data_json = r.json()
-    date_list = data_json["data"]
-    date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
-    for date in tqdm(date_point_list, leave=False):
-        url = "https://datacenter-api.jin10.com/reports/list_v2"
-        params = {
-            "max_date": f"{date}",
-            "category": "ec",
-            "attr_id": ec,
-        }
-        headers = {
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/107.0.0.0 Safari/537.36",
-            "x-app-id": "rU6QIu7JHe2gOUeR",
-            "x-csrf-token": "x-csrf-token",
-            "x-version": "1.0.0",
-        }
-        r = requests.get(url, headers=headers, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(
-            data_json["data"]["values"],
-            columns=[item["name"] for item in data_json["data"]["keys"]],
-        )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+    big_df = macro_jin10_base_values({"category": "ec", "attr_id": ec})
+    big_df.columns = ["日期", "今值", "预测值", "前值"]
     big_df["商品"] = "欧元区CPI年率"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -202,44 +98,8 @@ def macro_euro_ppi_mom() -> pd.DataFrame:
     :rtype: pandas.Series
     """
     ec = 36
-    url = "https://datacenter-api.jin10.com/reports/dates"
-    params = {
-        "category": "ec",
-        "attr_id": ec,
-    }
-    headers = {
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/107.0.0.0 Safari/537.36",
-        "x-app-id": "rU6QIu7JHe2gOUeR",
-        "x-csrf-token": "x-csrf-token",
-        "x-version": "1.0.0",
-    }
-    r = requests.get(url, headers=headers, params=params)
-    data_json = r.json()
-    date_list = data_json["data"]
-    date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
-    for date in tqdm(date_point_list, leave=False):
-        url = "https://datacenter-api.jin10.com/reports/list_v2"
-        params = {
-            "max_date": f"{date}",
-            "category": "ec",
-            "attr_id": ec,
-        }
-        headers = {
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/107.0.0.0 Safari/537.36",
-            "x-app-id": "rU6QIu7JHe2gOUeR",
-            "x-csrf-token": "x-csrf-token",
-            "x-version": "1.0.0",
-        }
-        r = requests.get(url, headers=headers, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(
-            data_json["data"]["values"],
-            columns=[item["name"] for item in data_json["data"]["keys"]],
-        )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+    big_df = macro_jin10_base_values({"category": "ec", "attr_id": ec})
+    big_df.columns = ["日期", "今值", "预测值", "前值"]
     big_df["商品"] = "欧元区PPI月率"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -260,45 +120,8 @@ def macro_euro_retail_sales_mom() -> pd.DataFrame:
     :rtype: pandas.Series
     """
     ec = 38
-    url = "https://datacenter-api.jin10.com/reports/dates"
-    params = {
-        "category": "ec",
-        "attr_id": ec,
-    }
-    headers = {
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/107.0.0.0 Safari/537.36",
-        "x-app-id": "rU6QIu7JHe2gOUeR",
-        "x-csrf-token": "x-csrf-token",
-        "x-version": "1.0.0",
-    }
-
-    r = requests.get(url, headers=headers, params=params)
-    data_json = r.json()
-    date_list = data_json["data"]
-    date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
-    for date in tqdm(date_point_list, leave=False):
-        url = "https://datacenter-api.jin10.com/reports/list_v2"
-        params = {
-            "max_date": f"{date}",
-            "category": "ec",
-            "attr_id": ec,
-        }
-        headers = {
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/107.0.0.0 Safari/537.36",
-            "x-app-id": "rU6QIu7JHe2gOUeR",
-            "x-csrf-token": "x-csrf-token",
-            "x-version": "1.0.0",
-        }
-        r = requests.get(url, headers=headers, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(
-            data_json["data"]["values"],
-            columns=[item["name"] for item in data_json["data"]["keys"]],
-        )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+    big_df = macro_jin10_base_values({"category": "ec", "attr_id": ec})
+    big_df.columns = ["日期", "今值", "预测值", "前值"]
     big_df["商品"] = "欧元区零售销售月率"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -319,42 +142,8 @@ def macro_euro_employment_change_qoq() -> pd.DataFrame:
     :rtype: pandas.Series
     """
     ec = 14
-    url = "https://datacenter-api.jin10.com/reports/dates"
-    params = {"category": "ec", "attr_id": ec}
-    headers = {
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/107.0.0.0 Safari/537.36",
-        "x-app-id": "rU6QIu7JHe2gOUeR",
-        "x-csrf-token": "x-csrf-token",
-        "x-version": "1.0.0",
-    }
-
-    r = requests.get(url, headers=headers, params=params)
-    data_json = r.json()
-    date_list = data_json["data"]
-    date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
-    for date in tqdm(date_point_list, leave=False):
-        url = "https://datacenter-api.jin10.com/reports/list_v2"
-        params = {
-            "max_date": f"{date}",
-            "category": "ec",
-            "attr_id": ec,
-        }
-        headers = {
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/107.0.0.0 Safari/537.36",
-            "x-app-id": "rU6QIu7JHe2gOUeR",
-            "x-csrf-token": "x-csrf-token",
-            "x-version": "1.0.0",
-        }
-        r = requests.get(url, headers=headers, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(
-            data_json["data"]["values"],
-            columns=[item["name"] for item in data_json["data"]["keys"]],
-        )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+    big_df = macro_jin10_base_values({"category": "ec", "attr_id": ec})
+    big_df.columns = ["日期", "今值", "预测值", "前值"]
     big_df["商品"] = "欧元区季调后就业人数季率"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -375,45 +164,8 @@ def macro_euro_unemployment_rate_mom() -> pd.DataFrame:
     :rtype: pandas.Series
     """
     ec = 46
-    url = "https://datacenter-api.jin10.com/reports/dates"
-    params = {
-        "category": "ec",
-        "attr_id": ec,
-    }
-    headers = {
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/107.0.0.0 Safari/537.36",
-        "x-app-id": "rU6QIu7JHe2gOUeR",
-        "x-csrf-token": "x-csrf-token",
-        "x-version": "1.0.0",
-    }
-
-    r = requests.get(url, headers=headers, params=params)
-    data_json = r.json()
-    date_list = data_json["data"]
-    date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
-    for date in tqdm(date_point_list, leave=False):
-        url = "https://datacenter-api.jin10.com/reports/list_v2"
-        params = {
-            "max_date": f"{date}",
-            "category": "ec",
-            "attr_id": ec,
-        }
-        headers = {
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/107.0.0.0 Safari/537.36",
-            "x-app-id": "rU6QIu7JHe2gOUeR",
-            "x-csrf-token": "x-csrf-token",
-            "x-version": "1.0.0",
-        }
-        r = requests.get(url, headers=headers, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(
-            data_json["data"]["values"],
-            columns=[item["name"] for item in data_json["data"]["keys"]],
-        )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+    big_df = macro_jin10_base_values({"category": "ec", "attr_id": ec})
+    big_df.columns = ["日期", "今值", "预测值", "前值"]
     big_df["商品"] = "欧元区失业率"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -434,45 +186,8 @@ def macro_euro_trade_balance() -> pd.DataFrame:
     :rtype: pandas.Series
     """
     ec = 43
-    url = "https://datacenter-api.jin10.com/reports/dates"
-    params = {
-        "category": "ec",
-        "attr_id": ec,
-    }
-    headers = {
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/107.0.0.0 Safari/537.36",
-        "x-app-id": "rU6QIu7JHe2gOUeR",
-        "x-csrf-token": "x-csrf-token",
-        "x-version": "1.0.0",
-    }
-
-    r = requests.get(url, headers=headers, params=params)
-    data_json = r.json()
-    date_list = data_json["data"]
-    date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
-    for date in tqdm(date_point_list, leave=False):
-        url = "https://datacenter-api.jin10.com/reports/list_v2"
-        params = {
-            "max_date": f"{date}",
-            "category": "ec",
-            "attr_id": ec,
-        }
-        headers = {
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/107.0.0.0 Safari/537.36",
-            "x-app-id": "rU6QIu7JHe2gOUeR",
-            "x-csrf-token": "x-csrf-token",
-            "x-version": "1.0.0",
-        }
-        r = requests.get(url, headers=headers, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(
-            data_json["data"]["values"],
-            columns=[item["name"] for item in data_json["data"]["keys"]],
-        )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+    big_df = macro_jin10_base_values({"category": "ec", "attr_id": ec})
+    big_df.columns = ["日期", "今值", "预测值", "前值"]
     big_df["商品"] = "欧元区未季调贸易帐"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -493,45 +208,8 @@ def macro_euro_current_account_mom() -> pd.DataFrame:
     :rtype: pandas.Series
     """
     ec = 11
-    url = "https://datacenter-api.jin10.com/reports/dates"
-    params = {
-        "category": "ec",
-        "attr_id": ec,
-    }
-    headers = {
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/107.0.0.0 Safari/537.36",
-        "x-app-id": "rU6QIu7JHe2gOUeR",
-        "x-csrf-token": "x-csrf-token",
-        "x-version": "1.0.0",
-    }
-
-    r = requests.get(url, headers=headers, params=params)
-    data_json = r.json()
-    date_list = data_json["data"]
-    date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
-    for date in tqdm(date_point_list, leave=False):
-        url = "https://datacenter-api.jin10.com/reports/list_v2"
-        params = {
-            "max_date": f"{date}",
-            "category": "ec",
-            "attr_id": ec,
-        }
-        headers = {
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/107.0.0.0 Safari/537.36",
-            "x-app-id": "rU6QIu7JHe2gOUeR",
-            "x-csrf-token": "x-csrf-token",
-            "x-version": "1.0.0",
-        }
-        r = requests.get(url, headers=headers, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(
-            data_json["data"]["values"],
-            columns=[item["name"] for item in data_json["data"]["keys"]],
-        )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+    big_df = macro_jin10_base_values({"category": "ec", "attr_id": ec})
+    big_df.columns = ["日期", "今值", "预测值", "前值"]
     big_df["商品"] = "欧元区经常帐"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -552,45 +230,8 @@ def macro_euro_industrial_production_mom() -> pd.DataFrame:
     :rtype: pandas.Series
     """
     ec = 19
-    url = "https://datacenter-api.jin10.com/reports/dates"
-    params = {
-        "category": "ec",
-        "attr_id": ec,
-    }
-    headers = {
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/107.0.0.0 Safari/537.36",
-        "x-app-id": "rU6QIu7JHe2gOUeR",
-        "x-csrf-token": "x-csrf-token",
-        "x-version": "1.0.0",
-    }
-
-    r = requests.get(url, headers=headers, params=params)
-    data_json = r.json()
-    date_list = data_json["data"]
-    date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
-    for date in tqdm(date_point_list, leave=False):
-        url = "https://datacenter-api.jin10.com/reports/list_v2"
-        params = {
-            "max_date": f"{date}",
-            "category": "ec",
-            "attr_id": ec,
-        }
-        headers = {
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/107.0.0.0 Safari/537.36",
-            "x-app-id": "rU6QIu7JHe2gOUeR",
-            "x-csrf-token": "x-csrf-token",
-            "x-version": "1.0.0",
-        }
-        r = requests.get(url, headers=headers, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(
-            data_json["data"]["values"],
-            columns=[item["name"] for item in data_json["data"]["keys"]],
-        )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+    big_df = macro_jin10_base_values({"category": "ec", "attr_id": ec})
+    big_df.columns = ["日期", "今值", "预测值", "前值"]
     big_df["商品"] = "欧元区工业产出月率"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -611,45 +252,8 @@ def macro_euro_manufacturing_pmi() -> pd.DataFrame:
     :rtype: pandas.Series
     """
     ec = 30
-    url = "https://datacenter-api.jin10.com/reports/dates"
-    params = {
-        "category": "ec",
-        "attr_id": ec,
-    }
-    headers = {
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/107.0.0.0 Safari/537.36",
-        "x-app-id": "rU6QIu7JHe2gOUeR",
-        "x-csrf-token": "x-csrf-token",
-        "x-version": "1.0.0",
-    }
-
-    r = requests.get(url, headers=headers, params=params)
-    data_json = r.json()
-    date_list = data_json["data"]
-    date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
-    for date in tqdm(date_point_list, leave=False):
-        url = "https://datacenter-api.jin10.com/reports/list_v2"
-        params = {
-            "max_date": f"{date}",
-            "category": "ec",
-            "attr_id": ec,
-        }
-        headers = {
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/107.0.0.0 Safari/537.36",
-            "x-app-id": "rU6QIu7JHe2gOUeR",
-            "x-csrf-token": "x-csrf-token",
-            "x-version": "1.0.0",
-        }
-        r = requests.get(url, headers=headers, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(
-            data_json["data"]["values"],
-            columns=[item["name"] for item in data_json["data"]["keys"]],
-        )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+    big_df = macro_jin10_base_values({"category": "ec", "attr_id": ec})
+    big_df.columns = ["日期", "今值", "预测值", "前值"]
     big_df["商品"] = "欧元区制造业PMI初值"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -670,45 +274,8 @@ def macro_euro_services_pmi() -> pd.DataFrame:
     :rtype: pandas.Series
     """
     ec = 41
-    url = "https://datacenter-api.jin10.com/reports/dates"
-    params = {
-        "category": "ec",
-        "attr_id": ec,
-    }
-    headers = {
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/107.0.0.0 Safari/537.36",
-        "x-app-id": "rU6QIu7JHe2gOUeR",
-        "x-csrf-token": "x-csrf-token",
-        "x-version": "1.0.0",
-    }
-
-    r = requests.get(url, headers=headers, params=params)
-    data_json = r.json()
-    date_list = data_json["data"]
-    date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
-    for date in tqdm(date_point_list, leave=False):
-        url = "https://datacenter-api.jin10.com/reports/list_v2"
-        params = {
-            "max_date": f"{date}",
-            "category": "ec",
-            "attr_id": ec,
-        }
-        headers = {
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/107.0.0.0 Safari/537.36",
-            "x-app-id": "rU6QIu7JHe2gOUeR",
-            "x-csrf-token": "x-csrf-token",
-            "x-version": "1.0.0",
-        }
-        r = requests.get(url, headers=headers, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(
-            data_json["data"]["values"],
-            columns=[item["name"] for item in data_json["data"]["keys"]],
-        )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+    big_df = macro_jin10_base_values({"category": "ec", "attr_id": ec})
+    big_df.columns = ["日期", "今值", "预测值", "前值"]
     big_df["商品"] = "欧元区服务业PMI终值"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -729,44 +296,8 @@ def macro_euro_zew_economic_sentiment() -> pd.DataFrame:
     :rtype: pandas.Series
     """
     ec = 48
-    url = "https://datacenter-api.jin10.com/reports/dates"
-    params = {
-        "category": "ec",
-        "attr_id": ec,
-    }
-    headers = {
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/107.0.0.0 Safari/537.36",
-        "x-app-id": "rU6QIu7JHe2gOUeR",
-        "x-csrf-token": "x-csrf-token",
-        "x-version": "1.0.0",
-    }
-    r = requests.get(url, headers=headers, params=params)
-    data_json = r.json()
-    date_list = data_json["data"]
-    date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
-    for date in tqdm(date_point_list, leave=False):
-        url = "https://datacenter-api.jin10.com/reports/list_v2"
-        params = {
-            "max_date": f"{date}",
-            "category": "ec",
-            "attr_id": ec,
-        }
-        headers = {
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/107.0.0.0 Safari/537.36",
-            "x-app-id": "rU6QIu7JHe2gOUeR",
-            "x-csrf-token": "x-csrf-token",
-            "x-version": "1.0.0",
-        }
-        r = requests.get(url, headers=headers, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(
-            data_json["data"]["values"],
-            columns=[item["name"] for item in data_json["data"]["keys"]],
-        )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+    big_df = macro_jin10_base_values({"category": "ec", "attr_id": ec})
+    big_df.columns = ["日期", "今值", "预测值", "前值"]
     big_df["商品"] = "欧元区ZEW经济景气指数"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -787,44 +318,8 @@ def macro_euro_sentix_investor_confidence() -> pd.DataFrame:
     :rtype: pandas.Series
     """
     ec = 40
-    url = "https://datacenter-api.jin10.com/reports/dates"
-    params = {
-        "category": "ec",
-        "attr_id": ec,
-    }
-    headers = {
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/107.0.0.0 Safari/537.36",
-        "x-app-id": "rU6QIu7JHe2gOUeR",
-        "x-csrf-token": "x-csrf-token",
-        "x-version": "1.0.0",
-    }
-    r = requests.get(url, headers=headers, params=params)
-    data_json = r.json()
-    date_list = data_json["data"]
-    date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
-    for date in tqdm(date_point_list, leave=False):
-        url = "https://datacenter-api.jin10.com/reports/list_v2"
-        params = {
-            "max_date": f"{date}",
-            "category": "ec",
-            "attr_id": ec,
-        }
-        headers = {
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/107.0.0.0 Safari/537.36",
-            "x-app-id": "rU6QIu7JHe2gOUeR",
-            "x-csrf-token": "x-csrf-token",
-            "x-version": "1.0.0",
-        }
-        r = requests.get(url, headers=headers, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(
-            data_json["data"]["values"],
-            columns=[item["name"] for item in data_json["data"]["keys"]],
-        )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+    big_df = macro_jin10_base_values({"category": "ec", "attr_id": ec})
+    big_df.columns = ["日期", "今值", "预测值", "前值"]
     big_df["商品"] = "欧元区Sentix投资者信心指数"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 15:00
+Desc: 金十数据中心-经济指标-公共请求和本地仓库
+https://datacenter.jin10.com/economic
+接口按 max_date 从新到旧翻页; 启用本地仓库后, 每个指标的历史数据保存在本地,
+刷新时只向前翻页到本地最新日期为止
+"""
+
+import datetime
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+import requests
+
+from akshare.utils.batch import run_batch
+from akshare.utils.store import LocalStore
+
+_store = LocalStore(namespace="macro_jin10")
+_local = threading.local()
+_use_store_default = False
+
+
+def set_macro_store_jin10(enable: bool = True) -> None:
+    """
+    金十数据中心-经济指标-是否默认使用本地仓库
+    :param enable: 是否启用
+    :type enable: bool
+    :return: None
+    :rtype: None
+    """
+    global _use_store_default
+    _use_store_default = enable
+
+
+def _use_store() -> bool:
+    return getattr(_local, "use_store", None) or _use_store_default
+
+
+def _macro_jin10_page(params: Dict) -> List[List]:
+    """
+    金十数据中心-经济指标-单页数据
+    :param params: 请求参数
+    :type params: dict
+    :return: 单页数据, 日期从新到旧
+    :rtype: list
+    """
+    headers = {
+        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/107.0.0.0 Safari/537.36",
+        "x-app-id": "rU6QIu7JHe2gOUeR",
+        "x-csrf-token": "x-csrf-token",
+        "x-version": "1.0.0",
+    }
+    url = "https://datacenter-api.jin10.com/reports/list_v2"
+    r = requests.get(url, params=params, headers=headers, timeout=15)
+    data_json = r.json()
+    return data_json["data"]["values"]
+
+
+def macro_jin10_values(params: Dict, min_date: Optional[str] = None) -> pd.DataFrame:
+    """
+    金十数据中心-经济指标-按 max_date 向前翻页获取原始数据
+    :param params: 请求参数, 包含 category 和 attr_id
+    :type params: dict
+    :param min_date: 翻页到该日期(包含)为止, 默认获取全部历史
+    :type min_date: str
+    :return: 原始数据, 日期从新到旧
+    :rtype: pandas.DataFrame
+    """
+    params = params.copy()
+    temp_list = []
+    while True:
+        values = _macro_jin10_page(params)
+        if not values:
+            break
+        temp_list.extend(values)
+        last_date_str = values[-1][0]
+        if min_date is not None and last_date_str <= min_date:
+            break
+        last_date_str = (
+            (
+                datetime.datetime.strptime(last_date_str, "%Y-%m-%d")
+                - datetime.timedelta(days=1)
+            )
+            .date()
+            .isoformat()
+        )
+        params.update({"max_date": f"{last_date_str}"})
+    return pd.DataFrame(temp_list)
+
+
+def macro_jin10_base_values(params: Dict) -> pd.DataFrame:
+    """
+    金十数据中心-经济指标-原始数据; 启用本地仓库时只获取本地最新日期之后的数据并与本地数据合并
+    :param params: 请求参数, 包含 category 和 attr_id
+    :type params: dict
+    :return: 原始数据, 日期从新到旧
+    :rtype: pandas.DataFrame
+    """
+    if not _use_store():
+        return macro_jin10_values(params)
+    key = f"{params.get('category', 'ec')}_{params['attr_id']}"
+    old_df = _store.read(key)
+    if old_df is None or old_df.empty:
+        big_df = macro_jin10_values(params)
+    else:
+        # 本地最新日期的数据也重新获取, 以便更新今值和前值的修订
+        new_df = macro_jin10_values(params, min_date=old_df.iat[0, 0])
+        big_df = pd.concat([new_df, old_df], ignore_index=True)
+        big_df.drop_duplicates(subset=[0], keep="first", inplace=True)
+        big_df.sort_values(by=[0], ascending=False, inplace=True, ignore_index=True)
+    if not big_df.empty:
+        _store.write(key, big_df)
+    return big_df
+
+
+def macro_refresh_jin10(
+    func_list: List[Callable], max_workers: int = 8
+) -> Tuple[Dict[str, pd.DataFrame], pd.DataFrame]:
+    """
+    金十数据中心-经济指标-并发刷新多个指标, 使用本地仓库只获取缺失的部分
+    :param func_list: 金十数据的接口函数列表, 例如 [ak.macro_china_cpi_yearly, ak.macro_usa_cpi_monthly]
+    :type func_list: list
+    :param max_workers: 最大并发数
+    :type max_workers: int
+    :return: {函数名: 数据} 和错误表
+    :rtype: tuple
+    """
+
+    def _refresh(func: Callable) -> pd.DataFrame:
+        _local.use_store = True
+        try:
+            return func()
+        finally:
+            _local.use_store = None
+
+    result_list, error_df = run_batch(
+        func=_refresh,
+        task_list=[{"func": func} for func in func_list],
+        max_workers=max_workers,
+        host="datacenter-api.jin10.com",
+    )
+    if not error_df.empty:
+        error_df["func"] = error_df["func"].map(lambda func: func.__name__)
+    data_dict = {
+        func.__name__: temp_df
+        for func, temp_df in zip(func_list, result_list)
+        if temp_df is not None
+    }
+    return data_dict, error_df
+
+
+if __name__ == "__main__":
+    from akshare.economic.macro_china import macro_china_cpi_yearly
+    from akshare.economic.macro_usa import macro_usa_cpi_monthly
+
+    macro_refresh_jin10_dict, macro_refresh_jin10_error_df = macro_refresh_jin10(
+        func_list=[macro_china_cpi_yearly, macro_usa_cpi_monthly]
+    )
+    print(macro_refresh_jin10_dict)
+    print(macro_refresh_jin10_error_df)
@@ -6,12 +6,13 @@ Desc: 金十数据中心-经济指标-美国
 https://datacenter.jin10.com/economic
 """
 
-import datetime
 import time
 
 import pandas as pd
 import requests
 
+from akshare.economic.macro_jin10 import macro_jin10_base_values
+
 
 def __macro_usa_base_func(symbol: str, params: dict) -> pd.DataFrame:
     """
@@ -23,33 +24,7 @@ def __macro_usa_base_func(symbol: str, params: dict) -> pd.DataFrame:
     import warnings
 
     warnings.filterwarnings(action="ignore", category=FutureWarning)
-    headers = {
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/107.0.0.0 Safari/537.36",
-        "x-app-id": "rU6QIu7JHe2gOUeR",
-        "x-csrf-token": "x-csrf-token",
-        "x-version": "1.0.0",
-    }
-    url = "https://datacenter-api.jin10.com/reports/list_v2"
-    params = params
-    big_df = pd.DataFrame()
-    while True:
-        r = requests.get(url, params=params, headers=headers)
-        data_json = r.json()
-        if not data_json["data"]["values"]:
-            break
-        temp_df = pd.DataFrame(data_json["data"]["values"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-        last_date_str = temp_df.iat[-1, 0]
-        last_date_str = (
-            (
-                datetime.datetime.strptime(last_date_str, "%Y-%m-%d")
-                - datetime.timedelta(days=1)
-            )
-            .date()
-            .isoformat()
-        )
-        params.update({"max_date": f"{last_date_str}"})
+    big_df = macro_jin10_base_values(params)
     big_df.columns = [
         "日期",
         "今值",
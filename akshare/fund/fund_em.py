@@ -24,8 +24,10 @@ import pandas as pd
 import py_mini_racer
 import requests
 
-from akshare.utils import demjson
+from akshare.utils import lenient_json
 from akshare.utils.cons import headers
+from akshare.utils.http_cache import fetch_parsed
+from akshare.utils.single_flight import single_flight
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -45,7 +47,7 @@ def fund_purchase_em() -> pd.DataFrame:
     }
     r = requests.get(url, params=params, headers=headers)
     data_text = r.text
-    data_json = demjson.decode(data_text.strip("var reData="))
+    data_json = lenient_json.decode(data_text.strip("var reData="))
     temp_df = pd.DataFrame(data_json["datas"])
     temp_df.reset_index(inplace=True)
     temp_df["index"] = temp_df.index + 1
@@ -96,6 +98,22 @@ def fund_purchase_em() -> pd.DataFrame:
     return temp_df
 
 
+def _parse_fund_name(content: bytes) -> pd.DataFrame:
+    """
+    东方财富网站-天天基金网-解析 fundcode_search.js
+    :param content: 文件内容
+    :type content: bytes
+    :return: 所有基金的名称和类型
+    :rtype: pandas.DataFrame
+    """
+    text_data = content.decode("utf-8", errors="replace")
+    data_json = lenient_json.decode(text_data.strip("var r = ")[:-1])
+    temp_df = pd.DataFrame(data_json)
+    temp_df.columns = ["基金代码", "拼音缩写", "基金简称", "基金类型", "拼音全称"]
+    return temp_df
+
+
+@single_flight
 def fund_name_em() -> pd.DataFrame:
     """
     东方财富网站-天天基金网-基金数据-所有基金的名称和类型
@@ -104,12 +122,9 @@ def fund_name_em() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "https://fund.eastmoney.com/js/fundcode_search.js"
-    r = requests.get(url, headers=headers)
-    text_data = r.text
-    data_json = demjson.decode(text_data.strip("var r = ")[:-1])
-    temp_df = pd.DataFrame(data_json)
-    temp_df.columns = ["基金代码", "拼音缩写", "基金简称", "基金类型", "拼音全称"]
-    return temp_df
+    return fetch_parsed(
+        url, parser=_parse_fund_name, namespace="fund_em", headers=headers
+    )
 
 
 def fund_info_index_em(
@@ -286,7 +301,7 @@ def fund_open_fund_daily_em() -> pd.DataFrame:
     }
     res = requests.get(url, params=params, headers=headers)
     text_data = res.text
-    data_json = demjson.decode(text_data.strip("var db="))
+    data_json = lenient_json.decode(text_data.strip("var db="))
     temp_df = pd.DataFrame(data_json["datas"])
     show_day = data_json["showday"]
     temp_df.columns = [
@@ -750,7 +765,7 @@ def fund_financial_fund_info_em(symbol: str = "000134") -> pd.DataFrame:
     }
     r = requests.get(url, params=params, headers=headers)
     text_data = r.text
-    data_json = demjson.decode(text_data[text_data.find("{") : -1])
+    data_json = lenient_json.decode(text_data[text_data.find("{") : -1])
     temp_df = pd.DataFrame(data_json["Data"]["LSJZList"])
     temp_df.columns = [
         "净值日期",
@@ -812,7 +827,7 @@ def fund_graded_fund_daily_em() -> pd.DataFrame:
     }
     res = requests.get(url, params=params, headers=headers)
     text_data = res.text
-    data_json = demjson.decode(text_data.strip("var db="))
+    data_json = lenient_json.decode(text_data.strip("var db="))
     temp_df = pd.DataFrame(data_json["datas"])
     show_day = data_json["showday"]
     temp_df.columns = [
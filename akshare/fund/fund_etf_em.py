@@ -6,15 +6,13 @@ Desc: 东方财富-ETF行情
 https://quote.eastmoney.com/sh513500.html
 """
 
-from functools import lru_cache
-
 import pandas as pd
 import requests
 
 from akshare.utils.func import fetch_paginated_data
+from akshare.utils.security_master import get_code_id_dict_em
 
 
-@lru_cache()
 def _fund_etf_code_id_map_em() -> dict:
     """
     东方财富-ETF代码和市场标识映射
@@ -22,23 +20,7 @@ def _fund_etf_code_id_map_em() -> dict:
     :return: ETF 代码和市场标识映射
     :rtype: dict
     """
-    url = "https://88.push2.eastmoney.com/api/qt/clist/get"
-    params = {
-        "pn": "1",
-        "pz": "100",
-        "po": "1",
-        "np": "1",
-        "ut": "bd1d9ddb04089700cf9c27f6f7426281",
-        "fltt": "2",
-        "invt": "2",
-        "wbp2u": "|0|0|0|web",
-        "fid": "f3",
-        "fs": "b:MK0021,b:MK0022,b:MK0023,b:MK0024",
-        "fields": "f3,f12,f13",
-    }
-    temp_df = fetch_paginated_data(url, params)
-    temp_dict = dict(zip(temp_df["f12"], temp_df["f13"]))
-    return temp_dict
+    return get_code_id_dict_em("etf")
 
 
 def fund_etf_spot_em() -> pd.DataFrame:
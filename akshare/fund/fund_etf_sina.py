@@ -11,7 +11,7 @@ import py_mini_racer
 import requests
 
 from akshare.stock.cons import hk_js_decode
-from akshare.utils import demjson
+from akshare.utils import lenient_json
 
 
 def fund_etf_category_sina(symbol: str = "LOF基金") -> pd.DataFrame:
@@ -42,7 +42,7 @@ def fund_etf_category_sina(symbol: str = "LOF基金") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("([") + 1: -2])
+    data_json = lenient_json.decode(data_text[data_text.find("([") + 1: -2])
     temp_df = pd.DataFrame(data_json)
     if symbol == "封闭式基金":
         temp_df.columns = [
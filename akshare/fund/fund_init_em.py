@@ -9,7 +9,7 @@ https://fund.eastmoney.com/data/xinfound.html
 import pandas as pd
 import requests
 
-from akshare.utils import demjson
+from akshare.utils import lenient_json
 
 
 def fund_new_found_em() -> pd.DataFrame:
@@ -30,7 +30,7 @@ def fund_new_found_em() -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text.strip("var newfunddata="))
+    data_json = lenient_json.decode(data_text.strip("var newfunddata="))
     temp_df = pd.DataFrame(data_json["datas"])
     temp_df.columns = [
         "基金代码",
@@ -7,15 +7,13 @@ https://quote.eastmoney.com/center/gridlist.html#fund_lof
 https://quote.eastmoney.com/sz166009.html
 """
 
-from functools import lru_cache
-
 import pandas as pd
 import requests
 
 from akshare.utils.func import fetch_paginated_data
+from akshare.utils.security_master import get_code_id_dict_em
 
 
-@lru_cache()
 def _fund_lof_code_id_map_em() -> dict:
     """
     东方财富-LOF 代码和市场标识映射
@@ -23,23 +21,7 @@ def _fund_lof_code_id_map_em() -> dict:
     :return: LOF 代码和市场标识映射
     :rtype: pandas.DataFrame
     """
-    url = "https://2.push2.eastmoney.com/api/qt/clist/get"
-    params = {
-        "pn": "1",
-        "pz": "100",
-        "po": "1",
-        "np": "1",
-        "ut": "bd1d9ddb04089700cf9c27f6f7426281",
-        "fltt": "2",
-        "invt": "2",
-        "wbp2u": "|0|0|0|web",
-        "fid": "f12",
-        "fs": "b:MK0404,b:MK0405,b:MK0406,b:MK0407",
-        "fields": "f3,f12,f13",
-    }
-    temp_df = fetch_paginated_data(url, params)
-    temp_dict = dict(zip(temp_df["f12"], temp_df["f13"]))
-    return temp_dict
+    return get_code_id_dict_em("lof")
 
 
 def fund_lof_spot_em() -> pd.DataFrame:
@@ -1,101 +1,155 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/6/7 20:00
+Date: 2026/10/19 23:00
 Desc: 天天基金网-基金档案-投资组合
 https://fundf10.eastmoney.com/ccmx_000001.html
+fund_portfolio_hold_all_em 按 (基金, 年份) 并发采集全市场的持仓明细并以分类类型压缩保存到本地仓库,
+fund_portfolio_stock_holders 按股票汇总持有基金
 """
 
-from io import StringIO
+import datetime
+import re
+from typing import List, Optional, Tuple
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 
-from akshare.utils import demjson
+from akshare.utils import lenient_json
+from akshare.utils.batch import run_batch
+from akshare.utils.html_table import parse_table_element
+from akshare.utils.store import LocalStore
 
+# 指标: (接口参数, 目标字段)
+_PORTFOLIO_INDICATOR = {
+    "股票持仓": (
+        {"type": "jjcc", "topline": "10000", "month": ""},
+        ["股票代码", "股票名称", "占净值比例", "持股数", "持仓市值"],
+    ),
+    "债券持仓": (
+        {"type": "zqcc"},
+        ["债券代码", "债券名称", "占净值比例", "持仓市值"],
+    ),
+    "累计买入": (
+        {"type": "zdbd", "zdbd": "1"},
+        ["股票代码", "股票名称", "本期累计买入金额", "占期初基金资产净值比例"],
+    ),
+    "累计卖出": (
+        {"type": "zdbd", "zdbd": "2"},
+        ["股票代码", "股票名称", "本期累计买入金额", "占期初基金资产净值比例"],
+    ),
+}
+# 表头中的空白和单位, 例如 "持股数 （万股）" -> "持股数"
+_HEADER_PATTERN = re.compile(r"\s|（.*?）|\(.*?\)")
+_HEADER_ALIAS = {"本期累计卖出金额": "本期累计买入金额"}
 
-def fund_portfolio_hold_em(symbol: str = "000001", date: str = "2024") -> pd.DataFrame:
+
+def _fund_portfolio_content(
+    symbol: str = "000001", date: str = "2024", indicator: str = "股票持仓"
+) -> str:
     """
-    天天基金网-基金档案-投资组合-基金持仓
-    https://fundf10.eastmoney.com/ccmx_000001.html
+    天天基金网-基金档案-投资组合-网页片段
     :param symbol: 基金代码
     :type symbol: str
     :param date: 查询年份
     :type date: str
-    :return: 基金持仓
-    :rtype: pandas.DataFrame
+    :param indicator: choice of {"股票持仓", "债券持仓", "累计买入", "累计卖出"}
+    :type indicator: str
+    :return: 网页片段
+    :rtype: str
     """
     url = "https://fundf10.eastmoney.com/FundArchivesDatas.aspx"
     params = {
-        "type": "jjcc",
+        **_PORTFOLIO_INDICATOR[indicator][0],
         "code": symbol,
-        "topline": "10000",
         "year": date,
-        "month": "",
         "rt": "0.913877030254846",
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -1])
-    soup = BeautifulSoup(data_json["content"], features="lxml")
-    item_label = [
-        item.text.split("\xa0\xa0")[1]
-        for item in soup.find_all(name="h4", attrs={"class": "t"})
-    ]
+    data_json = lenient_json.decode(data_text[data_text.find("{") : -1])
+    return data_json["content"]
 
-    column_name = [
-        "序号",
-        "股票代码",
-        "股票名称",
-        "占净值比例",
-        "持股数",
-        "持仓市值",
-        "季度",
+
+def _fund_portfolio_rows(content: str, indicator: str = "股票持仓") -> List[List]:
+    """
+    用 lxml 解析一次网页片段, 按表头名称抽取目标字段的原始字符串, 每行末尾为季度
+    :param content: 网页片段
+    :type content: str
+    :param indicator: choice of {"股票持仓", "债券持仓", "累计买入", "累计卖出"}
+    :type indicator: str
+    :return: 数据行
+    :rtype: list
+    """
+    if not content or not content.strip():
+        return []
+    doc = lxml_html.document_fromstring(content)
+    label_list = [
+        "".join(item.itertext()).split("\xa0\xa0")[1]
+        for item in doc.xpath('//h4[@class="t"]')
     ]
-    big_df = pd.DataFrame(columns=column_name)
-
-    for item in range(len(item_label)):
-        temp_df = pd.read_html(
-            StringIO(data_json["content"]), converters={"股票代码": str}
-        )[item]
-        del temp_df["相关资讯"]
-        temp_df.rename(columns={"占净值 比例": "占净值比例"}, inplace=True)
-        temp_df["占净值比例"] = (
-            temp_df["占净值比例"].str.split("%", expand=True).iloc[:, 0]
-        )
-        temp_df.rename(
-            columns={"持股数（万股）": "持股数", "持仓市值（万元）": "持仓市值"},
-            inplace=True,
-        )
-        temp_df.rename(
-            columns={"持股数 （万股）": "持股数", "持仓市值 （万元）": "持仓市值"},
-            inplace=True,
-        )
-        temp_df.rename(
-            columns={"持股数（万股）": "持股数", "持仓市值（万元人民币）": "持仓市值"},
-            inplace=True,
+    column_list = _PORTFOLIO_INDICATOR[indicator][1]
+    row_list = []
+    for label, table in zip(label_list, doc.xpath("//table")):
+        header, data = parse_table_element(table)
+        header = [_HEADER_PATTERN.sub("", item) for item in header]
+        header = [_HEADER_ALIAS.get(item, item) for item in header]
+        index_list = [
+            header.index(item) if item in header else None for item in column_list
+        ]
+        row_list.extend(
+            [None if i is None else row[i] for i in index_list] + [label]
+            for row in data
+            if len(row) == len(header)
         )
-        temp_df.rename(
-            columns={
-                "持股数 （万股）": "持股数",
-                "持仓市值 （万元人民币）": "持仓市值",
-            },
-            inplace=True,
+    return row_list
+
+
+def _fund_portfolio_frame(
+    row_list: List[List], indicator: str = "股票持仓"
+) -> pd.DataFrame:
+    """
+    所有季度的数据行合并后只做一次类型转换
+    :param row_list: 数据行
+    :type row_list: list
+    :param indicator: choice of {"股票持仓", "债券持仓", "累计买入", "累计卖出"}
+    :type indicator: str
+    :return: 投资组合
+    :rtype: pandas.DataFrame
+    """
+    column_list = _PORTFOLIO_INDICATOR[indicator][1]
+    temp_df = pd.DataFrame(row_list, columns=column_list + ["季度"], dtype=object)
+    for item in column_list[2:]:
+        temp_df[item] = pd.to_numeric(
+            temp_df[item].str.replace(r"[%,]", "", regex=True), errors="coerce"
         )
+    temp_df[column_list[:2] + ["季度"]] = temp_df[column_list[:2] + ["季度"]].astype(
+        str
+    )
+    return temp_df
 
-        temp_df["季度"] = item_label[item]
-        temp_df = temp_df[column_name]
-        big_df = pd.concat(objs=[temp_df, big_df], ignore_index=True) if not big_df.empty else temp_df
-
-    if not big_df.empty:
-        big_df["占净值比例"] = pd.to_numeric(big_df["占净值比例"], errors="coerce")
-        big_df["持股数"] = pd.to_numeric(big_df["持股数"], errors="coerce")
-        big_df["持仓市值"] = pd.to_numeric(big_df["持仓市值"], errors="coerce")
-        del big_df["序号"]
-        big_df.reset_index(inplace=True, drop=False)
-        big_df["index"] = big_df["index"] + 1
-        big_df.rename(columns={"index": "序号"}, inplace=True)
+
+def fund_portfolio_hold_em(symbol: str = "000001", date: str = "2024") -> pd.DataFrame:
+    """
+    天天基金网-基金档案-投资组合-基金持仓
+    https://fundf10.eastmoney.com/ccmx_000001.html
+    :param symbol: 基金代码
+    :type symbol: str
+    :param date: 查询年份
+    :type date: str
+    :return: 基金持仓
+    :rtype: pandas.DataFrame
+    """
+    content = _fund_portfolio_content(symbol=symbol, date=date, indicator="股票持仓")
+    row_list = _fund_portfolio_rows(content, indicator="股票持仓")
+    # 较早的季度排在前面
+    quarter_list = list(dict.fromkeys(row[-1] for row in row_list))[::-1]
+    row_list = [
+        row for quarter in quarter_list for row in row_list if row[-1] == quarter
+    ]
+    big_df = _fund_portfolio_frame(row_list, indicator="股票持仓")
+    big_df.insert(0, "序号", range(1, len(big_df) + 1))
     return big_df
 
 
@@ -112,45 +166,10 @@ def fund_portfolio_bond_hold_em(
     :return: 债券持仓
     :rtype: pandas.DataFrame
     """
-    url = "https://fundf10.eastmoney.com/FundArchivesDatas.aspx"
-    params = {
-        "type": "zqcc",
-        "code": symbol,
-        "year": date,
-        "rt": "0.913877030254846",
-    }
-    r = requests.get(url, params=params)
-    data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -1])
-    soup = BeautifulSoup(data_json["content"], features="lxml")
-    item_label = [
-        item.text.split("\xa0\xa0")[1]
-        for item in soup.find_all(name="h4", attrs={"class": "t"})
-    ]
-    big_df = pd.DataFrame()
-    for item in range(len(item_label)):
-        temp_df = pd.read_html(
-            StringIO(data_json["content"]), converters={"债券代码": str}
-        )[item]
-        temp_df["占净值比例"] = (
-            temp_df["占净值比例"].str.split("%", expand=True).iloc[:, 0]
-        )
-        temp_df.rename(columns={"持仓市值（万元）": "持仓市值"}, inplace=True)
-        temp_df["季度"] = item_label[item]
-        temp_df = temp_df[
-            [
-                "序号",
-                "债券代码",
-                "债券名称",
-                "占净值比例",
-                "持仓市值",
-                "季度",
-            ]
-        ]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-    big_df["占净值比例"] = pd.to_numeric(big_df["占净值比例"], errors="coerce")
-    big_df["持仓市值"] = pd.to_numeric(big_df["持仓市值"], errors="coerce")
-    big_df["序号"] = range(1, len(big_df) + 1)
+    content = _fund_portfolio_content(symbol=symbol, date=date, indicator="债券持仓")
+    row_list = _fund_portfolio_rows(content, indicator="债券持仓")
+    big_df = _fund_portfolio_frame(row_list, indicator="债券持仓")
+    big_df.insert(0, "序号", range(1, len(big_df) + 1))
     return big_df
 
 
@@ -187,7 +206,7 @@ def fund_portfolio_industry_allocation_em(
     }
     r = requests.get(url, params=params, headers=headers)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -1])
+    data_json = lenient_json.decode(data_text[data_text.find("{") : -1])
     temp_list = []
     for item in data_json["Data"]["QuarterInfos"]:
         temp_list.extend(item["HYPZInfo"])
@@ -242,69 +261,227 @@ def fund_portfolio_change_em(
     :return: 重大变动
     :rtype: pandas.DataFrame
     """
-    indicator_map = {
-        "累计买入": "1",
-        "累计卖出": "2",
-    }
-    url = "https://fundf10.eastmoney.com/FundArchivesDatas.aspx"
-    params = {
-        "type": "zdbd",
-        "code": symbol,
-        "zdbd": indicator_map[indicator],
-        "year": date,
-        "rt": "0.913877030254846",
-    }
-    r = requests.get(url, params=params)
-    data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -1])
-    soup = BeautifulSoup(data_json["content"], features="lxml")
-    item_label = [
-        item.text.split("\xa0\xa0")[1]
-        for item in soup.find_all(name="h4", attrs={"class": "t"})
+    content = _fund_portfolio_content(symbol=symbol, date=date, indicator=indicator)
+    row_list = _fund_portfolio_rows(content, indicator=indicator)
+    big_df = _fund_portfolio_frame(row_list, indicator=indicator)
+    big_df.insert(0, "序号", range(1, len(big_df) + 1))
+    return big_df
+
+
+_store = LocalStore(namespace="fund_portfolio_em")
+# 本地仓库中以分类类型保存的字段
+_CATEGORY_COLUMNS = ["基金代码", "季度", "股票代码", "股票名称", "债券代码", "债券名称"]
+
+
+def _fund_portfolio_job(symbol: str, date: str, indicator: str) -> List[List]:
+    """
+    单只基金单个年份的投资组合数据行, 每行开头为基金代码
+    :param symbol: 基金代码
+    :type symbol: str
+    :param date: 查询年份
+    :type date: str
+    :param indicator: choice of {"股票持仓", "债券持仓", "累计买入", "累计卖出"}
+    :type indicator: str
+    :return: 数据行
+    :rtype: list
+    """
+    content = _fund_portfolio_content(symbol=symbol, date=date, indicator=indicator)
+    return [[symbol] + row for row in _fund_portfolio_rows(content, indicator)]
+
+
+def _fund_portfolio_compact(temp_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    代码、名称和季度转为分类类型, 数值转为 float32
+    :param temp_df: 投资组合
+    :type temp_df: pandas.DataFrame
+    :return: 压缩后的投资组合
+    :rtype: pandas.DataFrame
+    """
+    temp_df = temp_df.copy()
+    for item in temp_df.columns:
+        if item in _CATEGORY_COLUMNS:
+            temp_df[item] = temp_df[item].astype(object).astype("category")
+        else:
+            temp_df[item] = temp_df[item].astype("float32")
+    return temp_df
+
+
+def _fund_portfolio_merge(indicator: str, year: str) -> None:
+    """
+    把 (指标, 年份) 的分区合并到主数据中; 重新获取的基金以最新分区的数据为准, 包括中断后遗留的分区
+    :param indicator: choice of {"股票持仓", "债券持仓", "累计买入", "累计卖出"}
+    :type indicator: str
+    :param year: 年份
+    :type year: str
+    :return: None
+    :rtype: None
+    """
+    key = f"{indicator}_{year}"
+    part_list = [item for item in _store.keys() if item.startswith(f"{key}_part_")]
+    if not part_list:
+        return
+    frame_list = []
+    done_set = set()
+    # 从最新的分区开始, 较早的数据中去掉之后重新获取过的基金
+    for part_key in sorted(part_list, reverse=True):
+        part_df = _store.read(part_key)
+        frame_list.append(part_df[~part_df["基金代码"].isin(done_set)])
+        done_set.update(part_df.attrs.get("done", []))
+    old_df = _store.read(key)
+    if old_df is not None:
+        frame_list.append(old_df[~old_df["基金代码"].isin(done_set)])
+    temp_df = pd.concat(list(reversed(frame_list)), ignore_index=True)
+    _store.write(key, _fund_portfolio_compact(temp_df))
+    for part_key in part_list:
+        _store.delete(part_key)
+
+
+def fund_portfolio_hold_all_em(
+    symbol_list: Optional[List[str]] = None,
+    start_year: str = "2024",
+    end_year: str = "2024",
+    indicator: str = "股票持仓",
+    max_workers: int = 8,
+    refresh: bool = False,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    天天基金网-基金档案-投资组合-全市场
+    按 (基金, 年份) 并发获取投资组合并按 (指标, 年份) 追加到本地仓库, 代码、名称和季度以分类类型保存;
+    再次运行时只获取本地没有的 (基金, 年份), 当年的数据每次都重新获取
+    https://fundf10.eastmoney.com/ccmx_000001.html
+    :param symbol_list: 基金代码列表, 默认为 fund_name_em 中的所有基金
+    :type symbol_list: list
+    :param start_year: 开始年份
+    :type start_year: str
+    :param end_year: 结束年份
+    :type end_year: str
+    :param indicator: choice of {"股票持仓", "债券持仓", "累计买入", "累计卖出"}
+    :type indicator: str
+    :param max_workers: 最大并发数
+    :type max_workers: int
+    :param refresh: 是否忽略本地仓库重新获取
+    :type refresh: bool
+    :return: 投资组合和错误表, 季度为 "2024年2季度" 格式
+    :rtype: tuple
+    """
+    if symbol_list is None:
+        from akshare.fund.fund_em import fund_name_em
+
+        symbol_list = fund_name_em()["基金代码"].tolist()
+    year_list = [str(year) for year in range(int(start_year), int(end_year) + 1)]
+    this_year = str(datetime.date.today().year)
+    fetched_df = None if refresh else _store.read(f"{indicator}_fetched")
+    fetched_set = (
+        set()
+        if fetched_df is None
+        else set(zip(fetched_df["symbol"], fetched_df["date"]))
+    )
+    task_list = [
+        {"symbol": symbol, "date": year, "indicator": indicator}
+        for year in year_list
+        for symbol in symbol_list
+        if (symbol, year) not in fetched_set
     ]
-    big_df = pd.DataFrame()
-    for item in range(len(item_label)):
-        temp_df = pd.read_html(
-            StringIO(data_json["content"]), converters={"股票代码": str}
-        )[item]
-        del temp_df["相关资讯"]
-        temp_df["占期初基金资产净值比例（%）"] = (
-            temp_df["占期初基金资产净值比例（%）"]
-            .str.split("%", expand=True)
-            .iloc[:, 0]
+    column_list = ["基金代码"] + _PORTFOLIO_INDICATOR[indicator][1] + ["季度"]
+    # 分批写入本地仓库, 长时间的回补中断后已完成的部分不会丢失
+    chunk_size = max(1, max_workers) * 50
+    error_list = []
+    part_number = max(
+        [int(key.rsplit("_", 1)[1]) for key in _store.keys() if "_part_" in key] + [0]
+    )
+    for i in range(0, len(task_list), chunk_size):
+        chunk_list = task_list[i : i + chunk_size]
+        result_list, error_df = run_batch(
+            _fund_portfolio_job,
+            chunk_list,
+            max_workers=max_workers,
+            host="fundf10.eastmoney.com",
         )
-        temp_df["季度"] = item_label[item]
-        temp_df.columns = [
-            "序号",
-            "股票代码",
-            "股票名称",
-            "本期累计买入金额",
-            "占期初基金资产净值比例",
-            "季度",
-        ]
-        temp_df = temp_df[
-            [
-                "序号",
-                "股票代码",
-                "股票名称",
-                "本期累计买入金额",
-                "占期初基金资产净值比例",
-                "季度",
+        error_list.append(error_df)
+        for year in year_list:
+            done_list = [
+                task["symbol"]
+                for task, row_list in zip(chunk_list, result_list)
+                if task["date"] == year and row_list is not None
             ]
-        ]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-    del big_df["序号"]
-    big_df.reset_index(inplace=True)
-    big_df["index"] = big_df.index + 1
-    big_df.rename(columns={"index": "序号"}, inplace=True)
-
-    big_df["本期累计买入金额"] = pd.to_numeric(
-        big_df["本期累计买入金额"], errors="coerce"
+            if not done_list:
+                continue
+            row_list = [
+                row
+                for task, row_list in zip(chunk_list, result_list)
+                if task["date"] == year and row_list is not None
+                for row in row_list
+            ]
+            temp_df = _fund_portfolio_frame([row[1:] for row in row_list], indicator)
+            temp_df.insert(0, "基金代码", [row[0] for row in row_list])
+            temp_df["季度"] = temp_df["季度"].str.extract(r"(\d{4}年\d季度)")[0]
+            # 每批单独写入一个分区, 全部完成后再合并, 避免每批都重写整年的数据
+            temp_df.attrs["done"] = done_list
+            part_number += 1
+            _store.write(f"{indicator}_{year}_part_{part_number:05d}", temp_df)
+            if year < this_year:
+                _store.append(
+                    f"{indicator}_fetched",
+                    pd.DataFrame({"symbol": done_list, "date": year}),
+                    subset=["symbol", "date"],
+                )
+    for year in year_list:
+        _fund_portfolio_merge(indicator, year)
+    year_df_list = [_store.read(f"{indicator}_{year}") for year in year_list]
+    year_df_list = [item for item in year_df_list if item is not None]
+    if year_df_list:
+        big_df = pd.concat(year_df_list, ignore_index=True)
+        big_df = big_df[big_df["基金代码"].isin(symbol_list)]
+        big_df = _fund_portfolio_compact(big_df.reset_index(drop=True))
+    else:
+        big_df = pd.DataFrame(columns=column_list)
+    error_df = (
+        pd.concat(error_list, ignore_index=True)
+        if error_list
+        else pd.DataFrame(
+            columns=["symbol", "date", "indicator", "error_type", "error"]
+        )
     )
-    big_df["占期初基金资产净值比例"] = pd.to_numeric(
-        big_df["占期初基金资产净值比例"], errors="coerce"
+    return big_df, error_df
+
+
+def fund_portfolio_stock_holders(
+    hold_df: pd.DataFrame, output: str = "tidy", value: str = "持仓市值"
+) -> pd.DataFrame:
+    """
+    天天基金网-基金档案-投资组合-按股票汇总持有基金
+    由 fund_portfolio_hold_all_em 的股票持仓计算每只股票每个季度的持有基金数、合计持股数和合计持仓市值
+    :param hold_df: fund_portfolio_hold_all_em 返回的股票持仓
+    :type hold_df: pandas.DataFrame
+    :param output: choice of {"tidy", "wide"}; wide 为 股票代码 × 季度 的宽表
+    :type output: str
+    :param value: wide 时的取值字段, choice of {"持有基金数", "持股数", "持仓市值"}
+    :type value: str
+    :return: 股票的持有基金汇总
+    :rtype: pandas.DataFrame
+    """
+    if output not in {"tidy", "wide"}:
+        raise ValueError('output 参数只能为 "tidy" 或 "wide"')
+    temp_df = hold_df.drop_duplicates(subset=["季度", "股票代码", "基金代码"])
+    temp_df = temp_df.groupby(["季度", "股票代码"], observed=True, sort=True).agg(
+        股票名称=("股票名称", "last"),
+        持有基金数=("基金代码", "size"),
+        持股数=("持股数", "sum"),
+        持仓市值=("持仓市值", "sum"),
     )
-    return big_df
+    temp_df.reset_index(inplace=True)
+    temp_df["季度"] = temp_df["季度"].astype(str)
+    temp_df["股票代码"] = temp_df["股票代码"].astype(str)
+    temp_df["股票名称"] = temp_df["股票名称"].astype(str)
+    if output == "wide":
+        return temp_df.pivot(index="股票代码", columns="季度", values=value)
+    temp_df.sort_values(
+        by=["季度", "持仓市值"],
+        ascending=[True, False],
+        ignore_index=True,
+        inplace=True,
+    )
+    return temp_df
 
 
 if __name__ == "__main__":
@@ -326,7 +503,31 @@ if __name__ == "__main__":
     )
     print(fund_portfolio_change_em_df)
 
+    fund_portfolio_hold_all_em_df, fund_portfolio_hold_all_em_error_df = (
+        fund_portfolio_hold_all_em(
+            symbol_list=["000001", "003567"], start_year="2024", end_year="2024"
+        )
+    )
+    print(fund_portfolio_hold_all_em_df)
+
+    fund_portfolio_stock_holders_df = fund_portfolio_stock_holders(
+        fund_portfolio_hold_all_em_df
+    )
+    print(fund_portfolio_stock_holders_df)
+
     fund_portfolio_change_em_df = fund_portfolio_change_em(
         symbol="003567", indicator="累计卖出", date="2023"
     )
     print(fund_portfolio_change_em_df)
+
+    fund_portfolio_hold_all_em_df, fund_portfolio_hold_all_em_error_df = (
+        fund_portfolio_hold_all_em(
+            symbol_list=["000001", "003567"], start_year="2024", end_year="2024"
+        )
+    )
+    print(fund_portfolio_hold_all_em_df)
+
+    fund_portfolio_stock_holders_df = fund_portfolio_stock_holders(
+        fund_portfolio_hold_all_em_df
+    )
+    print(fund_portfolio_stock_holders_df)
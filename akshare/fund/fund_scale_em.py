@@ -9,7 +9,7 @@ https://fund.eastmoney.com/data/cyrjglist.html
 import pandas as pd
 import requests
 
-from akshare.utils import demjson
+from akshare.utils import lenient_json
 
 
 def fund_scale_change_em() -> pd.DataFrame:
@@ -30,14 +30,14 @@ def fund_scale_change_em() -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -1])
+    data_json = lenient_json.decode(data_text[data_text.find("{") : -1])
     total_page = data_json["pages"]
     big_df = pd.DataFrame()
     for page in range(1, int(total_page) + 1):
         params.update({"pi": page})
         r = requests.get(url, params=params)
         data_text = r.text
-        data_json = demjson.decode(data_text[data_text.find("{") : -1])
+        data_json = lenient_json.decode(data_text[data_text.find("{") : -1])
         temp_df = pd.DataFrame(data_json["data"])
         big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
     big_df.reset_index(inplace=True)
@@ -86,14 +86,14 @@ def fund_hold_structure_em() -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -1])
+    data_json = lenient_json.decode(data_text[data_text.find("{") : -1])
     total_page = data_json["pages"]
     big_df = pd.DataFrame()
     for page in range(1, int(total_page) + 1):
         params.update({"pi": page})
         r = requests.get(url, params=params)
         data_text = r.text
-        data_json = demjson.decode(data_text[data_text.find("{") : -1])
+        data_json = lenient_json.decode(data_text[data_text.find("{") : -1])
         temp_df = pd.DataFrame(data_json["data"])
         big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
     big_df.reset_index(inplace=True)
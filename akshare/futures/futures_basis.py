@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/12/12 17:00
+Date: 2026/10/19 23:00
 Desc: 生意社网站采集大宗商品现货价格及相应基差数据, 数据时间段从 20110104-至今
 备注：现期差 = 现货价格 - 期货价格(这里的期货价格为结算价)
 黄金为 元/克, 白银为 元/千克, 玻璃现货为 元/平方米, 鸡蛋现货为 元/公斤, 鸡蛋期货为 元/500千克, 其余为 元/吨.
@@ -17,16 +17,27 @@ import datetime
 import re
 import time
 import warnings
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
 import pandas as pd
 
 from akshare.futures import cons
+from akshare.futures.futures_continuous import (
+    _annualized_roll_yield,
+    _futures_panel,
+    _main_contract_table,
+)
+from akshare.futures.futures_daily_bar import get_futures_daily_markets
 from akshare.futures.requests_fun import pandas_read_html_link
 from akshare.futures.symbol_var import chinese_to_english
+from akshare.utils.batch import run_batch
+from akshare.utils.instrument import propagate_context
 
 calendar = cons.get_calendar()
 
+_SPOT_HOST = "www.100ppi.com"
+
 
 def futures_spot_price_daily(
     start_day: str = "20210201",
@@ -62,20 +73,83 @@ def futures_spot_price_daily(
         if end_day is not None
         else cons.convert_date(cons.get_latest_data_date(datetime.datetime.now()))
     )
-    df_list = []
-    while start_day <= end_day:
-        temp_df = futures_spot_price(start_day, vars_list)
-        if temp_df is False:
-            return pd.concat(df_list).reset_index(drop=True)
-        elif temp_df is not None:
-            df_list.append(temp_df)
-        start_day += datetime.timedelta(days=1)
+    if start_day < datetime.date(2011, 1, 4):
+        raise Exception(
+            "数据源开始日期为 20110104, 请将获取数据时间点设置在 20110104 后"
+        )
+    # 各交易日的页面相互独立, 并发获取, 失败的交易日由 run_batch 重试
+    task_list = [
+        {"date": item, "vars_list": vars_list}
+        for item in calendar
+        if start_day.strftime("%Y%m%d") <= item <= end_day.strftime("%Y%m%d")
+    ]
+    result_list, error_df = run_batch(
+        _futures_spot_price_once,
+        task_list,
+        max_workers=4,
+        host=_SPOT_HOST,
+        max_retries=5,
+        retry_delay=3,
+    )
+    for item, error in zip(error_df["date"], error_df["error"]):
+        print(f"{item}日生意社数据连接失败[错误信息:{error}]")
+    df_list = [
+        temp_df for temp_df in result_list if temp_df is not None and not temp_df.empty
+    ]
     if len(df_list) > 0:
         temp_df = pd.concat(df_list)
         temp_df.reset_index(drop=True, inplace=True)
         return temp_df
 
 
+def _futures_spot_price_page(
+    url: str, date: datetime.date, vars_list: list
+) -> Optional[pd.DataFrame]:
+    """
+    解析生意社的一个现货与基差页面
+    :param url: 页面地址
+    :type url: str
+    :param date: 交易日
+    :type date: datetime.date
+    :param vars_list: 合约品种如 RB、AL 等列表
+    :type vars_list: list
+    :return: 现货价格及相应基差, 页面的日期不是 date 时返回 None
+    :rtype: pandas.DataFrame
+    """
+    r = pandas_read_html_link(url)
+    string = r[0].loc[1, 1]
+    news = "".join(re.findall(r"[0-9]", string))
+    if news[3:11] != date.strftime("%Y%m%d"):
+        return None
+    records = _check_information(r[1], date)
+    records.index = records["symbol"]
+    var_list_in_market = [i for i in vars_list if i in records.index]
+    temp_df = records.loc[var_list_in_market, :]
+    temp_df.reset_index(drop=True, inplace=True)
+    return temp_df
+
+
+def _futures_spot_price_once(date: str, vars_list: list) -> pd.DataFrame:
+    """
+    指定交易日大宗商品现货价格及相应基差, 只请求一次, 失败时抛出异常, 由调用方重试
+    :param date: 交易日 format: YYYYMMDD
+    :type date: str
+    :param vars_list: 合约品种如 RB、AL 等列表
+    :type vars_list: list
+    :return: 现货价格及相应基差
+    :rtype: pandas.DataFrame
+    """
+    date = cons.convert_date(date)
+    for url in [
+        f"https://www.100ppi.com/sf/day-{date.strftime('%Y-%m-%d')}.html",
+        "https://www.100ppi.com/sf/",
+    ]:
+        temp_df = _futures_spot_price_page(url, date, vars_list)
+        if temp_df is not None:
+            return temp_df
+    raise ValueError(f"{date.strftime('%Y-%m-%d')}日生意社页面的日期不匹配")
+
+
 def futures_spot_price(
     date: str = "20240430", vars_list: list = cons.contract_symbols
 ) -> pd.DataFrame:
@@ -113,15 +187,8 @@ def futures_spot_price(
         for url in [u2, u1]:
             try:
                 # url = u2
-                r = pandas_read_html_link(url)
-                string = r[0].loc[1, 1]
-                news = "".join(re.findall(r"[0-9]", string))
-                if news[3:11] == date.strftime("%Y%m%d"):
-                    records = _check_information(r[1], date)
-                    records.index = records["symbol"]
-                    var_list_in_market = [i for i in vars_list if i in records.index]
-                    temp_df = records.loc[var_list_in_market, :]
-                    temp_df.reset_index(drop=True, inplace=True)
+                temp_df = _futures_spot_price_page(url, date, vars_list)
+                if temp_df is not None:
                     return temp_df
                 else:
                     time.sleep(3)
@@ -357,7 +424,145 @@ def futures_spot_price_previous(date: str = "20240430") -> pd.DataFrame:
     return basis
 
 
+# 面板数据的字段, 宽表的列为 (字段, 品种)
+_PANEL_FIELDS = [
+    "spot_price",
+    "near_price",
+    "dom_price",
+    "roll_yield",
+    "near_basis",
+    "dom_basis",
+    "near_basis_rate",
+    "dom_basis_rate",
+]
+
+
+def futures_basis_panel(
+    daily_df: pd.DataFrame,
+    spot_df: Optional[pd.DataFrame] = None,
+    rule: str = "open_interest",
+    confirm_days: int = 1,
+    monotonic: bool = True,
+    output: str = "tidy",
+) -> pd.DataFrame:
+    """
+    期货-展期收益率和基差面板, 一次计算所有品种每天的展期收益率、基差和基差率
+    基差 = 期货结算价 - 现货价格, 基差率 = 期货结算价 / 现货价格 - 1; 展期收益率为主力合约相对次主力合约的年化收益率
+    :param daily_df: 交易所日线行情, 即 get_futures_daily 的返回值, 可以包含多个交易所和多年的数据
+    :type daily_df: pandas.DataFrame
+    :param spot_df: 现货价格, 即 futures_spot_price_daily 的返回值; 为空时只计算展期收益率
+    :type spot_df: pandas.DataFrame
+    :param rule: choice of {"open_interest", "volume"}, 按持仓量或者成交量最大确定主力合约
+    :type rule: str
+    :param confirm_days: 新合约连续 confirm_days 天持仓量(或者成交量)最大后才换月
+    :type confirm_days: int
+    :param monotonic: 主力合约是否只向更远的交割月切换, 不切回已经放弃的近月合约
+    :type monotonic: bool
+    :param output: choice of {"tidy": "每行为一个交易日的一个品种", "wide": "以日期为索引, 列为 (字段, 品种)"}; 宽表的 to_numpy() 可以变形为 (日期, 字段, 品种) 的三维数组
+    :type output: str
+    :return: 展期收益率和基差
+    :rtype: pandas.DataFrame
+    """
+    if output not in ("tidy", "wide"):
+        raise ValueError("output must be one of {'tidy', 'wide'}")
+    panel = _futures_panel(daily_df)
+    price = "settle" if "settle" in panel.columns else "close"
+    table_df = _main_contract_table(panel, rule, confirm_days, monotonic)
+    # _futures_panel 按交割月排序, 每个品种每天的第一行即为临近交割合约
+    near_df = panel.drop_duplicates(subset=["variety", "trade_date"])[
+        ["variety", "trade_date", "symbol", price]
+    ].rename(columns={"symbol": "near_contract", price: "near_price"})
+    if spot_df is None or spot_df.empty:
+        spot_df = pd.DataFrame(columns=["variety", "trade_date", "spot_price"])
+    else:
+        spot_df = spot_df[["date", "symbol", "spot_price"]].rename(
+            columns={"symbol": "variety"}
+        )
+        spot_df["variety"] = spot_df["variety"].astype(str).str.upper()
+        spot_df["trade_date"] = pd.to_datetime(spot_df["date"].astype(str))
+        spot_df["spot_price"] = pd.to_numeric(spot_df["spot_price"], errors="coerce")
+        spot_df = spot_df.drop_duplicates(subset=["variety", "trade_date"], keep="last")
+    temp_df = table_df.merge(near_df, on=["variety", "trade_date"], how="left").merge(
+        spot_df[["variety", "trade_date", "spot_price"]],
+        on=["variety", "trade_date"],
+        how="left",
+    )
+    temp_df["spot_price"] = temp_df["spot_price"].astype(float)
+    temp_df["dom_contract"] = temp_df["symbol_main"]
+    temp_df["dom_price"] = temp_df[f"{price}_main"]
+    temp_df["sub_contract"] = temp_df["symbol_sub"]
+    temp_df["roll_yield"] = _annualized_roll_yield(
+        temp_df["close_main"],
+        temp_df["close_sub"],
+        temp_df["month_index_sub"] - temp_df["month_index_main"],
+    )
+    spot_price = temp_df["spot_price"].where(temp_df["spot_price"] > 0)
+    temp_df["near_basis"] = temp_df["near_price"] - spot_price
+    temp_df["dom_basis"] = temp_df["dom_price"] - spot_price
+    temp_df["near_basis_rate"] = temp_df["near_price"] / spot_price - 1
+    temp_df["dom_basis_rate"] = temp_df["dom_price"] / spot_price - 1
+    temp_df["date"] = temp_df["trade_date"].dt.strftime("%Y%m%d")
+    temp_df.sort_values(by=["trade_date", "variety"], inplace=True)
+    temp_df.reset_index(drop=True, inplace=True)
+    if output == "wide":
+        return temp_df.pivot(index="date", columns="variety", values=_PANEL_FIELDS)
+    return temp_df[
+        [
+            "date",
+            "variety",
+            "spot_price",
+            "near_contract",
+            "near_price",
+            "dom_contract",
+            "dom_price",
+            "sub_contract",
+            *_PANEL_FIELDS[3:],
+        ]
+    ]
+
+
+def futures_roll_yield_basis_daily(
+    start_day: str = "20250708",
+    end_day: str = "20250709",
+    vars_list: list = cons.contract_symbols,
+    output: str = "tidy",
+) -> pd.DataFrame:
+    """
+    指定时间段内所有品种的展期收益率、基差和基差率
+    交易所日线行情和现货价格各获取一次, 再由 futures_basis_panel 统一计算
+    https://www.100ppi.com/sf/
+    :param start_day: 开始日期 format：YYYYMMDD
+    :type start_day: str
+    :param end_day: 结束日期 format：YYYYMMDD
+    :type end_day: str
+    :param vars_list: 合约品种如 [RB, AL]; 默认参数为所有商品
+    :type vars_list: list
+    :param output: choice of {"tidy", "wide"}, 参见 futures_basis_panel
+    :type output: str
+    :return: 展期收益率和基差
+    :rtype: pandas.DataFrame
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        daily_future = executor.submit(
+            propagate_context(get_futures_daily_markets), start_day, end_day
+        )
+        spot_future = executor.submit(
+            propagate_context(futures_spot_price_daily), start_day, end_day, vars_list
+        )
+        daily_df = daily_future.result()
+        spot_df = spot_future.result()
+    if daily_df.empty:
+        return pd.DataFrame()
+    daily_df = daily_df[daily_df["variety"].str.upper().isin(vars_list)]
+    return futures_basis_panel(daily_df, spot_df, output=output)
+
+
 if __name__ == "__main__":
+    futures_roll_yield_basis_daily_df = futures_roll_yield_basis_daily(
+        start_day="20250708", end_day="20250709"
+    )
+    print(futures_roll_yield_basis_daily_df)
+
     futures_spot_price_daily_df = futures_spot_price_daily(
         start_day="20250708", end_day="20250709", vars_list=["BZ", "RB"]
     )
@@ -0,0 +1,340 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 23:00
+Desc: 期货主力合约连续数据
+基于交易所日线行情(get_futures_daily 的返回值, 可以包含多个交易所和多年的数据),
+一次分组计算所有品种每天的主力和次主力合约、复权连续数据和展期收益率期限结构, 不再逐日或者逐品种请求
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+_PRICE_COLUMNS = ["open", "high", "low", "close", "settle"]
+_NUMERIC_COLUMNS = [*_PRICE_COLUMNS, "volume", "open_interest"]
+
+
+def _futures_panel(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    整理交易所日线行情: 只保留期货合约(去掉期权和期转现), 转换数值, 计算交割月序号
+    :param df: 交易所日线行情
+    :type df: pandas.DataFrame
+    :return: 带有 trade_date(交易日) 和 month_index(交割年份 * 12 + 交割月份 - 1) 的日线行情
+    :rtype: pandas.DataFrame
+    """
+    temp_df = df[df["symbol"].astype(str).str.match(r"^[A-Za-z]{1,2}\d{3,4}$")].copy()
+    temp_df["variety"] = temp_df["variety"].astype(str).str.upper()
+    for item in _NUMERIC_COLUMNS:
+        if item in temp_df.columns:
+            temp_df[item] = pd.to_numeric(temp_df[item], errors="coerce")
+    temp_df["trade_date"] = pd.to_datetime(temp_df["date"].astype(str))
+    digits = temp_df["symbol"].str.extract(r"(\d+)$")[0]
+    trade_year = temp_df["trade_date"].dt.year.to_numpy()
+    year_part = digits.str[:-2].astype(int).to_numpy()
+    # 郑商所合约代码只有年份的最后一位, 交割年份不早于交易年份
+    year = np.where(
+        digits.str.len().to_numpy() == 4,
+        2000 + year_part,
+        trade_year - trade_year % 10 + year_part,
+    )
+    year = np.where(year < trade_year, year + 10, year)
+    temp_df["month_index"] = year * 12 + digits.str[-2:].astype(int).to_numpy() - 1
+    temp_df.drop_duplicates(
+        subset=["variety", "trade_date", "month_index"], keep="last", inplace=True
+    )
+    temp_df.sort_values(by=["variety", "trade_date", "month_index"], inplace=True)
+    temp_df.reset_index(drop=True, inplace=True)
+    return temp_df
+
+
+def _main_month(
+    panel: pd.DataFrame, rule: str, confirm_days: int, monotonic: bool
+) -> pd.DataFrame:
+    """
+    按换月规则计算每个品种每天的主力合约交割月序号
+    :param panel: _futures_panel 整理后的日线行情
+    :type panel: pandas.DataFrame
+    :param rule: choice of {"open_interest", "volume"}, 按持仓量或者成交量最大确定主力合约
+    :type rule: str
+    :param confirm_days: 新合约连续 confirm_days 天最大后才换月
+    :type confirm_days: int
+    :param monotonic: 主力合约是否只向更远的交割月切换
+    :type monotonic: bool
+    :return: variety, trade_date, main_month
+    :rtype: pandas.DataFrame
+    """
+    if rule not in ("open_interest", "volume"):
+        raise ValueError("rule must be one of {'open_interest', 'volume'}")
+    candidate_df = (
+        panel.sort_values(
+            by=["variety", "trade_date", rule, "month_index"],
+            ascending=[True, True, False, True],
+            kind="mergesort",
+        )
+        .drop_duplicates(subset=["variety", "trade_date"])
+        .sort_values(by=["variety", "trade_date"])
+        .reset_index(drop=True)
+    )
+    candidate = candidate_df["month_index"]
+    group = candidate_df["variety"]
+    month = candidate
+    if confirm_days > 1:
+        run_id = (candidate != candidate.groupby(group).shift()).cumsum()
+        run_length = candidate.groupby(run_id).cumcount() + 1
+        # 每个品种的第一天直接采用候选合约, 之后的候选合约需要连续领先 confirm_days 天
+        is_first = candidate.groupby(group).cumcount() == 0
+        month = candidate.where((run_length >= confirm_days) | is_first)
+        month = month.groupby(group).ffill()
+    if monotonic:
+        month = month.groupby(group).cummax()
+    # 换月规则选出的合约当天没有行情(例如已经交割)时使用当天的候选合约
+    key = pd.MultiIndex.from_arrays([group, candidate_df["trade_date"], month])
+    exists = key.isin(
+        pd.MultiIndex.from_frame(panel[["variety", "trade_date", "month_index"]])
+    )
+    candidate_df["main_month"] = np.where(exists, month, candidate).astype(int)
+    return candidate_df[["variety", "trade_date", "main_month"]]
+
+
+def _main_contract_table(
+    panel: pd.DataFrame, rule: str, confirm_days: int, monotonic: bool
+) -> pd.DataFrame:
+    """
+    主力合约和次主力合约, 次主力合约为交割月晚于主力合约的合约中持仓量(或者成交量)最大的合约
+    :param panel: _futures_panel 整理后的日线行情
+    :type panel: pandas.DataFrame
+    :return: 主力合约和次主力合约的代码、收盘价、结算价和交割月序号, 以 _main 和 _sub 区分
+    :rtype: pandas.DataFrame
+    """
+    main_df = _main_month(panel, rule, confirm_days, monotonic)
+    merged_df = panel.merge(main_df, on=["variety", "trade_date"])
+    near_df = merged_df[merged_df["month_index"] == merged_df["main_month"]]
+    far_df = (
+        merged_df[merged_df["month_index"] > merged_df["main_month"]]
+        .sort_values(
+            by=["variety", "trade_date", rule, "month_index"],
+            ascending=[True, True, False, True],
+            kind="mergesort",
+        )
+        .drop_duplicates(subset=["variety", "trade_date"])
+    )
+    column_list = ["variety", "trade_date", "symbol", "close", "month_index"]
+    if "settle" in panel.columns:
+        column_list.append("settle")
+    table_df = near_df[column_list].merge(
+        far_df[column_list],
+        on=["variety", "trade_date"],
+        how="left",
+        suffixes=("_main", "_sub"),
+    )
+    return table_df
+
+
+def _annualized_roll_yield(
+    near_close: pd.Series, far_close: pd.Series, months: pd.Series
+) -> pd.Series:
+    """
+    年化展期收益率 ln(近月价格 / 远月价格) / 相差月数 * 12, 价格非正或者月数为 0 时为空
+    :param near_close: 近月合约价格
+    :type near_close: pandas.Series
+    :param far_close: 远月合约价格
+    :type far_close: pandas.Series
+    :param months: 远月合约与近月合约相差的月数
+    :type months: pandas.Series
+    :return: 年化展期收益率
+    :rtype: pandas.Series
+    """
+    valid = (near_close > 0) & (far_close > 0) & (months != 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        roll_yield = np.log(near_close / far_close) / months * 12
+    return roll_yield.where(valid)
+
+
+def futures_main_contract_daily(
+    df: pd.DataFrame,
+    rule: str = "open_interest",
+    confirm_days: int = 1,
+    monotonic: bool = True,
+) -> pd.DataFrame:
+    """
+    期货-每个品种每天的主力合约和次主力合约, 以及两者之间的展期收益率
+    :param df: 交易所日线行情, 即 get_futures_daily 的返回值, 可以包含多个交易所和多年的数据
+    :type df: pandas.DataFrame
+    :param rule: choice of {"open_interest", "volume"}, 按持仓量或者成交量最大确定主力合约
+    :type rule: str
+    :param confirm_days: 新合约连续 confirm_days 天持仓量(或者成交量)最大后才换月
+    :type confirm_days: int
+    :param monotonic: 主力合约是否只向更远的交割月切换, 不切回已经放弃的近月合约
+    :type monotonic: bool
+    :return: 主力合约和次主力合约
+    :rtype: pandas.DataFrame
+    """
+    panel = _futures_panel(df)
+    if panel.empty:
+        return pd.DataFrame(
+            columns=[
+                "date",
+                "variety",
+                "main_contract",
+                "sub_main_contract",
+                "roll_yield",
+            ]
+        )
+    table_df = _main_contract_table(panel, rule, confirm_days, monotonic)
+    table_df["roll_yield"] = _annualized_roll_yield(
+        table_df["close_main"],
+        table_df["close_sub"],
+        table_df["month_index_sub"] - table_df["month_index_main"],
+    )
+    table_df["date"] = table_df["trade_date"].dt.strftime("%Y%m%d")
+    table_df.rename(
+        columns={"symbol_main": "main_contract", "symbol_sub": "sub_main_contract"},
+        inplace=True,
+    )
+    table_df.sort_values(by=["trade_date", "variety"], inplace=True)
+    table_df.reset_index(drop=True, inplace=True)
+    return table_df[
+        ["date", "variety", "main_contract", "sub_main_contract", "roll_yield"]
+    ]
+
+
+def futures_continuous_daily(
+    df: pd.DataFrame,
+    adjust: str = "",
+    variety: Optional[str] = None,
+    rule: str = "open_interest",
+    confirm_days: int = 1,
+    monotonic: bool = True,
+) -> pd.DataFrame:
+    """
+    期货-主力合约连续数据, 换月当天以新旧合约的收盘价之比或者之差调整之前的价格, 最新的价格不变
+    :param df: 交易所日线行情, 即 get_futures_daily 的返回值, 可以包含多个交易所和多年的数据
+    :type df: pandas.DataFrame
+    :param adjust: choice of {"": "不复权", "ratio": "等比复权", "difference": "等差复权"}
+    :type adjust: str
+    :param variety: 品种, 例如 "RB"; 默认为所有品种
+    :type variety: str
+    :param rule: choice of {"open_interest", "volume"}, 按持仓量或者成交量最大确定主力合约
+    :type rule: str
+    :param confirm_days: 新合约连续 confirm_days 天持仓量(或者成交量)最大后才换月
+    :type confirm_days: int
+    :param monotonic: 主力合约是否只向更远的交割月切换, 不切回已经放弃的近月合约
+    :type monotonic: bool
+    :return: 主力合约连续数据
+    :rtype: pandas.DataFrame
+    """
+    if adjust not in ("", "ratio", "difference"):
+        raise ValueError("adjust must be one of {'', 'ratio', 'difference'}")
+    panel = _futures_panel(df)
+    if variety is not None:
+        panel = panel[panel["variety"] == variety.upper()]
+    column_list = [
+        "date",
+        "variety",
+        "symbol",
+        *[item for item in _NUMERIC_COLUMNS if item in panel.columns],
+    ]
+    if panel.empty:
+        return pd.DataFrame(columns=column_list)
+    main_df = _main_month(panel, rule, confirm_days, monotonic)
+    temp_df = panel.merge(
+        main_df.rename(columns={"main_month": "month_index"}),
+        on=["variety", "trade_date", "month_index"],
+    )
+    temp_df.sort_values(by=["variety", "trade_date"], inplace=True)
+    temp_df.reset_index(drop=True, inplace=True)
+    if adjust:
+        # 换月当天新合约与旧合约的收盘价之比(之差), 旧合约当天没有行情时不调整
+        temp_df["old_symbol"] = temp_df.groupby("variety")["symbol"].shift()
+        old_df = panel[["variety", "trade_date", "symbol", "close"]].rename(
+            columns={"symbol": "old_symbol", "close": "old_close"}
+        )
+        temp_df = temp_df.merge(
+            old_df, on=["variety", "trade_date", "old_symbol"], how="left"
+        )
+        is_roll = temp_df["old_symbol"].notna() & (
+            temp_df["old_symbol"] != temp_df["symbol"]
+        )
+        reverse_df = temp_df.iloc[::-1]
+        if adjust == "ratio":
+            gap = (temp_df["close"] / temp_df["old_close"]).where(is_roll)
+            gap = gap.where(np.isfinite(gap) & (gap > 0), 1.0)
+            total = gap.iloc[::-1].groupby(reverse_df["variety"]).cumprod().iloc[::-1]
+            factor = total / gap
+            for item in _PRICE_COLUMNS:
+                if item in temp_df.columns:
+                    temp_df[item] = temp_df[item] * factor
+        else:
+            gap = (temp_df["close"] - temp_df["old_close"]).where(is_roll)
+            gap = gap.fillna(0.0)
+            total = gap.iloc[::-1].groupby(reverse_df["variety"]).cumsum().iloc[::-1]
+            factor = total - gap
+            for item in _PRICE_COLUMNS:
+                if item in temp_df.columns:
+                    temp_df[item] = temp_df[item] + factor
+    temp_df["date"] = temp_df["trade_date"].dt.strftime("%Y%m%d")
+    return temp_df[column_list]
+
+
+def futures_roll_yield_term_structure(
+    df: pd.DataFrame,
+    rule: str = "open_interest",
+    confirm_days: int = 1,
+    monotonic: bool = True,
+) -> pd.DataFrame:
+    """
+    期货-展期收益率期限结构, 每个品种每天的各合约相对于主力合约的年化展期收益率
+    :param df: 交易所日线行情, 即 get_futures_daily 的返回值, 可以包含多个交易所和多年的数据
+    :type df: pandas.DataFrame
+    :param rule: choice of {"open_interest", "volume"}, 按持仓量或者成交量最大确定主力合约
+    :type rule: str
+    :param confirm_days: 新合约连续 confirm_days 天持仓量(或者成交量)最大后才换月
+    :type confirm_days: int
+    :param monotonic: 主力合约是否只向更远的交割月切换, 不切回已经放弃的近月合约
+    :type monotonic: bool
+    :return: 展期收益率期限结构, months 为合约与主力合约相差的月数, 主力合约的展期收益率为空
+    :rtype: pandas.DataFrame
+    """
+    column_list = ["date", "variety", "symbol", "close", "months", "roll_yield"]
+    panel = _futures_panel(df)
+    if panel.empty:
+        return pd.DataFrame(columns=column_list)
+    main_df = _main_month(panel, rule, confirm_days, monotonic)
+    temp_df = panel.merge(main_df, on=["variety", "trade_date"])
+    main_close_df = temp_df.loc[
+        temp_df["month_index"] == temp_df["main_month"],
+        ["variety", "trade_date", "close"],
+    ].rename(columns={"close": "main_close"})
+    temp_df = temp_df.merge(main_close_df, on=["variety", "trade_date"], how="left")
+    temp_df["months"] = temp_df["month_index"] - temp_df["main_month"]
+    temp_df["roll_yield"] = _annualized_roll_yield(
+        temp_df["main_close"], temp_df["close"], temp_df["months"]
+    )
+    temp_df["date"] = temp_df["trade_date"].dt.strftime("%Y%m%d")
+    temp_df.sort_values(by=["trade_date", "variety", "month_index"], inplace=True)
+    temp_df.reset_index(drop=True, inplace=True)
+    return temp_df[column_list]
+
+
+if __name__ == "__main__":
+    from akshare.futures.futures_daily_bar import get_futures_daily
+
+    get_futures_daily_df = get_futures_daily(
+        start_date="20250601", end_date="20250710", market="SHFE"
+    )
+    futures_main_contract_daily_df = futures_main_contract_daily(
+        get_futures_daily_df, confirm_days=3
+    )
+    print(futures_main_contract_daily_df)
+
+    futures_continuous_daily_df = futures_continuous_daily(
+        get_futures_daily_df, adjust="ratio", variety="RB"
+    )
+    print(futures_continuous_daily_df)
+
+    futures_roll_yield_term_structure_df = futures_roll_yield_term_structure(
+        get_futures_daily_df
+    )
+    print(futures_roll_yield_term_structure_df)
@@ -9,6 +9,7 @@ import datetime
 import json
 import re
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO, StringIO
 
 import numpy as np
@@ -17,6 +18,7 @@ import requests
 
 from akshare.futures import cons
 from akshare.futures.requests_fun import requests_link
+from akshare.utils.instrument import propagate_context
 
 calendar = cons.get_calendar()
 
@@ -691,6 +693,36 @@ def get_futures_daily(
         return pd.DataFrame()
 
 
+def get_futures_daily_markets(
+    start_date: str = "20220208",
+    end_date: str = "20220208",
+    market_list: tuple = ("dce", "cffex", "shfe", "czce", "gfex"),
+) -> pd.DataFrame:
+    """
+    多个交易所的日交易数据, 各交易所并发获取
+    :param start_date: 开始日期 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象
+    :type start_date: str
+    :param end_date: 结束数据 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象
+    :type end_date: str
+    :param market_list: 交易所列表, 参见 get_futures_daily 的 market 参数
+    :type market_list: tuple
+    :return: 交易所日交易数据
+    :rtype: pandas.DataFrame
+    """
+
+    def _fetch(market: str) -> pd.DataFrame:
+        return get_futures_daily(
+            start_date=start_date, end_date=end_date, market=market
+        )
+
+    with ThreadPoolExecutor(max_workers=max(1, len(market_list))) as executor:
+        df_list = list(executor.map(propagate_context(_fetch), market_list))
+    df_list = [temp_df for temp_df in df_list if not temp_df.empty]
+    if len(df_list) == 0:
+        return pd.DataFrame()
+    return pd.concat(df_list, ignore_index=True)
+
+
 if __name__ == "__main__":
     get_futures_daily_df = get_futures_daily(
         start_date="20250708", end_date="20250708", market="DCE"
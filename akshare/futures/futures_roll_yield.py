@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/7/16 17:40
+Date: 2026/10/19 23:00
 Desc: 中国期货各合约展期收益率
 日线数据从 daily_bar 函数获取, 需要在收盘后运行
 """
@@ -11,10 +11,15 @@ import re
 import warnings
 
 import math
+import numpy as np
 import pandas as pd
 
 from akshare.futures import cons
-from akshare.futures.futures_daily_bar import get_futures_daily
+from akshare.futures.futures_continuous import _futures_panel
+from akshare.futures.futures_daily_bar import (
+    get_futures_daily,
+    get_futures_daily_markets,
+)
 from akshare.futures.symbol_var import symbol_market, symbol_varieties
 
 calendar = cons.get_calendar()
@@ -71,6 +76,41 @@ def get_roll_yield(date=None, var="BB", symbol1=None, symbol2=None, df=None):
         return math.log(close2 / close1) / c * 12, symbol1, symbol2
 
 
+def _roll_yield_top_two(df: pd.DataFrame, by: str) -> pd.DataFrame:
+    """
+    按 by 分组, 以持仓量最大的两个合约计算展期收益率, 与 get_roll_yield 的口径一致
+    :param df: 交易所日线行情
+    :type df: pandas.DataFrame
+    :param by: choice of {"trade_date", "variety"}
+    :type by: str
+    :return: 展期收益率, 以 by 为索引, 列为 roll_yield, near_by, deferred
+    :rtype: pandas.DataFrame
+    """
+    panel = _futures_panel(df)
+    panel = panel.sort_values(
+        by=[by, "open_interest"], ascending=[True, False], kind="mergesort"
+    )
+    rank = panel.groupby(by).cumcount()
+    first_df = panel[rank == 0].set_index(by)
+    second_df = panel[rank == 1].set_index(by)
+    pair_df = first_df.join(second_df, lsuffix="_1", rsuffix="_2", how="inner")
+    first_is_near = pair_df["month_index_1"] < pair_df["month_index_2"]
+    near_close = pair_df["close_1"].where(first_is_near, pair_df["close_2"])
+    far_close = pair_df["close_2"].where(first_is_near, pair_df["close_1"])
+    months = (pair_df["month_index_1"] - pair_df["month_index_2"]).abs()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        roll_yield = np.log(near_close / far_close) / months * 12
+    valid = (near_close != 0) & (far_close != 0) & (months != 0)
+    result_df = pd.DataFrame(
+        {
+            "roll_yield": roll_yield,
+            "near_by": pair_df["symbol_1"].where(first_is_near, pair_df["symbol_2"]),
+            "deferred": pair_df["symbol_2"].where(first_is_near, pair_df["symbol_1"]),
+        }
+    )
+    return result_df[valid & roll_yield.notna()]
+
+
 def get_roll_yield_bar(
     type_method: str = "var",
     var: str = "RB",
@@ -108,55 +148,25 @@ def get_roll_yield_bar(
         return df
 
     if type_method == "var":
-        df = pd.DataFrame()
-        for market in ["dce", "cffex", "shfe", "czce", "gfex"]:
-            df = pd.concat(
-                [
-                    df,
-                    get_futures_daily(start_date=date, end_date=date, market=market),
-                ]
-            )
-        var_list = list(set(df["variety"]))
-        for i_remove in ["IO", "MO", "HO"]:
-            if i_remove in var_list:
-                var_list.remove(i_remove)
-        df_l = pd.DataFrame()
-        for var in var_list:
-            ry = get_roll_yield(date, var, df=df)
-            if ry:
-                df_l = pd.concat(
-                    [
-                        df_l,
-                        pd.DataFrame(
-                            [ry],
-                            index=[var],
-                            columns=["roll_yield", "near_by", "deferred"],
-                        ),
-                    ]
-                )
+        # 各交易所并发获取一次, 再按品种分组计算
+        df = get_futures_daily_markets(start_date=date, end_date=date)
+        if df.empty:
+            return pd.DataFrame()
+        df = df[~df["variety"].isin(["IO", "MO", "HO"])]
+        df_l = _roll_yield_top_two(df, by="variety")
         df_l["date"] = date
         df_l = df_l.sort_values("roll_yield")
         return df_l
 
     if type_method == "date":
-        df_l = pd.DataFrame()
-        while start_day <= end_day:
-            try:
-                ry = get_roll_yield(start_day, var)
-                if ry:
-                    df_l = pd.concat(
-                        [
-                            df_l,
-                            pd.DataFrame(
-                                [ry],
-                                index=[start_day],
-                                columns=["roll_yield", "near_by", "deferred"],
-                            ),
-                        ]
-                    )
-            except:  # noqa: E722
-                pass
-            start_day += datetime.timedelta(days=1)
+        # 一次获取整个区间的日线行情, 再按日期分组计算
+        df = get_futures_daily(
+            start_date=start_day, end_date=end_day, market=symbol_market(var)
+        )
+        if df.empty:
+            return pd.DataFrame()
+        df_l = _roll_yield_top_two(df[df["variety"] == var], by="trade_date")
+        df_l.index = df_l.index.date
         return df_l
 
 
@@ -21,25 +21,22 @@ from akshare.futures.cons import (
     zh_match_main_contract_payload,
 )
 from akshare.futures.futures_contract_detail import futures_contract_detail
-from akshare.utils import demjson
+from akshare.utils import lenient_json
+from akshare.utils.http_cache import fetch_parsed
+from akshare.utils.single_flight import single_flight
 
 
-@lru_cache()
-def futures_symbol_mark() -> pd.DataFrame:
+def _parse_symbol_mark(content: bytes) -> pd.DataFrame:
     """
-    期货的品种和代码映射
-    https://vip.stock.finance.sina.com.cn/quotes_service/view/js/qihuohangqing.js
+    期货的品种和代码映射-解析 qihuohangqing.js
+    :param content: 文件内容
+    :type content: bytes
     :return: 期货的品种和代码映射
     :rtype: pandas.DataFrame
     """
-    url = (
-        "https://vip.stock.finance.sina.com.cn/quotes_service/view/js/qihuohangqing.js"
-    )
-    r = requests.get(url)
-    r.encoding = "gb2312"
-    data_text = r.text
+    data_text = str(content, "gb2312", errors="replace")
     raw_json = data_text[data_text.find("{") : data_text.find("}") + 1]
-    data_json = demjson.decode(raw_json)
+    data_json = lenient_json.decode(raw_json)
     czce_mark_list = [item[1] for item in data_json["czce"][1:]]
     dce_mark_list = [item[1] for item in data_json["dce"][1:]]
     shfe_mark_list = [item[1] for item in data_json["shfe"][1:]]
@@ -88,6 +85,21 @@ def futures_symbol_mark() -> pd.DataFrame:
     return temp_df
 
 
+@lru_cache()
+@single_flight
+def futures_symbol_mark() -> pd.DataFrame:
+    """
+    期货的品种和代码映射
+    https://vip.stock.finance.sina.com.cn/quotes_service/view/js/qihuohangqing.js
+    :return: 期货的品种和代码映射
+    :rtype: pandas.DataFrame
+    """
+    url = (
+        "https://vip.stock.finance.sina.com.cn/quotes_service/view/js/qihuohangqing.js"
+    )
+    return fetch_parsed(url, parser=_parse_symbol_mark, namespace="sina")
+
+
 def futures_zh_realtime(symbol: str = "PTA") -> pd.DataFrame:
     """
     期货品种当前时刻所有可交易的合约实时数据
@@ -148,7 +160,7 @@ def zh_subscribe_exchange_symbol(symbol: str = "cffex") -> pd.DataFrame:
     r = requests.get(zh_subscribe_exchange_symbol_url)
     r.encoding = "gbk"
     data_text = r.text
-    data_json = demjson.decode(
+    data_json = lenient_json.decode(
         data_text[data_text.find("{") : data_text.find("};") + 1]
     )
     if symbol == "czce":
@@ -185,7 +197,7 @@ def match_main_contract(symbol: str = "cffex") -> str:
         res = requests.get(
             zh_match_main_contract_url, params=zh_match_main_contract_payload
         )
-        data_json = demjson.decode(res.text)
+        data_json = lenient_json.decode(res.text)
         data_df = pd.DataFrame(data_json)
         try:
             main_contract = data_df[data_df.iloc[:, 3:].duplicated()]
@@ -1,16 +1,17 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/7/21 15:00
+Date: 2026/10/19 23:00
 Desc: 每日注册仓单数据
 大连商品交易所, 上海期货交易所, 郑州商品交易所, 广州期货交易所
+futures_receipt_collect 按 (交易所, 交易日) 并发采集并增量保存到本地仓库, 用于长时间段的回补
 """
 
 import datetime
 import re
 import warnings
 from io import BytesIO
-from typing import List
+from typing import Callable, List, Optional, Tuple
 
 import pandas as pd
 import requests
@@ -18,6 +19,8 @@ import requests
 from akshare.futures import cons
 from akshare.futures.requests_fun import requests_link, pandas_read_html_link
 from akshare.futures.symbol_var import chinese_to_english
+from akshare.utils.batch import default_limiter, run_batch
+from akshare.utils.store import LocalStore
 
 calendar = cons.get_calendar()
 shfe_20100126 = pd.DataFrame(
@@ -58,19 +61,20 @@ def get_dce_receipt(date: str = None, vars_list: List = cons.contract_symbols):
     }
     r = requests.post(url, json=payload)
     data_json = r.json()
-    temp_df = pd.DataFrame(data_json['data']['entityList'])
+    temp_df = pd.DataFrame(data_json["data"]["entityList"])
     records = pd.DataFrame()
-    for x in temp_df.to_dict(orient="records"):
-        if isinstance(x["variety"], str):
-            if x["variety"][-2:] == "小计":
-                var = x["variety"][:-2]
-                temp_data = {
-                    "var": chinese_to_english(var),
-                    "receipt": int(x["wbillQty"]),
-                    "receipt_chg": int(x["diff"]),
-                    "date": date.strftime("%Y%m%d"),
-                }
-                records = pd.concat([records, pd.DataFrame(temp_data, index=[0])])
+    if not temp_df.empty:
+        subtotal_df = temp_df[temp_df["variety"].str.endswith("小计", na=False)]
+        records = pd.DataFrame(
+            {
+                "var": [
+                    chinese_to_english(item[:-2]) for item in subtotal_df["variety"]
+                ],
+                "receipt": subtotal_df["wbillQty"].astype(int).to_numpy(),
+                "receipt_chg": subtotal_df["diff"].astype(int).to_numpy(),
+                "date": date.strftime("%Y%m%d"),
+            }
+        )
 
     if len(records.index) != 0:
         records.index = records["var"]
@@ -131,8 +135,9 @@ def get_shfe_receipt_1(
         ]
         url = cons.SHFE_RECEIPT_URL_1 % date
         data = pandas_read_html_link(url)[0]
-        indexes = [x for x in data.index if (data[0].tolist()[x] in var_list)]
-        last_index = [x for x in data.index if "注" in str(data[0].tolist()[x])][0] - 1
+        first_column = data[0].astype(str)
+        indexes = data.index[first_column.isin(var_list)].tolist()
+        last_index = data.index[first_column.str.contains("注")][0] - 1
         records = pd.DataFrame()
         for i in list(range(len(indexes))):
             if i != len(indexes) - 1:
@@ -185,29 +190,22 @@ def get_shfe_receipt_2(
     data = pd.DataFrame(context["o_cursor"])
     if len(data.columns) < 1:
         return pd.DataFrame()
-    records = pd.DataFrame()
-    for var in set(data["VARNAME"].tolist()):
-        data_cut = data[data["VARNAME"] == var]
-        if "BC" in var:
-            data_dict = {
-                "var": "BC",
-                "receipt": int(data_cut["WRTWGHTS"].tolist()[-1]),
-                "receipt_chg": int(data_cut["WRTCHANGE"].tolist()[-1]),
-                "date": date,
-            }
-        else:
-            data_dict = {
-                "var": chinese_to_english(re.sub(r"\W|[a-zA-Z]", "", var)),
-                "receipt": int(data_cut["WRTWGHTS"].tolist()[-1]),
-                "receipt_chg": int(data_cut["WRTCHANGE"].tolist()[-1]),
-                "date": date,
-            }
-        records = pd.concat([records, pd.DataFrame(data_dict, index=[0])])
-        temp_records = (
-            records.groupby("var")[["receipt", "receipt_chg"]].sum().reset_index()
-        )
-        temp_records["date"] = date
-        records = temp_records
+    # 每个品种取最后一行(合计), 同一品种的不同名称(例如沥青仓库和沥青厂库)合并
+    last_df = data.drop_duplicates(subset=["VARNAME"], keep="last")
+    records = pd.DataFrame(
+        {
+            "var": [
+                "BC"
+                if "BC" in var
+                else chinese_to_english(re.sub(r"\W|[a-zA-Z]", "", var))
+                for var in last_df["VARNAME"]
+            ],
+            "receipt": last_df["WRTWGHTS"].astype(int).to_numpy(),
+            "receipt_chg": last_df["WRTCHANGE"].astype(int).to_numpy(),
+        }
+    )
+    records = records.groupby("var")[["receipt", "receipt_chg"]].sum().reset_index()
+    records["date"] = date
     if len(records.index) != 0:
         records.index = records["var"]
         vars_in_market = [i for i in vars_list if i in records.index]
@@ -241,8 +239,9 @@ def get_czce_receipt_1(date: str = None, vars_list: List = cons.contract_symbols
     context = r.text
     data = pd.read_html(context)[1]
     records = pd.DataFrame()
-    indexes = [x for x in data.index if "品种：" in str(data[0].tolist()[x])]
-    ends = [x for x in data.index if "总计" in str(data[0].tolist()[x])]
+    first_column = data[0].astype(str)
+    indexes = data.index[first_column.str.contains("品种：")].tolist()
+    ends = data.index[first_column.str.contains("总计")].tolist()
     for i in list(range(len(indexes))):
         if i != len(indexes) - 1:
             data_cut = data.loc[indexes[i]: ends[i], :]
@@ -303,9 +302,9 @@ def get_czce_receipt_2(date: str = None, vars_list: List = cons.contract_symbols
     records = pd.DataFrame()
     for data_cut in data:
         if len(data_cut.columns) > 3:
-            last_indexes = [
-                x for x in data_cut.index if "注：" in str(data_cut[0].tolist()[x])
-            ]
+            last_indexes = data_cut.index[
+                data_cut[0].astype(str).str.contains("注：")
+            ].tolist()
             if len(last_indexes) > 0:
                 last_index = last_indexes[0] - 1
                 data_cut = data_cut.loc[:last_index, :]
@@ -363,33 +362,12 @@ def get_czce_receipt_3(
         url = f"http://www.czce.com.cn/cn/DFSStaticFiles/Future/{date[:4]}/{date}/FutureDataWhsheet.xls"
     r = requests_link(url, encoding="utf-8", headers=cons.shfe_headers)
     temp_df = pd.read_excel(BytesIO(r.content))
-    temp_df = temp_df[
-        [
-            bool(1 - item)
-            for item in [
-                item if item is not pd.NA else False
-                for item in temp_df.iloc[:, 0].str.contains("非农产品")
-            ]
-        ]
-    ]
+    temp_df = temp_df[~temp_df.iloc[:, 0].str.contains("非农产品", na=False)]
     temp_df.reset_index(inplace=True, drop=True)
-    range_list_one = list(
-        temp_df[
-            [
-                item if not pd.isnull(item) else False
-                for item in temp_df.iloc[:, 0].str.contains("品种")
-            ]
-        ].index
-    )
-    range_list_two = list(
-        temp_df[
-            [
-                item if not pd.isnull(item) else False
-                for item in temp_df.iloc[:, 0].str.contains("品种")
-            ]
-        ].index
-    )[1:]
-    range_list_two.append(None)
+    range_list_one = temp_df.index[
+        temp_df.iloc[:, 0].str.contains("品种", na=False)
+    ].tolist()
+    range_list_two = range_list_one[1:] + [None]
     symbol_list = []
     receipt_list = []
     receipt_chg_list = []
@@ -507,15 +485,48 @@ def get_gfex_receipt(
     )
     result_df = result_df[["var", "receipt", "receipt_chg", "date"]]
     result_df.set_index(keys=["var"], inplace=True)
-    if "LC" not in result_df.index:
-        vars_list.remove("LC")
-    if "PS" not in result_df.index:
-        vars_list.remove("PS")
-    result_df = result_df.loc[vars_list, :]
+    vars_in_market = [i for i in vars_list if i in result_df.index]
+    result_df = result_df.loc[vars_in_market, :]
     result_df.reset_index(inplace=True)
     return result_df
 
 
+def _receipt_func(market: str, day: datetime.date) -> Optional[Callable]:
+    """
+    交易所在指定交易日对应的注册仓单接口
+    :param market: choice of {"dce", "shfe", "czce", "gfex"}
+    :type market: str
+    :param day: 交易日
+    :type day: datetime.date
+    :return: 注册仓单接口, 该交易所在该日期没有仓单数据时返回 None
+    :rtype: callable
+    """
+    if market == "dce":
+        return get_dce_receipt if day >= datetime.date(2009, 4, 7) else None
+    if market == "shfe":
+        if datetime.date(2008, 10, 6) <= day <= datetime.date(2014, 5, 16):
+            return get_shfe_receipt_1
+        return get_shfe_receipt_2 if day > datetime.date(2014, 5, 16) else None
+    if market == "gfex":
+        return get_gfex_receipt if day > datetime.date(2022, 12, 22) else None
+    if market == "czce":
+        if datetime.date(2008, 3, 3) <= day <= datetime.date(2010, 8, 24):
+            return get_czce_receipt_1
+        if datetime.date(2010, 8, 24) < day <= datetime.date(2015, 11, 11):
+            return get_czce_receipt_2
+        return get_czce_receipt_3 if day > datetime.date(2015, 11, 11) else None
+    return None
+
+
+# 各交易所开始每个交易日更新仓单数据的说明
+_RECEIPT_START_NOTE = {
+    "dce": "20090407 起，大连商品交易所每个交易日更新仓单数据",
+    "shfe": "20081006 起，上海期货交易所每个交易日更新仓单数据",
+    "gfex": "20221223 起，广州期货交易所每个交易日更新仓单数据",
+    "czce": "20080303 起，郑州商品交易所每个交易日更新仓单数据",
+}
+
+
 def get_receipt(
     start_date: str = None,
     end_date: str = None,
@@ -551,52 +562,14 @@ def get_receipt(
         else:
             print(start_date)
             for market, market_vars in cons.market_exchange_symbols.items():
-                if market == "dce":
-                    if start_date >= datetime.date(2009, 4, 7):
-                        f = get_dce_receipt
-                    else:
-                        print("20090407 起，大连商品交易所每个交易日更新仓单数据")
-                        f = None
-                elif market == "shfe":
-                    if (
-                        datetime.date(2008, 10, 6)
-                        <= start_date
-                        <= datetime.date(2014, 5, 16)
-                    ):
-                        f = get_shfe_receipt_1
-                    elif start_date > datetime.date(2014, 5, 16):
-                        f = get_shfe_receipt_2
-                    else:
-                        f = None
-                        print("20081006 起，上海期货交易所每个交易日更新仓单数据")
-                elif market == "gfex":
-                    if start_date > datetime.date(2022, 12, 22):
-                        f = get_gfex_receipt
-                    else:
-                        f = None
-                        print("20081006 起，上海期货交易所每个交易日更新仓单数据")
-                elif market == "czce":
-                    if (
-                        datetime.date(2008, 3, 3)
-                        <= start_date
-                        <= datetime.date(2010, 8, 24)
-                    ):
-                        f = get_czce_receipt_1
-                    elif (
-                        datetime.date(2010, 8, 24)
-                        < start_date
-                        <= datetime.date(2015, 11, 11)
-                    ):
-                        f = get_czce_receipt_2
-                    elif start_date > datetime.date(2015, 11, 11):
-                        f = get_czce_receipt_3
-                    else:
-                        f = None
-                        print("20080303 起，郑州商品交易所每个交易日更新仓单数据")
+                if market == "cffex":
+                    continue
+                f = _receipt_func(market, start_date)
+                if f is None:
+                    print(_RECEIPT_START_NOTE[market])
                 get_vars = [var for var in vars_list if var in market_vars]
-                if market != "cffex" and get_vars != []:
-                    if f is not None:
-                        records = pd.concat([records, f(start_date, get_vars)])
+                if get_vars != [] and f is not None:
+                    records = pd.concat([records, f(start_date, get_vars)])
         start_date += datetime.timedelta(days=1)
     records.reset_index(drop=True, inplace=True)
     if records.empty:
@@ -604,6 +577,131 @@ def get_receipt(
     return records
 
 
+_RECEIPT_HOST = {
+    "dce": "www.dce.com.cn",
+    "shfe": "www.shfe.com.cn",
+    "czce": "www.czce.com.cn",
+    "gfex": "www.gfex.com.cn",
+}
+_RECEIPT_COLUMNS = ["var", "receipt", "receipt_chg", "date", "market"]
+_store = LocalStore(namespace="futures_receipt")
+
+
+def _receipt_job(market: str, date: str) -> pd.DataFrame:
+    """
+    单个交易所单个交易日的全部品种注册仓单
+    :param market: choice of {"dce", "shfe", "czce", "gfex"}
+    :type market: str
+    :param date: 交易日 format：YYYYMMDD
+    :type date: str
+    :return: 注册仓单数据
+    :rtype: pandas.DataFrame
+    """
+    day = cons.convert_date(date)
+    f = _receipt_func(market, day)
+    with default_limiter.limit(_RECEIPT_HOST[market]):
+        temp_df = f(day, list(cons.market_exchange_symbols[market]))
+    if temp_df is None or temp_df.empty:
+        return pd.DataFrame(columns=_RECEIPT_COLUMNS)
+    temp_df = temp_df[["var", "receipt", "receipt_chg"]].copy()
+    temp_df["receipt"] = pd.to_numeric(temp_df["receipt"], errors="coerce")
+    temp_df["receipt_chg"] = pd.to_numeric(temp_df["receipt_chg"], errors="coerce")
+    temp_df["date"] = date
+    temp_df["market"] = market
+    return temp_df
+
+
+def futures_receipt_collect(
+    start_date: str = "20250701",
+    end_date: str = "20250710",
+    vars_list: List = cons.contract_symbols,
+    max_workers: int = 8,
+    refresh: bool = False,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    大宗商品-注册仓单数据-批量采集
+    按 (交易所, 交易日) 并发获取全部品种的仓单数据并追加到本地仓库; 再次运行时只获取本地没有的 (交易所, 交易日)
+    :param start_date: 开始日期 format：YYYYMMDD
+    :type start_date: str
+    :param end_date: 结束日期 format：YYYYMMDD
+    :type end_date: str
+    :param vars_list: 合约品种如 RB、AL 等列表, 只影响返回的数据, 本地仓库总是保存全部品种
+    :type vars_list: list
+    :param max_workers: 最大并发数
+    :type max_workers: int
+    :param refresh: 是否忽略本地仓库重新获取
+    :type refresh: bool
+    :return: 注册仓单数据和错误表
+    :rtype: tuple
+    """
+    start_date = cons.convert_date(start_date).strftime("%Y%m%d")
+    end_date = cons.convert_date(end_date).strftime("%Y%m%d")
+    fetched_df = None if refresh else _store.read("fetched")
+    fetched_set = (
+        set()
+        if fetched_df is None
+        else set(zip(fetched_df["market"], fetched_df["date"]))
+    )
+    task_list = [
+        {"market": market, "date": date}
+        for date in calendar
+        if start_date <= date <= end_date
+        for market in _RECEIPT_HOST
+        if (market, date) not in fetched_set
+        and _receipt_func(market, cons.convert_date(date)) is not None
+    ]
+    # 分批写入本地仓库, 长时间的回补中断后已完成的部分不会丢失
+    today = datetime.date.today().strftime("%Y%m%d")
+    chunk_size = max(1, max_workers) * 20
+    error_list = []
+    for i in range(0, len(task_list), chunk_size):
+        chunk_list = task_list[i : i + chunk_size]
+        result_list, error_df = run_batch(
+            _receipt_job, chunk_list, max_workers=max_workers
+        )
+        error_list.append(error_df)
+        data_list = [
+            temp_df
+            for temp_df in result_list
+            if temp_df is not None and not temp_df.empty
+        ]
+        if data_list:
+            _store.append(
+                "receipt",
+                pd.concat(data_list, ignore_index=True),
+                subset=["market", "date", "var"],
+            )
+        # 当天的仓单可能尚未发布, 不记为已获取
+        done_list = [
+            task
+            for task, temp_df in zip(chunk_list, result_list)
+            if temp_df is not None and task["date"] < today
+        ]
+        if done_list:
+            _store.append("fetched", pd.DataFrame(done_list), subset=["market", "date"])
+    big_df = _store.read("receipt")
+    if big_df is None:
+        big_df = pd.DataFrame(columns=_RECEIPT_COLUMNS)
+    big_df = big_df[
+        (big_df["date"] >= start_date)
+        & (big_df["date"] <= end_date)
+        & big_df["var"].isin(vars_list)
+    ]
+    big_df = big_df.sort_values(by=["date", "market", "var"], ignore_index=True)
+    error_df = (
+        pd.concat(error_list, ignore_index=True)
+        if error_list
+        else pd.DataFrame(columns=["market", "date", "error_type", "error"])
+    )
+    return big_df[["var", "receipt", "receipt_chg", "date"]], error_df
+
+
 if __name__ == "__main__":
+    futures_receipt_collect_df, futures_receipt_collect_error_df = (
+        futures_receipt_collect(start_date="20251027", end_date="20251031")
+    )
+    print(futures_receipt_collect_df)
+    print(futures_receipt_collect_error_df)
+
     get_receipt_df = get_receipt(start_date="20251031", end_date="20251103", vars_list=['MA'])
     print(get_receipt_df)
@@ -1,20 +1,24 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/6/17 14:00
+Date: 2026/10/19 12:00
 Desc: 股票指数成份股数据, 新浪有两个接口, 这里使用老接口:
 新接口：https://vip.stock.finance.sina.com.cn/mkt/#zhishu_000001
 老接口：https://vip.stock.finance.sina.com.cn/corp/view/vII_NewestComponent.php?page=1&indexid=399639
 """
 
 import math
-from io import BytesIO, StringIO
+from io import StringIO
+from typing import List, Optional, Tuple
 
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
-from akshare.utils import demjson
+from akshare.utils import lenient_json
+from akshare.utils.batch import run_batch
+from akshare.utils.excel import read_excel_bytes, read_excel_bytes_list
+from akshare.utils.http_cache import fetch_parsed, fetch_with_validators
 
 
 def index_stock_cons_sina(symbol: str = "000300") -> pd.DataFrame:
@@ -49,7 +53,8 @@ def index_stock_cons_sina(symbol: str = "000300") -> pd.DataFrame:
             }
             r = requests.get(url, params=params)
             temp_df = pd.concat(
-                objs=[temp_df, pd.DataFrame(demjson.decode(r.text))], ignore_index=True
+                objs=[temp_df, pd.DataFrame(lenient_json.decode(r.text))],
+                ignore_index=True,
             )
         return temp_df
 
@@ -63,7 +68,7 @@ def index_stock_cons_sina(symbol: str = "000300") -> pd.DataFrame:
         "_s_r_a": "setlen",
     }
     r = requests.get(url, params=params)
-    temp = pd.DataFrame(demjson.decode(r.text))
+    temp = pd.DataFrame(lenient_json.decode(r.text))
     return temp
 
 
@@ -123,21 +128,14 @@ def index_stock_cons(symbol: str = "399639") -> pd.DataFrame:
     return temp_df
 
 
-def index_stock_cons_csindex(symbol: str = "000300") -> pd.DataFrame:
+def _index_stock_cons_csindex_clean(temp_df: pd.DataFrame) -> pd.DataFrame:
     """
-    中证指数网站-成份股目录
-    https://www.csindex.com.cn/zh-CN/indices/index-detail/000300
-    :param symbol: 指数代码, 可以通过 ak.index_stock_info() 函数获取
-    :type symbol: str
-    :return: 最新指数的成份股
+    中证指数网站-成份股目录-字段整理
+    :param temp_df: 原始数据
+    :type temp_df: pandas.DataFrame
+    :return: 整理后的数据
     :rtype: pandas.DataFrame
     """
-    url = (
-        f"https://oss-ch.csindex.com.cn/static/"
-        f"html/csindex/public/uploads/file/autofile/cons/{symbol}cons.xls"
-    )
-    r = requests.get(url)
-    temp_df = pd.read_excel(BytesIO(r.content))
     temp_df.columns = [
         "日期",
         "指数代码",
@@ -157,21 +155,14 @@ def index_stock_cons_csindex(symbol: str = "000300") -> pd.DataFrame:
     return temp_df
 
 
-def index_stock_cons_weight_csindex(symbol: str = "000300") -> pd.DataFrame:
+def _index_stock_cons_weight_csindex_clean(temp_df: pd.DataFrame) -> pd.DataFrame:
     """
-    中证指数网站-样本权重
-    https://www.csindex.com.cn/zh-CN/indices/index-detail/000300
-    :param symbol: 指数代码, 可以通过 ak.index_stock_info() 接口获取
-    :type symbol: str
-    :return: 最新指数的成份股权重
+    中证指数网站-样本权重-字段整理
+    :param temp_df: 原始数据
+    :type temp_df: pandas.DataFrame
+    :return: 整理后的数据
     :rtype: pandas.DataFrame
     """
-    url = (
-        f"https://oss-ch.csindex.com.cn/static/html/csindex/"
-        f"public/uploads/file/autofile/closeweight/{symbol}closeweight.xls"
-    )
-    r = requests.get(url)
-    temp_df = pd.read_excel(BytesIO(r.content))
     temp_df.columns = [
         "日期",
         "指数代码",
@@ -193,6 +184,144 @@ def index_stock_cons_weight_csindex(symbol: str = "000300") -> pd.DataFrame:
     return temp_df
 
 
+def _parse_csindex_cons(content: bytes) -> pd.DataFrame:
+    return _index_stock_cons_csindex_clean(read_excel_bytes(content))
+
+
+def _parse_csindex_weight(content: bytes) -> pd.DataFrame:
+    return _index_stock_cons_weight_csindex_clean(read_excel_bytes(content))
+
+
+_CSINDEX_CONS_URL = (
+    "https://oss-ch.csindex.com.cn/static/"
+    "html/csindex/public/uploads/file/autofile/cons/{}cons.xls"
+)
+_CSINDEX_WEIGHT_URL = (
+    "https://oss-ch.csindex.com.cn/static/html/csindex/"
+    "public/uploads/file/autofile/closeweight/{}closeweight.xls"
+)
+
+
+def _fetch_csindex_file_list(
+    url_template: str, symbol_list: List[str], max_workers: int = 8
+) -> Tuple[List[bytes], pd.DataFrame]:
+    """
+    中证指数网站-并发下载文件, 原始文件按 ETag/Last-Modified 缓存
+    返回 404 的指数视为没有该文件直接跳过, 其他错误重试后记入错误表
+    :param url_template: 文件地址模板, 例如 _CSINDEX_CONS_URL
+    :type url_template: str
+    :param symbol_list: 指数代码列表
+    :type symbol_list: list
+    :param max_workers: 最大并发数
+    :type max_workers: int
+    :return: 下载成功的文件内容列表和错误表(symbol, error_type, error)
+    :rtype: tuple
+    """
+    session = requests.Session()
+
+    def _fetch(symbol: str) -> Optional[bytes]:
+        try:
+            return fetch_with_validators(
+                url_template.format(symbol), namespace="csindex", session=session
+            )
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            raise
+
+    content_list, error_df = run_batch(
+        _fetch,
+        [{"symbol": symbol} for symbol in symbol_list],
+        max_workers=max_workers,
+        host="oss-ch.csindex.com.cn",
+    )
+    return [item for item in content_list if item is not None], error_df
+
+
+def index_stock_cons_csindex(symbol: str = "000300") -> pd.DataFrame:
+    """
+    中证指数网站-成份股目录
+    https://www.csindex.com.cn/zh-CN/indices/index-detail/000300
+    :param symbol: 指数代码, 可以通过 ak.index_stock_info() 函数获取
+    :type symbol: str
+    :return: 最新指数的成份股
+    :rtype: pandas.DataFrame
+    """
+    url = _CSINDEX_CONS_URL.format(symbol)
+    return fetch_parsed(url, parser=_parse_csindex_cons, namespace="csindex")
+
+
+def index_stock_cons_weight_csindex(symbol: str = "000300") -> pd.DataFrame:
+    """
+    中证指数网站-样本权重
+    https://www.csindex.com.cn/zh-CN/indices/index-detail/000300
+    :param symbol: 指数代码, 可以通过 ak.index_stock_info() 接口获取
+    :type symbol: str
+    :return: 最新指数的成份股权重
+    :rtype: pandas.DataFrame
+    """
+    url = _CSINDEX_WEIGHT_URL.format(symbol)
+    return fetch_parsed(url, parser=_parse_csindex_weight, namespace="csindex")
+
+
+def index_stock_cons_csindex_batch(
+    symbol_list: List[str], max_workers: int = 8, processes: Optional[int] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    中证指数网站-成份股目录-批量
+    并发下载所有指数的文件, 在进程池中解析, 合并后统一整理字段; 没有成份股文件(404)的指数会被跳过
+    https://www.csindex.com.cn/zh-CN/indices/index-detail/000300
+    :param symbol_list: 指数代码列表, 例如 ["000300", "000905"]
+    :type symbol_list: list
+    :param max_workers: 最大下载并发数
+    :type max_workers: int
+    :param processes: 解析进程数, 默认为 CPU 核数
+    :type processes: int
+    :return: 所有指数的成份股和下载失败的错误表(symbol, error_type, error)
+    :rtype: tuple
+    """
+    content_list, error_df = _fetch_csindex_file_list(
+        _CSINDEX_CONS_URL, symbol_list, max_workers=max_workers
+    )
+    if not content_list:
+        temp_df = pd.DataFrame(columns=range(9))
+        return _index_stock_cons_csindex_clean(temp_df), error_df
+    temp_list = read_excel_bytes_list(content_list, processes=processes)
+    for temp_df in temp_list:
+        temp_df.columns = range(temp_df.shape[1])
+    temp_df = pd.concat(temp_list, ignore_index=True)
+    return _index_stock_cons_csindex_clean(temp_df), error_df
+
+
+def index_stock_cons_weight_csindex_batch(
+    symbol_list: List[str], max_workers: int = 8, processes: Optional[int] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    中证指数网站-样本权重-批量
+    并发下载所有指数的文件, 在进程池中解析, 合并后统一整理字段; 没有权重文件(404)的指数会被跳过
+    https://www.csindex.com.cn/zh-CN/indices/index-detail/000300
+    :param symbol_list: 指数代码列表, 例如 ["000300", "000905"]
+    :type symbol_list: list
+    :param max_workers: 最大下载并发数
+    :type max_workers: int
+    :param processes: 解析进程数, 默认为 CPU 核数
+    :type processes: int
+    :return: 所有指数的成份股权重和下载失败的错误表(symbol, error_type, error)
+    :rtype: tuple
+    """
+    content_list, error_df = _fetch_csindex_file_list(
+        _CSINDEX_WEIGHT_URL, symbol_list, max_workers=max_workers
+    )
+    if not content_list:
+        temp_df = pd.DataFrame(columns=range(10))
+        return _index_stock_cons_weight_csindex_clean(temp_df), error_df
+    temp_list = read_excel_bytes_list(content_list, processes=processes)
+    for temp_df in temp_list:
+        temp_df.columns = range(temp_df.shape[1])
+    temp_df = pd.concat(temp_list, ignore_index=True)
+    return _index_stock_cons_weight_csindex_clean(temp_df), error_df
+
+
 def stock_a_code_to_symbol(symbol: str = "000300") -> str:
     """
     输入股票代码判断股票市场
@@ -216,6 +345,15 @@ if __name__ == "__main__":
     )
     print(index_stock_cons_weight_csindex_df)
 
+    (
+        index_stock_cons_weight_csindex_batch_df,
+        index_stock_cons_weight_csindex_batch_error_df,
+    ) = index_stock_cons_weight_csindex_batch(
+        symbol_list=["000300", "000905", "000852"]
+    )
+    print(index_stock_cons_weight_csindex_batch_df)
+    print(index_stock_cons_weight_csindex_batch_error_df)
+
     index_stock_cons_sina_df = index_stock_cons_sina(symbol="000300")
     print(index_stock_cons_sina_df)
 
@@ -6,11 +6,12 @@ Desc: 中证指数网站-指数列表
 网站：https://www.csindex.com.cn/#/indices/family/list?index_series=1
 """
 import warnings
-from io import BytesIO
 
 import pandas as pd
 import requests
 
+from akshare.utils.excel import read_excel_bytes
+
 
 def index_csindex_all() -> pd.DataFrame:
     """
@@ -52,7 +53,7 @@ def index_csindex_all() -> pd.DataFrame:
     }
     r = requests.post(url, json=playloads, headers=headers)
 
-    temp_df = pd.read_excel(BytesIO(r.content))
+    temp_df = read_excel_bytes(r.content)
     temp_df["基日"] = pd.to_datetime(
         temp_df["基日"], format="%Y-%m-%d", errors="coerce"
     ).dt.date
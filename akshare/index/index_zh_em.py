@@ -5,15 +5,12 @@ Date: 2025/3/11 17:00
 Desc: 东方财富网-指数行情数据
 """
 
-from functools import lru_cache
-
 import pandas as pd
 import requests
 
-from akshare.utils.func import fetch_paginated_data
+from akshare.utils.security_master import get_code_id_dict_em
 
 
-@lru_cache()
 def index_code_id_map_em() -> dict:
     """
     东方财富-股票和市场代码
@@ -21,22 +18,7 @@ def index_code_id_map_em() -> dict:
     :return: 股票和市场代码
     :rtype: dict
     """
-    url = "https://80.push2.eastmoney.com/api/qt/clist/get"
-    params = {
-        "pn": "1",
-        "pz": "100",
-        "po": "1",
-        "np": "1",
-        "ut": "bd1d9ddb04089700cf9c27f6f7426281",
-        "fltt": "2",
-        "invt": "2",
-        "fid": "f3",
-        "fs": "b:MK0010,m:1+t:1,m:0 t:5,m:1+s:3,m:0+t:5,m:2",
-        "fields": "f3,f12,f13",
-    }
-    temp_df = fetch_paginated_data(url, params)
-    code_id_dict = dict(zip(temp_df["f12"], temp_df["f13"]))
-    return code_id_dict
+    return get_code_id_dict_em("index")
 
 
 def index_zh_a_hist(
@@ -11,6 +11,21 @@ import re
 import pandas as pd
 from curl_cffi import requests
 
+from akshare.utils.session_cache import session_cache
+
+_BAIDU_HEADERS = {
+    "accept": "application/vnd.finance-web.v1+json",
+    "accept-encoding": "gzip, deflate, br, zstd",
+    "accept-language": "en,zh-CN;q=0.9,zh;q=0.8",
+    "cache-control": "no-cache",
+    "origin": "https://gushitong.baidu.com",
+    "pragma": "no-cache",
+    "priority": "u=1, i",
+    "referer": "https://gushitong.baidu.com/",
+    "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+                  "Chrome/142.0.0.0 Safari/537.36"
+}
+
 
 def _get_baidu_cookie(headers: dict) -> str:
     """
@@ -74,6 +89,14 @@ def _get_baidu_cookie(headers: dict) -> str:
         raise ValueError(f"Regex pattern error: {str(e)}") from e
 
 
+# Cookie 在一天内复用, 请求返回错误状态码时重新获取
+session_cache.register(
+    site="baidu_gushitong",
+    factory=lambda: _get_baidu_cookie(_BAIDU_HEADERS.copy()),
+    ttl=24 * 60 * 60,
+)
+
+
 def _baidu_finance_calendar(
     date: str,
     cate: str,
@@ -102,27 +125,7 @@ def _baidu_finance_calendar(
     }
 
     # 构建请求头
-    headers = {
-        "accept": "application/vnd.finance-web.v1+json",
-        "accept-encoding": "gzip, deflate, br, zstd",
-        "accept-language": "en,zh-CN;q=0.9,zh;q=0.8",
-        "cache-control": "no-cache",
-        "origin": "https://gushitong.baidu.com",
-        "pragma": "no-cache",
-        "priority": "u=1, i",
-        "referer": "https://gushitong.baidu.com/",
-        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-                      "Chrome/142.0.0.0 Safari/537.36"
-    }
-
-    # 在_baidu_finance_calendar函数中替换原代码块
-    if cookie is None:
-        try:
-            cookie = _get_baidu_cookie(headers.copy())  # 保护原始headers
-        except Exception as e:
-            # 可降级处理或保留原始行为
-            raise RuntimeError(f"Failed to obtain Baidu cookies: {str(e)}") from e
-    headers["cookie"] = cookie
+    headers = _BAIDU_HEADERS.copy()
 
     url = "https://finance.pae.baidu.com/sapi/v1/financecalendar"
     big_df = pd.DataFrame()
@@ -133,9 +136,27 @@ def _baidu_finance_calendar(
 
     # 第一次请求
     params = base_params.copy()
-    response = requests.get(url=url, params=params, headers=headers)
-    response.raise_for_status()
-    data_json = response.json()
+
+    def _first_request(cookie_str: str) -> dict:
+        headers["cookie"] = cookie_str
+        response = requests.get(url=url, params=params, headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+    if cookie is None:
+        try:
+            cookie = session_cache.get("baidu_gushitong")
+        except Exception as e:
+            # 可降级处理或保留原始行为
+            raise RuntimeError(f"Failed to obtain Baidu cookies: {str(e)}") from e
+        try:
+            data_json = _first_request(cookie)
+        except requests.exceptions.HTTPError:
+            # 缓存的 Cookie 已失效, 重新获取后重试一次
+            session_cache.invalidate("baidu_gushitong", cookie)
+            data_json = _first_request(session_cache.get("baidu_gushitong"))
+    else:
+        data_json = _first_request(cookie)
 
     # 从JSON中提取指定日期的总记录数
     if "Result" in data_json and "calendarInfo" in data_json["Result"]:
@@ -5,6 +5,7 @@ from requests.exceptions import RequestException
 
 from akshare.exceptions import NetworkError, APIError, RateLimitError, DataParsingError
 from akshare.utils.context import config
+from akshare.utils.instrument import incr, phase, record_response
 
 
 def make_request_with_retry_json(
@@ -25,12 +26,15 @@ def make_request_with_retry_json(
         proxies = config.proxies
     for attempt in range(max_retries):
         try:
-            response = requests.get(
-                url, params=params, headers=headers, proxies=proxies
-            )
+            with phase("network"):
+                response = requests.get(
+                    url, params=params, headers=headers, proxies=proxies
+                )
+            record_response(response)
             if response.status_code == 200:
                 try:
-                    data = response.json()
+                    with phase("parse"):
+                        data = response.json()
                     if not data:
                         raise DataParsingError("Empty response data")
                     return data
@@ -56,6 +60,7 @@ def make_request_with_retry_json(
                         f"Failed to connect after {max_retries} attempts: {str(e)}"
                     )
 
+            incr("retries")
             time.sleep(retry_delay)
             retry_delay *= 2  # 指数退避策略
 
@@ -80,9 +85,11 @@ def make_request_with_retry_text(
         proxies = config.proxies
     for attempt in range(max_retries):
         try:
-            response = requests.get(
-                url, params=params, headers=headers, proxies=proxies
-            )
+            with phase("network"):
+                response = requests.get(
+                    url, params=params, headers=headers, proxies=proxies
+                )
+            record_response(response)
             if response.status_code == 200:
                 try:
                     data = response.text
@@ -111,6 +118,7 @@ def make_request_with_retry_text(
                         f"Failed to connect after {max_retries} attempts: {str(e)}"
                     )
 
+            incr("retries")
             time.sleep(retry_delay)
             retry_delay *= 2  # 指数退避策略
 
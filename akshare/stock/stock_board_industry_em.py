@@ -13,9 +13,11 @@ import pandas as pd
 import requests
 
 from akshare.utils.func import fetch_paginated_data
+from akshare.utils.single_flight import single_flight
 
 
 @lru_cache()
+@single_flight
 def __stock_board_industry_name_em() -> pd.DataFrame:
     """
     东方财富网-沪深板块-行业板块-名称
@@ -112,6 +114,7 @@ def __stock_board_industry_name_em() -> pd.DataFrame:
     return temp_df
 
 
+@single_flight
 def stock_board_industry_name_em() -> pd.DataFrame:
     """
     东方财富网-沪深板块-行业板块-名称
@@ -458,14 +461,13 @@ def stock_board_industry_hist_min_em(
         return temp_df
 
 
-def stock_board_industry_cons_em(symbol: str = "小金属") -> pd.DataFrame:
+def _stock_board_industry_cons_em_request(symbol: str = "小金属") -> tuple:
     """
-    东方财富网-沪深板块-行业板块-板块成份
-    https://data.eastmoney.com/bkzj/BK1027.html
+    东方财富网-沪深板块-行业板块-板块成份-请求参数
     :param symbol: 板块名称或者板块代码
     :type symbol: str
-    :return: 板块成份
-    :rtype: pandas.DataFrame
+    :return: 网址和请求参数
+    :rtype: tuple
     """
     if re.match(pattern=r"^BK\d+", string=symbol):
         stock_board_code = symbol
@@ -488,7 +490,17 @@ def stock_board_industry_cons_em(symbol: str = "小金属") -> pd.DataFrame:
         "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18,f20,f21,"
         "f23,f24,f25,f22,f11,f62,f128,f136,f115,f152,f45",
     }
-    temp_df = fetch_paginated_data(url, params)
+    return url, params
+
+
+def _stock_board_industry_cons_em_clean(temp_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    东方财富网-沪深板块-行业板块-板块成份-整理数据
+    :param temp_df: 分页合并后的原始数据
+    :type temp_df: pandas.DataFrame
+    :return: 整理后的数据
+    :rtype: pandas.DataFrame
+    """
     temp_df.columns = [
         "序号",
         "_",
@@ -560,6 +572,20 @@ def stock_board_industry_cons_em(symbol: str = "小金属") -> pd.DataFrame:
     return temp_df
 
 
+def stock_board_industry_cons_em(symbol: str = "小金属") -> pd.DataFrame:
+    """
+    东方财富网-沪深板块-行业板块-板块成份
+    https://data.eastmoney.com/bkzj/BK1027.html
+    :param symbol: 板块名称或者板块代码
+    :type symbol: str
+    :return: 板块成份
+    :rtype: pandas.DataFrame
+    """
+    url, params = _stock_board_industry_cons_em_request(symbol)
+    temp_df = fetch_paginated_data(url, params)
+    return _stock_board_industry_cons_em_clean(temp_df)
+
+
 if __name__ == "__main__":
     stock_board_industry_name_em_df = stock_board_industry_name_em()
     print(stock_board_industry_name_em_df)
@@ -17,25 +17,20 @@ from akshare.utils.func import fetch_paginated_data
 from akshare.utils.tqdm import get_tqdm
 
 
-def stock_individual_fund_flow(
+def _stock_individual_fund_flow_request(
     stock: str = "600094", market: str = "sh"
-) -> pd.DataFrame:
+) -> tuple:
     """
-    东方财富网-数据中心-资金流向-个股
-    https://data.eastmoney.com/zjlx/detail.html
+    东方财富网-数据中心-资金流向-个股-请求参数
     :param stock: 股票代码
     :type stock: str
     :param market: 股票市场; 上海证券交易所: sh, 深证证券交易所: sz, 北京证券交易所: bj;
     :type market: str
-    :return: 近期个股的资金流数据
-    :rtype: pandas.DataFrame
+    :return: 网址和请求参数
+    :rtype: tuple
     """
     market_map = {"sh": 1, "sz": 0, "bj": 0}
     url = "https://push2his.eastmoney.com/api/qt/stock/fflow/daykline/get"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/81.0.4044.138 Safari/537.36",
-    }
     params = {
         "lmt": "0",
         "klt": "101",
@@ -45,8 +40,17 @@ def stock_individual_fund_flow(
         "ut": "b2884a393a59ad64002292a3e90d46a5",
         "_": int(time.time() * 1000),
     }
-    r = requests.get(url, params=params, headers=headers)
-    data_json = r.json()
+    return url, params
+
+
+def _stock_individual_fund_flow_clean(data_json: dict) -> pd.DataFrame:
+    """
+    东方财富网-数据中心-资金流向-个股-整理数据
+    :param data_json: 接口返回的数据
+    :type data_json: dict
+    :return: 整理后的数据
+    :rtype: pandas.DataFrame
+    """
     content_list = data_json["data"]["klines"]
     temp_df = pd.DataFrame([item.split(",") for item in content_list])
     temp_df.columns = [
@@ -119,14 +123,36 @@ def stock_individual_fund_flow(
     return temp_df
 
 
-def stock_individual_fund_flow_rank(indicator: str = "5日") -> pd.DataFrame:
+def stock_individual_fund_flow(
+    stock: str = "600094", market: str = "sh"
+) -> pd.DataFrame:
     """
-    东方财富网-数据中心-资金流向-排名
+    东方财富网-数据中心-资金流向-个股
     https://data.eastmoney.com/zjlx/detail.html
+    :param stock: 股票代码
+    :type stock: str
+    :param market: 股票市场; 上海证券交易所: sh, 深证证券交易所: sz, 北京证券交易所: bj;
+    :type market: str
+    :return: 近期个股的资金流数据
+    :rtype: pandas.DataFrame
+    """
+    url, params = _stock_individual_fund_flow_request(stock, market)
+    headers = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/81.0.4044.138 Safari/537.36",
+    }
+    r = requests.get(url, params=params, headers=headers)
+    data_json = r.json()
+    return _stock_individual_fund_flow_clean(data_json)
+
+
+def _stock_individual_fund_flow_rank_request(indicator: str = "5日") -> tuple:
+    """
+    东方财富网-数据中心-资金流向-排名-请求参数
     :param indicator: choice of {"今日", "3日", "5日", "10日"}
     :type indicator: str
-    :return: 指定 indicator 资金流向排行
-    :rtype: pandas.DataFrame
+    :return: 网址和请求参数
+    :rtype: tuple
     """
     indicator_map = {
         "今日": [
@@ -159,22 +185,21 @@ def stock_individual_fund_flow_rank(indicator: str = "5日") -> pd.DataFrame:
         "fs": "m:0+t:6+f:!2,m:0+t:13+f:!2,m:0+t:80+f:!2,m:1+t:2+f:!2,m:1+t:23+f:!2,m:0+t:7+f:!2,m:1+t:3+f:!2",
         "fields": indicator_map[indicator][1],
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = math.ceil(data_json["data"]["total"] / 100)
-    temp_list = []
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update(
-            {
-                "pn": page,
-            }
-        )
-        r = requests.get(url, params=params, timeout=15)
-        data_json = r.json()
-        inner_temp_df = pd.DataFrame(data_json["data"]["diff"])
-        temp_list.append(inner_temp_df)
-    temp_df = pd.concat(temp_list, ignore_index=True)
+    return url, params
+
+
+def _stock_individual_fund_flow_rank_clean(
+    temp_df: pd.DataFrame, indicator: str = "5日"
+) -> pd.DataFrame:
+    """
+    东方财富网-数据中心-资金流向-排名-整理数据
+    :param temp_df: 各页合并后的原始数据
+    :type temp_df: pandas.DataFrame
+    :param indicator: choice of {"今日", "3日", "5日", "10日"}
+    :type indicator: str
+    :return: 整理后的数据
+    :rtype: pandas.DataFrame
+    """
     temp_df.reset_index(inplace=True)
     temp_df["index"] = range(1, len(temp_df) + 1)
     if indicator == "今日":
@@ -344,6 +369,35 @@ def stock_individual_fund_flow_rank(indicator: str = "5日") -> pd.DataFrame:
     return temp_df
 
 
+def stock_individual_fund_flow_rank(indicator: str = "5日") -> pd.DataFrame:
+    """
+    东方财富网-数据中心-资金流向-排名
+    https://data.eastmoney.com/zjlx/detail.html
+    :param indicator: choice of {"今日", "3日", "5日", "10日"}
+    :type indicator: str
+    :return: 指定 indicator 资金流向排行
+    :rtype: pandas.DataFrame
+    """
+    url, params = _stock_individual_fund_flow_rank_request(indicator)
+    r = requests.get(url, params=params)
+    data_json = r.json()
+    total_page = math.ceil(data_json["data"]["total"] / 100)
+    temp_list = []
+    tqdm = get_tqdm()
+    for page in tqdm(range(1, total_page + 1), leave=False):
+        params.update(
+            {
+                "pn": page,
+            }
+        )
+        r = requests.get(url, params=params, timeout=15)
+        data_json = r.json()
+        inner_temp_df = pd.DataFrame(data_json["data"]["diff"])
+        temp_list.append(inner_temp_df)
+    temp_df = pd.concat(temp_list, ignore_index=True)
+    return _stock_individual_fund_flow_rank_clean(temp_df, indicator)
+
+
 def stock_market_fund_flow() -> pd.DataFrame:
     """
     东方财富网-数据中心-资金流向-大盘
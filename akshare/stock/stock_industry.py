@@ -12,7 +12,7 @@ import math
 import pandas as pd
 import requests
 
-from akshare.utils import demjson
+from akshare.utils import lenient_json
 from tqdm import tqdm
 
 
@@ -102,7 +102,7 @@ def stock_sector_detail(sector: str = "gn_gfgn") -> pd.DataFrame:
         }
         r = requests.get(url, params=params)
         data_text = r.text
-        data_json = demjson.decode(data_text)
+        data_json = lenient_json.decode(data_text)
         temp_df = pd.DataFrame(data_json)
         big_df = pd.concat([big_df, temp_df], ignore_index=True)
     big_df["trade"] = pd.to_numeric(big_df["trade"], errors="coerce")
@@ -9,6 +9,8 @@ https://quote.eastmoney.com/concept/sh603777.html?from=classic
 import pandas as pd
 import requests
 
+from akshare.utils.security_master import get_secid_em
+
 
 def stock_individual_info_em(
     symbol: str = "603777", timeout: float = None
@@ -24,7 +26,6 @@ def stock_individual_info_em(
     :rtype: pandas.DataFrame
     """
     url = "https://push2.eastmoney.com/api/qt/stock/get"
-    market_code = 1 if symbol.startswith("6") else 0
     params = {
         "fltt": "2",
         "invt": "2",
@@ -35,7 +36,7 @@ def stock_individual_info_em(
         "f110,f262,f263,f264,f267,f268,f255,f256,f257,f258,f127,f199,f128,f198,f259,f260,f261,"
         "f171,f277,f278,f279,f288,f152,f250,f251,f252,f253,f254,f269,f270,f271,f272,f273,f274,"
         "f275,f276,f265,f266,f289,f290,f286,f285,f292,f293,f294,f295,f43",
-        "secid": f"{market_code}.{symbol}",
+        "secid": get_secid_em(symbol),
     }
     r = requests.get(url, params=params, timeout=timeout)
     data_json = r.json()
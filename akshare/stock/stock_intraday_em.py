@@ -11,6 +11,8 @@ import json
 import pandas as pd
 import requests
 
+from akshare.utils.security_master import get_secid_em
+
 
 def __event_stream(url, params):
     # 使用 stream=True 参数来启用流式请求
@@ -35,7 +37,6 @@ def stock_intraday_em(symbol: str = "000001") -> pd.DataFrame:
     :return: 分时数据
     :rtype: pandas.DataFrame
     """
-    market_code = 1 if symbol.startswith("6") else 0
     url = "https://70.push2.eastmoney.com/api/qt/stock/details/sse"
     params = {
         "fields1": "f1,f2,f3,f4",
@@ -44,7 +45,7 @@ def stock_intraday_em(symbol: str = "000001") -> pd.DataFrame:
         "ut": "bd1d9ddb04089700cf9c27f6f7426281",
         "fltt": "2",
         "pos": "-0",
-        "secid": f"{market_code}.{symbol}",
+        "secid": get_secid_em(symbol),
         "wbp2u": "|0|0|0|web",
     }
 
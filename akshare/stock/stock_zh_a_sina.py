@@ -8,7 +8,11 @@ https://finance.sina.com.cn/realstock/company/sh689009/nc.shtml
 
 import json
 import re
+from datetime import date
+from functools import lru_cache
+from typing import Optional
 
+import numpy as np
 import pandas as pd
 import py_mini_racer
 import requests
@@ -23,7 +27,9 @@ from akshare.stock.cons import (
     zh_sina_a_stock_qfq_url,
     zh_sina_a_stock_amount_url,
 )
-from akshare.utils import demjson
+from akshare.utils import lenient_json
+from akshare.utils.instrument import phase, record_response
+from akshare.utils.process_pool import run_in_process_pool
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -58,7 +64,7 @@ def stock_zh_a_spot() -> pd.DataFrame:
     ):
         zh_sina_stock_payload_copy.update({"page": page})
         r = requests.get(zh_sina_a_stock_url, params=zh_sina_stock_payload_copy)
-        data_json = demjson.decode(r.text)
+        data_json = lenient_json.decode(r.text)
         big_df = pd.concat(objs=[big_df, pd.DataFrame(data_json)], ignore_index=True)
 
     big_df = big_df.astype(
@@ -124,6 +130,69 @@ def stock_zh_a_spot() -> pd.DataFrame:
     return big_df
 
 
+def _stock_zh_a_fq_factor(symbol: str, method: str) -> pd.DataFrame:
+    """
+    新浪财经-A 股-复权因子
+    :param symbol: sh600000
+    :type symbol: str
+    :param method: choice of {"qfq", "hfq"}
+    :type method: str
+    :return: 复权因子, 与新浪返回的顺序一致(日期从新到旧)
+    :rtype: pandas.DataFrame
+    """
+    url = zh_sina_a_stock_hfq_url if method == "hfq" else zh_sina_a_stock_qfq_url
+    r = requests.get(url.format(symbol))
+    r.raise_for_status()
+    factor_df = pd.DataFrame(
+        lenient_json.decode(r.text.split("=")[1].split("\n")[0])["data"]
+    )
+    if factor_df.shape[0] == 0:
+        raise ValueError(f"sina {method} factor not available")
+    factor_df.columns = ["date", f"{method}_factor"]
+    factor_df.index = pd.to_datetime(factor_df.date)
+    del factor_df["date"]
+    factor_df.reset_index(inplace=True)
+    return factor_df
+
+
+@lru_cache(maxsize=512)
+def _stock_zh_a_fq_factor_daily(
+    symbol: str, method: str, day: str
+) -> Optional[pd.DataFrame]:
+    """
+    新浪财经-A 股-复权因子, 同一交易日内按股票缓存; 没有复权因子(例如指数)时返回 None
+    网络错误直接抛出, 不会被缓存, 避免一次超时导致当天都返回不复权的数据
+    :param symbol: sh600000
+    :type symbol: str
+    :param method: choice of {"qfq", "hfq"}
+    :type method: str
+    :param day: 缓存所属的日期, 日期变化后重新下载
+    :type day: str
+    :return: 复权因子
+    :rtype: pandas.DataFrame
+    """
+    try:
+        return _stock_zh_a_fq_factor(symbol, method)
+    except (ValueError, KeyError, IndexError):
+        return None
+
+
+def _decode_hist_js(text: str) -> pd.DataFrame:
+    """
+    新浪财经-A 股-解密历史行情, 启用常驻进程池时在子进程中执行
+    :param text: 历史行情接口返回的 JS 文本
+    :type text: str
+    :return: 行情数据
+    :rtype: pandas.DataFrame
+    """
+    js_code = py_mini_racer.MiniRacer()
+    js_code.eval(hk_js_decode)
+    dict_list = js_code.call(
+        "d", text.split("=")[1].split(";")[0].replace('"', "")
+    )  # 执行js解密代码
+    return pd.DataFrame(dict_list)
+
+
 def stock_zh_a_daily(
     symbol: str = "sh603843",
     start_date: str = "19900101",
@@ -145,42 +214,14 @@ def stock_zh_a_daily(
     :rtype: pandas.DataFrame
     """
 
-    def _fq_factor(method: str) -> pd.DataFrame:
-        if method == "hfq":
-            r = requests.get(zh_sina_a_stock_hfq_url.format(symbol))
-            hfq_factor_df = pd.DataFrame(
-                eval(r.text.split("=")[1].split("\n")[0])["data"]
-            )
-            if hfq_factor_df.shape[0] == 0:
-                raise ValueError("sina hfq factor not available")
-            hfq_factor_df.columns = ["date", "hfq_factor"]
-            hfq_factor_df.index = pd.to_datetime(hfq_factor_df.date)
-            del hfq_factor_df["date"]
-            hfq_factor_df.reset_index(inplace=True)
-            return hfq_factor_df
-        else:
-            r = requests.get(zh_sina_a_stock_qfq_url.format(symbol))
-            qfq_factor_df = pd.DataFrame(
-                eval(r.text.split("=")[1].split("\n")[0])["data"]
-            )
-            if qfq_factor_df.shape[0] == 0:
-                raise ValueError("sina hfq factor not available")
-            qfq_factor_df.columns = ["date", "qfq_factor"]
-            qfq_factor_df.index = pd.to_datetime(qfq_factor_df.date)
-            del qfq_factor_df["date"]
-            qfq_factor_df.reset_index(inplace=True)
-            return qfq_factor_df
-
     if adjust in ("hfq-factor", "qfq-factor"):
-        return _fq_factor(adjust.split("-")[0])
+        return _stock_zh_a_fq_factor(symbol, adjust.split("-")[0])
 
-    r = requests.get(zh_sina_a_stock_hist_url.format(symbol))
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", r.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行js解密代码
-    data_df = pd.DataFrame(dict_list)
+    with phase("network"):
+        r = requests.get(zh_sina_a_stock_hist_url.format(symbol))
+    record_response(r)
+    with phase("js"):
+        data_df = run_in_process_pool(_decode_hist_js, r.text)
     data_df.index = pd.to_datetime(data_df["date"]).dt.date
     del data_df["date"]
     try:
@@ -194,7 +235,7 @@ def stock_zh_a_daily(
         pass
     data_df = data_df.astype("float")
     r = requests.get(zh_sina_a_stock_amount_url.format(symbol, symbol))
-    amount_data_json = demjson.decode(r.text[r.text.find("[") : r.text.rfind("]") + 1])
+    amount_data_json = lenient_json.decode(r.text[r.text.find("[") : r.text.rfind("]") + 1])
     amount_data_df = pd.DataFrame(amount_data_json)
     amount_data_df.columns = ["date", "outstanding_share"]
     amount_data_df.index = pd.to_datetime(amount_data_df.date)
@@ -345,12 +386,7 @@ def stock_zh_a_cdr_daily(
     :rtype: pandas.DataFrame
     """
     res = requests.get(zh_sina_a_stock_hist_url.format(symbol))
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", res.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行js解密代码
-    data_df = pd.DataFrame(dict_list)
+    data_df = run_in_process_pool(_decode_hist_js, res.text)
     data_df.index = pd.to_datetime(data_df["date"])
     del data_df["date"]
     data_df = data_df.astype("float")
@@ -408,66 +444,47 @@ def stock_zh_a_minute(
     if temp_df.empty:
         print(f"{symbol} 股票数据不存在，请检查是否已退市")
         return pd.DataFrame()
-    try:
-        stock_zh_a_daily(symbol=symbol, adjust="qfq")
-    except:  # noqa: E722
-        return temp_df
-
     if adjust == "":
         return temp_df
-
-    if adjust == "qfq":
-        temp_df[["date", "time"]] = temp_df["day"].str.split(" ", expand=True)
-        # 处理没有最后一分钟的情况
-        need_df = temp_df[
-            [
-                True if "09:31:00" <= item <= "15:00:00" else False
-                for item in temp_df["time"]
-            ]
-        ]
-        need_df.drop_duplicates(subset=["date"], keep="last", inplace=True)
-        need_df.index = pd.to_datetime(need_df["date"])
-        stock_zh_a_daily_qfq_df = stock_zh_a_daily(symbol=symbol, adjust="qfq")
-        stock_zh_a_daily_qfq_df.index = pd.to_datetime(stock_zh_a_daily_qfq_df["date"])
-        result_df = stock_zh_a_daily_qfq_df.iloc[-len(need_df) :, :]["close"].astype(
-            float
-        ) / need_df["close"].astype(float)
-        temp_df.index = pd.to_datetime(temp_df["date"])
-        merged_df = pd.merge(temp_df, result_df, left_index=True, right_index=True)
-        merged_df["open"] = merged_df["open"].astype(float) * merged_df["close_y"]
-        merged_df["high"] = merged_df["high"].astype(float) * merged_df["close_y"]
-        merged_df["low"] = merged_df["low"].astype(float) * merged_df["close_y"]
-        merged_df["close"] = merged_df["close_x"].astype(float) * merged_df["close_y"]
-        temp_df = merged_df[["day", "open", "high", "low", "close", "volume"]]
-        temp_df.reset_index(drop=True, inplace=True)
-        return temp_df
-    if adjust == "hfq":
-        temp_df[["date", "time"]] = temp_df["day"].str.split(" ", expand=True)
-        # 处理没有最后一分钟的情况
-        need_df = temp_df[
-            [
-                True if "09:31:00" <= item <= "15:00:00" else False
-                for item in temp_df["time"]
-            ]
-        ]
-        need_df.drop_duplicates(subset=["date"], keep="last", inplace=True)
-        need_df.index = pd.to_datetime(need_df["date"])
-        stock_zh_a_daily_hfq_df = stock_zh_a_daily(symbol=symbol, adjust="hfq")
-        stock_zh_a_daily_hfq_df.index = pd.to_datetime(stock_zh_a_daily_hfq_df["date"])
-        result_df = stock_zh_a_daily_hfq_df.iloc[-len(need_df) :, :]["close"].astype(
-            float
-        ) / need_df["close"].astype(float)
-        temp_df.index = pd.to_datetime(temp_df["date"])
-        merged_df = pd.merge(temp_df, result_df, left_index=True, right_index=True)
-        merged_df["open"] = merged_df["open"].astype(float) * merged_df["close_y"]
-        merged_df["high"] = merged_df["high"].astype(float) * merged_df["close_y"]
-        merged_df["low"] = merged_df["low"].astype(float) * merged_df["close_y"]
-        merged_df["close"] = merged_df["close_x"].astype(float) * merged_df["close_y"]
-        temp_df = merged_df[["day", "open", "high", "low", "close", "volume"]]
-        temp_df.reset_index(drop=True, inplace=True)
-        return temp_df
-    else:
+    if adjust not in ("qfq", "hfq"):
         return pd.DataFrame()
+    # 复权因子每只股票每天只下载一次, 没有复权因子(例如指数)时返回不复权的数据
+    factor_df = _stock_zh_a_fq_factor_daily(symbol, adjust, date.today().isoformat())
+    if factor_df is None:
+        return temp_df
+    return _stock_zh_a_minute_adjust(temp_df, factor_df, adjust)
+
+
+def _stock_zh_a_minute_adjust(
+    temp_df: pd.DataFrame, factor_df: pd.DataFrame, method: str
+) -> pd.DataFrame:
+    """
+    按日期对齐复权因子并复权分钟数据, 每根 K 线使用当日或之前最近的复权因子
+    :param temp_df: 不复权的分钟数据
+    :type temp_df: pandas.DataFrame
+    :param factor_df: 复权因子
+    :type factor_df: pandas.DataFrame
+    :param method: choice of {"qfq", "hfq"}
+    :type method: str
+    :return: 复权后的分钟数据
+    :rtype: pandas.DataFrame
+    """
+    # 按日期升序排列的副本只用于对齐, 不改变缓存的复权因子
+    factor_df = factor_df.sort_values(by="date", ignore_index=True)
+    factor_date = factor_df["date"].to_numpy(dtype="datetime64[ns]")
+    factor_value = pd.to_numeric(factor_df[f"{method}_factor"]).to_numpy(dtype=float)
+    minute_date = pd.to_datetime(temp_df["day"].str[:10]).to_numpy(
+        dtype="datetime64[ns]"
+    )
+    position = np.searchsorted(factor_date, minute_date, side="right") - 1
+    factor = np.where(position >= 0, factor_value[np.maximum(position, 0)], np.nan)
+    ratio = 1 / factor if method == "qfq" else factor
+    temp_df = temp_df[["day", "open", "high", "low", "close", "volume"]].copy()
+    for item in ["open", "high", "low", "close"]:
+        temp_df[item] = temp_df[item].astype(float) * ratio
+    temp_df = temp_df[~np.isnan(ratio)]
+    temp_df.reset_index(drop=True, inplace=True)
+    return temp_df
 
 
 if __name__ == "__main__":
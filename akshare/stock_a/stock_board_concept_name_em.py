@@ -1,72 +1,26 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/3/22 18:00
+Date: 2026/10/19 23:00
 Desc: 东方财富网-行情中心-沪深京板块-概念板块-名称
 https://quote.eastmoney.com/center/boardlist.html#concept_board
-异步接口-测试版
+异步接口, 使用 akshare.aio 共享的会话
 """
 
-import asyncio
-from typing import Dict, List
+from typing import List
 
-import aiohttp
 import pandas as pd
 
+from akshare.aio.client import fetch_clist_pages, run_coroutine
+from akshare.utils.single_flight import single_flight
 
-async def fetch_single_page(
-    session: aiohttp.ClientSession, url: str, params: Dict
-) -> Dict:
-    """异步获取单页数据"""
-    async with session.get(url, params=params, ssl=False) as response:
-        return await response.json()
 
-
-async def fetch_all_pages_async(url: str, base_params: Dict) -> List[Dict]:
-    """异步获取所有页面数据"""
-    # 首先获取总数以计算页数
-    first_page_params = base_params.copy()
-    first_page_params["pn"] = "1"
-
-    async with aiohttp.ClientSession() as session:
-        first_page_data = await fetch_single_page(session, url, first_page_params)
-
-        # 检查是否成功获取数据
-        if first_page_data.get("rc") != 0 or not first_page_data.get("data"):
-            return [first_page_data]  # 返回错误信息
-
-        total = first_page_data["data"]["total"]
-        page_size = int(base_params["pz"])
-        total_pages = (total + page_size - 1) // page_size
-
-        # 限制页数，避免过大请求
-        total_pages = min(total_pages, 100)
-
-        # 创建所有页面的任务
-        tasks = []
-        for page in range(1, total_pages + 1):
-            page_params = base_params.copy()
-            page_params["pn"] = str(page)
-            tasks.append(fetch_single_page(session, url, page_params))
-
-        # 并发执行所有任务
-        results = await asyncio.gather(*tasks)
-        return results
-
-
-def process_concept_board_data(page_results: List[Dict]) -> pd.DataFrame:
-    """处理概念板块数据，转换为DataFrame"""
-    all_data = []
-
-    for result in page_results:
-        if result.get("data") and result["data"].get("diff"):
-            page_data = result["data"]["diff"]
-            all_data.extend(page_data)
-
-    if not all_data:
+def process_concept_board_data(temp_list: List[pd.DataFrame]) -> pd.DataFrame:
+    """处理概念板块数据，合并每一页的数据"""
+    if not temp_list:
         return pd.DataFrame()
 
-    temp_df = pd.DataFrame(all_data)
+    temp_df = pd.concat(temp_list, ignore_index=True)
 
     # 转换数值类型，确保排序正确
     numeric_columns = ["f2", "f3", "f4", "f8", "f20", "f104", "f105", "f136"]
@@ -126,6 +80,7 @@ def process_concept_board_data(page_results: List[Dict]) -> pd.DataFrame:
     return temp_df
 
 
+@single_flight
 async def stock_board_concept_name_em_async() -> pd.DataFrame:
     """
     异步获取东方财富网-行情中心-沪深京板块-概念板块-名称
@@ -147,8 +102,8 @@ async def stock_board_concept_name_em_async() -> pd.DataFrame:
         "fields": "f2,f3,f4,f8,f12,f14,f15,f16,f17,f18,f20,f21,f24,f25,f22,f33,f11,f62,f128,f124,f107,f104,f105,f136",
     }
 
-    results = await fetch_all_pages_async(url, params)
-    return process_concept_board_data(results)
+    temp_list = await fetch_clist_pages(url, params)
+    return process_concept_board_data(temp_list)
 
 
 def stock_board_concept_name_em() -> pd.DataFrame:
@@ -158,10 +113,7 @@ def stock_board_concept_name_em() -> pd.DataFrame:
     :return: 概念板块-名称
     :rtype: pandas.DataFrame
     """
-    import nest_asyncio
-
-    nest_asyncio.apply()
-    return asyncio.run(stock_board_concept_name_em_async())
+    return run_coroutine(stock_board_concept_name_em_async)
 
 
 if __name__ == "__main__":
@@ -7,24 +7,17 @@ https://quote.eastmoney.com/concept/sz000001.html
 """
 
 from datetime import datetime
+from typing import List
 
 import pandas as pd
 import py_mini_racer
 import requests
 
+from akshare.utils.instrument import phase
+from akshare.utils.process_pool import run_in_process_pool
+from akshare.utils.security_master import get_secid_em
 
-def stock_cyq_em(symbol: str = "000001", adjust: str = "") -> pd.DataFrame:
-    """
-    东方财富网-概念板-行情中心-日K-筹码分布
-    https://quote.eastmoney.com/concept/sz000001.html
-    :param symbol: 股票代码
-    :type symbol: str
-    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
-    :type adjust: str
-    :return: 筹码分布
-    :rtype: pandas.DataFrame
-    """
-    html_str = """
+_CYQ_JS = """
     // @ts-nocheck
 
     /**
@@ -215,24 +208,20 @@ def stock_cyq_em(symbol: str = "000001", adjust: str = "") -> pd.DataFrame:
         }
         return array;
     }
+"""
+
+
+def _stock_cyq_em_calc(klines: List[str]) -> pd.DataFrame:
+    """
+    东方财富网-筹码分布-计算, 启用常驻进程池时在子进程中执行
+    :param klines: 日 K 线数据
+    :type klines: list
+    :return: 筹码分布
+    :rtype: pandas.DataFrame
     """
     js_code = py_mini_racer.MiniRacer()
-    js_code.eval(html_str)
-    adjust_dict = {"qfq": "1", "hfq": "2", "": "0"}
-    market_code = 1 if symbol.startswith("6") else 0
-    url = "https://push2his.eastmoney.com/api/qt/stock/kline/get"
-    params = {
-        "secid": f"{market_code}.{symbol}",
-        "fields1": "f1,f2,f3,f4,f5,f6",
-        "fields2": "f51,f52,f53,f54,f55,f56,f57,f58,f59,f60,f61",
-        "klt": "101",
-        "fqt": adjust_dict[adjust],
-        "end": datetime.now().date().strftime("%Y%m%d"),
-        "lmt": "210",
-    }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
+    js_code.eval(_CYQ_JS)
+    temp_df = pd.DataFrame([item.split(",") for item in klines])
     temp_df.columns = [
         "date",
         "open",
@@ -308,6 +297,34 @@ def stock_cyq_em(symbol: str = "000001", adjust: str = "") -> pd.DataFrame:
     return temp_df
 
 
+def stock_cyq_em(symbol: str = "000001", adjust: str = "") -> pd.DataFrame:
+    """
+    东方财富网-概念板-行情中心-日K-筹码分布
+    https://quote.eastmoney.com/concept/sz000001.html
+    :param symbol: 股票代码
+    :type symbol: str
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :return: 筹码分布
+    :rtype: pandas.DataFrame
+    """
+    adjust_dict = {"qfq": "1", "hfq": "2", "": "0"}
+    url = "https://push2his.eastmoney.com/api/qt/stock/kline/get"
+    params = {
+        "secid": get_secid_em(symbol),
+        "fields1": "f1,f2,f3,f4,f5,f6",
+        "fields2": "f51,f52,f53,f54,f55,f56,f57,f58,f59,f60,f61",
+        "klt": "101",
+        "fqt": adjust_dict[adjust],
+        "end": datetime.now().date().strftime("%Y%m%d"),
+        "lmt": "210",
+    }
+    r = requests.get(url, params=params)
+    data_json = r.json()
+    with phase("js"):
+        return run_in_process_pool(_stock_cyq_em_calc, data_json["data"]["klines"])
+
+
 if __name__ == "__main__":
     stock_cyq_em_df = stock_cyq_em(symbol="000001", adjust="")
     print(stock_cyq_em_df)
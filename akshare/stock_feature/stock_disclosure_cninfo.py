@@ -6,12 +6,20 @@ Desc: 巨潮资讯-首页-公告查询-信息披露
 http://www.cninfo.com.cn/new/commonUrl/pageOfSearch?url=disclosure/list/search
 """
 
+import json
 import math
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import pandas as pd
 import requests
 
+from akshare.utils.batch import default_limiter
+from akshare.utils.date_window import date_window
+from akshare.utils.http_cache import fetch_parsed
+from akshare.utils.security_master import get_org_id_dict_cninfo
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -54,7 +62,18 @@ def __get_category_dict() -> dict:
     return big_dict
 
 
-@lru_cache()
+def _parse_stock_json(content: bytes) -> dict:
+    """
+    巨潮资讯-股票代码字典-解析 stockList
+    :param content: 文件内容
+    :type content: bytes
+    :return: 股票代码字典
+    :rtype: dict
+    """
+    stock_list = json.loads(content)["stockList"]
+    return {item["code"]: item["orgId"] for item in stock_list}
+
+
 def __get_stock_json(symbol: str = "沪深京") -> dict:
     """
     获取巨潮资讯-首页-公告查询-信息披露-股票代码字典
@@ -63,10 +82,23 @@ def __get_stock_json(symbol: str = "沪深京") -> dict:
     :return: 股票代码字典
     :rtype: dict
     """
-    url = "http://www.cninfo.com.cn/new/data/szse_stock.json"
     if symbol == "沪深京":
-        url = "http://www.cninfo.com.cn/new/data/szse_stock.json"
-    elif symbol == "港股":
+        # 沪深京股票的 orgId 来自每天更新一次的证券主数据, 由其自身缓存
+        return get_org_id_dict_cninfo()
+    return __get_other_stock_json(symbol)
+
+
+@lru_cache()
+def __get_other_stock_json(symbol: str) -> dict:
+    """
+    获取巨潮资讯-港股、三板、基金和债券的代码字典, 文件按 ETag/Last-Modified 条件请求
+    :param symbol: choice of {"港股", "三板", "基金", "债券"}
+    :type symbol: str
+    :return: 股票代码字典
+    :rtype: dict
+    """
+    url = "http://www.cninfo.com.cn/new/data/szse_stock.json"
+    if symbol == "港股":
         url = "http://www.cninfo.com.cn/new/data/hke_stock.json"
     elif symbol == "三板":
         url = "http://www.cninfo.com.cn/new/data/gfzr_stock.json"
@@ -74,40 +106,27 @@ def __get_stock_json(symbol: str = "沪深京") -> dict:
         url = "http://www.cninfo.com.cn/new/data/fund_stock.json"
     elif symbol == "债券":
         url = "http://www.cninfo.com.cn/new/data/bond_stock.json"
-    r = requests.get(url)
-    text_json = r.json()
-    temp_df = pd.DataFrame([item for item in text_json["stockList"]])
-    return dict(zip(temp_df["code"], temp_df["orgId"]))
+    # 代码表很少变化, 按 ETag/Last-Modified 条件请求, 未变化时直接使用上次的解析结果
+    return fetch_parsed(url, parser=_parse_stock_json, namespace="cninfo")
 
 
-def stock_zh_a_disclosure_report_cninfo(
-    symbol: str = "000001",
-    market: str = "沪深京",
-    keyword: str = "",
-    category: str = "",
-    start_date: str = "20230618",
-    end_date: str = "20231219",
-) -> pd.DataFrame:
+_CNINFO_DISCLOSURE_URL = "http://www.cninfo.com.cn/new/hisAnnouncement/query"
+_CNINFO_HOST = "www.cninfo.com.cn"
+_CNINFO_PAGE_SIZE = 30
+
+
+def _cninfo_disclosure_payload(
+    symbol: str,
+    market: str,
+    keyword: str,
+    category: str,
+    start_date: str,
+    end_date: str,
+) -> dict:
     """
-    巨潮资讯-首页-公告查询-信息披露公告
-    http://www.cninfo.com.cn/new/commonUrl/pageOfSearch?url=disclosure/list/search
-    :param symbol: 股票代码
-    :type symbol: str
-    :param market: choice of {"沪深京", "港股", "三板", "基金", "债券", "监管", "预披露"}
-    :type market: str
-    :param keyword: 关键词
-    :type keyword: str
-    :param category: choice of {'年报', '半年报', '一季报', '三季报', '业绩预告', '权益分派',
-    '董事会', '监事会', '股东大会', '日常经营', '公司治理', '中介报告',
-     '首发', '增发', '股权激励', '配股', '解禁', '公司债', '可转债', '其他融资',
-     '股权变动', '补充更正', '澄清致歉', '风险提示', '特别处理和退市', '退市整理期'}
-    :type category: str
-    :param start_date: 开始时间
-    :type start_date: str
-    :param end_date: 开始时间
-    :type end_date: str
-    :return: 指定 symbol 的数据
-    :rtype: pandas.DataFrame
+    巨潮资讯-信息披露公告-请求参数
+    :return: 请求参数
+    :rtype: dict
     """
     column_map = {
         "沪深京": "szse",
@@ -118,16 +137,14 @@ def stock_zh_a_disclosure_report_cninfo(
         "监管": "regulator",
         "预披露": "pre_disclosure",
     }
-    stock_id_map = ""
-    if market == "沪深京" or "基金":
+    stock_item = ""
+    if symbol != "":
         stock_id_map = __get_stock_json(market)
-    category_dict = __get_category_dict()
-    url = "http://www.cninfo.com.cn/new/hisAnnouncement/query"
-    stock_item = "" if symbol == "" else f"{symbol},{stock_id_map[symbol]}"
-    category_item = "" if category == "" else f"{category_dict[category]}"
-    payload = {
+        stock_item = f"{symbol},{stock_id_map[symbol]}"
+    category_item = "" if category == "" else f"{__get_category_dict()[category]}"
+    return {
         "pageNum": "1",
-        "pageSize": "30",
+        "pageSize": str(_CNINFO_PAGE_SIZE),
         "column": column_map[market],
         "tabName": "fulltext",
         "plate": "",
@@ -142,27 +159,47 @@ def stock_zh_a_disclosure_report_cninfo(
         "sortType": "",
         "isHLtitle": "true",
     }
-    r = requests.post(url, params=payload)
-    text_json = r.json()
-    page_num = math.ceil(int(text_json["totalAnnouncement"]) / 30)
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, page_num + 1), leave=False):
-        payload.update({"pageNum": page})
-        r = requests.post(url, data=payload)
-        text_json = r.json()
-        temp_df = pd.DataFrame(text_json["announcements"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+
+
+def _cninfo_disclosure_page(payload: dict, page: int) -> dict:
+    """
+    巨潮资讯-信息披露公告-单页数据, 在巨潮资讯的限流范围内请求
+    :param payload: 请求参数
+    :type payload: dict
+    :param page: 页码
+    :type page: int
+    :return: 单页数据
+    :rtype: dict
+    """
+    with default_limiter.limit(_CNINFO_HOST):
+        r = requests.post(_CNINFO_DISCLOSURE_URL, data={**payload, "pageNum": page})
+    return r.json()
+
+
+def _cninfo_disclosure_clean(announcement_list: List[Dict]) -> pd.DataFrame:
+    """
+    巨潮资讯-信息披露公告-整理原始数据
+    :param announcement_list: 原始公告列表
+    :type announcement_list: list
+    :return: 公告数据, 包含公告ID
+    :rtype: pandas.DataFrame
+    """
+    if not announcement_list:
+        return pd.DataFrame(
+            columns=["代码", "简称", "公告标题", "公告时间", "公告链接", "公告ID"]
+        )
+    big_df = pd.DataFrame(announcement_list)
     big_df.rename(
         columns={
             "secCode": "代码",
             "secName": "简称",
             "announcementTitle": "公告标题",
             "announcementTime": "公告时间",
+            "announcementId": "公告ID",
         },
         inplace=True,
     )
-    big_df = big_df[["代码", "简称", "公告标题", "公告时间", "announcementId", "orgId"]]
+    big_df = big_df[["代码", "简称", "公告标题", "公告时间", "公告ID", "orgId"]]
     big_df["公告时间"] = pd.to_datetime(
         big_df["公告时间"], unit="ms", utc=True, errors="coerce"
     )
@@ -174,7 +211,7 @@ def stock_zh_a_disclosure_report_cninfo(
     )
     url_list = []
     for item in zip(
-        big_df["代码"], big_df["announcementId"], big_df["orgId"], big_df["公告时间"]
+        big_df["代码"], big_df["公告ID"], big_df["orgId"], big_df["公告时间"]
     ):
         url_format = (
             f"http://www.cninfo.com.cn/new/disclosure/detail?stockCode={item[0]}&"
@@ -182,10 +219,144 @@ def stock_zh_a_disclosure_report_cninfo(
         )
         url_list.append(url_format)
     big_df["公告链接"] = url_list
+    big_df = big_df[["代码", "简称", "公告标题", "公告时间", "公告链接", "公告ID"]]
+    return big_df
+
+
+@date_window(
+    max_days=90,
+    key_columns=["公告链接"],
+    sort_columns=["公告时间"],
+    ascending=False,
+)
+def stock_zh_a_disclosure_report_cninfo(
+    symbol: str = "000001",
+    market: str = "沪深京",
+    keyword: str = "",
+    category: str = "",
+    start_date: str = "20230618",
+    end_date: str = "20231219",
+) -> pd.DataFrame:
+    """
+    巨潮资讯-首页-公告查询-信息披露公告
+    http://www.cninfo.com.cn/new/commonUrl/pageOfSearch?url=disclosure/list/search
+    :param symbol: 股票代码
+    :type symbol: str
+    :param market: choice of {"沪深京", "港股", "三板", "基金", "债券", "监管", "预披露"}
+    :type market: str
+    :param keyword: 关键词
+    :type keyword: str
+    :param category: choice of {'年报', '半年报', '一季报', '三季报', '业绩预告', '权益分派',
+    '董事会', '监事会', '股东大会', '日常经营', '公司治理', '中介报告',
+     '首发', '增发', '股权激励', '配股', '解禁', '公司债', '可转债', '其他融资',
+     '股权变动', '补充更正', '澄清致歉', '风险提示', '特别处理和退市', '退市整理期'}
+    :type category: str
+    :param start_date: 开始时间, 与结束时间相差超过 90 天时自动拆分为多个请求
+    :type start_date: str
+    :param end_date: 开始时间
+    :type end_date: str
+    :return: 指定 symbol 的数据
+    :rtype: pandas.DataFrame
+    """
+    payload = _cninfo_disclosure_payload(
+        symbol, market, keyword, category, start_date, end_date
+    )
+    data_json = _cninfo_disclosure_page(payload, 1)
+    page_num = math.ceil(int(data_json["totalAnnouncement"]) / _CNINFO_PAGE_SIZE)
+    tqdm = get_tqdm()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        json_list = [data_json] + list(
+            tqdm(
+                executor.map(
+                    lambda page: _cninfo_disclosure_page(payload, page),
+                    range(2, page_num + 1),
+                ),
+                total=max(page_num - 1, 0),
+                leave=False,
+            )
+        )
+    announcement_list = [
+        item for data_json in json_list for item in data_json["announcements"] or []
+    ]
+    big_df = _cninfo_disclosure_clean(announcement_list)
     big_df = big_df[["代码", "简称", "公告标题", "公告时间", "公告链接"]]
     return big_df
 
 
+def stock_zh_a_disclosure_report_cninfo_stream(
+    symbol: str = "",
+    market: str = "沪深京",
+    keyword: str = "",
+    category: str = "",
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    since_id: Optional[str] = None,
+    max_workers: int = 4,
+) -> Iterator[pd.DataFrame]:
+    """
+    巨潮资讯-首页-公告查询-信息披露公告-按页流式返回
+    公告按时间从新到旧排列, 每获取一页就返回该页的数据; 指定 since_id 时遇到该公告即停止,
+    只返回比它新的公告, 用于盘中轮询
+    http://www.cninfo.com.cn/new/commonUrl/pageOfSearch?url=disclosure/list/search
+    :param symbol: 股票代码, 默认为全市场
+    :type symbol: str
+    :param market: choice of {"沪深京", "港股", "三板", "基金", "债券", "监管", "预披露"}
+    :type market: str
+    :param keyword: 关键词
+    :type keyword: str
+    :param category: 公告类别, 详见 stock_zh_a_disclosure_report_cninfo
+    :type category: str
+    :param start_date: 开始时间, 默认为当天
+    :type start_date: str
+    :param end_date: 结束时间, 默认为当天
+    :type end_date: str
+    :param since_id: 上次轮询得到的最新公告ID
+    :type since_id: str
+    :param max_workers: 最大并发数
+    :type max_workers: int
+    :return: 每页的公告数据, 包含公告ID
+    :rtype: Iterator[pandas.DataFrame]
+    """
+    today = datetime.now().strftime("%Y%m%d")
+    payload = _cninfo_disclosure_payload(
+        symbol, market, keyword, category, start_date or today, end_date or today
+    )
+    seen_set = set()
+
+    def _new_rows(data_json: dict) -> Tuple[pd.DataFrame, bool]:
+        announcement_list = []
+        for item in data_json["announcements"] or []:
+            announcement_id = str(item["announcementId"])
+            if since_id is not None and announcement_id == str(since_id):
+                return _cninfo_disclosure_clean(announcement_list), True
+            # 轮询期间有新公告时分页会整体后移, 跨页的重复公告只返回一次
+            if announcement_id not in seen_set:
+                seen_set.add(announcement_id)
+                announcement_list.append(item)
+        return _cninfo_disclosure_clean(announcement_list), False
+
+    data_json = _cninfo_disclosure_page(payload, 1)
+    temp_df, found = _new_rows(data_json)
+    if not temp_df.empty:
+        yield temp_df
+    if found:
+        return
+    page_num = math.ceil(int(data_json["totalAnnouncement"]) / _CNINFO_PAGE_SIZE)
+    # 轮询时每次只并发请求 max_workers 页, 找到 since_id 后不再请求后面的页
+    batch_size = max(1, max_workers) if since_id is not None else max(page_num, 1)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        for batch_start in range(2, page_num + 1, batch_size):
+            page_list = range(batch_start, min(batch_start + batch_size, page_num + 1))
+            for data_json in executor.map(
+                lambda page: _cninfo_disclosure_page(payload, page), page_list
+            ):
+                temp_df, found = _new_rows(data_json)
+                if not temp_df.empty:
+                    yield temp_df
+                if found:
+                    return
+
+
 def stock_zh_a_disclosure_relation_cninfo(
     symbol: str = "000001",
     market: str = "沪深京",
@@ -292,6 +463,9 @@ if __name__ == "__main__":
     )
     print(stock_zh_a_disclosure_report_cninfo_df)
 
+    for temp_df in stock_zh_a_disclosure_report_cninfo_stream(symbol="", market="沪深京"):
+        print(temp_df)
+
     stock_zh_a_disclosure_relation_cninfo_df = stock_zh_a_disclosure_relation_cninfo(
         symbol="000001", market="沪深京", start_date="20230619", end_date="20231220"
     )
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/8/15 18:00
+Date: 2026/10/19 11:00
 Desc: 同花顺-数据中心-资金流向
 同花顺-数据中心-资金流向-个股资金流
 https://data.10jqka.com.cn/funds/ggzjl/#refCountId=data_55f13c2c_254
@@ -13,29 +13,56 @@ https://data.10jqka.com.cn/funds/hyzjl/#refCountId=data_55f13c2c_254
 https://data.10jqka.com.cn/funds/ddzz/#refCountId=data_55f13c2c_254
 """
 
-from io import StringIO
+from typing import Dict
 
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
-import py_mini_racer
-from akshare.utils.tqdm import get_tqdm
 
-from akshare.datasets import get_ths_js
+from akshare.utils.html_table import (
+    fetch_html_page,
+    fetch_html_pages,
+    get_html_page_count,
+    html_tables_to_df,
+)
+from akshare.utils.ths_cookie import get_ths_v_code, reset_ths_v_code
 
 
-def _get_file_content_ths(file: str = "ths.js") -> str:
+def _fetch_ths_fund_flow_table(url: str, referer: str) -> pd.DataFrame:
     """
-    获取 JS 文件的内容
-    :param file:  JS 文件名
-    :type file: str
-    :return: 文件内容
-    :rtype: str
+    同花顺-数据中心-资金流向-并发获取所有分页的表格
+    :param url: 网址, 其中的 {} 为页码占位符
+    :type url: str
+    :param referer: 请求头中的 Referer
+    :type referer: str
+    :return: 所有分页合并后的表格
+    :rtype: pandas.DataFrame
     """
-    setting_file_path = get_ths_js(file)
-    with open(setting_file_path, encoding="utf-8") as f:
-        file_data = f.read()
-    return file_data
+
+    def _get_headers() -> Dict:
+        return {
+            "Accept": "text/html, */*; q=0.01",
+            "Accept-Encoding": "gzip, deflate",
+            "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "hexin-v": get_ths_v_code(),
+            "Host": "data.10jqka.com.cn",
+            "Pragma": "no-cache",
+            "Referer": referer,
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/90.0.4430.85 Safari/537.36",
+            "X-Requested-With": "XMLHttpRequest",
+        }
+
+    html_text = fetch_html_page(
+        url.format(1), headers_func=_get_headers, auth_error_func=reset_ths_v_code
+    )
+    total_page = get_html_page_count(html_text)
+    html_list = [html_text] + fetch_html_pages(
+        url_list=[url.format(page) for page in range(2, total_page + 1)],
+        headers_func=_get_headers,
+        auth_error_func=reset_ths_v_code,
+    )
+    return html_tables_to_df(html_list)
 
 
 def stock_fund_flow_individual(symbol: str = "即时") -> pd.DataFrame:
@@ -47,29 +74,6 @@ def stock_fund_flow_individual(symbol: str = "即时") -> pd.DataFrame:
     :return: 个股资金流
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
-    headers = {
-        "Accept": "text/html, */*; q=0.01",
-        "Accept-Encoding": "gzip, deflate",
-        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-        "Cache-Control": "no-cache",
-        "Connection": "keep-alive",
-        "hexin-v": v_code,
-        "Host": "data.10jqka.com.cn",
-        "Pragma": "no-cache",
-        "Referer": "http://data.10jqka.com.cn/funds/hyzjl/",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/90.0.4430.85 Safari/537.36",
-        "X-Requested-With": "XMLHttpRequest",
-    }
-    url = "http://data.10jqka.com.cn/funds/ggzjl/field/code/order/desc/ajax/1/free/1/"
-    r = requests.get(url, headers=headers)
-    soup = BeautifulSoup(r.text, features="lxml")
-    raw_page = soup.find(name="span", attrs={"class": "page_info"}).text
-    page_num = raw_page.split("/")[1]
     if symbol == "3日排行":
         url = "http://data.10jqka.com.cn/funds/ggzjl/board/3/field/zdf/order/desc/page/{}/ajax/1/free/1/"
     elif symbol == "5日排行":
@@ -80,30 +84,9 @@ def stock_fund_flow_individual(symbol: str = "即时") -> pd.DataFrame:
         url = "http://data.10jqka.com.cn/funds/ggzjl/board/20/field/zdf/order/desc/page/{}/ajax/1/free/1/"
     else:
         url = "http://data.10jqka.com.cn/funds/ggzjl/field/zdf/order/desc/page/{}/ajax/1/free/1/"
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, int(page_num) + 1), leave=False):
-        js_code = py_mini_racer.MiniRacer()
-        js_content = _get_file_content_ths("ths.js")
-        js_code.eval(js_content)
-        v_code = js_code.call("v")
-        headers = {
-            "Accept": "text/html, */*; q=0.01",
-            "Accept-Encoding": "gzip, deflate",
-            "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "hexin-v": v_code,
-            "Host": "data.10jqka.com.cn",
-            "Pragma": "no-cache",
-            "Referer": "http://data.10jqka.com.cn/funds/hyzjl/",
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/90.0.4430.85 Safari/537.36",
-            "X-Requested-With": "XMLHttpRequest",
-        }
-        r = requests.get(url.format(page), headers=headers)
-        temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    big_df = _fetch_ths_fund_flow_table(
+        url, referer="http://data.10jqka.com.cn/funds/hyzjl/"
+    )
 
     del big_df["序号"]
     big_df.reset_index(inplace=True)
@@ -143,31 +126,6 @@ def stock_fund_flow_concept(symbol: str = "即时") -> pd.DataFrame:
     :return: 概念资金流
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
-    headers = {
-        "Accept": "text/html, */*; q=0.01",
-        "Accept-Encoding": "gzip, deflate",
-        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-        "Cache-Control": "no-cache",
-        "Connection": "keep-alive",
-        "hexin-v": v_code,
-        "Host": "data.10jqka.com.cn",
-        "Pragma": "no-cache",
-        "Referer": "http://data.10jqka.com.cn/funds/gnzjl/",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/90.0.4430.85 Safari/537.36",
-        "X-Requested-With": "XMLHttpRequest",
-    }
-    url = (
-        "http://data.10jqka.com.cn/funds/gnzjl/field/tradezdf/order/desc/ajax/1/free/1/"
-    )
-    r = requests.get(url, headers=headers)
-    soup = BeautifulSoup(r.text, features="lxml")
-    raw_page = soup.find(name="span", attrs={"class": "page_info"}).text
-    page_num = raw_page.split("/")[1]
     if symbol == "3日排行":
         url = "http://data.10jqka.com.cn/funds/gnzjl/board/3/field/tradezdf/order/desc/page/{}/ajax/1/free/1/"
     elif symbol == "5日排行":
@@ -178,30 +136,9 @@ def stock_fund_flow_concept(symbol: str = "即时") -> pd.DataFrame:
         url = "http://data.10jqka.com.cn/funds/gnzjl/board/20/field/tradezdf/order/desc/page/{}/ajax/1/free/1/"
     else:
         url = "http://data.10jqka.com.cn/funds/gnzjl/field/tradezdf/order/desc/page/{}/ajax/1/free/1/"
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, int(page_num) + 1), leave=False):
-        js_code = py_mini_racer.MiniRacer()
-        js_content = _get_file_content_ths("ths.js")
-        js_code.eval(js_content)
-        v_code = js_code.call("v")
-        headers = {
-            "Accept": "text/html, */*; q=0.01",
-            "Accept-Encoding": "gzip, deflate",
-            "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "hexin-v": v_code,
-            "Host": "data.10jqka.com.cn",
-            "Pragma": "no-cache",
-            "Referer": "http://data.10jqka.com.cn/funds/gnzjl/",
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/90.0.4430.85 Safari/537.36",
-            "X-Requested-With": "XMLHttpRequest",
-        }
-        r = requests.get(url.format(page), headers=headers)
-        temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    big_df = _fetch_ths_fund_flow_table(
+        url, referer="http://data.10jqka.com.cn/funds/gnzjl/"
+    )
 
     del big_df["序号"]
     big_df.reset_index(inplace=True)
@@ -249,31 +186,6 @@ def stock_fund_flow_industry(symbol: str = "即时") -> pd.DataFrame:
     :return: 行业资金流
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
-    headers = {
-        "Accept": "text/html, */*; q=0.01",
-        "Accept-Encoding": "gzip, deflate",
-        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-        "Cache-Control": "no-cache",
-        "Connection": "keep-alive",
-        "hexin-v": v_code,
-        "Host": "data.10jqka.com.cn",
-        "Pragma": "no-cache",
-        "Referer": "http://data.10jqka.com.cn/funds/hyzjl/",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/90.0.4430.85 Safari/537.36",
-        "X-Requested-With": "XMLHttpRequest",
-    }
-    url = (
-        "http://data.10jqka.com.cn/funds/hyzjl/field/tradezdf/order/desc/ajax/1/free/1/"
-    )
-    r = requests.get(url, headers=headers)
-    soup = BeautifulSoup(r.text, features="lxml")
-    raw_page = soup.find(name="span", attrs={"class": "page_info"}).text
-    page_num = raw_page.split("/")[1]
     if symbol == "3日排行":
         url = "http://data.10jqka.com.cn/funds/hyzjl/board/3/field/tradezdf/order/desc/page/{}/ajax/1/free/1/"
     elif symbol == "5日排行":
@@ -284,30 +196,9 @@ def stock_fund_flow_industry(symbol: str = "即时") -> pd.DataFrame:
         url = "http://data.10jqka.com.cn/funds/hyzjl/board/20/field/tradezdf/order/desc/page/{}/ajax/1/free/1/"
     else:
         url = "http://data.10jqka.com.cn/funds/hyzjl/field/tradezdf/order/desc/page/{}/ajax/1/free/1/"
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, int(page_num) + 1), leave=False):
-        js_code = py_mini_racer.MiniRacer()
-        js_content = _get_file_content_ths("ths.js")
-        js_code.eval(js_content)
-        v_code = js_code.call("v")
-        headers = {
-            "Accept": "text/html, */*; q=0.01",
-            "Accept-Encoding": "gzip, deflate",
-            "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "hexin-v": v_code,
-            "Host": "data.10jqka.com.cn",
-            "Pragma": "no-cache",
-            "Referer": "http://data.10jqka.com.cn/funds/hyzjl/",
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/90.0.4430.85 Safari/537.36",
-            "X-Requested-With": "XMLHttpRequest",
-        }
-        r = requests.get(url.format(page), headers=headers)
-        temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    big_df = _fetch_ths_fund_flow_table(
+        url, referer="http://data.10jqka.com.cn/funds/hyzjl/"
+    )
 
     del big_df["序号"]
     big_df.reset_index(inplace=True)
@@ -353,54 +244,10 @@ def stock_fund_flow_big_deal() -> pd.DataFrame:
     :return: 大单追踪
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
-    headers = {
-        "Accept": "text/html, */*; q=0.01",
-        "Accept-Encoding": "gzip, deflate",
-        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-        "Cache-Control": "no-cache",
-        "Connection": "keep-alive",
-        "hexin-v": v_code,
-        "Host": "data.10jqka.com.cn",
-        "Pragma": "no-cache",
-        "Referer": "http://data.10jqka.com.cn/funds/hyzjl/",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/90.0.4430.85 Safari/537.36",
-        "X-Requested-With": "XMLHttpRequest",
-    }
-    url = "http://data.10jqka.com.cn/funds/ddzz/order/desc/ajax/1/free/1/"
-    r = requests.get(url, headers=headers)
-    soup = BeautifulSoup(r.text, features="lxml")
-    raw_page = soup.find(name="span", attrs={"class": "page_info"}).text
-    page_num = raw_page.split("/")[1]
     url = "http://data.10jqka.com.cn/funds/ddzz/order/asc/page/{}/ajax/1/free/1/"
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, int(page_num) + 1), leave=False):
-        js_code = py_mini_racer.MiniRacer()
-        js_content = _get_file_content_ths("ths.js")
-        js_code.eval(js_content)
-        v_code = js_code.call("v")
-        headers = {
-            "Accept": "text/html, */*; q=0.01",
-            "Accept-Encoding": "gzip, deflate",
-            "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "hexin-v": v_code,
-            "Host": "data.10jqka.com.cn",
-            "Pragma": "no-cache",
-            "Referer": "http://data.10jqka.com.cn/funds/hyzjl/",
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/90.0.4430.85 Safari/537.36",
-            "X-Requested-With": "XMLHttpRequest",
-        }
-        r = requests.get(url.format(page), headers=headers)
-        temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    big_df = _fetch_ths_fund_flow_table(
+        url, referer="http://data.10jqka.com.cn/funds/hyzjl/"
+    )
 
     big_df.columns = [
         "成交时间",
@@ -10,14 +10,16 @@ import pandas as pd
 import requests
 
 from akshare.utils.func import fetch_paginated_data
+from akshare.utils.instrument import phase, record_response
+from akshare.utils.security_master import get_secid_em
+from akshare.utils.single_flight import single_flight
 
 
-def stock_zh_a_spot_em() -> pd.DataFrame:
+def _stock_zh_a_spot_em_request() -> tuple:
     """
-    东方财富网-沪深京 A 股-实时行情
-    https://quote.eastmoney.com/center/gridlist.html#hs_a_board
-    :return: 实时行情
-    :rtype: pandas.DataFrame
+    东方财富网-沪深京 A 股-实时行情-请求参数
+    :return: 网址和请求参数
+    :rtype: tuple
     """
     url = "https://82.push2.eastmoney.com/api/qt/clist/get"
     params = {
@@ -33,7 +35,17 @@ def stock_zh_a_spot_em() -> pd.DataFrame:
         "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18,"
                   "f20,f21,f23,f24,f25,f22,f11,f62,f128,f136,f115,f152",
     }
-    temp_df = fetch_paginated_data(url, params)
+    return url, params
+
+
+def _stock_zh_a_spot_em_clean(temp_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    东方财富网-沪深京 A 股-实时行情-整理数据
+    :param temp_df: 分页合并后的原始数据
+    :type temp_df: pandas.DataFrame
+    :return: 整理后的数据
+    :rtype: pandas.DataFrame
+    """
     temp_df.columns = [
         "index",
         "_",
@@ -121,6 +133,19 @@ def stock_zh_a_spot_em() -> pd.DataFrame:
     return temp_df
 
 
+@single_flight
+def stock_zh_a_spot_em() -> pd.DataFrame:
+    """
+    东方财富网-沪深京 A 股-实时行情
+    https://quote.eastmoney.com/center/gridlist.html#hs_a_board
+    :return: 实时行情
+    :rtype: pandas.DataFrame
+    """
+    url, params = _stock_zh_a_spot_em_request()
+    temp_df = fetch_paginated_data(url, params)
+    return _stock_zh_a_spot_em_clean(temp_df)
+
+
 def stock_sh_a_spot_em() -> pd.DataFrame:
     """
     东方财富网-沪 A 股-实时行情
@@ -947,17 +972,15 @@ def stock_zh_b_spot_em() -> pd.DataFrame:
     return temp_df
 
 
-def stock_zh_a_hist(
+def _stock_zh_a_hist_request(
     symbol: str = "000001",
     period: str = "daily",
     start_date: str = "19700101",
     end_date: str = "20500101",
     adjust: str = "",
-    timeout: float = None,
-) -> pd.DataFrame:
+) -> tuple:
     """
-    东方财富网-行情首页-沪深京 A 股-每日行情
-    https://quote.eastmoney.com/concept/sh603777.html?from=classic
+    东方财富网-行情首页-沪深京 A 股-每日行情-请求参数
     :param symbol: 股票代码
     :type symbol: str
     :param period: choice of {'daily', 'weekly', 'monthly'}
@@ -968,12 +991,9 @@ def stock_zh_a_hist(
     :type end_date: str
     :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
     :type adjust: str
-    :param timeout: choice of None or a positive float number
-    :type timeout: float
-    :return: 每日行情
-    :rtype: pandas.DataFrame
+    :return: 网址和请求参数
+    :rtype: tuple
     """
-    market_code = 1 if symbol.startswith("6") else 0
     adjust_dict = {"qfq": "1", "hfq": "2", "": "0"}
     period_dict = {"daily": "101", "weekly": "102", "monthly": "103"}
     url = "https://push2his.eastmoney.com/api/qt/stock/kline/get"
@@ -983,12 +1003,23 @@ def stock_zh_a_hist(
         "ut": "7eea3edcaed734bea9cbfc24409ed989",
         "klt": period_dict[period],
         "fqt": adjust_dict[adjust],
-        "secid": f"{market_code}.{symbol}",
+        "secid": get_secid_em(symbol),
         "beg": start_date,
         "end": end_date,
     }
-    r = requests.get(url, params=params, timeout=timeout)
-    data_json = r.json()
+    return url, params
+
+
+def _stock_zh_a_hist_clean(data_json: dict, symbol: str = "000001") -> pd.DataFrame:
+    """
+    东方财富网-行情首页-沪深京 A 股-每日行情-整理数据
+    :param data_json: 接口返回的数据
+    :type data_json: dict
+    :param symbol: 股票代码
+    :type symbol: str
+    :return: 整理后的数据
+    :rtype: pandas.DataFrame
+    """
     if not (data_json["data"] and data_json["data"]["klines"]):
         return pd.DataFrame()
     temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
@@ -1037,6 +1068,44 @@ def stock_zh_a_hist(
     return temp_df
 
 
+def stock_zh_a_hist(
+    symbol: str = "000001",
+    period: str = "daily",
+    start_date: str = "19700101",
+    end_date: str = "20500101",
+    adjust: str = "",
+    timeout: float = None,
+) -> pd.DataFrame:
+    """
+    东方财富网-行情首页-沪深京 A 股-每日行情
+    https://quote.eastmoney.com/concept/sh603777.html?from=classic
+    :param symbol: 股票代码
+    :type symbol: str
+    :param period: choice of {'daily', 'weekly', 'monthly'}
+    :type period: str
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :param timeout: choice of None or a positive float number
+    :type timeout: float
+    :return: 每日行情
+    :rtype: pandas.DataFrame
+    """
+    url, params = _stock_zh_a_hist_request(
+        symbol, period, start_date, end_date, adjust
+    )
+    with phase("network"):
+        r = requests.get(url, params=params, timeout=timeout)
+    record_response(r)
+    with phase("parse"):
+        data_json = r.json()
+    with phase("transform"):
+        return _stock_zh_a_hist_clean(data_json, symbol)
+
+
 def stock_zh_a_hist_min_em(
     symbol: str = "000001",
     start_date: str = "1979-09-01 09:32:00",
@@ -1060,7 +1129,6 @@ def stock_zh_a_hist_min_em(
     :return: 每日分时行情
     :rtype: pandas.DataFrame
     """
-    market_code = 1 if symbol.startswith("6") else 0
     adjust_map = {
         "": "0",
         "qfq": "1",
@@ -1074,7 +1142,7 @@ def stock_zh_a_hist_min_em(
             "ut": "7eea3edcaed734bea9cbfc24409ed989",
             "ndays": "5",
             "iscr": "0",
-            "secid": f"{market_code}.{symbol}",
+            "secid": get_secid_em(symbol),
         }
         r = requests.get(url, timeout=15, params=params)
         data_json = r.json()
@@ -1111,7 +1179,7 @@ def stock_zh_a_hist_min_em(
             "ut": "7eea3edcaed734bea9cbfc24409ed989",
             "klt": period,
             "fqt": adjust_map[adjust],
-            "secid": f"{market_code}.{symbol}",
+            "secid": get_secid_em(symbol),
             "beg": "0",
             "end": "20500000",
         }
@@ -1182,7 +1250,6 @@ def stock_zh_a_hist_pre_min_em(
     :return: 每日分时行情包含盘前数据
     :rtype: pandas.DataFrame
     """
-    market_code = 1 if symbol.startswith("6") else 0
     url = "https://push2.eastmoney.com/api/qt/stock/trends2/get"
     params = {
         "fields1": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f11,f12,f13",
@@ -1190,7 +1257,7 @@ def stock_zh_a_hist_pre_min_em(
         "ndays": "1",
         "iscr": "1",
         "iscca": "0",
-        "secid": f"{market_code}.{symbol}",
+        "secid": get_secid_em(symbol),
     }
     r = requests.get(url, timeout=15, params=params)
     data_json = r.json()
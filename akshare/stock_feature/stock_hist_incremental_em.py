@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 14:00
+Desc: 东方财富网-沪深京 A 股-历史行情增量更新
+本地仓库保存每个股票的完整历史行情, 更新时只请求最后两根 K 线之后的数据;
+倒数第二根 K 线用于校验数据是否被修订(例如复权因子变化), 发生变化时重新下载完整历史
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from akshare.stock_feature.stock_hist_em import stock_zh_a_hist
+from akshare.utils.store import LocalStore
+
+_store = LocalStore(namespace="stock_zh_a_hist")
+
+# 用于校验边界 K 线是否被修订的字段
+_CHECK_COLUMNS = ["开盘", "收盘", "最高", "最低", "成交量", "成交额"]
+
+
+def _stock_zh_a_hist_is_restated(
+    old_df: pd.DataFrame, new_df: pd.DataFrame, check_date
+) -> bool:
+    """
+    校验边界 K 线在新旧数据中是否一致
+    :param old_df: 本地数据
+    :type old_df: pandas.DataFrame
+    :param new_df: 新下载的数据
+    :type new_df: pandas.DataFrame
+    :param check_date: 边界日期
+    :type check_date: datetime.date
+    :return: 是否被修订
+    :rtype: bool
+    """
+    old_row = old_df[old_df["日期"] == check_date]
+    new_row = new_df[new_df["日期"] == check_date]
+    if old_row.empty or new_row.empty:
+        return True
+    return not np.allclose(
+        old_row[_CHECK_COLUMNS].to_numpy(dtype=float),
+        new_row[_CHECK_COLUMNS].to_numpy(dtype=float),
+        equal_nan=True,
+    )
+
+
+def stock_zh_a_hist_incremental(
+    symbol: str = "000001",
+    period: str = "daily",
+    start_date: str = "19700101",
+    end_date: str = "20500101",
+    adjust: str = "",
+    timeout: float = None,
+) -> pd.DataFrame:
+    """
+    东方财富网-行情首页-沪深京 A 股-每日行情-增量更新
+    与 stock_zh_a_hist 返回相同的字段; 首次调用下载完整历史并保存到本地仓库, 之后只下载缺失的部分
+    https://quote.eastmoney.com/concept/sh603777.html?from=classic
+    :param symbol: 股票代码
+    :type symbol: str
+    :param period: choice of {'daily', 'weekly', 'monthly'}
+    :type period: str
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :param timeout: choice of None or a positive float number
+    :type timeout: float
+    :return: 每日行情
+    :rtype: pandas.DataFrame
+    """
+    key = f"{symbol}_{period}_{adjust or 'none'}"
+    old_df = _store.read(key)
+    big_df = None
+    if old_df is not None and len(old_df) >= 2:
+        check_date = old_df["日期"].iloc[-2]
+        new_df = stock_zh_a_hist(
+            symbol=symbol,
+            period=period,
+            start_date=check_date.strftime("%Y%m%d"),
+            end_date="20500101",
+            adjust=adjust,
+            timeout=timeout,
+        )
+        if not new_df.empty and not _stock_zh_a_hist_is_restated(
+            old_df, new_df, check_date
+        ):
+            big_df = pd.concat(
+                [old_df[old_df["日期"] < check_date], new_df], ignore_index=True
+            )
+    if big_df is None:
+        big_df = stock_zh_a_hist(
+            symbol=symbol,
+            period=period,
+            start_date="19700101",
+            end_date="20500101",
+            adjust=adjust,
+            timeout=timeout,
+        )
+        if big_df.empty:
+            return big_df
+    _store.write(key, big_df)
+    start = datetime.strptime(start_date, "%Y%m%d").date()
+    end = datetime.strptime(end_date, "%Y%m%d").date()
+    temp_df = big_df[(big_df["日期"] >= start) & (big_df["日期"] <= end)]
+    return temp_df.reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    stock_zh_a_hist_incremental_df = stock_zh_a_hist_incremental(
+        symbol="000001",
+        period="daily",
+        start_date="20240101",
+        end_date="20500101",
+        adjust="qfq",
+    )
+    print(stock_zh_a_hist_incremental_df)
@@ -1,20 +1,72 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/10/15 22:30
+Date: 2026/10/19 23:00
 Desc: 腾讯证券-行情首页-沪深京A股
 https://quote.eastmoney.com/
 """
 
 import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
 
 import pandas as pd
 import requests
 
-from akshare.index.index_stock_zh import get_tx_start_year
-from akshare.utils import demjson
+from akshare.utils import lenient_json
+from akshare.utils.batch import default_limiter
+from akshare.utils.instrument import phase, propagate_context, record_response
+from akshare.utils.security_master import get_start_date_tx
 from akshare.utils.tqdm import get_tqdm
 
+_TX_KLINE_HOST = "proxy.finance.qq.com"
+
+
+def _stock_zh_a_hist_tx_year(
+    symbol: str,
+    year: int,
+    start_date: str,
+    end_date: str,
+    adjust: str,
+    timeout: float = None,
+) -> List[list]:
+    """
+    腾讯证券-日频-单个年度的股票历史数据, 只保留该年度且在日期区间内的数据
+    :param symbol: 带市场标识的股票或者指数代码
+    :type symbol: str
+    :param year: 年度
+    :type year: int
+    :param start_date: 开始日期, 例如 "2020-01-01"
+    :type start_date: str
+    :param end_date: 结束日期, 例如 "2023-10-27"
+    :type end_date: str
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :param timeout: choice of None or a positive float number
+    :type timeout: float
+    :return: [[日期, 开盘, 收盘, 最高, 最低, 成交量], ...]
+    :rtype: list
+    """
+    url = "https://proxy.finance.qq.com/ifzqgtimg/appstock/app/newfqkline/get"
+    params = {
+        "_var": f"kline_day{adjust}{year}",
+        "param": f"{symbol},day,{year}-01-01,{year + 1}-12-31,640,{adjust}",
+        "r": "0.8205512681390605",
+    }
+    with default_limiter.limit(_TX_KLINE_HOST):
+        with phase("network"):
+            r = requests.get(url, params=params, timeout=timeout)
+    record_response(r)
+    data_text = r.text
+    data_json = lenient_json.decode(data_text[data_text.find("={") + 1 :])["data"][
+        symbol
+    ]
+    row_list = data_json.get("day") or data_json.get(f"{adjust}day") or []
+    # 请求的窗口跨两个年度, 相邻年度的数据会重复, 这里只保留本年度的数据
+    low = max(start_date, f"{year}-01-01")
+    high = min(end_date, f"{year}-12-31")
+    return [row[:6] for row in row_list if low <= row[0] <= high]
+
 
 def stock_zh_a_hist_tx(
     symbol: str = "sz000001",
@@ -22,6 +74,7 @@ def stock_zh_a_hist_tx(
     end_date: str = "20500101",
     adjust: str = "",
     timeout: float = None,
+    max_workers: int = 4,
 ) -> pd.DataFrame:
     """
     腾讯证券-日频-股票历史数据
@@ -36,51 +89,45 @@ def stock_zh_a_hist_tx(
     :type adjust: str
     :param timeout: choice of None or a positive float number
     :type timeout: float
+    :param max_workers: 并发获取各年度数据的最大线程数
+    :type max_workers: int
     :return: 前复权的股票和指数数据
     :rtype: pandas.DataFrame
     """
-    init_start_date = get_tx_start_year(symbol=symbol)
-    if int(start_date.replace("-", "")) < int(init_start_date.replace("-", "")):
-        start_date = init_start_date
-    url = "https://proxy.finance.qq.com/ifzqgtimg/appstock/app/newfqkline/get"
-    range_start = int(start_date[:4])
-    if int(end_date.split("-")[0]) > datetime.date.today().year:
-        range_end = datetime.date.today().year + 1
-    else:
-        range_end = int(end_date.split("-")[0]) + 1
-    big_df = pd.DataFrame()
+    # 统一转换为日期后再比较, 开始日期可能是 "19000101" 或者 "2007-01-15" 等格式
+    start_date = max(
+        pd.to_datetime(start_date), pd.to_datetime(get_start_date_tx(symbol))
+    ).strftime("%Y-%m-%d")
+    end_date = pd.to_datetime(end_date).strftime("%Y-%m-%d")
+    range_end = min(int(end_date[:4]), datetime.date.today().year) + 1
+    year_list = list(range(int(start_date[:4]), range_end))
+
+    def _fetch(year: int) -> List[list]:
+        return _stock_zh_a_hist_tx_year(
+            symbol, year, start_date, end_date, adjust, timeout
+        )
+
     tqdm = get_tqdm()
-    for year in tqdm(range(range_start, range_end), leave=False):
-        params = {
-            "_var": f"kline_day{adjust}{year}",
-            "param": f"{symbol},day,{year}-01-01,{year + 1}-12-31,640,{adjust}",
-            "r": "0.8205512681390605",
-        }
-        r = requests.get(url, params=params, timeout=timeout)
-        data_text = r.text
-        data_json = demjson.decode(data_text[data_text.find("={") + 1 :])["data"][
-            symbol
-        ]
-        if "day" in data_json.keys():
-            temp_df = pd.DataFrame(data_json["day"])
-        elif "hfqday" in data_json.keys():
-            temp_df = pd.DataFrame(data_json["hfqday"])
-        else:
-            temp_df = pd.DataFrame(data_json["qfqday"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
-    big_df = big_df.iloc[:, :6]
-    big_df.columns = ["date", "open", "close", "high", "low", "amount"]
-    big_df["date"] = pd.to_datetime(big_df["date"], errors="coerce").dt.date
-    big_df["open"] = pd.to_numeric(big_df["open"], errors="coerce")
-    big_df["close"] = pd.to_numeric(big_df["close"], errors="coerce")
-    big_df["high"] = pd.to_numeric(big_df["high"], errors="coerce")
-    big_df["low"] = pd.to_numeric(big_df["low"], errors="coerce")
-    big_df["amount"] = pd.to_numeric(big_df["amount"], errors="coerce")
-    big_df.drop_duplicates(inplace=True, ignore_index=True)
-    big_df.index = pd.to_datetime(big_df["date"], errors="coerce")
-    big_df.sort_index(inplace=True)
-    big_df = big_df[start_date:end_date]
-    big_df.reset_index(inplace=True, drop=True)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        year_row_list = list(
+            tqdm(
+                executor.map(propagate_context(_fetch), year_list),
+                total=len(year_list),
+                leave=False,
+            )
+        )
+    with phase("transform"):
+        big_df = pd.DataFrame(
+            [row for row_list in year_row_list for row in row_list],
+            columns=["date", "open", "close", "high", "low", "amount"],
+        )
+        big_df["date"] = pd.to_datetime(big_df["date"], errors="coerce").dt.date
+        big_df["open"] = pd.to_numeric(big_df["open"], errors="coerce")
+        big_df["close"] = pd.to_numeric(big_df["close"], errors="coerce")
+        big_df["high"] = pd.to_numeric(big_df["high"], errors="coerce")
+        big_df["low"] = pd.to_numeric(big_df["low"], errors="coerce")
+        big_df["amount"] = pd.to_numeric(big_df["amount"], errors="coerce")
+        big_df.drop_duplicates(inplace=True, ignore_index=True)
     return big_df
 
 
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 13:00
+Desc: 东方财富网-多标的历史行情批量下载
+按股票列表(或者指数代码、板块名称)并发下载历史行情, 并按主机限流, 单个标的失败不会中断整个批次
+"""
+
+from typing import Dict, List, Tuple, Union
+
+import pandas as pd
+
+from akshare.fund.fund_etf_em import fund_etf_hist_em
+from akshare.index.index_cons import index_stock_cons_csindex
+from akshare.index.index_stock_zh import stock_zh_index_daily_em
+from akshare.stock.stock_board_concept_em import stock_board_concept_cons_em
+from akshare.stock.stock_board_industry_em import stock_board_industry_cons_em
+from akshare.stock_feature.stock_hist_em import (
+    stock_hk_hist,
+    stock_us_hist,
+    stock_zh_a_hist,
+)
+from akshare.stock_feature.stock_hist_incremental_em import (
+    stock_zh_a_hist_incremental,
+)
+from akshare.utils.batch import run_batch
+
+# 各市场对应的单标的接口, 是否支持 period/adjust 参数, 以及请求的主机
+_MARKET_MAP = {
+    "a": (stock_zh_a_hist, True, "push2his.eastmoney.com"),
+    "hk": (stock_hk_hist, True, "33.push2his.eastmoney.com"),
+    "us": (stock_us_hist, True, "63.push2his.eastmoney.com"),
+    "etf": (fund_etf_hist_em, True, "push2his.eastmoney.com"),
+    "index": (stock_zh_index_daily_em, False, "push2his.eastmoney.com"),
+}
+
+
+def _stock_hist_universe_symbol_list(symbol: str) -> List[str]:
+    """
+    指数代码或者板块名称对应的成份股代码
+    :param symbol: 中证指数代码, 例如 "000300"; 或者东方财富行业/概念板块名称, 例如 "小金属"
+    :type symbol: str
+    :return: 成份股代码列表
+    :rtype: list
+    """
+    if symbol.isdigit() and len(symbol) == 6:
+        temp_df = index_stock_cons_csindex(symbol=symbol)
+        return temp_df["成分券代码"].tolist()
+    try:
+        temp_df = stock_board_industry_cons_em(symbol=symbol)
+    except (KeyError, IndexError, TypeError):
+        temp_df = stock_board_concept_cons_em(symbol=symbol)
+    return temp_df["代码"].tolist()
+
+
+def stock_hist_universe_em(
+    symbol_list: Union[List[str], str] = "000300",
+    market: str = "a",
+    period: str = "daily",
+    start_date: str = "19700101",
+    end_date: str = "20500101",
+    adjust: str = "",
+    output: str = "long",
+    max_workers: int = 8,
+    incremental: bool = False,
+) -> Tuple[Union[pd.DataFrame, Dict[str, pd.DataFrame]], pd.DataFrame]:
+    """
+    东方财富网-多标的历史行情
+    https://quote.eastmoney.com/concept/sh603777.html?from=classic
+    :param symbol_list: 代码列表; 当 market="a" 时也可以是中证指数代码或者东方财富板块名称, 自动展开为成份股
+    :type symbol_list: list or str
+    :param market: choice of {"a", "hk", "us", "etf", "index"}; 分别对应 stock_zh_a_hist, stock_hk_hist, stock_us_hist, fund_etf_hist_em, stock_zh_index_daily_em
+    :type market: str
+    :param period: choice of {'daily', 'weekly', 'monthly'}; market="index" 时只支持 daily
+    :type period: str
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :param output: choice of {"long", "dict"}; long 返回合并后的长表(增加代码列), dict 返回 {代码: 行情}
+    :type output: str
+    :param max_workers: 最大并发数, 同一主机的并发数还受全局限流器约束
+    :type max_workers: int
+    :param incremental: 仅 market="a" 有效, 使用 stock_zh_a_hist_incremental 基于本地仓库增量更新
+    :type incremental: bool
+    :return: 历史行情和错误表(失败的代码及原因)
+    :rtype: tuple
+    """
+    func, has_period_adjust, host = _MARKET_MAP[market]
+    if incremental and market == "a":
+        func = stock_zh_a_hist_incremental
+    if isinstance(symbol_list, str):
+        symbol_list = _stock_hist_universe_symbol_list(symbol_list)
+    symbol_list = list(dict.fromkeys(symbol_list))
+    if has_period_adjust:
+        task_list = [
+            {
+                "symbol": symbol,
+                "period": period,
+                "start_date": start_date,
+                "end_date": end_date,
+                "adjust": adjust,
+            }
+            for symbol in symbol_list
+        ]
+    else:
+        task_list = [
+            {"symbol": symbol, "start_date": start_date, "end_date": end_date}
+            for symbol in symbol_list
+        ]
+    result_list, error_df = run_batch(
+        func=func, task_list=task_list, max_workers=max_workers, host=host
+    )
+    data_dict = {
+        symbol: temp_df
+        for symbol, temp_df in zip(symbol_list, result_list)
+        if temp_df is not None
+    }
+    if output == "dict":
+        return data_dict, error_df
+    temp_list = []
+    for symbol, temp_df in data_dict.items():
+        if temp_df.empty:
+            continue
+        if "代码" not in temp_df.columns and "股票代码" not in temp_df.columns:
+            temp_df = temp_df.copy()
+            temp_df.insert(0, "代码", symbol)
+        temp_list.append(temp_df)
+    if not temp_list:
+        return pd.DataFrame(), error_df
+    big_df = pd.concat(temp_list, ignore_index=True)
+    return big_df, error_df
+
+
+if __name__ == "__main__":
+    stock_hist_universe_em_df, stock_hist_universe_em_error_df = stock_hist_universe_em(
+        symbol_list=["000001", "600000", "300750"],
+        market="a",
+        period="daily",
+        start_date="20240101",
+        end_date="20241231",
+        adjust="qfq",
+    )
+    print(stock_hist_universe_em_df)
+    print(stock_hist_universe_em_error_df)
+
+    stock_hist_universe_em_df, stock_hist_universe_em_error_df = stock_hist_universe_em(
+        symbol_list="000300",
+        market="a",
+        start_date="20240101",
+        end_date="20241231",
+    )
+    print(stock_hist_universe_em_df)
+    print(stock_hist_universe_em_error_df)
@@ -12,7 +12,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from akshare.utils.tqdm import get_tqdm
-from akshare.utils.func import fetch_paginated_data
+from akshare.utils.func import fetch_datacenter_data, fetch_paginated_data
 
 
 def stock_hsgt_fund_flow_summary_em() -> pd.DataFrame:
@@ -224,22 +224,7 @@ def stock_hsgt_hold_stock_em(
         "client": "WEB",
         "filter": filter_str,
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    page_num = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, page_num + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-
-    big_df.reset_index(inplace=True)
-    big_df["index"] = range(1, len(big_df) + 1)
-    big_df.columns = [
-        "序号",
+    column_list = [
         "_",
         "_",
         "日期",
@@ -284,6 +269,13 @@ def stock_hsgt_hold_stock_em(
         "_",
         "_",
     ]
+    # 单页 50000 条, 流式解析且只保留输出的字段(按字段位置)
+    position_list = [i for i, item in enumerate(column_list) if item != "_"]
+    big_df = fetch_datacenter_data(url, params=params, fields=position_list)
+    if big_df.empty:
+        return pd.DataFrame()
+    big_df.columns = [column_list[i] for i in position_list]
+    big_df.insert(0, "序号", range(1, len(big_df) + 1))
     big_df = big_df[
         [
             "序号",
@@ -8,6 +8,7 @@ https://data.eastmoney.com/stock/tradedetail.html
 
 import pandas as pd
 import requests
+from akshare.utils.func import fetch_datacenter_data
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -41,50 +42,36 @@ def stock_lhb_detail_em(
         "client": "WEB",
         "filter": f"(TRADE_DATE<='{end_date}')(TRADE_DATE>='{start_date}')",
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page_num = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page_num + 1), leave=False):
-        params.update(
-            {
-                "pageNumber": page,
-            }
-        )
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+    column_map = {
+        "SECURITY_CODE": "代码",
+        "SECURITY_NAME_ABBR": "名称",
+        "TRADE_DATE": "上榜日",
+        "EXPLAIN": "解读",
+        "CLOSE_PRICE": "收盘价",
+        "CHANGE_RATE": "涨跌幅",
+        "BILLBOARD_NET_AMT": "龙虎榜净买额",
+        "BILLBOARD_BUY_AMT": "龙虎榜买入额",
+        "BILLBOARD_SELL_AMT": "龙虎榜卖出额",
+        "BILLBOARD_DEAL_AMT": "龙虎榜成交额",
+        "ACCUM_AMOUNT": "市场总成交额",
+        "DEAL_NET_RATIO": "净买额占总成交比",
+        "DEAL_AMOUNT_RATIO": "成交额占总成交比",
+        "TURNOVERRATE": "换手率",
+        "FREE_MARKET_CAP": "流通市值",
+        "EXPLANATION": "上榜原因",
+        "D1_CLOSE_ADJCHRATE": "上榜后1日",
+        "D2_CLOSE_ADJCHRATE": "上榜后2日",
+        "D5_CLOSE_ADJCHRATE": "上榜后5日",
+        "D10_CLOSE_ADJCHRATE": "上榜后10日",
+    }
+    # 单页 5000 条, 流式解析且只保留输出的字段
+    big_df = fetch_datacenter_data(url, params=params, fields=list(column_map))
+    if big_df.empty:
+        return pd.DataFrame()
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
-    big_df.rename(
-        columns={
-            "index": "序号",
-            "SECURITY_CODE": "代码",
-            "SECUCODE": "-",
-            "SECURITY_NAME_ABBR": "名称",
-            "TRADE_DATE": "上榜日",
-            "EXPLAIN": "解读",
-            "CLOSE_PRICE": "收盘价",
-            "CHANGE_RATE": "涨跌幅",
-            "BILLBOARD_NET_AMT": "龙虎榜净买额",
-            "BILLBOARD_BUY_AMT": "龙虎榜买入额",
-            "BILLBOARD_SELL_AMT": "龙虎榜卖出额",
-            "BILLBOARD_DEAL_AMT": "龙虎榜成交额",
-            "ACCUM_AMOUNT": "市场总成交额",
-            "DEAL_NET_RATIO": "净买额占总成交比",
-            "DEAL_AMOUNT_RATIO": "成交额占总成交比",
-            "TURNOVERRATE": "换手率",
-            "FREE_MARKET_CAP": "流通市值",
-            "EXPLANATION": "上榜原因",
-            "D1_CLOSE_ADJCHRATE": "上榜后1日",
-            "D2_CLOSE_ADJCHRATE": "上榜后2日",
-            "D5_CLOSE_ADJCHRATE": "上榜后5日",
-            "D10_CLOSE_ADJCHRATE": "上榜后10日",
-        },
-        inplace=True,
-    )
+    column_map["index"] = "序号"
+    big_df.rename(columns=column_map, inplace=True)
 
     big_df = big_df[
         [
@@ -0,0 +1,372 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 23:00
+Desc: 技术选股-本地计算
+由全市场的日线行情(例如 stock_hist_universe_em 的结果)一次计算同花顺-数据中心-技术选股的各个排行,
+输出字段与 stock_rank_*_ths 一致, 不需要逐页抓取同花顺网页
+https://data.10jqka.com.cn/rank/cxg/
+"""
+
+from typing import Dict, Optional
+
+import pandas as pd
+
+# 创新高/创新低的回看交易日数, None 表示上市以来
+_NEW_HIGH_WINDOW = {
+    "创月新高": 20,
+    "半年新高": 120,
+    "一年新高": 250,
+    "历史新高": None,
+}
+_NEW_LOW_WINDOW = {
+    "创月新低": 20,
+    "半年新低": 120,
+    "一年新低": 250,
+    "历史新低": None,
+}
+_MA_WINDOW = {
+    "5日均线": 5,
+    "10日均线": 10,
+    "20日均线": 20,
+    "30日均线": 30,
+    "60日均线": 60,
+    "90日均线": 90,
+    "250日均线": 250,
+    "500日均线": 500,
+}
+
+
+def _technology_panel(
+    daily_df: pd.DataFrame, date: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    整理日线行情: 统一类型, 按 (股票代码, 日期) 排序, 补充前收盘、前成交量和每只股票内的位置
+    :param daily_df: 日线行情, 至少包含 日期, 股票代码, 收盘, 最高, 最低, 成交量
+    :type daily_df: pandas.DataFrame
+    :param date: 选股日期, 默认为行情中的最后一个交易日
+    :type date: str
+    :return: 日线行情
+    :rtype: pandas.DataFrame
+    """
+    temp_df = daily_df.copy()
+    if "股票代码" not in temp_df.columns:
+        temp_df.rename(columns={"代码": "股票代码"}, inplace=True)
+    temp_df["日期"] = pd.to_datetime(temp_df["日期"])
+    if date is not None:
+        temp_df = temp_df[temp_df["日期"] <= pd.to_datetime(date)]
+    for item in ["收盘", "最高", "最低", "成交量", "成交额", "换手率", "涨跌幅"]:
+        if item in temp_df.columns:
+            temp_df[item] = pd.to_numeric(temp_df[item], errors="coerce")
+        else:
+            temp_df[item] = float("nan")
+    temp_df.sort_values(by=["股票代码", "日期"], inplace=True, ignore_index=True)
+    # 整数编号分组, 避免每次分组都重新对股票代码编码
+    temp_df["编号"] = temp_df.groupby("股票代码", sort=False).ngroup()
+    group = temp_df.groupby("编号", sort=False)
+    temp_df["前收盘"] = group["收盘"].shift(1)
+    temp_df["前成交量"] = group["成交量"].shift(1)
+    # 行情中没有涨跌幅时由前收盘计算
+    temp_df["涨跌幅"] = temp_df["涨跌幅"].fillna(
+        (temp_df["收盘"] / temp_df["前收盘"] - 1) * 100
+    )
+    temp_df["位置"] = group.cumcount()
+    return temp_df
+
+
+def _technology_streak(temp_df: pd.DataFrame, flag: pd.Series) -> pd.DataFrame:
+    """
+    每个交易日连续满足条件的天数, 以及这段时间的基准日收盘价、基准日成交量、累计换手率、最高价和最低价
+    基准日为连续区间开始的前一个交易日
+    :param temp_df: _technology_panel 整理后的日线行情
+    :type temp_df: pandas.DataFrame
+    :param flag: 每个交易日是否满足条件, 每只股票的第一个交易日必须为 False
+    :type flag: pandas.Series
+    :return: 连续区间统计
+    :rtype: pandas.DataFrame
+    """
+    # 不满足条件的交易日开始一个新区间, 区间的第一行即为基准日;
+    # 每只股票的第一行都是基准日, 所以区间不会跨越两只股票
+    start = ~flag
+    days = flag.astype(int).cumsum()
+    turnover = temp_df["换手率"].where(flag, 0).fillna(0).cumsum()
+    group = pd.DataFrame(
+        {"最高价": temp_df["最高"].where(flag), "最低价": temp_df["最低"].where(flag)}
+    ).groupby(start.cumsum(), sort=False)
+    return pd.DataFrame(
+        {
+            "天数": (days - days.where(start).ffill()).astype(int),
+            "基准日收盘": temp_df["收盘"].where(start).ffill(),
+            "基准日成交量": temp_df["成交量"].where(start).ffill(),
+            "累计换手率": turnover - turnover.where(start).ffill(),
+            "最高价": group["最高价"].cummax(),
+            "最低价": group["最低价"].cummin(),
+        }
+    )
+
+
+def _technology_output(
+    temp_df: pd.DataFrame, columns: list, info_df: Optional[pd.DataFrame]
+) -> pd.DataFrame:
+    """
+    补充股票简称和所属行业, 重新编号并选择输出字段
+    :param temp_df: 选出的股票
+    :type temp_df: pandas.DataFrame
+    :param columns: 输出字段
+    :type columns: list
+    :param info_df: 股票信息, 包含 股票代码 以及 股票简称 和/或 所属行业
+    :type info_df: pandas.DataFrame
+    :return: 排行
+    :rtype: pandas.DataFrame
+    """
+    temp_df = temp_df.reset_index(drop=True)
+    for item in ["股票简称", "所属行业"]:
+        if info_df is not None and item in info_df.columns:
+            item_map = info_df.drop_duplicates("股票代码").set_index("股票代码")[item]
+            temp_df[item] = temp_df["股票代码"].map(item_map)
+        elif item not in temp_df.columns:
+            temp_df[item] = None
+    temp_df["序号"] = range(1, len(temp_df) + 1)
+    return temp_df[columns]
+
+
+def _rank_new_high(
+    temp_df: pd.DataFrame, last_mask: pd.Series, window: Optional[int], low: bool
+) -> pd.DataFrame:
+    """
+    创新高/创新低: 选股日的最高价(最低价)突破此前 window 个交易日的最高价(最低价)
+    :return: 选出的股票, 包含 前期高点/前期低点 和对应的日期
+    :rtype: pandas.DataFrame
+    """
+    price = "最低" if low else "最高"
+    shifted = temp_df.groupby("编号", sort=False)[price].shift(1)
+    if window is None:
+        group = shifted.groupby(temp_df["编号"], sort=False)
+        previous = group.cummin() if low else group.cummax()
+    else:
+        rolling = shifted.groupby(temp_df["编号"], sort=False).rolling(
+            window, min_periods=window
+        )
+        previous = rolling.min() if low else rolling.max()
+        previous = previous.reset_index(level=0, drop=True)
+    breakout = temp_df[price] < previous if low else temp_df[price] > previous
+    select_df = temp_df[last_mask & breakout].copy()
+    select_df["前期点位"] = previous[select_df.index]
+    # 前期高点(低点)的日期: 回看窗口内最后一次出现该价格的交易日
+    window_df = temp_df[["股票代码", "日期", "位置", price]].merge(
+        select_df[["股票代码", "位置", "前期点位"]].rename(
+            columns={"位置": "选股位置"}
+        ),
+        on="股票代码",
+    )
+    window_df = window_df[
+        (window_df["位置"] < window_df["选股位置"])
+        & (window_df[price] == window_df["前期点位"])
+    ]
+    if window is not None:
+        window_df = window_df[window_df["位置"] >= window_df["选股位置"] - window]
+    date_map = window_df.groupby("股票代码")["日期"].max().dt.date
+    select_df["前期点位日期"] = select_df["股票代码"].map(date_map)
+    return select_df.sort_values(by="股票代码")
+
+
+def _rank_streak(
+    temp_df: pd.DataFrame, last_mask: pd.Series, flag: pd.Series, min_days: int
+) -> pd.DataFrame:
+    """
+    连续区间排行: 选股日连续满足条件至少 min_days 天, 按天数从多到少排序
+    :return: 选出的股票, 包含连续区间统计和阶段涨跌幅
+    :rtype: pandas.DataFrame
+    """
+    streak_df = _technology_streak(temp_df, flag)
+    select_df = pd.concat([temp_df, streak_df], axis=1)
+    select_df = select_df[last_mask & (streak_df["天数"] >= min_days)].copy()
+    select_df["阶段涨跌幅"] = (select_df["收盘"] / select_df["基准日收盘"] - 1) * 100
+    return select_df.sort_values(by=["天数", "股票代码"], ascending=[False, True])
+
+
+def _rank_ma_breakout(
+    temp_df: pd.DataFrame, last_mask: pd.Series, window: int, down: bool
+) -> pd.DataFrame:
+    """
+    均线突破: 前一交易日收盘价在均线下方(上方), 选股日收盘价在均线上方(下方)
+    :return: 选出的股票
+    :rtype: pandas.DataFrame
+    """
+    ma = (
+        temp_df.groupby("编号", sort=False)["收盘"]
+        .rolling(window, min_periods=window)
+        .mean()
+        .reset_index(level=0, drop=True)
+    )
+    previous_ma = ma.groupby(temp_df["编号"], sort=False).shift(1)
+    if down:
+        breakout = (temp_df["前收盘"] >= previous_ma) & (temp_df["收盘"] < ma)
+    else:
+        breakout = (temp_df["前收盘"] <= previous_ma) & (temp_df["收盘"] > ma)
+    return temp_df[last_mask & breakout].sort_values(by="股票代码")
+
+
+def stock_rank_local(
+    daily_df: pd.DataFrame,
+    indicator: str = "cxg",
+    symbol: Optional[str] = None,
+    date: Optional[str] = None,
+    info_df: Optional[pd.DataFrame] = None,
+    min_days: int = 3,
+) -> pd.DataFrame:
+    """
+    技术选股-本地计算
+    由全市场日线行情计算同花顺技术选股排行, 输出字段与对应的 stock_rank_{indicator}_ths 一致
+    https://data.10jqka.com.cn/rank/cxg/
+    :param daily_df: 日线行情, 至少包含 日期, 股票代码(或 代码), 收盘, 最高, 最低, 成交量; 可选 成交额, 换手率, 涨跌幅
+    :type daily_df: pandas.DataFrame
+    :param indicator: choice of {"cxg", "cxd", "lxsz", "lxxd", "cxfl", "cxsl", "xstp", "xxtp", "ljqs", "ljqd"}
+    :type indicator: str
+    :param symbol: cxg: choice of {"创月新高", "半年新高", "一年新高", "历史新高"}; cxd: choice of {"创月新低", "半年新低", "一年新低", "历史新低"}; xstp/xxtp: choice of {"5日均线", "10日均线", "20日均线", "30日均线", "60日均线", "90日均线", "250日均线", "500日均线"}; 默认与 stock_rank_*_ths 相同
+    :type symbol: str
+    :param date: 选股日期, 默认为行情中的最后一个交易日
+    :type date: str
+    :param info_df: 股票信息, 包含 股票代码 以及 股票简称 和/或 所属行业, 例如 stock_info_a_code_name 的结果改名后
+    :type info_df: pandas.DataFrame
+    :param min_days: 连续上涨、连续下跌、持续放量、持续缩量、量价齐升和量价齐跌的最少天数
+    :type min_days: int
+    :return: 技术选股排行
+    :rtype: pandas.DataFrame
+    """
+    temp_df = _technology_panel(daily_df, date=date)
+    return _stock_rank_local(temp_df, indicator, symbol, info_df, min_days)
+
+
+def _stock_rank_local(
+    temp_df: pd.DataFrame,
+    indicator: str,
+    symbol: Optional[str],
+    info_df: Optional[pd.DataFrame],
+    min_days: int,
+) -> pd.DataFrame:
+    """
+    技术选股-本地计算-由整理后的日线行情计算单个排行
+    :return: 技术选股排行
+    :rtype: pandas.DataFrame
+    """
+    last_mask = temp_df["日期"] == temp_df["日期"].max()
+    rise = temp_df["收盘"] > temp_df["前收盘"]
+    fall = temp_df["收盘"] < temp_df["前收盘"]
+    volume_up = temp_df["成交量"] > temp_df["前成交量"]
+    volume_down = temp_df["成交量"] < temp_df["前成交量"]
+    if indicator in {"cxg", "cxd"}:
+        low = indicator == "cxd"
+        window_map = _NEW_LOW_WINDOW if low else _NEW_HIGH_WINDOW
+        symbol = symbol or ("创月新低" if low else "创月新高")
+        select_df = _rank_new_high(temp_df, last_mask, window_map[symbol], low)
+        label = "前期低点" if low else "前期高点"
+        select_df.rename(
+            columns={
+                "收盘": "最新价",
+                "前期点位": label,
+                "前期点位日期": f"{label}日期",
+            },
+            inplace=True,
+        )
+        columns = ["序号", "股票代码", "股票简称", "涨跌幅", "换手率", "最新价"]
+        return _technology_output(select_df, columns + [label, f"{label}日期"], info_df)
+    if indicator in {"lxsz", "lxxd"}:
+        flag = rise if indicator == "lxsz" else fall
+        select_df = _rank_streak(temp_df, last_mask, flag, min_days)
+        select_df.rename(
+            columns={
+                "收盘": "收盘价",
+                "天数": "连涨天数",
+                "阶段涨跌幅": "连续涨跌幅",
+            },
+            inplace=True,
+        )
+        columns = ["序号", "股票代码", "股票简称", "收盘价", "最高价", "最低价"]
+        columns += ["连涨天数", "连续涨跌幅", "累计换手率", "所属行业"]
+        return _technology_output(select_df, columns, info_df)
+    if indicator in {"cxfl", "cxsl"}:
+        flag = volume_up if indicator == "cxfl" else volume_down
+        label = "放量天数" if indicator == "cxfl" else "缩量天数"
+        select_df = _rank_streak(temp_df, last_mask, flag, min_days)
+        select_df.rename(columns={"收盘": "最新价", "天数": label}, inplace=True)
+        columns = ["序号", "股票代码", "股票简称", "涨跌幅", "最新价", "成交量"]
+        columns += ["基准日成交量", label, "阶段涨跌幅", "所属行业"]
+        return _technology_output(select_df, columns, info_df)
+    if indicator in {"xstp", "xxtp"}:
+        window = _MA_WINDOW[symbol or "500日均线"]
+        select_df = _rank_ma_breakout(
+            temp_df, last_mask, window, down=indicator == "xxtp"
+        )
+        select_df = select_df.rename(columns={"收盘": "最新价"})
+        columns = ["序号", "股票代码", "股票简称", "最新价", "成交额", "成交量"]
+        return _technology_output(select_df, columns + ["涨跌幅", "换手率"], info_df)
+    if indicator in {"ljqs", "ljqd"}:
+        if indicator == "ljqs":
+            flag, label = rise & volume_up, "量价齐升天数"
+        else:
+            flag, label = fall & volume_down, "量价齐跌天数"
+        select_df = _rank_streak(temp_df, last_mask, flag, min_days)
+        select_df.rename(
+            columns={"收盘": "最新价", "天数": label, "阶段涨跌幅": "阶段涨幅"},
+            inplace=True,
+        )
+        columns = ["序号", "股票代码", "股票简称", "最新价", label, "阶段涨幅"]
+        return _technology_output(
+            select_df, columns + ["累计换手率", "所属行业"], info_df
+        )
+    raise ValueError(
+        'indicator 参数只能为 "cxg", "cxd", "lxsz", "lxxd", "cxfl", "cxsl", '
+        '"xstp", "xxtp", "ljqs" 或 "ljqd"'
+    )
+
+
+def stock_rank_all_local(
+    daily_df: pd.DataFrame,
+    date: Optional[str] = None,
+    info_df: Optional[pd.DataFrame] = None,
+    min_days: int = 3,
+) -> Dict[str, pd.DataFrame]:
+    """
+    技术选股-本地计算-全部排行
+    日线行情只整理一次, 计算所有技术选股排行; 键为 indicator 或者 indicator_symbol, 例如 "lxsz", "cxg_创月新高", "xstp_20日均线"
+    https://data.10jqka.com.cn/rank/cxg/
+    :param daily_df: 日线行情, 详见 stock_rank_local
+    :type daily_df: pandas.DataFrame
+    :param date: 选股日期, 默认为行情中的最后一个交易日
+    :type date: str
+    :param info_df: 股票信息, 详见 stock_rank_local
+    :type info_df: pandas.DataFrame
+    :param min_days: 连续区间排行的最少天数
+    :type min_days: int
+    :return: 所有技术选股排行
+    :rtype: dict
+    """
+    temp_df = _technology_panel(daily_df, date=date)
+    task_list = [("cxg", item) for item in _NEW_HIGH_WINDOW]
+    task_list += [("cxd", item) for item in _NEW_LOW_WINDOW]
+    task_list += [(item, None) for item in ["lxsz", "lxxd", "cxfl", "cxsl"]]
+    task_list += [("xstp", item) for item in _MA_WINDOW]
+    task_list += [("xxtp", item) for item in _MA_WINDOW]
+    task_list += [("ljqs", None), ("ljqd", None)]
+    return {
+        indicator if symbol is None else f"{indicator}_{symbol}": _stock_rank_local(
+            temp_df, indicator, symbol, info_df, min_days
+        )
+        for indicator, symbol in task_list
+    }
+
+
+if __name__ == "__main__":
+    from akshare.stock_feature.stock_hist_universe_em import stock_hist_universe_em
+
+    stock_hist_universe_em_df, _ = stock_hist_universe_em(
+        symbol_list="000300", start_date="20230101", end_date="20251017"
+    )
+    stock_rank_local_df = stock_rank_local(
+        stock_hist_universe_em_df, indicator="cxg", symbol="创月新高"
+    )
+    print(stock_rank_local_df)
+
+    stock_rank_all_local_dict = stock_rank_all_local(stock_hist_universe_em_df)
+    print(stock_rank_all_local_dict["lxsz"])
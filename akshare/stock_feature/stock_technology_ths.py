@@ -1,34 +1,58 @@
 # -*- coding:utf-8 -*-
 # !/usr/bin/env python
 """
-Date: 2024/9/21 19:00
+Date: 2026/10/19 11:00
 Desc: 同花顺-数据中心-技术选股
 https://data.10jqka.com.cn/rank/cxg/
 """
 
-from io import StringIO
+from typing import Dict, Optional
 
 import pandas as pd
-import py_mini_racer
 import requests
-from bs4 import BeautifulSoup
 
-from akshare.datasets import get_ths_js
-from akshare.utils.tqdm import get_tqdm
+from akshare.utils.html_table import (
+    fetch_html_page,
+    fetch_html_pages,
+    get_html_page_count,
+    html_tables_to_df,
+)
+from akshare.utils.ths_cookie import get_ths_v_code, reset_ths_v_code
 
 
-def _get_file_content_ths(file: str = "ths.js") -> str:
+def _get_headers_ths() -> Dict:
     """
-    获取 JS 文件的内容
-    :param file:  JS 文件名
-    :type file: str
-    :return: 文件内容
-    :rtype: str
+    同花顺-请求头, v 参数在时间窗口内复用
+    :return: 请求头
+    :rtype: dict
     """
-    setting_file_path = get_ths_js(file)
-    with open(setting_file_path, encoding="utf-8") as f:
-        file_data = f.read()
-    return file_data
+    return {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
+        "Cookie": f"v={get_ths_v_code()}",
+    }
+
+
+def _fetch_ths_rank_table(url: str, converters: Optional[Dict] = None) -> pd.DataFrame:
+    """
+    同花顺-数据中心-技术选股-并发获取所有分页的表格
+    :param url: 网址, 其中的 {} 为页码占位符
+    :type url: str
+    :param converters: 指定列的转换函数, 例如 {"股票代码": str}
+    :type converters: dict
+    :return: 所有分页合并后的表格
+    :rtype: pandas.DataFrame
+    """
+    html_text = fetch_html_page(
+        url.format(1), headers_func=_get_headers_ths, auth_error_func=reset_ths_v_code
+    )
+    total_page = get_html_page_count(html_text)
+    html_list = [html_text] + fetch_html_pages(
+        url_list=[url.format(page) for page in range(2, total_page + 1)],
+        headers_func=_get_headers_ths,
+        auth_error_func=reset_ths_v_code,
+    )
+    return html_tables_to_df(html_list, converters=converters)
 
 
 def stock_rank_cxg_ths(symbol: str = "创月新高") -> pd.DataFrame:
@@ -46,43 +70,11 @@ def stock_rank_cxg_ths(symbol: str = "创月新高") -> pd.DataFrame:
         "一年新高": "2",
         "历史新高": "1",
     }
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
-        "Cookie": f"v={v_code}",
-    }
     url = (
-        f"http://data.10jqka.com.cn/rank/cxg/board/{symbol_map[symbol]}/field/"
-        f"stockcode/order/asc/page/1/ajax/1/free/1/"
+        f"http://data.10jqka.com.cn/rank/cxg/board/{symbol_map[symbol]}/field/stockcode/"
+        "order/asc/page/{}/ajax/1/free/1/"
     )
-    r = requests.get(url, headers=headers)
-    soup = BeautifulSoup(r.text, features="lxml")
-    try:
-        total_page = soup.find(name="span", attrs={"class": "page_info"}).text.split(
-            "/"
-        )[1]
-    except AttributeError:
-        total_page = 1
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, int(total_page) + 1), leave=False):
-        v_code = js_code.call("v")
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
-            "Cookie": f"v={v_code}",
-        }
-        url = (
-            f"http://data.10jqka.com.cn/rank/cxg/board/{symbol_map[symbol]}/field/stockcode/"
-            f"order/asc/page/{page}/ajax/1/free/1/"
-        )
-        r = requests.get(url, headers=headers)
-        temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    big_df = _fetch_ths_rank_table(url)
     big_df.columns = [
         "序号",
         "股票代码",
@@ -121,43 +113,11 @@ def stock_rank_cxd_ths(symbol: str = "创月新低") -> pd.DataFrame:
         "一年新低": "2",
         "历史新低": "1",
     }
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
-        "Cookie": f"v={v_code}",
-    }
     url = (
         f"http://data.10jqka.com.cn/rank/cxd/board/{symbol_map[symbol]}/field/"
-        f"stockcode/order/asc/page/1/ajax/1/free/1/"
+        "stockcode/order/asc/page/{}/ajax/1/free/1/"
     )
-    r = requests.get(url, headers=headers)
-    soup = BeautifulSoup(r.text, features="lxml")
-    try:
-        total_page = soup.find(name="span", attrs={"class": "page_info"}).text.split(
-            "/"
-        )[1]
-    except AttributeError:
-        total_page = 1
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, int(total_page) + 1), leave=False):
-        v_code = js_code.call("v")
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
-            "Cookie": f"v={v_code}",
-        }
-        url = (
-            f"http://data.10jqka.com.cn/rank/cxd/board/{symbol_map[symbol]}/field/"
-            f"stockcode/order/asc/page/{page}/ajax/1/free/1/"
-        )
-        r = requests.get(url, headers=headers)
-        temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    big_df = _fetch_ths_rank_table(url)
     big_df.columns = [
         "序号",
         "股票代码",
@@ -188,37 +148,8 @@ def stock_rank_lxsz_ths() -> pd.DataFrame:
     :return: 连续上涨
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
-        "Cookie": f"v={v_code}",
-    }
-    url = "http://data.10jqka.com.cn/rank/lxsz/field/lxts/order/desc/page/1/ajax/1/free/1/"
-    r = requests.get(url, headers=headers)
-    soup = BeautifulSoup(r.text, features="lxml")
-    try:
-        total_page = soup.find(name="span", attrs={"class": "page_info"}).text.split(
-            "/"
-        )[1]
-    except AttributeError:
-        total_page = 1
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, int(total_page) + 1), leave=False):
-        v_code = js_code.call("v")
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
-            "Cookie": f"v={v_code}",
-        }
-        url = f"http://data.10jqka.com.cn/rank/lxsz/field/lxts/order/desc/page/{page}/ajax/1/free/1/"
-        r = requests.get(url, headers=headers)
-        temp_df = pd.read_html(StringIO(r.text), converters={"股票代码": str})[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    url = "http://data.10jqka.com.cn/rank/lxsz/field/lxts/order/desc/page/{}/ajax/1/free/1/"
+    big_df = _fetch_ths_rank_table(url, converters={"股票代码": str})
     big_df.columns = [
         "序号",
         "股票代码",
@@ -249,37 +180,8 @@ def stock_rank_lxxd_ths() -> pd.DataFrame:
     :return: 连续下跌
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
-        "Cookie": f"v={v_code}",
-    }
-    url = "http://data.10jqka.com.cn/rank/lxxd/field/lxts/order/desc/page/1/ajax/1/free/1/"
-    r = requests.get(url, headers=headers)
-    soup = BeautifulSoup(r.text, features="lxml")
-    try:
-        total_page = soup.find(name="span", attrs={"class": "page_info"}).text.split(
-            "/"
-        )[1]
-    except AttributeError:
-        total_page = 1
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, int(total_page) + 1), leave=False):
-        v_code = js_code.call("v")
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
-            "Cookie": f"v={v_code}",
-        }
-        url = f"http://data.10jqka.com.cn/rank/lxxd/field/lxts/order/desc/page/{page}/ajax/1/free/1/"
-        r = requests.get(url, headers=headers)
-        temp_df = pd.read_html(StringIO(r.text), converters={"股票代码": str})[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    url = "http://data.10jqka.com.cn/rank/lxxd/field/lxts/order/desc/page/{}/ajax/1/free/1/"
+    big_df = _fetch_ths_rank_table(url, converters={"股票代码": str})
     big_df.columns = [
         "序号",
         "股票代码",
@@ -310,37 +212,8 @@ def stock_rank_cxfl_ths() -> pd.DataFrame:
     :return: 持续放量
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
-        "Cookie": f"v={v_code}",
-    }
-    url = "http://data.10jqka.com.cn/rank/cxfl/field/count/order/desc/ajax/1/free/1/page/1/free/1/"
-    r = requests.get(url, headers=headers)
-    soup = BeautifulSoup(r.text, features="lxml")
-    try:
-        total_page = soup.find(name="span", attrs={"class": "page_info"}).text.split(
-            "/"
-        )[1]
-    except AttributeError:
-        total_page = 1
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, int(total_page) + 1), leave=False):
-        v_code = js_code.call("v")
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
-            "Cookie": f"v={v_code}",
-        }
-        url = f"http://data.10jqka.com.cn/rank/cxfl/field/count/order/desc/ajax/1/free/1/page/{page}/free/1/"
-        r = requests.get(url, headers=headers)
-        temp_df = pd.read_html(StringIO(r.text), converters={"股票代码": str})[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    url = "http://data.10jqka.com.cn/rank/cxfl/field/count/order/desc/ajax/1/free/1/page/{}/free/1/"
+    big_df = _fetch_ths_rank_table(url, converters={"股票代码": str})
     big_df.columns = [
         "序号",
         "股票代码",
@@ -370,37 +243,8 @@ def stock_rank_cxsl_ths() -> pd.DataFrame:
     :return: 持续缩量
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
-        "Cookie": f"v={v_code}",
-    }
-    url = "http://data.10jqka.com.cn/rank/cxsl/field/count/order/desc/ajax/1/free/1/page/1/free/1/"
-    r = requests.get(url, headers=headers)
-    soup = BeautifulSoup(r.text, features="lxml")
-    try:
-        total_page = soup.find(name="span", attrs={"class": "page_info"}).text.split(
-            "/"
-        )[1]
-    except AttributeError:
-        total_page = 1
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, int(total_page) + 1), leave=False):
-        v_code = js_code.call("v")
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
-            "Cookie": f"v={v_code}",
-        }
-        url = f"http://data.10jqka.com.cn/rank/cxsl/field/count/order/desc/ajax/1/free/1/page/{page}/free/1/"
-        r = requests.get(url, headers=headers)
-        temp_df = pd.read_html(StringIO(r.text), converters={"股票代码": str})[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    url = "http://data.10jqka.com.cn/rank/cxsl/field/count/order/desc/ajax/1/free/1/page/{}/free/1/"
+    big_df = _fetch_ths_rank_table(url, converters={"股票代码": str})
     big_df.columns = [
         "序号",
         "股票代码",
@@ -442,40 +286,11 @@ def stock_rank_xstp_ths(symbol: str = "500日均线") -> pd.DataFrame:
         "250日均线": 250,
         "500日均线": 500,
     }
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
-        "Cookie": f"v={v_code}",
-    }
-    url = f"http://data.10jqka.com.cn/rank/xstp/board/{symbol_map[symbol]}/order/asc/ajax/1/free/1/page/1/free/1/"
-    r = requests.get(url, headers=headers)
-    soup = BeautifulSoup(r.text, features="lxml")
-    try:
-        total_page = soup.find(name="span", attrs={"class": "page_info"}).text.split(
-            "/"
-        )[1]
-    except AttributeError:
-        total_page = 1
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, int(total_page) + 1), leave=False):
-        v_code = js_code.call("v")
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
-            "Cookie": f"v={v_code}",
-        }
-        url = (
-            f"http://data.10jqka.com.cn/rank/xstp/board/{symbol_map[symbol]}/order/"
-            f"asc/ajax/1/free/1/page/{page}/free/1/"
-        )
-        r = requests.get(url, headers=headers)
-        temp_df = pd.read_html(StringIO(r.text), converters={"股票代码": str})[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    url = (
+        f"http://data.10jqka.com.cn/rank/xstp/board/{symbol_map[symbol]}/order/"
+        "asc/ajax/1/free/1/page/{}/free/1/"
+    )
+    big_df = _fetch_ths_rank_table(url, converters={"股票代码": str})
     big_df.columns = [
         "序号",
         "股票代码",
@@ -514,40 +329,11 @@ def stock_rank_xxtp_ths(symbol: str = "500日均线") -> pd.DataFrame:
         "250日均线": 250,
         "500日均线": 500,
     }
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
-        "Cookie": f"v={v_code}",
-    }
-    url = f"http://data.10jqka.com.cn/rank/xxtp/board/{symbol_map[symbol]}/order/asc/ajax/1/free/1/page/1/free/1/"
-    r = requests.get(url, headers=headers)
-    soup = BeautifulSoup(r.text, features="lxml")
-    try:
-        total_page = soup.find(name="span", attrs={"class": "page_info"}).text.split(
-            "/"
-        )[1]
-    except AttributeError:
-        total_page = 1
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, int(total_page) + 1), leave=False):
-        v_code = js_code.call("v")
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
-            "Cookie": f"v={v_code}",
-        }
-        url = (
-            f"http://data.10jqka.com.cn/rank/xxtp/board/{symbol_map[symbol]}/order/"
-            f"asc/ajax/1/free/1/page/{page}/free/1/"
-        )
-        r = requests.get(url, headers=headers)
-        temp_df = pd.read_html(StringIO(r.text), converters={"股票代码": str})[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    url = (
+        f"http://data.10jqka.com.cn/rank/xxtp/board/{symbol_map[symbol]}/order/"
+        "asc/ajax/1/free/1/page/{}/free/1/"
+    )
+    big_df = _fetch_ths_rank_table(url, converters={"股票代码": str})
     big_df.columns = [
         "序号",
         "股票代码",
@@ -574,37 +360,8 @@ def stock_rank_ljqs_ths() -> pd.DataFrame:
     :return: 量价齐升
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
-        "Cookie": f"v={v_code}",
-    }
-    url = "http://data.10jqka.com.cn/rank/ljqs/field/count/order/desc/ajax/1/free/1/page/1/free/1/"
-    r = requests.get(url, headers=headers)
-    soup = BeautifulSoup(r.text, features="lxml")
-    try:
-        total_page = soup.find(name="span", attrs={"class": "page_info"}).text.split(
-            "/"
-        )[1]
-    except AttributeError:
-        total_page = 1
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, int(total_page) + 1), leave=False):
-        v_code = js_code.call("v")
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
-            "Cookie": f"v={v_code}",
-        }
-        url = f"http://data.10jqka.com.cn/rank/ljqs/field/count/order/desc/ajax/1/free/1/page/{page}/free/1/"
-        r = requests.get(url, headers=headers)
-        temp_df = pd.read_html(StringIO(r.text), converters={"股票代码": str})[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    url = "http://data.10jqka.com.cn/rank/ljqs/field/count/order/desc/ajax/1/free/1/page/{}/free/1/"
+    big_df = _fetch_ths_rank_table(url, converters={"股票代码": str})
     big_df.columns = [
         "序号",
         "股票代码",
@@ -632,37 +389,8 @@ def stock_rank_ljqd_ths() -> pd.DataFrame:
     :return: 量价齐跌
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
-        "Cookie": f"v={v_code}",
-    }
-    url = "http://data.10jqka.com.cn/rank/ljqd/field/count/order/desc/ajax/1/free/1/page/1/free/1/"
-    r = requests.get(url, headers=headers)
-    soup = BeautifulSoup(r.text, features="lxml")
-    try:
-        total_page = soup.find(name="span", attrs={"class": "page_info"}).text.split(
-            "/"
-        )[1]
-    except AttributeError:
-        total_page = 1
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, int(total_page) + 1), leave=False):
-        v_code = js_code.call("v")
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
-            "Cookie": f"v={v_code}",
-        }
-        url = f"http://data.10jqka.com.cn/rank/ljqd/field/count/order/desc/ajax/1/free/1/page/{page}/free/1/"
-        r = requests.get(url, headers=headers)
-        temp_df = pd.read_html(StringIO(r.text), converters={"股票代码": str})[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    url = "http://data.10jqka.com.cn/rank/ljqd/field/count/order/desc/ajax/1/free/1/page/{}/free/1/"
+    big_df = _fetch_ths_rank_table(url, converters={"股票代码": str})
     big_df.columns = [
         "序号",
         "股票代码",
@@ -690,20 +418,9 @@ def stock_rank_xzjp_ths() -> pd.DataFrame:
     :return: 险资举牌
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    big_df = pd.DataFrame()
-    v_code = js_code.call("v")
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
-        "Cookie": f"v={v_code}",
-    }
     url = "http://data.10jqka.com.cn/ajax/xzjp/field/DECLAREDATE/order/desc/ajax/1/free/1/"
-    r = requests.get(url, headers=headers)
-    temp_df = pd.read_html(StringIO(r.text), converters={"股票代码": str})[0]
-    big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    r = requests.get(url, headers=_get_headers_ths())
+    big_df = html_tables_to_df([r.text], converters={"股票代码": str})
     big_df.columns = [
         "序号",
         "举牌公告日",
@@ -13,18 +13,14 @@ import requests
 from akshare.utils.tqdm import get_tqdm
 
 
-def stock_yjbb_em(date: str = "20200331") -> pd.DataFrame:
+def _stock_yjbb_em_request(date: str = "20200331") -> tuple:
     """
-    东方财富-数据中心-年报季报-业绩快报-业绩报表
-    https://data.eastmoney.com/bbsj/202003/yjbb.html
+    东方财富-数据中心-年报季报-业绩快报-业绩报表-请求参数
     :param date: "20200331", "20200630", "20200930", "20201231"; 从 20100331 开始
     :type date: str
-    :return: 业绩报表
-    :rtype: pandas.DataFrame
+    :return: 网址和请求参数
+    :rtype: tuple
     """
-    import warnings
-
-    warnings.simplefilter(action="ignore", category=FutureWarning)  # 忽略所有
     url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
     params = {
         "sortColumns": "UPDATE_DATE,SECURITY_CODE",
@@ -35,23 +31,17 @@ def stock_yjbb_em(date: str = "20200331") -> pd.DataFrame:
         "columns": "ALL",
         "filter": f"(REPORTDATE='{'-'.join([date[:4], date[4:6], date[6:]])}')",
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    page_num = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    big_list = []
-    for page in tqdm(range(1, page_num + 1), leave=False):
-        params.update(
-            {
-                "pageNumber": page,
-            }
-        )
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_list.append(temp_df)
-    big_df = pd.concat(big_list, ignore_index=True)
+    return url, params
+
+
+def _stock_yjbb_em_clean(big_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    东方财富-数据中心-年报季报-业绩快报-业绩报表-整理数据
+    :param big_df: 各页合并后的原始数据
+    :type big_df: pandas.DataFrame
+    :return: 整理后的数据
+    :rtype: pandas.DataFrame
+    """
     big_df.reset_index(inplace=True)
     big_df["index"] = range(1, len(big_df) + 1)
     big_df.columns = [
@@ -143,6 +133,39 @@ def stock_yjbb_em(date: str = "20200331") -> pd.DataFrame:
     return big_df
 
 
+def stock_yjbb_em(date: str = "20200331") -> pd.DataFrame:
+    """
+    东方财富-数据中心-年报季报-业绩快报-业绩报表
+    https://data.eastmoney.com/bbsj/202003/yjbb.html
+    :param date: "20200331", "20200630", "20200930", "20201231"; 从 20100331 开始
+    :type date: str
+    :return: 业绩报表
+    :rtype: pandas.DataFrame
+    """
+    import warnings
+
+    warnings.simplefilter(action="ignore", category=FutureWarning)  # 忽略所有
+    url, params = _stock_yjbb_em_request(date)
+    r = requests.get(url, params=params)
+    data_json = r.json()
+    page_num = data_json["result"]["pages"]
+    big_df = pd.DataFrame()
+    tqdm = get_tqdm()
+    big_list = []
+    for page in tqdm(range(1, page_num + 1), leave=False):
+        params.update(
+            {
+                "pageNumber": page,
+            }
+        )
+        r = requests.get(url, params=params)
+        data_json = r.json()
+        temp_df = pd.DataFrame(data_json["result"]["data"])
+        big_list.append(temp_df)
+    big_df = pd.concat(big_list, ignore_index=True)
+    return _stock_yjbb_em_clean(big_df)
+
+
 if __name__ == "__main__":
     stock_yjbb_em_df = stock_yjbb_em(date="20220331")
     print(stock_yjbb_em_df)
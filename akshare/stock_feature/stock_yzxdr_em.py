@@ -10,7 +10,7 @@ import pandas as pd
 import requests
 from akshare.utils.tqdm import get_tqdm
 
-from akshare.utils import demjson
+from akshare.utils import lenient_json
 
 
 def stock_yzxdr_em(date: str = "20240930") -> pd.DataFrame:
@@ -41,7 +41,7 @@ def stock_yzxdr_em(date: str = "20240930") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -1])
+    data_json = lenient_json.decode(data_text[data_text.find("{") : -1])
     total_pages = data_json["result"]["pages"]
     big_df = pd.DataFrame()
     tqdm = get_tqdm()
@@ -54,7 +54,7 @@ def stock_yzxdr_em(date: str = "20240930") -> pd.DataFrame:
         )
         r = requests.get(url, params=params)
         data_text = r.text
-        data_json = demjson.decode(data_text[data_text.find("{") : -1])
+        data_json = lenient_json.decode(data_text[data_text.find("{") : -1])
         temp_df = pd.DataFrame(data_json["result"]["data"])
         big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
 
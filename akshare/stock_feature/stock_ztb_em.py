@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/11/22 21:30
+Date: 2026/10/19 23:00
 Desc: 首页-行情中心-涨停板行情-涨停股池
 https://quote.eastmoney.com/ztb/detail#type=ztgc
 
@@ -16,36 +16,60 @@ https://quote.eastmoney.com/ztb/detail#type=ztgc
 """
 
 from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
 
 import pandas as pd
 import requests
 
+from akshare.futures.cons import get_calendar
+from akshare.utils.batch import run_batch
+from akshare.utils.store import LocalStore
 
-def stock_zt_pool_em(date: str = "20241008") -> pd.DataFrame:
+# 股票池: (接口地址, 每页数量, 排序方式)
+_ZT_POOL_API = {
+    "zt": ("https://push2ex.eastmoney.com/getTopicZTPool", "10000", "fbt:asc"),
+    "previous": ("https://push2ex.eastmoney.com/getYesterdayZTPool", "5000", "zs:desc"),
+    "strong": ("https://push2ex.eastmoney.com/getTopicQSPool", "5000", "zdp:desc"),
+    "sub_new": ("https://push2ex.eastmoney.com/getTopicCXPooll", "5000", "ods:asc"),
+    "zbgc": ("https://push2ex.eastmoney.com/getTopicZBPool", "5000", "fbt:asc"),
+    "dtgc": ("https://push2ex.eastmoney.com/getTopicDTPool", "10000", "fund:asc"),
+}
+
+
+def _stock_zt_pool_raw(pool: str = "zt", date: str = "20241008") -> pd.DataFrame:
     """
-    东方财富网-行情中心-涨停板行情-涨停股池
-    https://quote.eastmoney.com/ztb/detail#type=ztgc
+    东方财富网-行情中心-涨停板行情-股票池原始数据
+    :param pool: choice of {"zt", "previous", "strong", "sub_new", "zbgc", "dtgc"}
+    :type pool: str
     :param date: 交易日
     :type date: str
-    :return: 涨停股池
+    :return: 原始数据, 没有数据时返回空表
     :rtype: pandas.DataFrame
     """
-    url = "https://push2ex.eastmoney.com/getTopicZTPool"
+    url, pagesize, sort = _ZT_POOL_API[pool]
     params = {
         "ut": "7eea3edcaed734bea9cbfc24409ed989",
         "dpt": "wz.ztzt",
         "Pageindex": "0",
-        "pagesize": "10000",
-        "sort": "fbt:asc",
+        "pagesize": pagesize,
+        "sort": sort,
         "date": date,
     }
     r = requests.get(url, params=params)
     data_json = r.json()
     if data_json["data"] is None:
         return pd.DataFrame()
-    if len(data_json["data"]["pool"]) == 0:
-        return pd.DataFrame()
-    temp_df = pd.DataFrame(data_json["data"]["pool"])
+    return pd.DataFrame(data_json["data"]["pool"])
+
+
+def _stock_zt_pool_em_clean(temp_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    涨停股池-整理原始数据的字段名称和类型
+    :param temp_df: 原始数据
+    :type temp_df: pandas.DataFrame
+    :return: 涨停股池
+    :rtype: pandas.DataFrame
+    """
     temp_df.reset_index(inplace=True)
     temp_df["index"] = range(1, len(temp_df) + 1)
     temp_df.columns = [
@@ -107,31 +131,29 @@ def stock_zt_pool_em(date: str = "20241008") -> pd.DataFrame:
     return temp_df
 
 
-def stock_zt_pool_previous_em(date: str = "20240415") -> pd.DataFrame:
+def stock_zt_pool_em(date: str = "20241008") -> pd.DataFrame:
     """
-    东方财富网-行情中心-涨停板行情-昨日涨停股池
-    https://quote.eastmoney.com/ztb/detail#type=zrzt
+    东方财富网-行情中心-涨停板行情-涨停股池
+    https://quote.eastmoney.com/ztb/detail#type=ztgc
     :param date: 交易日
     :type date: str
-    :return: 昨日涨停股池
+    :return: 涨停股池
     :rtype: pandas.DataFrame
     """
-    url = "https://push2ex.eastmoney.com/getYesterdayZTPool"
-    params = {
-        "ut": "7eea3edcaed734bea9cbfc24409ed989",
-        "dpt": "wz.ztzt",
-        "Pageindex": "0",
-        "pagesize": "5000",
-        "sort": "zs:desc",
-        "date": date,
-    }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    if data_json["data"] is None:
-        return pd.DataFrame()
-    if len(data_json["data"]["pool"]) == 0:
+    temp_df = _stock_zt_pool_raw(pool="zt", date=date)
+    if temp_df.empty:
         return pd.DataFrame()
-    temp_df = pd.DataFrame(data_json["data"]["pool"])
+    return _stock_zt_pool_em_clean(temp_df)
+
+
+def _stock_zt_pool_previous_em_clean(temp_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    昨日涨停股池-整理原始数据的字段名称和类型
+    :param temp_df: 原始数据
+    :type temp_df: pandas.DataFrame
+    :return: 昨日涨停股池
+    :rtype: pandas.DataFrame
+    """
     temp_df.reset_index(inplace=True)
     temp_df["index"] = range(1, len(temp_df) + 1)
     temp_df.columns = [
@@ -184,31 +206,29 @@ def stock_zt_pool_previous_em(date: str = "20240415") -> pd.DataFrame:
     return temp_df
 
 
-def stock_zt_pool_strong_em(date: str = "20241231") -> pd.DataFrame:
+def stock_zt_pool_previous_em(date: str = "20240415") -> pd.DataFrame:
     """
-    东方财富网-行情中心-涨停板行情-强势股池
-    https://quote.eastmoney.com/ztb/detail#type=qsgc
+    东方财富网-行情中心-涨停板行情-昨日涨停股池
+    https://quote.eastmoney.com/ztb/detail#type=zrzt
     :param date: 交易日
     :type date: str
-    :return: 强势股池
+    :return: 昨日涨停股池
     :rtype: pandas.DataFrame
     """
-    url = "https://push2ex.eastmoney.com/getTopicQSPool"
-    params = {
-        "ut": "7eea3edcaed734bea9cbfc24409ed989",
-        "dpt": "wz.ztzt",
-        "Pageindex": "0",
-        "pagesize": "5000",
-        "sort": "zdp:desc",
-        "date": date,
-    }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    if data_json["data"] is None:
+    temp_df = _stock_zt_pool_raw(pool="previous", date=date)
+    if temp_df.empty:
         return pd.DataFrame()
-    if len(data_json["data"]["pool"]) == 0:
-        return pd.DataFrame()
-    temp_df = pd.DataFrame(data_json["data"]["pool"])
+    return _stock_zt_pool_previous_em_clean(temp_df)
+
+
+def _stock_zt_pool_strong_em_clean(temp_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    强势股池-整理原始数据的字段名称和类型
+    :param temp_df: 原始数据
+    :type temp_df: pandas.DataFrame
+    :return: 强势股池
+    :rtype: pandas.DataFrame
+    """
     temp_df.reset_index(inplace=True)
     temp_df["index"] = range(1, len(temp_df) + 1)
     temp_df.columns = [
@@ -273,29 +293,29 @@ def stock_zt_pool_strong_em(date: str = "20241231") -> pd.DataFrame:
     return temp_df
 
 
-def stock_zt_pool_sub_new_em(date: str = "20241231") -> pd.DataFrame:
+def stock_zt_pool_strong_em(date: str = "20241231") -> pd.DataFrame:
     """
-    东方财富网-行情中心-涨停板行情-次新股池
-    https://quote.eastmoney.com/ztb/detail#type=cxgc
+    东方财富网-行情中心-涨停板行情-强势股池
+    https://quote.eastmoney.com/ztb/detail#type=qsgc
     :param date: 交易日
     :type date: str
-    :return: 次新股池
+    :return: 强势股池
     :rtype: pandas.DataFrame
     """
-    url = "https://push2ex.eastmoney.com/getTopicCXPooll"
-    params = {
-        "ut": "7eea3edcaed734bea9cbfc24409ed989",
-        "dpt": "wz.ztzt",
-        "Pageindex": "0",
-        "pagesize": "5000",
-        "sort": "ods:asc",
-        "date": date,
-    }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    if len(data_json["data"]["pool"]) == 0:
+    temp_df = _stock_zt_pool_raw(pool="strong", date=date)
+    if temp_df.empty:
         return pd.DataFrame()
-    temp_df = pd.DataFrame(data_json["data"]["pool"])
+    return _stock_zt_pool_strong_em_clean(temp_df)
+
+
+def _stock_zt_pool_sub_new_em_clean(temp_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    次新股池-整理原始数据的字段名称和类型
+    :param temp_df: 原始数据
+    :type temp_df: pandas.DataFrame
+    :return: 次新股池
+    :rtype: pandas.DataFrame
+    """
     temp_df.reset_index(inplace=True)
     temp_df["index"] = range(1, len(temp_df) + 1)
     temp_df.columns = [
@@ -354,36 +374,29 @@ def stock_zt_pool_sub_new_em(date: str = "20241231") -> pd.DataFrame:
     return temp_df
 
 
-def stock_zt_pool_zbgc_em(date: str = "20241011") -> pd.DataFrame:
+def stock_zt_pool_sub_new_em(date: str = "20241231") -> pd.DataFrame:
     """
-    东方财富网-行情中心-涨停板行情-炸板股池
-    https://quote.eastmoney.com/ztb/detail#type=zbgc
+    东方财富网-行情中心-涨停板行情-次新股池
+    https://quote.eastmoney.com/ztb/detail#type=cxgc
     :param date: 交易日
     :type date: str
-    :return: 炸板股池
+    :return: 次新股池
     :rtype: pandas.DataFrame
     """
-    thirty_days_ago = datetime.now() - timedelta(days=30)
-    thirty_days_ago_str = thirty_days_ago.strftime("%Y%m%d")
-    if int(date) < int(thirty_days_ago_str):
-        raise ValueError("炸板股池只能获取最近 30 个交易日的数据")
-
-    url = "https://push2ex.eastmoney.com/getTopicZBPool"
-    params = {
-        "ut": "7eea3edcaed734bea9cbfc24409ed989",
-        "dpt": "wz.ztzt",
-        "Pageindex": "0",
-        "pagesize": "5000",
-        "sort": "fbt:asc",
-        "date": date,
-    }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    if data_json["data"] is None:
-        return pd.DataFrame()
-    if len(data_json["data"]["pool"]) == 0:
+    temp_df = _stock_zt_pool_raw(pool="sub_new", date=date)
+    if temp_df.empty:
         return pd.DataFrame()
-    temp_df = pd.DataFrame(data_json["data"]["pool"])
+    return _stock_zt_pool_sub_new_em_clean(temp_df)
+
+
+def _stock_zt_pool_zbgc_em_clean(temp_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    炸板股池-整理原始数据的字段名称和类型
+    :param temp_df: 原始数据
+    :type temp_df: pandas.DataFrame
+    :return: 炸板股池
+    :rtype: pandas.DataFrame
+    """
     temp_df.reset_index(inplace=True)
     temp_df["index"] = range(1, len(temp_df) + 1)
     temp_df.columns = [
@@ -436,34 +449,33 @@ def stock_zt_pool_zbgc_em(date: str = "20241011") -> pd.DataFrame:
     return temp_df
 
 
-def stock_zt_pool_dtgc_em(date: str = "20241011") -> pd.DataFrame:
+def stock_zt_pool_zbgc_em(date: str = "20241011") -> pd.DataFrame:
     """
-    东方财富网-行情中心-涨停板行情-跌停股池
-    https://quote.eastmoney.com/ztb/detail#type=dtgc
+    东方财富网-行情中心-涨停板行情-炸板股池
+    https://quote.eastmoney.com/ztb/detail#type=zbgc
     :param date: 交易日
     :type date: str
-    :return: 跌停股池
+    :return: 炸板股池
     :rtype: pandas.DataFrame
     """
     thirty_days_ago = datetime.now() - timedelta(days=30)
     thirty_days_ago_str = thirty_days_ago.strftime("%Y%m%d")
     if int(date) < int(thirty_days_ago_str):
-        raise ValueError("跌停股池只能获取最近 30 个交易日的数据")
-
-    url = "https://push2ex.eastmoney.com/getTopicDTPool"
-    params = {
-        "ut": "7eea3edcaed734bea9cbfc24409ed989",
-        "dpt": "wz.ztzt",
-        "Pageindex": "0",
-        "pagesize": "10000",
-        "sort": "fund:asc",
-        "date": date,
-    }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    if len(data_json["data"]["pool"]) == 0:
+        raise ValueError("炸板股池只能获取最近 30 个交易日的数据")
+    temp_df = _stock_zt_pool_raw(pool="zbgc", date=date)
+    if temp_df.empty:
         return pd.DataFrame()
-    temp_df = pd.DataFrame(data_json["data"]["pool"])
+    return _stock_zt_pool_zbgc_em_clean(temp_df)
+
+
+def _stock_zt_pool_dtgc_em_clean(temp_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    跌停股池-整理原始数据的字段名称和类型
+    :param temp_df: 原始数据
+    :type temp_df: pandas.DataFrame
+    :return: 跌停股池
+    :rtype: pandas.DataFrame
+    """
     temp_df.reset_index(inplace=True)
     temp_df["index"] = range(1, len(temp_df) + 1)
     temp_df.columns = [
@@ -522,7 +534,163 @@ def stock_zt_pool_dtgc_em(date: str = "20241011") -> pd.DataFrame:
     return temp_df
 
 
+def stock_zt_pool_dtgc_em(date: str = "20241011") -> pd.DataFrame:
+    """
+    东方财富网-行情中心-涨停板行情-跌停股池
+    https://quote.eastmoney.com/ztb/detail#type=dtgc
+    :param date: 交易日
+    :type date: str
+    :return: 跌停股池
+    :rtype: pandas.DataFrame
+    """
+    thirty_days_ago = datetime.now() - timedelta(days=30)
+    thirty_days_ago_str = thirty_days_ago.strftime("%Y%m%d")
+    if int(date) < int(thirty_days_ago_str):
+        raise ValueError("跌停股池只能获取最近 30 个交易日的数据")
+    temp_df = _stock_zt_pool_raw(pool="dtgc", date=date)
+    if temp_df.empty:
+        return pd.DataFrame()
+    return _stock_zt_pool_dtgc_em_clean(temp_df)
+
+
+_ZT_POOL_CLEAN = {
+    "zt": _stock_zt_pool_em_clean,
+    "previous": _stock_zt_pool_previous_em_clean,
+    "strong": _stock_zt_pool_strong_em_clean,
+    "sub_new": _stock_zt_pool_sub_new_em_clean,
+    "zbgc": _stock_zt_pool_zbgc_em_clean,
+    "dtgc": _stock_zt_pool_dtgc_em_clean,
+}
+# 炸板股池和跌停股池只能获取最近 30 个交易日的数据
+_ZT_POOL_RECENT = {"zbgc", "dtgc"}
+_store = LocalStore(namespace="stock_zt_pool_em")
+
+
+def _stock_zt_pool_save(pool: str, frame_list: List[Tuple[str, pd.DataFrame]]) -> None:
+    """
+    整理一批交易日的原始数据并按 (股票池, 年份) 分区追加到本地仓库
+    :param pool: choice of {"zt", "previous", "strong", "sub_new", "zbgc", "dtgc"}
+    :type pool: str
+    :param frame_list: (交易日, 原始数据) 列表
+    :type frame_list: list
+    :return: None
+    :rtype: None
+    """
+    # 字段相同的原始数据合并后只整理一次, 接口字段变化前后的数据分开整理
+    group_dict = {}
+    for date, temp_df in frame_list:
+        group_dict.setdefault(tuple(temp_df.columns), []).append((date, temp_df))
+    for group_list in group_dict.values():
+        date_list = [date for date, temp_df in group_list for _ in range(len(temp_df))]
+        temp_df = _ZT_POOL_CLEAN[pool](
+            pd.concat([item for _, item in group_list], ignore_index=True)
+        )
+        temp_df.insert(1, "日期", pd.to_datetime(date_list, format="%Y%m%d").date)
+        temp_df["序号"] = temp_df.groupby("日期").cumcount() + 1
+        year_list = [date[:4] for date in date_list]
+        for year, year_df in temp_df.groupby(year_list):
+            _store.append(f"{pool}_{year}", year_df, subset=["日期", "代码"])
+
+
+def stock_zt_pool_hist_em(
+    start_date: str = "20250102",
+    end_date: str = "20250110",
+    pool_list: Tuple = tuple(_ZT_POOL_API),
+    max_workers: int = 8,
+    refresh: bool = False,
+) -> Tuple[Dict[str, pd.DataFrame], pd.DataFrame]:
+    """
+    东方财富网-行情中心-涨停板行情-股票池历史数据
+    按交易日历并发获取 (股票池, 交易日) 的数据, 整理后按 (股票池, 年份) 追加到本地仓库;
+    再次运行时只获取本地没有的 (股票池, 交易日), 当天的数据每次都重新获取
+    https://quote.eastmoney.com/ztb/detail#type=ztgc
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :param pool_list: 股票池, choice of {"zt": 涨停股池, "previous": 昨日涨停股池, "strong": 强势股池, "sub_new": 次新股池, "zbgc": 炸板股池, "dtgc": 跌停股池}; 炸板股池和跌停股池只获取最近 30 天的数据
+    :type pool_list: tuple
+    :param max_workers: 最大并发数
+    :type max_workers: int
+    :param refresh: 是否忽略本地仓库重新获取
+    :type refresh: bool
+    :return: 股票池到历史数据的字典和错误表
+    :rtype: tuple
+    """
+    today = datetime.now().strftime("%Y%m%d")
+    recent_date = (datetime.now() - timedelta(days=30)).strftime("%Y%m%d")
+    fetched_df = None if refresh else _store.read("fetched")
+    fetched_set = (
+        set()
+        if fetched_df is None
+        else set(zip(fetched_df["pool"], fetched_df["date"]))
+    )
+    task_list = [
+        {"pool": pool, "date": date}
+        for date in get_calendar()
+        if start_date <= date <= min(end_date, today)
+        for pool in pool_list
+        if (pool, date) not in fetched_set
+        and not (pool in _ZT_POOL_RECENT and date < recent_date)
+    ]
+    # 分批写入本地仓库, 长时间的回补中断后已完成的部分不会丢失
+    chunk_size = max(1, max_workers) * 20
+    error_list = []
+    for i in range(0, len(task_list), chunk_size):
+        chunk_list = task_list[i : i + chunk_size]
+        result_list, error_df = run_batch(
+            _stock_zt_pool_raw,
+            chunk_list,
+            max_workers=max_workers,
+            host="push2ex.eastmoney.com",
+        )
+        error_list.append(error_df)
+        for pool in pool_list:
+            frame_list = [
+                (task["date"], temp_df)
+                for task, temp_df in zip(chunk_list, result_list)
+                if task["pool"] == pool and temp_df is not None and not temp_df.empty
+            ]
+            if frame_list:
+                _stock_zt_pool_save(pool, frame_list)
+        # 当天的股票池盘中还在变化, 不记为已获取
+        done_list = [
+            task
+            for task, temp_df in zip(chunk_list, result_list)
+            if temp_df is not None and task["date"] < today
+        ]
+        if done_list:
+            _store.append("fetched", pd.DataFrame(done_list), subset=["pool", "date"])
+    start_day = pd.to_datetime(start_date, format="%Y%m%d").date()
+    end_day = pd.to_datetime(end_date, format="%Y%m%d").date()
+    pool_dict = {}
+    for pool in pool_list:
+        year_list = [
+            _store.read(f"{pool}_{year}")
+            for year in range(start_day.year, end_day.year + 1)
+        ]
+        year_list = [item for item in year_list if item is not None]
+        if not year_list:
+            pool_dict[pool] = pd.DataFrame()
+            continue
+        temp_df = pd.concat(year_list, ignore_index=True)
+        temp_df = temp_df[(temp_df["日期"] >= start_day) & (temp_df["日期"] <= end_day)]
+        pool_dict[pool] = temp_df.sort_values(by=["日期", "序号"], ignore_index=True)
+    error_df = (
+        pd.concat(error_list, ignore_index=True)
+        if error_list
+        else pd.DataFrame(columns=["pool", "date", "error_type", "error"])
+    )
+    return pool_dict, error_df
+
+
 if __name__ == "__main__":
+    stock_zt_pool_hist_em_dict, stock_zt_pool_hist_em_error_df = stock_zt_pool_hist_em(
+        start_date="20250102", end_date="20250110"
+    )
+    print(stock_zt_pool_hist_em_dict["zt"])
+    print(stock_zt_pool_hist_em_error_df)
+
     stock_zt_pool_em_df = stock_zt_pool_em(date="20241008")
     print(stock_zt_pool_em_df)
 
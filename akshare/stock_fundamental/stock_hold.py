@@ -11,7 +11,7 @@ from io import StringIO
 import pandas as pd
 import requests
 
-from akshare.utils import demjson
+from akshare.utils import lenient_json
 
 
 def stock_institute_hold(symbol: str = "20051") -> pd.DataFrame:
@@ -75,7 +75,7 @@ def stock_institute_hold_detail(
     }
     r = requests.get(url, params=params)
     text_data = r.text
-    json_data = demjson.decode(text_data[text_data.find("{") : -2])
+    json_data = lenient_json.decode(text_data[text_data.find("{") : -2])
     big_df = pd.DataFrame()
     for item in json_data["data"].keys():
         inner_temp_df = pd.DataFrame(json_data["data"][item]).T.iloc[:-1, :]
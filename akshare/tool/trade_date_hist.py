@@ -10,24 +10,26 @@ https://finance.sina.com.cn/realstock/company/klc_td_sh.txt
 import datetime
 
 import pandas as pd
-import requests
 import py_mini_racer
 
 from akshare.stock.cons import hk_js_decode
+from akshare.utils.http_cache import fetch_parsed
 
 
-def tool_trade_date_hist_sina() -> pd.DataFrame:
+def _parse_trade_date(content: bytes) -> pd.DataFrame:
     """
-    新浪财经-交易日历-历史数据
-    https://finance.sina.com.cn/realstock/company/klc_td_sh.txt
+    新浪财经-交易日历-解码 klc_td_sh.txt
+    :param content: 文件内容
+    :type content: bytes
     :return: 交易日历
     :rtype: pandas.DataFrame
     """
-    url = "https://finance.sina.com.cn/realstock/company/klc_td_sh.txt"
-    r = requests.get(url)
+    data_text = content.decode("utf-8", errors="replace")
     js_code = py_mini_racer.MiniRacer()
     js_code.eval(hk_js_decode)
-    dict_list = js_code.call("d", r.text.split("=")[1].split(";")[0].replace('"', ""))
+    dict_list = js_code.call(
+        "d", data_text.split("=")[1].split(";")[0].replace('"', "")
+    )
     temp_df = pd.DataFrame(dict_list)
     temp_df.columns = ["trade_date"]
     temp_df["trade_date"] = pd.to_datetime(temp_df["trade_date"]).dt.date
@@ -39,6 +41,18 @@ def tool_trade_date_hist_sina() -> pd.DataFrame:
     return temp_df
 
 
+def tool_trade_date_hist_sina() -> pd.DataFrame:
+    """
+    新浪财经-交易日历-历史数据
+    https://finance.sina.com.cn/realstock/company/klc_td_sh.txt
+    :return: 交易日历
+    :rtype: pandas.DataFrame
+    """
+    url = "https://finance.sina.com.cn/realstock/company/klc_td_sh.txt"
+    # 日历文件每年才更新几次, 条件请求未变化时跳过 JavaScript 解码
+    return fetch_parsed(url, parser=_parse_trade_date, namespace="sina")
+
+
 if __name__ == "__main__":
     tool_trade_date_hist_df = tool_trade_date_hist_sina()
     print(tool_trade_date_hist_df)
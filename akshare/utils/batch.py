@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 13:00
+Desc: 批量任务调度
+有界并发 + 按主机限流(同一主机的最大并发数和最小请求间隔), 单个任务失败不会中断整个批次,
+失败的任务以错误表的形式返回
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+import requests
+
+from akshare.utils.instrument import incr, propagate_context
+from akshare.utils.tqdm import get_tqdm
+
+
+class HostLimiter:
+    """
+    按主机限流: 限制同一主机的并发请求数, 以及相邻两次请求之间的最小间隔(秒)
+    """
+
+    def __init__(self, max_concurrency: int = 4, min_interval: float = 0.0):
+        self.max_concurrency = max_concurrency
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._hosts = {}
+
+    def _get_host_state(self, host: str) -> Dict:
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = {
+                    "semaphore": threading.BoundedSemaphore(self.max_concurrency),
+                    "lock": threading.Lock(),
+                    "last_time": 0.0,
+                }
+            return self._hosts[host]
+
+    @contextmanager
+    def limit(self, host: Optional[str]):
+        """
+        在该主机的限流范围内执行代码块
+        :param host: 主机名, 为 None 时不限流
+        :type host: str
+        """
+        if host is None:
+            yield
+            return
+        state = self._get_host_state(host)
+        with state["semaphore"]:
+            if self.min_interval > 0:
+                with state["lock"]:
+                    wait_time = (
+                        state["last_time"] + self.min_interval - time.monotonic()
+                    )
+                    if wait_time > 0:
+                        time.sleep(wait_time)
+                    state["last_time"] = time.monotonic()
+            yield
+
+
+# 默认的全局限流器, 所有批量接口共享
+default_limiter = HostLimiter(max_concurrency=4, min_interval=0.05)
+
+
+def _is_retryable(error: Exception) -> bool:
+    """
+    是否为可以重试的临时错误: 连接错误、超时、HTTP 5xx 和 429
+    代码不存在、解析失败等确定性错误重试也不会成功, 直接记入错误表
+    :param error: 任务抛出的异常
+    :type error: Exception
+    :return: 是否重试
+    :rtype: bool
+    """
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status_code = error.response.status_code
+        return status_code >= 500 or status_code == 429
+    return False
+
+
+def run_batch(
+    func: Callable,
+    task_list: List[Dict],
+    max_workers: int = 8,
+    host: Optional[str] = None,
+    limiter: Optional[HostLimiter] = None,
+    max_retries: int = 3,
+    retry_delay: float = 1,
+    show_progress: bool = True,
+) -> Tuple[List[Any], pd.DataFrame]:
+    """
+    并发执行批量任务, 每个任务为 func 的关键字参数
+    :param func: 需要执行的函数
+    :type func: callable
+    :param task_list: 任务列表, 例如 [{"symbol": "000001"}, {"symbol": "600000"}]
+    :type task_list: list
+    :param max_workers: 最大并发数
+    :type max_workers: int
+    :param host: 任务请求的主机, 用于按主机限流
+    :type host: str
+    :param limiter: 限流器, 默认使用全局限流器
+    :type limiter: HostLimiter
+    :param max_retries: 最大尝试次数, 只有连接错误、超时、HTTP 5xx 和 429 会重试
+    :type max_retries: int
+    :param retry_delay: 初始重试延迟(秒), 之后指数退避
+    :type retry_delay: float
+    :param show_progress: 是否显示进度条
+    :type show_progress: bool
+    :return: 与 task_list 顺序一致的结果列表(失败的任务为 None)和错误表
+    :rtype: tuple
+    """
+    limiter = limiter or default_limiter
+
+    def _run(task: Dict) -> Tuple[Any, Optional[Exception]]:
+        delay = retry_delay
+        for attempt in range(max(1, max_retries)):
+            try:
+                with limiter.limit(host):
+                    return func(**task), None
+            except Exception as e:
+                if attempt == max(1, max_retries) - 1 or not _is_retryable(e):
+                    return None, e
+                incr("retries")
+                time.sleep(delay)
+                delay *= 2
+        return None, None
+
+    tqdm = get_tqdm(enable=show_progress)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        output_list = list(
+            tqdm(
+                executor.map(propagate_context(_run), task_list),
+                total=len(task_list),
+                leave=False,
+            )
+        )
+    result_list = [item[0] for item in output_list]
+    error_list = [
+        {**task, "error_type": type(error).__name__, "error": str(error)}
+        for task, (_, error) in zip(task_list, output_list)
+        if error is not None
+    ]
+    error_df = pd.DataFrame(
+        error_list,
+        columns=(
+            list(task_list[0].keys()) + ["error_type", "error"]
+            if task_list
+            else ["error_type", "error"]
+        ),
+    )
+    return result_list, error_df
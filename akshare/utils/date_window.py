@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 17:00
+Desc: 日期窗口拆分
+部分接口限制单次查询的日期跨度, 超出时报错或者静默截断; 使用 date_window 声明接口的最大跨度后,
+超出跨度的请求会被拆分为多个符合要求的子窗口并发获取, 再按主键合并去重
+"""
+
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional, Tuple
+
+import pandas as pd
+
+from akshare.utils.batch import default_limiter
+from akshare.utils.instrument import propagate_context
+
+
+def split_date_range(
+    start_date: str, end_date: str, max_days: int
+) -> List[Tuple[str, str]]:
+    """
+    将日期区间拆分为首尾相接且互不重叠的子窗口, 每个子窗口(包含首尾)不超过 max_days 天
+    :param start_date: 开始日期, 例如 "20200101"
+    :type start_date: str
+    :param end_date: 结束日期, 例如 "20231231"
+    :type end_date: str
+    :param max_days: 子窗口的最大天数
+    :type max_days: int
+    :return: [(开始日期, 结束日期), ...]
+    :rtype: list
+    """
+    start = datetime.strptime(start_date, "%Y%m%d")
+    end = datetime.strptime(end_date, "%Y%m%d")
+    window_list = []
+    while start <= end:
+        window_end = min(start + timedelta(days=max_days - 1), end)
+        window_list.append((start.strftime("%Y%m%d"), window_end.strftime("%Y%m%d")))
+        start = window_end + timedelta(days=1)
+    return window_list
+
+
+def date_window(
+    max_days: int,
+    key_columns: Optional[List[str]] = None,
+    sort_columns: Optional[List[str]] = None,
+    ascending: bool = True,
+    host: Optional[str] = None,
+    max_workers: int = 4,
+) -> Callable:
+    """
+    声明接口单次查询的最大日期跨度, 接口需要有 start_date 和 end_date 参数(格式为 YYYYMMDD)
+    :param max_days: 单次查询的最大天数(包含首尾)
+    :type max_days: int
+    :param key_columns: 合并后按这些字段去重, 默认为所有字段
+    :type key_columns: list
+    :param sort_columns: 合并后按这些字段排序, 默认保持子窗口的先后顺序
+    :type sort_columns: list
+    :param ascending: 排序方向
+    :type ascending: bool
+    :param host: 接口请求的主机, 每个子窗口的调用整体占用一个限流名额; 接口内部已经按主机限流时不要指定
+    :type host: str
+    :param max_workers: 最大并发数
+    :type max_workers: int
+    :return: 装饰器
+    :rtype: callable
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> pd.DataFrame:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            window_list = split_date_range(
+                bound.arguments["start_date"], bound.arguments["end_date"], max_days
+            )
+            if len(window_list) <= 1:
+                return func(*bound.args, **bound.kwargs)
+
+            def _fetch(window: Tuple[str, str]) -> pd.DataFrame:
+                arguments = dict(bound.arguments)
+                arguments["start_date"], arguments["end_date"] = window
+                with default_limiter.limit(host):
+                    return func(**arguments)
+
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                df_list = list(executor.map(propagate_context(_fetch), window_list))
+            data_list = [temp_df for temp_df in df_list if not temp_df.empty]
+            if not data_list:
+                return df_list[0]
+            big_df = pd.concat(data_list, ignore_index=True)
+            big_df.drop_duplicates(subset=key_columns, keep="last", inplace=True)
+            if sort_columns is not None:
+                big_df.sort_values(
+                    by=sort_columns, ascending=ascending, kind="stable", inplace=True
+                )
+            big_df.reset_index(drop=True, inplace=True)
+            return big_df
+
+        wrapper.max_days = max_days
+        return wrapper
+
+    return decorator
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 12:00
+Desc: Excel 文件解析
+优先使用 calamine 引擎(需要安装 python-calamine), 批量文件在进程池中并行解析;
+启用常驻进程池(akshare.utils.process_pool)时所有解析都交给它执行
+"""
+
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from importlib.util import find_spec
+from io import BytesIO
+from typing import List, Optional
+
+import pandas as pd
+
+from akshare.utils.process_pool import (
+    get_process_pool,
+    map_in_process_pool,
+    run_in_process_pool,
+)
+
+
+def get_excel_engine() -> Optional[str]:
+    """
+    可用的最快 Excel 解析引擎
+    :return: 安装了 python-calamine 时返回 "calamine", 否则返回 None 交给 pandas 自动选择
+    :rtype: str
+    """
+    if find_spec("python_calamine") is not None:
+        return "calamine"
+    return None
+
+
+def _read_excel_bytes(content: bytes, **kwargs) -> pd.DataFrame:
+    engine = kwargs.pop("engine", None) or get_excel_engine()
+    return pd.read_excel(BytesIO(content), engine=engine, **kwargs)
+
+
+def read_excel_bytes(content: bytes, **kwargs) -> pd.DataFrame:
+    """
+    解析 Excel 文件的原始字节
+    :param content: 文件内容
+    :type content: bytes
+    :param kwargs: 传给 pandas.read_excel 的其他参数
+    :type kwargs: dict
+    :return: 解析后的数据
+    :rtype: pandas.DataFrame
+    """
+    return run_in_process_pool(_read_excel_bytes, content, **kwargs)
+
+
+def read_excel_bytes_list(
+    content_list: List[bytes], processes: Optional[int] = None, **kwargs
+) -> List[pd.DataFrame]:
+    """
+    在进程池中并行解析多个 Excel 文件, 返回结果与 content_list 的顺序一致
+    :param content_list: 文件内容列表
+    :type content_list: list
+    :param processes: 进程数, 默认为 CPU 核数; 文件较少或者为 1 时在当前进程中解析; 启用常驻进程池时忽略
+    :type processes: int
+    :param kwargs: 传给 pandas.read_excel 的其他参数
+    :type kwargs: dict
+    :return: 解析后的数据列表
+    :rtype: list
+    """
+    if get_process_pool() is not None:
+        return map_in_process_pool(
+            functools.partial(_read_excel_bytes, **kwargs), content_list
+        )
+    processes = processes or os.cpu_count() or 1
+    processes = min(processes, len(content_list))
+    if processes <= 1:
+        return [_read_excel_bytes(content, **kwargs) for content in content_list]
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [
+            executor.submit(_read_excel_bytes, content, **kwargs)
+            for content in content_list
+        ]
+        return [future.result() for future in futures]
@@ -5,11 +5,13 @@ Desc: 通用帮助函数
 """
 
 import math
-from typing import List, Dict
+from typing import Dict, Iterator, List, Optional, Sequence, Union
 
 import pandas as pd
 import requests
 
+from akshare.utils.instrument import incr, phase, record_response
+from akshare.utils.stream_json import decode_records
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -29,25 +31,115 @@ def fetch_paginated_data(url: str, base_params: Dict, timeout: int = 15):
     # 复制参数以避免修改原始参数
     params = base_params.copy()
     # 获取第一页数据，用于确定分页信息
-    r = requests.get(url, params=params, timeout=timeout)
-    data_json = r.json()
+    with phase("network"):
+        r = requests.get(url, params=params, timeout=timeout)
+    record_response(r)
+    with phase("parse"):
+        data_json = r.json()
     # 计算分页信息
     per_page_num = len(data_json["data"]["diff"])
     total_page = math.ceil(data_json["data"]["total"] / per_page_num)
     # 存储所有页面数据
     temp_list = []
     # 添加第一页数据
-    temp_list.append(pd.DataFrame(data_json["data"]["diff"]))
+    with phase("transform"):
+        temp_list.append(pd.DataFrame(data_json["data"]["diff"]))
     # 获取进度条
     tqdm = get_tqdm()
     # 获取剩余页面数据
     for page in tqdm(range(2, total_page + 1), leave=False):
         params.update({"pn": page})
-        r = requests.get(url, params=params, timeout=timeout)
-        data_json = r.json()
-        inner_temp_df = pd.DataFrame(data_json["data"]["diff"])
+        with phase("network"):
+            r = requests.get(url, params=params, timeout=timeout)
+        record_response(r)
+        with phase("parse"):
+            data_json = r.json()
+        with phase("transform"):
+            inner_temp_df = pd.DataFrame(data_json["data"]["diff"])
         temp_list.append(inner_temp_df)
-    # 合并所有数据
+    incr("pages", total_page)
+    with phase("transform"):
+        return paginated_data_to_df(temp_list)
+
+
+def _iter_response_chunks(r: requests.Response) -> Iterator[bytes]:
+    """
+    逐块读取流式响应, 下载耗时计入网络阶段
+    :param r: stream=True 的响应
+    :type r: requests.Response
+    :return: 响应内容的字节块
+    :rtype: iterator
+    """
+    chunk_iter = r.iter_content(chunk_size=65536)
+    while True:
+        with phase("network"):
+            chunk = next(chunk_iter, None)
+        if chunk is None:
+            return
+        incr("bytes", len(chunk))
+        yield chunk
+
+
+def fetch_datacenter_data(
+    url: str,
+    params: Dict,
+    fields: Optional[Sequence[Union[str, int]]] = None,
+    timeout: int = 15,
+) -> pd.DataFrame:
+    """
+    东方财富-数据中心-分页获取 result.data 并合并结果
+    边下载边解析, 只保留 fields 中的字段, 全部页面解析完后一次性构建 DataFrame
+    https://data.eastmoney.com/stock/tradedetail.html
+    :param url: 数据中心接口地址
+    :type url: str
+    :param params: 请求参数, 分页参数为 pageNumber
+    :type params: dict
+    :param fields: 需要保留的字段名称或位置(按第一条记录的字段顺序), None 表示保留全部字段
+    :type fields: list
+    :param timeout: 请求超时时间
+    :type timeout: int
+    :return: 合并后的数据, 列名为原始字段名; 接口返回 "result": null 时为空的 DataFrame
+    :rtype: pandas.DataFrame
+    :raises requests.HTTPError: 任意一页的 HTTP 状态码表示错误
+    :raises ValueError: 任意一页不是包含 result.data 的 JSON
+    """
+    params = params.copy()
+
+    def _fetch_page(page: int, columns: Dict[str, list]) -> tuple:
+        params.update({"pageNumber": page})
+        with phase("network"):
+            r = requests.get(url, params=params, timeout=timeout, stream=True)
+        record_response(r, count_bytes=False)
+        try:
+            r.raise_for_status()
+            with phase("parse"):
+                return decode_records(
+                    _iter_response_chunks(r), fields=fields, columns=columns
+                )
+        finally:
+            r.close()
+
+    # 第一页同时提供分页信息, 不再重复请求
+    columns, meta = _fetch_page(1, {})
+    if not columns:
+        return pd.DataFrame()
+    total_page = meta.get("pages", 1)
+    tqdm = get_tqdm()
+    for page in tqdm(range(2, total_page + 1), leave=False):
+        columns, _ = _fetch_page(page, columns)
+    incr("pages", total_page)
+    with phase("transform"):
+        return pd.DataFrame(columns)
+
+
+def paginated_data_to_df(temp_list: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    东方财富-合并分页数据, 按涨跌幅降序排列并添加序号
+    :param temp_list: 每一页的数据
+    :type temp_list: list
+    :return: 合并后的数据
+    :rtype: pandas.DataFrame
+    """
     temp_df = pd.concat(temp_list, ignore_index=True)
     temp_df["f3"] = pd.to_numeric(temp_df["f3"], errors="coerce")
     temp_df.sort_values(by=["f3"], ascending=False, inplace=True, ignore_index=True)
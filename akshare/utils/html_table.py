@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 11:00
+Desc: 分页 HTML 表格批量采集
+并发下载所有分页, 通过 lxml 的 XPath 直接抽取目标 <table> 中的原始字符串,
+所有分页的行合并后只做一次类型推断, 代替逐页 pd.read_html 再 pd.concat 的做法
+"""
+
+import functools
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+import requests
+from lxml import html as lxml_html
+from pandas.io.parsers import TextParser
+
+from akshare.utils.instrument import incr, phase, propagate_context, record_response
+from akshare.utils.process_pool import map_in_process_pool
+from akshare.utils.tqdm import get_tqdm
+
+DEFAULT_MAX_WORKERS = 4
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def _cell_text(cell) -> str:
+    return _WHITESPACE_PATTERN.sub(" ", "".join(cell.itertext())).strip()
+
+
+def parse_html_table(
+    html_text: str, table_index: int = 0
+) -> Tuple[List[str], List[List[str]]]:
+    """
+    从 HTML 文本中抽取指定表格的表头和数据行, 所有单元格均为原始字符串
+    :param html_text: HTML 文本
+    :type html_text: str
+    :param table_index: 第几个 <table>, 从 0 开始
+    :type table_index: int
+    :return: 表头和数据行
+    :rtype: tuple
+    """
+    if not html_text or not html_text.strip():
+        return [], []
+    doc = lxml_html.document_fromstring(html_text)
+    tables = doc.xpath("//table")
+    if len(tables) <= table_index:
+        return [], []
+    return parse_table_element(tables[table_index])
+
+
+def parse_table_element(table) -> Tuple[List[str], List[List[str]]]:
+    """
+    从已经解析的 <table> 元素中抽取表头和数据行, 用于同一网页中有多个表格时只解析一次网页
+    :param table: lxml 的 <table> 元素
+    :type table: lxml.html.HtmlElement
+    :return: 表头和数据行
+    :rtype: tuple
+    """
+    header_rows = table.xpath("./thead/tr")
+    body_rows = table.xpath("./tbody/tr | ./tr")
+    header = []
+    if header_rows:
+        header = [_cell_text(cell) for cell in header_rows[0].xpath("./th | ./td")]
+    elif body_rows and not body_rows[0].xpath("./td"):
+        header = [_cell_text(cell) for cell in body_rows[0].xpath("./th")]
+        body_rows = body_rows[1:]
+    data = []
+    for row in body_rows:
+        cells = row.xpath("./th | ./td")
+        if cells:
+            data.append([_cell_text(cell) for cell in cells])
+    return header, data
+
+
+def get_html_page_count(html_text: str) -> int:
+    """
+    同花顺等网站分页信息, 例如 <span class="page_info">1/56</span>
+    :param html_text: HTML 文本
+    :type html_text: str
+    :return: 总页数, 没有分页信息时为 1
+    :rtype: int
+    """
+    doc = lxml_html.document_fromstring(html_text or "<html></html>")
+    page_info = doc.xpath('//span[@class="page_info"]/text()')
+    try:
+        return int(page_info[0].split("/")[1])
+    except (IndexError, ValueError):
+        return 1
+
+
+def fetch_html_page(
+    url: str,
+    headers_func: Optional[Callable[[], Dict]] = None,
+    auth_error_func: Optional[Callable[[], None]] = None,
+    session: Optional[requests.Session] = None,
+    timeout: int = 15,
+) -> str:
+    """
+    下载单个网页; 返回 401 或者 403 时调用 auth_error_func 作废凭证, 然后重新生成请求头并重试一次
+    :param url: 网址
+    :type url: str
+    :param headers_func: 每次请求前调用, 返回请求头
+    :type headers_func: callable
+    :param auth_error_func: 凭证失效时调用, 例如 reset_ths_v_code
+    :type auth_error_func: callable
+    :param session: 复用的 Session
+    :type session: requests.Session
+    :param timeout: 请求超时时间
+    :type timeout: int
+    :return: 网页文本
+    :rtype: str
+    """
+    session = session or requests
+    headers = headers_func() if headers_func is not None else None
+    with phase("network"):
+        r = session.get(url, headers=headers, timeout=timeout)
+    record_response(r)
+    if r.status_code in (401, 403) and auth_error_func is not None:
+        incr("retries")
+        auth_error_func()
+        headers = headers_func() if headers_func is not None else None
+        with phase("network"):
+            r = session.get(url, headers=headers, timeout=timeout)
+        record_response(r)
+    return r.text
+
+
+def fetch_html_pages(
+    url_list: List[str],
+    headers_func: Optional[Callable[[], Dict]] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    timeout: int = 15,
+    auth_error_func: Optional[Callable[[], None]] = None,
+) -> List[str]:
+    """
+    并发下载网页, 返回结果与 url_list 的顺序一致
+    :param url_list: 网址列表
+    :type url_list: list
+    :param headers_func: 每次请求前调用, 返回请求头
+    :type headers_func: callable
+    :param max_workers: 最大并发数
+    :type max_workers: int
+    :param timeout: 请求超时时间
+    :type timeout: int
+    :param auth_error_func: 凭证失效时调用, 详见 fetch_html_page
+    :type auth_error_func: callable
+    :return: 网页文本列表
+    :rtype: list
+    """
+    session = requests.Session()
+
+    def _fetch(url: str) -> str:
+        return fetch_html_page(
+            url,
+            headers_func=headers_func,
+            auth_error_func=auth_error_func,
+            session=session,
+            timeout=timeout,
+        )
+
+    incr("pages", len(url_list))
+    tqdm = get_tqdm()
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        return list(
+            tqdm(
+                executor.map(propagate_context(_fetch), url_list),
+                total=len(url_list),
+                leave=False,
+            )
+        )
+
+
+def html_tables_to_df(
+    html_list: List[str],
+    table_index: int = 0,
+    converters: Optional[Dict] = None,
+) -> pd.DataFrame:
+    """
+    合并多个分页中的同一表格, 只做一次类型推断
+    传给 TextParser 的参数与 pd.read_html 的默认值相同(千分位逗号、缺失值、不解析日期),
+    不等长的行补空字符串, 重复的列名按 read_html 的方式加 .1 后缀
+    :param html_list: 网页文本列表
+    :type html_list: list
+    :param table_index: 第几个 <table>, 从 0 开始
+    :type table_index: int
+    :param converters: 指定列的转换函数, 例如 {"股票代码": str}
+    :type converters: dict
+    :return: 合并后的表格
+    :rtype: pandas.DataFrame
+    """
+    header = []
+    data = []
+    # 启用常驻进程池时各分页在子进程中解析
+    parsed_list = map_in_process_pool(
+        functools.partial(parse_html_table, table_index=table_index), html_list
+    )
+    for page_header, page_data in parsed_list:
+        if not header:
+            header = page_header
+        data.extend(page_data)
+    if not data:
+        return pd.DataFrame(columns=header)
+    width = max(len(header), max(len(row) for row in data))
+    body = ([list(header)] if header else []) + data
+    for row in body:
+        row.extend([""] * (width - len(row)))
+    with TextParser(
+        body,
+        header=0 if header else None,
+        thousands=",",
+        decimal=".",
+        na_values=None,
+        keep_default_na=True,
+        parse_dates=False,
+        converters=converters,
+    ) as parser:
+        return parser.read()
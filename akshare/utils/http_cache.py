@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 23:00
+Desc: 基于 ETag/Last-Modified 的原始文件缓存
+下载过的文件保存在本地缓存目录中, 再次请求时带上 If-None-Match/If-Modified-Since,
+服务器返回 304 时直接读取本地文件; fetch_parsed 还会缓存解析后的结果, 304 或者内容摘要未变时不再解析
+"""
+
+import copy
+import hashlib
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+import requests
+
+from akshare.utils.context import get_cache_dir
+from akshare.utils.instrument import incr, phase, record_response
+
+# 进程内的解析结果, (namespace, url) -> (摘要, 解析函数及版本, 结果), 只保留最近使用的 _PARSED_MEMO_SIZE 个
+_PARSED_MEMO_SIZE = 128
+_parsed_memo: "OrderedDict[Tuple[str, str], Tuple[str, str, Any]]" = OrderedDict()
+_parsed_lock = threading.Lock()
+
+
+def _cache_path(namespace: str, url: str) -> str:
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return os.path.join(get_cache_dir(), "http", namespace, key)
+
+
+def _write_atomic(path: str, content: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(content)
+    os.replace(temp_path, path)
+
+
+def _read_meta(path: str) -> Dict:
+    try:
+        with open(f"{path}.json", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _parser_key(parser: Callable[[bytes], Any]) -> str:
+    """
+    解析结果的有效性标识; 解析函数、akshare 或 pandas 的版本变化后, 本地的解析结果失效
+    :param parser: 解析函数
+    :type parser: callable
+    :return: 标识
+    :rtype: str
+    """
+    import akshare
+
+    return (
+        f"{parser.__module__}.{parser.__qualname__}|"
+        f"akshare={getattr(akshare, '__version__', '')}|pandas={pd.__version__}"
+    )
+
+
+def _memo_get(key: Tuple[str, str]) -> Optional[Tuple[str, str, Any]]:
+    with _parsed_lock:
+        cached = _parsed_memo.get(key)
+        if cached is not None:
+            _parsed_memo.move_to_end(key)
+        return cached
+
+
+def _memo_set(key: Tuple[str, str], cached: Tuple[str, str, Any]) -> None:
+    with _parsed_lock:
+        _parsed_memo[key] = cached
+        _parsed_memo.move_to_end(key)
+        while len(_parsed_memo) > _PARSED_MEMO_SIZE:
+            _parsed_memo.popitem(last=False)
+
+
+def _revalidate(
+    url: str,
+    namespace: str,
+    session: Optional[requests.Session],
+    headers: Optional[Dict],
+    timeout: int,
+) -> Tuple[Optional[bytes], str]:
+    """
+    条件请求文件, 更新本地缓存
+    :return: 文件内容(304 时为 None, 此时本地文件有效)和内容摘要
+    :rtype: tuple
+    """
+    path = _cache_path(namespace, url)
+    body_path = f"{path}.body"
+    meta = _read_meta(path)
+    request_headers = dict(headers or {})
+    if os.path.exists(body_path):
+        if meta.get("etag"):
+            request_headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            request_headers["If-Modified-Since"] = meta["last_modified"]
+    with phase("network"):
+        r = (session or requests).get(url, headers=request_headers, timeout=timeout)
+    record_response(r)
+    if r.status_code == 304 and (
+        "If-None-Match" in request_headers or "If-Modified-Since" in request_headers
+    ):
+        incr("cache_hits")
+        return None, meta.get("digest", "")
+    r.raise_for_status()
+    content = r.content
+    digest = hashlib.sha1(content).hexdigest()
+    etag = r.headers.get("ETag")
+    last_modified = r.headers.get("Last-Modified")
+    # 不支持条件请求的服务器只记录内容摘要, 用于判断解析结果是否仍然有效
+    if etag or last_modified:
+        _write_atomic(body_path, content)
+    _write_atomic(
+        f"{path}.json",
+        json.dumps(
+            {
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "digest": digest,
+            }
+        ).encode("utf-8"),
+    )
+    return content, digest
+
+
+def fetch_with_validators(
+    url: str,
+    namespace: str = "default",
+    session: Optional[requests.Session] = None,
+    headers: Optional[Dict] = None,
+    timeout: int = 15,
+) -> bytes:
+    """
+    下载文件并按 ETag/Last-Modified 缓存原始字节
+    :param url: 文件地址
+    :type url: str
+    :param namespace: 缓存子目录, 例如 "csindex"
+    :type namespace: str
+    :param session: 复用的会话, 默认使用 requests
+    :type session: requests.Session
+    :param headers: 额外的请求头
+    :type headers: dict
+    :param timeout: 请求超时时间
+    :type timeout: int
+    :return: 文件内容
+    :rtype: bytes
+    """
+    content, _ = _revalidate(url, namespace, session, headers, timeout)
+    if content is None:
+        with open(f"{_cache_path(namespace, url)}.body", "rb") as f:
+            return f.read()
+    return content
+
+
+def fetch_parsed(
+    url: str,
+    parser: Callable[[bytes], Any],
+    namespace: str = "default",
+    session: Optional[requests.Session] = None,
+    headers: Optional[Dict] = None,
+    timeout: int = 15,
+) -> Any:
+    """
+    下载文件并缓存解析后的结果
+    服务器返回 304, 或者不支持条件请求但内容摘要与上次相同时, 直接返回缓存的解析结果;
+    解析函数、akshare 或 pandas 的版本变化后重新解析
+    :param url: 文件地址
+    :type url: str
+    :param parser: 把文件内容解析为结果的函数, 结果需要可以 pickle
+    :type parser: callable
+    :param namespace: 缓存子目录, 例如 "cninfo"
+    :type namespace: str
+    :param session: 复用的会话, 默认使用 requests
+    :type session: requests.Session
+    :param headers: 额外的请求头
+    :type headers: dict
+    :param timeout: 请求超时时间
+    :type timeout: int
+    :return: 解析结果的副本
+    :rtype: object
+    """
+    parser_name = _parser_key(parser)
+    key = (namespace, url)
+    parsed_path = f"{_cache_path(namespace, url)}.pkl"
+    content, digest = _revalidate(url, namespace, session, headers, timeout)
+    cached = _memo_get(key)
+    if cached is None and os.path.exists(parsed_path):
+        try:
+            with open(parsed_path, "rb") as f:
+                cached = pickle.load(f)
+            if not isinstance(cached, tuple) or len(cached) != 3:
+                cached = None
+        except Exception:
+            # 旧版本写入的文件可能引用已经不存在的类, 重新解析并覆盖
+            cached = None
+    if cached is not None and cached[:2] == (digest, parser_name):
+        if content is not None:
+            incr("cache_hits")
+        _memo_set(key, cached)
+        return copy.deepcopy(cached[2])
+    if content is None:
+        # 304 但解析结果缺失或者解析函数已变化, 从本地文件重新解析
+        with open(f"{_cache_path(namespace, url)}.body", "rb") as f:
+            content = f.read()
+    value = parser(content)
+    cached = (digest, parser_name, value)
+    _write_atomic(parsed_path, pickle.dumps(cached, protocol=pickle.HIGHEST_PROTOCOL))
+    _memo_set(key, cached)
+    return copy.deepcopy(value)
@@ -0,0 +1,298 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 22:00
+Desc: 接口调用的性能统计
+在 instrument() 上下文中调用接口, 记录网络、解析、整理数据等阶段的耗时, 以及请求次数、
+传输字节数、重试次数、分页数和缓存命中数; 结束时交给 add_hook 注册的回调处理.
+没有进行中的统计时, 埋点只做一次 ContextVar 读取
+"""
+
+import contextlib
+import contextvars
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional
+
+# 网络: 建立连接、等待服务器和下载响应(包括 DNS 和 TLS); 解析: JSON/JS 等文本解析;
+# js: 执行 JavaScript; 整理: 构建和整理 DataFrame
+PHASES = ("network", "parse", "js", "transform")
+COUNTERS = ("requests", "bytes", "retries", "pages", "cache_hits")
+
+_current: contextvars.ContextVar = contextvars.ContextVar(
+    "akshare_instrument_record", default=None
+)
+_frames: contextvars.ContextVar = contextvars.ContextVar(
+    "akshare_instrument_frames", default=()
+)
+_hooks: List[Callable] = []
+_hooks_lock = threading.Lock()
+
+
+class CallRecord:
+    """
+    一次统计的结果, 各阶段的耗时不重复计算嵌套的阶段
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.phases: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.counters: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self.wall_time = 0.0
+        self.error: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def add_phase(self, phase: str, seconds: float) -> None:
+        with self._lock:
+            self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def incr(self, counter: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def to_dict(self) -> Dict:
+        """
+        转换为字典, 便于输出到日志或者保存
+        :return: 统计结果
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "name": self.name,
+                "wall_time": self.wall_time,
+                "error": self.error,
+                **{f"{key}_seconds": value for key, value in self.phases.items()},
+                **self.counters,
+            }
+
+    def __repr__(self) -> str:
+        return f"CallRecord({self.to_dict()})"
+
+
+def add_hook(func: Callable[[CallRecord], None]) -> None:
+    """
+    注册回调, 每次统计结束时以 CallRecord 调用
+    :param func: 回调函数
+    :type func: callable
+    :return: None
+    :rtype: None
+    """
+    with _hooks_lock:
+        _hooks.append(func)
+
+
+def remove_hook(func: Callable[[CallRecord], None]) -> None:
+    """
+    注销回调
+    :param func: 回调函数
+    :type func: callable
+    :return: None
+    :rtype: None
+    """
+    with _hooks_lock:
+        if func in _hooks:
+            _hooks.remove(func)
+
+
+@contextlib.contextmanager
+def instrument(name: str = "akshare") -> Iterator[CallRecord]:
+    """
+    统计上下文, 嵌套使用时内层单独统计
+    :param name: 名称, 一般为接口名称
+    :type name: str
+    :return: 统计结果, 上下文结束后完整
+    :rtype: CallRecord
+    """
+    record = CallRecord(name)
+    record_token = _current.set(record)
+    frames_token = _frames.set(())
+    start = time.perf_counter()
+    try:
+        yield record
+    except BaseException as e:
+        record.error = type(e).__name__
+        raise
+    finally:
+        record.wall_time = time.perf_counter() - start
+        _frames.reset(frames_token)
+        _current.reset(record_token)
+        with _hooks_lock:
+            hook_list = list(_hooks)
+        for hook in hook_list:
+            hook(record)
+
+
+class _Phase:
+    __slots__ = ("record", "name", "start", "child", "token")
+
+    def __init__(self, record: CallRecord, name: str):
+        self.record = record
+        self.name = name
+
+    def __enter__(self):
+        self.child = 0.0
+        self.token = _frames.set(_frames.get() + (self,))
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        elapsed = time.perf_counter() - self.start
+        _frames.reset(self.token)
+        frames = _frames.get()
+        if frames:
+            frames[-1].child += elapsed
+        self.record.add_phase(self.name, elapsed - self.child)
+        return False
+
+
+_NULL_PHASE = contextlib.nullcontext()
+
+
+def phase(name: str):
+    """
+    埋点: 统计一个阶段的耗时, 没有进行中的统计时不做任何事
+    :param name: 阶段, 参见 PHASES
+    :type name: str
+    :return: 上下文管理器
+    :rtype: contextlib.AbstractContextManager
+    """
+    record = _current.get()
+    if record is None:
+        return _NULL_PHASE
+    return _Phase(record, name)
+
+
+def incr(counter: str, value: int = 1) -> None:
+    """
+    埋点: 计数, 没有进行中的统计时不做任何事
+    :param counter: 计数项, 参见 COUNTERS
+    :type counter: str
+    :param value: 增加的数量
+    :type value: int
+    :return: None
+    :rtype: None
+    """
+    record = _current.get()
+    if record is not None:
+        record.incr(counter, value)
+
+
+def record_response(response, count_bytes: bool = True) -> None:
+    """
+    埋点: 记录一次请求及其响应字节数
+    :param response: requests 的响应
+    :type response: requests.Response
+    :param count_bytes: 是否记录响应字节数; 流式响应在读取时逐块记录, 此处不能读取 content
+    :type count_bytes: bool
+    :return: None
+    :rtype: None
+    """
+    record = _current.get()
+    if record is not None:
+        record.incr("requests")
+        if count_bytes:
+            record.incr("bytes", len(response.content))
+
+
+def propagate_context(func: Callable) -> Callable:
+    """
+    让线程池中执行的 func 计入当前的统计; 没有进行中的统计时原样返回 func
+    :param func: 在其他线程中执行的函数
+    :type func: callable
+    :return: 包装后的函数
+    :rtype: callable
+    """
+    if _current.get() is None:
+        return func
+    context = contextvars.copy_context()
+
+    def wrapper(*args, **kwargs):
+        # 同一个 Context 不能同时在多个线程中进入, 每次调用使用一个副本
+        return context.copy().run(func, *args, **kwargs)
+
+    return wrapper
+
+
+def logging_hook(
+    logger: Optional[logging.Logger] = None, level: int = logging.INFO
+) -> Callable[[CallRecord], None]:
+    """
+    输出到日志的回调
+    :param logger: 日志记录器, 默认为 akshare.instrument
+    :type logger: logging.Logger
+    :param level: 日志级别
+    :type level: int
+    :return: 回调函数
+    :rtype: callable
+    """
+    logger = logger or logging.getLogger("akshare.instrument")
+
+    def hook(record: CallRecord) -> None:
+        logger.log(level, "%s", record.to_dict())
+
+    return hook
+
+
+class PrometheusCounters:
+    """
+    按名称累计的计数器, 作为回调注册, render() 输出 Prometheus 文本格式
+    """
+
+    def __init__(self, prefix: str = "akshare"):
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._calls: Dict[str, int] = {}
+        self._errors: Dict[str, int] = {}
+        self._wall_time: Dict[str, float] = {}
+        self._phases: Dict[tuple, float] = {}
+        self._counters: Dict[tuple, int] = {}
+
+    def __call__(self, record: CallRecord) -> None:
+        with self._lock:
+            self._calls[record.name] = self._calls.get(record.name, 0) + 1
+            if record.error is not None:
+                self._errors[record.name] = self._errors.get(record.name, 0) + 1
+            self._wall_time[record.name] = (
+                self._wall_time.get(record.name, 0.0) + record.wall_time
+            )
+            for key, value in record.phases.items():
+                self._phases[record.name, key] = (
+                    self._phases.get((record.name, key), 0.0) + value
+                )
+            for key, value in record.counters.items():
+                self._counters[record.name, key] = (
+                    self._counters.get((record.name, key), 0) + value
+                )
+
+    def render(self) -> str:
+        """
+        Prometheus 文本格式
+        :return: 指标文本
+        :rtype: str
+        """
+        p = self.prefix
+        line_list = []
+        with self._lock:
+            line_list.append(f"# TYPE {p}_calls_total counter")
+            for name, value in self._calls.items():
+                line_list.append(f'{p}_calls_total{{name="{name}"}} {value}')
+            line_list.append(f"# TYPE {p}_errors_total counter")
+            for name, value in self._errors.items():
+                line_list.append(f'{p}_errors_total{{name="{name}"}} {value}')
+            line_list.append(f"# TYPE {p}_wall_seconds_total counter")
+            for name, value in self._wall_time.items():
+                line_list.append(f'{p}_wall_seconds_total{{name="{name}"}} {value}')
+            line_list.append(f"# TYPE {p}_phase_seconds_total counter")
+            for (name, key), value in self._phases.items():
+                line_list.append(
+                    f'{p}_phase_seconds_total{{name="{name}",phase="{key}"}} {value}'
+                )
+            for counter in sorted({key for _, key in self._counters}):
+                line_list.append(f"# TYPE {p}_{counter}_total counter")
+                for (name, key), value in self._counters.items():
+                    if key == counter:
+                        line_list.append(
+                            f'{p}_{counter}_total{{name="{name}"}} {value}'
+                        )
+        return "\n".join(line_list) + "\n"
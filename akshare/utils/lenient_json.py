@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 10:00
+Desc: 宽松 JSON 快速解析
+新浪、东方财富等接口返回的是 JavaScript 对象字面量而非标准 JSON(键名不带引号、单引号字符串、尾随逗号),
+此处先用编译好的正则扫描器将其规整为标准 JSON, 再交给 orjson/json 解析, 仅在失败时回退到 demjson
+"""
+
+import json
+import re
+from typing import Any, Union
+
+from akshare.utils import demjson
+from akshare.utils.instrument import phase
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _JSONDecodeError = (orjson.JSONDecodeError, ValueError)
+except ImportError:  # pragma: no cover
+    orjson = None
+    _loads = json.loads
+    _JSONDecodeError = (ValueError,)
+
+# 字符串必须放在最前面, 保证字符串内部的冒号、逗号和引号不会被误改
+_TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<dq>"(?:[^"\\]|\\.)*")
+    |(?P<sq>'(?:[^'\\]|\\.)*')
+    |(?P<num>-?\d[\w.+-]*)
+    |(?P<key>[A-Za-z_$][\w$]*)(?P<colon>\s*:)
+    |(?P<word>[A-Za-z_$][\w$]*)
+    |(?P<comma>,)(?=\s*[\]}])
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+_SINGLE_QUOTE_ESCAPE_PATTERN = re.compile(r"""\\(.)|(")""", re.DOTALL)
+
+
+def _convert_single_quote_escape(match: re.Match) -> str:
+    escaped = match.group(1)
+    if escaped is None:
+        return '\\"'
+    if escaped == "'":
+        return "'"
+    return "\\" + escaped
+
+
+def _replace_token(match: re.Match) -> str:
+    kind = match.lastgroup
+    if kind == "sq":
+        inner = match.group("sq")[1:-1]
+        inner = _SINGLE_QUOTE_ESCAPE_PATTERN.sub(_convert_single_quote_escape, inner)
+        return '"' + inner + '"'
+    if kind == "colon":
+        return '"' + match.group("key") + '"' + match.group("colon")
+    if kind == "comma":
+        return ""
+    return match.group(0)
+
+
+def normalize(text: str) -> str:
+    """
+    将 JavaScript 对象字面量规整为标准 JSON 文本
+    :param text: 待规整的文本
+    :type text: str
+    :return: 规整后的 JSON 文本
+    :rtype: str
+    """
+    return _TOKEN_PATTERN.sub(_replace_token, text)
+
+
+def decode(txt: Union[str, bytes]) -> Any:
+    """
+    宽松 JSON 解析, 接口与 demjson.decode 保持一致
+    1. 标准 JSON 直接交给 orjson/json 解析
+    2. 非标准 JSON 先规整后再解析
+    3. 仍然失败时回退到 demjson
+    :param txt: 待解析的文本
+    :type txt: str or bytes
+    :return: 解析后的 Python 对象
+    :rtype: Any
+    """
+    with phase("parse"):
+        return _decode(txt)
+
+
+def _decode(txt: Union[str, bytes]) -> Any:
+    if isinstance(txt, (bytes, bytearray)):
+        txt = txt.decode("utf-8")
+    try:
+        return _loads(txt)
+    except _JSONDecodeError:
+        pass
+    normalized_text = normalize(txt)
+    try:
+        return _loads(normalized_text)
+    except _JSONDecodeError:
+        pass
+    if orjson is not None:
+        # orjson 不支持 NaN 和 Infinity 等非标准数值, 交给标准库再试一次
+        try:
+            return json.loads(normalized_text)
+        except ValueError:
+            pass
+    return demjson.decode(txt)
+
+
+if __name__ == "__main__":
+    print(decode("{symbol:'sh600000',name:'浦发银行',trade:\"8.570\",}"))
@@ -3,7 +3,7 @@
 
 1. 未能解决 gevent 调用问题
 2. 导致 js 代码执行缓慢
-3. 该方案废弃，这里仅作参考
+3. 该方案废弃，这里仅作参考; 常驻进程池参见 akshare/utils/process_pool.py
 
 同时发现 gevent 里面无法调用异步的接口
 """
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 23:00
+Desc: 解析阶段的进程池
+下载之后的 CPU 密集型解析(Excel、HTML 表格、JS 解密、筹码分布计算)在多线程下载时受 GIL 限制,
+启用后这些解析交给一个常驻的进程池执行, 传入原始字节或者文本, 返回 DataFrame;
+默认不启用, 在当前线程中解析, 行为与之前一致.
+也可以通过环境变量 AKSHARE_PROCESS_POOL=进程数 启用
+"""
+
+import multiprocessing
+import os
+import threading
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Iterable, List, Optional
+
+_lock = threading.Lock()
+_executor: Optional[ProcessPoolExecutor] = None
+_max_workers: Optional[int] = None
+_env_checked = False
+
+
+def enable_process_pool(max_workers: Optional[int] = None) -> None:
+    """
+    启用常驻进程池, 已经启用时按新的进程数重建
+    子进程以 spawn 方式启动, 避免 fork 复制下载线程持有的锁和 JS 引擎的状态
+    :param max_workers: 进程数, 默认为 CPU 核数
+    :type max_workers: int
+    :return: None
+    :rtype: None
+    """
+    global _executor, _max_workers
+    executor = ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    with _lock:
+        old_executor, _executor = _executor, executor
+        _max_workers = max_workers
+    if old_executor is not None:
+        old_executor.shutdown(wait=False)
+
+
+def disable_process_pool(wait: bool = True) -> None:
+    """
+    关闭进程池, 之后在当前线程中解析
+    :param wait: 是否等待进行中的任务完成
+    :type wait: bool
+    :return: None
+    :rtype: None
+    """
+    global _executor
+    with _lock:
+        old_executor, _executor = _executor, None
+    if old_executor is not None:
+        old_executor.shutdown(wait=wait)
+
+
+def get_process_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    当前的进程池, 未启用时返回 None; 第一次调用时检查环境变量 AKSHARE_PROCESS_POOL, 无效时发出警告并忽略
+    :return: 进程池
+    :rtype: concurrent.futures.ProcessPoolExecutor
+    """
+    global _env_checked
+    if not _env_checked:
+        _env_checked = True
+        max_workers = os.environ.get("AKSHARE_PROCESS_POOL", "").strip()
+        if max_workers and _executor is None:
+            if max_workers.isdigit():
+                enable_process_pool(int(max_workers) or None)
+            else:
+                warnings.warn(
+                    f"忽略无效的 AKSHARE_PROCESS_POOL={max_workers!r}, 应为进程数",
+                    RuntimeWarning,
+                )
+    return _executor
+
+
+def _reset_broken(executor: ProcessPoolExecutor) -> None:
+    global _executor
+    with _lock:
+        if _executor is not executor:
+            return
+        _executor = None
+    executor.shutdown(wait=False)
+    enable_process_pool(_max_workers)
+
+
+def run_in_process_pool(func: Callable, *args, **kwargs) -> Any:
+    """
+    在进程池中执行 func 并等待结果, 未启用进程池时直接调用;
+    func 及其参数和返回值需要可以 pickle, 因此 func 必须是模块级函数
+    :param func: 解析函数
+    :type func: callable
+    :return: func 的返回值
+    :rtype: Any
+    """
+    executor = get_process_pool()
+    if executor is None:
+        return func(*args, **kwargs)
+    try:
+        future = executor.submit(func, *args, **kwargs)
+    except RuntimeError:
+        # 其他线程重建或者关闭了进程池, 本次在当前线程中解析
+        return func(*args, **kwargs)
+    try:
+        return future.result()
+    except BrokenProcessPool:
+        # 子进程异常退出后重建进程池, 本次在当前线程中解析
+        _reset_broken(executor)
+        return func(*args, **kwargs)
+
+
+def map_in_process_pool(func: Callable, iterable: Iterable) -> List[Any]:
+    """
+    在进程池中对每个元素执行 func, 结果与输入的顺序一致, 未启用进程池时依次调用
+    :param func: 解析函数
+    :type func: callable
+    :param iterable: 参数列表
+    :type iterable: iterable
+    :return: 结果列表
+    :rtype: list
+    """
+    item_list = list(iterable)
+    executor = get_process_pool()
+    if executor is None:
+        return [func(item) for item in item_list]
+    try:
+        result_iter = executor.map(func, item_list)
+    except RuntimeError:
+        # 其他线程重建或者关闭了进程池, 本次在当前线程中解析
+        return [func(item) for item in item_list]
+    try:
+        return list(result_iter)
+    except BrokenProcessPool:
+        _reset_broken(executor)
+        return [func(item) for item in item_list]
@@ -0,0 +1,381 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 18:00
+Desc: 证券主数据
+按类型(股票、ETF、LOF、可转债、指数)下载东方财富的证券列表, 每天只下载一次并保存到本地仓库;
+通过字典把代码或者名称映射为东方财富 secid、新浪/腾讯代码、巨潮资讯 orgId、交易所和证券类型;
+腾讯证券历史数据的开始日期不会变化, 下载后长期保存在本地仓库
+"""
+
+import datetime
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+import pandas as pd
+import requests
+
+from akshare.utils.func import fetch_paginated_data
+from akshare.utils.store import LocalStore
+
+# 各类型证券在东方财富行情中心的筛选条件
+_SYMBOL_TYPE_FS = {
+    "stock": "m:0 t:6,m:0 t:80,m:1 t:2,m:1 t:23,m:0 t:81 s:2048",
+    "etf": "b:MK0021,b:MK0022,b:MK0023,b:MK0024",
+    "lof": "b:MK0404,b:MK0405,b:MK0406,b:MK0407",
+    "bond": "b:MK0354",
+    "index": "b:MK0010,m:1+t:1,m:0 t:5,m:1+s:3,m:0+t:5,m:2",
+}
+
+# 按代码或者名称查找时, 未指定类型则按此顺序查找
+_RESOLVE_ORDER = ["stock", "etf", "lof", "bond", "index"]
+
+_COLUMNS = [
+    "代码",
+    "名称",
+    "类型",
+    "交易所",
+    "市场标识",
+    "secid",
+    "新浪代码",
+    "腾讯代码",
+    "orgId",
+]
+
+_SYMBOL_PATTERN = re.compile(
+    r"^(?:(?P<prefix>sh|sz|bj)(?P<prefix_code>\d+)"
+    r"|(?P<suffix_code>\d+)\.(?P<suffix>sh|sz|bj)"
+    r"|\d+\.(?P<secid_code>\w+))$",
+    re.IGNORECASE,
+)
+
+_store = LocalStore(namespace="security_master")
+_lock = threading.Lock()
+_type_lock_dict = {
+    symbol_type: threading.Lock() for symbol_type in [*_SYMBOL_TYPE_FS, "cninfo"]
+}
+# 类型 -> {"date": 日期, "df": 数据, "code": 代码字典, "name": 名称字典}; "cninfo" -> orgId 字典
+_cache = {}
+# 腾讯代码 -> 腾讯证券历史数据的开始日期, 第一次使用时从本地仓库读取
+_start_date_tx: Optional[Dict[str, str]] = None
+
+
+def _exchange(market_id: int, code: str) -> Optional[str]:
+    """
+    东方财富市场标识转换为交易所
+    :param market_id: 市场标识
+    :type market_id: int
+    :param code: 证券代码
+    :type code: str
+    :return: choice of {"SH", "SZ", "BJ", "CSI", None}
+    :rtype: str
+    """
+    if market_id == 1:
+        return "SH"
+    if market_id == 0:
+        return "BJ" if code.startswith(("4", "8", "92")) else "SZ"
+    if market_id == 2:
+        return "CSI"
+    return None
+
+
+def _market_id_by_rule(symbol: str) -> int:
+    """
+    东方财富-沪深京证券的市场标识, 没有证券主数据时按代码规则判断
+    :param symbol: 证券代码
+    :type symbol: str
+    :return: 1 为上海, 0 为深圳和北京
+    :rtype: int
+    """
+    return 1 if symbol.startswith(("5", "6", "900")) else 0
+
+
+def _fetch_cninfo_org_id() -> pd.DataFrame:
+    """
+    巨潮资讯-沪深京股票代码和 orgId
+    :return: 代码和 orgId
+    :rtype: pandas.DataFrame
+    """
+    url = "http://www.cninfo.com.cn/new/data/szse_stock.json"
+    r = requests.get(url, timeout=15)
+    data_json = r.json()
+    temp_df = pd.DataFrame(data_json["stockList"])
+    return temp_df[["code", "orgId"]]
+
+
+def _read_daily(
+    key: str, builder: Callable[[], pd.DataFrame], refresh: bool, build: bool
+) -> Optional[pd.DataFrame]:
+    """
+    读取本地仓库中当天写入的数据, 没有时调用 builder 下载并写入本地仓库
+    :param key: 键
+    :type key: str
+    :param builder: 下载数据的函数
+    :type builder: callable
+    :param refresh: 是否强制重新下载
+    :type refresh: bool
+    :param build: 本地没有当天的数据时是否下载
+    :type build: bool
+    :return: 数据, 不下载且本地没有当天的数据时返回 None
+    :rtype: pandas.DataFrame
+    """
+    modified_time = _store.modified_time(key)
+    if (
+        not refresh
+        and modified_time is not None
+        and datetime.date.fromtimestamp(modified_time) == datetime.date.today()
+    ):
+        return _store.read(key)
+    if not build:
+        return None
+    temp_df = builder()
+    _store.write(key, temp_df)
+    return temp_df
+
+
+def get_org_id_dict_cninfo(refresh: bool = False) -> Dict[str, str]:
+    """
+    巨潮资讯-沪深京股票代码和 orgId, 每天只下载一次
+    :param refresh: 是否强制重新下载
+    :type refresh: bool
+    :return: {代码: orgId}
+    :rtype: dict
+    """
+    today = datetime.date.today()
+    with _type_lock_dict["cninfo"]:
+        entry = _cache.get("cninfo")
+        if refresh or entry is None or entry["date"] != today:
+            temp_df = _read_daily(
+                "cninfo", _fetch_cninfo_org_id, refresh=refresh, build=True
+            )
+            entry = {
+                "date": today,
+                "code": dict(zip(temp_df["code"], temp_df["orgId"])),
+            }
+            with _lock:
+                _cache["cninfo"] = entry
+        return entry["code"]
+
+
+def _fetch_security_list(symbol_type: str) -> pd.DataFrame:
+    """
+    东方财富-行情中心-指定类型的证券列表
+    :param symbol_type: choice of {"stock", "etf", "lof", "bond", "index"}
+    :type symbol_type: str
+    :return: 证券列表
+    :rtype: pandas.DataFrame
+    """
+    url = "https://80.push2.eastmoney.com/api/qt/clist/get"
+    params = {
+        "pn": "1",
+        "pz": "100",
+        "po": "1",
+        "np": "1",
+        "ut": "bd1d9ddb04089700cf9c27f6f7426281",
+        "fltt": "2",
+        "invt": "2",
+        "fid": "f12",
+        "fs": _SYMBOL_TYPE_FS[symbol_type],
+        "fields": "f3,f12,f13,f14",
+    }
+    temp_df = fetch_paginated_data(url, params)
+    temp_df = temp_df.rename(columns={"f12": "代码", "f13": "市场标识", "f14": "名称"})
+    temp_df.sort_values(by=["代码", "市场标识"], inplace=True, ignore_index=True)
+    temp_df.drop_duplicates(subset=["代码"], keep="first", inplace=True)
+    temp_df["市场标识"] = temp_df["市场标识"].astype(int)
+    temp_df["类型"] = symbol_type
+    temp_df["交易所"] = [
+        _exchange(market_id, code)
+        for market_id, code in zip(temp_df["市场标识"], temp_df["代码"])
+    ]
+    temp_df["secid"] = temp_df["市场标识"].astype(str) + "." + temp_df["代码"]
+    prefix = temp_df["交易所"].map({"SH": "sh", "SZ": "sz", "BJ": "bj"})
+    temp_df["新浪代码"] = prefix + temp_df["代码"]
+    temp_df["腾讯代码"] = temp_df["新浪代码"]
+    if symbol_type == "stock":
+        temp_df["orgId"] = temp_df["代码"].map(get_org_id_dict_cninfo())
+    else:
+        temp_df["orgId"] = None
+    temp_df = temp_df.astype(object).where(temp_df.notna(), None)
+    return temp_df[_COLUMNS].reset_index(drop=True)
+
+
+def _load(
+    symbol_type: str, refresh: bool = False, build: bool = True
+) -> Optional[Dict]:
+    """
+    加载指定类型的证券主数据, 依次查找内存、本地仓库(当天写入)和网络
+    :param symbol_type: choice of {"stock", "etf", "lof", "bond", "index"}
+    :type symbol_type: str
+    :param refresh: 是否强制重新下载
+    :type refresh: bool
+    :param build: 本地没有当天的数据时是否下载
+    :type build: bool
+    :return: {"date": 日期, "df": 数据, "code": 代码字典, "code_id": 代码和市场标识, "name": 名称字典}
+    :rtype: dict
+    """
+    today = datetime.date.today()
+    entry = _cache.get(symbol_type)
+    if not refresh and entry is not None and entry["date"] == today:
+        return entry
+    with _type_lock_dict[symbol_type]:
+        entry = _cache.get(symbol_type)
+        if not refresh and entry is not None and entry["date"] == today:
+            return entry
+        temp_df = _read_daily(
+            symbol_type,
+            lambda: _fetch_security_list(symbol_type),
+            refresh=refresh,
+            build=build,
+        )
+        if temp_df is None:
+            return None
+        record_list = temp_df.to_dict(orient="records")
+        entry = {
+            "date": today,
+            "df": temp_df,
+            "code": {record["代码"]: record for record in record_list},
+            "code_id": {record["代码"]: record["市场标识"] for record in record_list},
+            "name": {record["名称"]: record for record in reversed(record_list)},
+        }
+        with _lock:
+            _cache[symbol_type] = entry
+        return entry
+
+
+def security_master(symbol_type: str = "all", refresh: bool = False) -> pd.DataFrame:
+    """
+    证券主数据, 每天只下载一次
+    https://quote.eastmoney.com/center/gridlist.html
+    :param symbol_type: choice of {"all", "stock", "etf", "lof", "bond", "index"}
+    :type symbol_type: str
+    :param refresh: 是否强制重新下载
+    :type refresh: bool
+    :return: 证券主数据
+    :rtype: pandas.DataFrame
+    """
+    if symbol_type != "all":
+        return _load(symbol_type, refresh=refresh)["df"].copy()
+    with ThreadPoolExecutor(max_workers=len(_RESOLVE_ORDER)) as executor:
+        entry_list = list(
+            executor.map(lambda item: _load(item, refresh=refresh), _RESOLVE_ORDER)
+        )
+    return pd.concat([entry["df"] for entry in entry_list], ignore_index=True)
+
+
+def _split_symbol(symbol: str) -> Tuple[str, Optional[Tuple[str, str]]]:
+    """
+    拆分带市场信息的代码
+    :param symbol: 例如 "600000", "sh600000", "1.600000", "600000.SH"
+    :type symbol: str
+    :return: (代码, (用于校验的字段, 字段值)), 不带市场信息时第二项为 None
+    :rtype: tuple
+    """
+    symbol = symbol.strip()
+    match = _SYMBOL_PATTERN.match(symbol)
+    if match is None:
+        return symbol, None
+    if match.group("secid_code"):
+        return match.group("secid_code"), ("secid", symbol)
+    code = match.group("prefix_code") or match.group("suffix_code")
+    exchange = (match.group("prefix") or match.group("suffix")).lower()
+    return code, ("新浪代码", f"{exchange}{code}")
+
+
+def security_resolve(symbol: str = "600000", symbol_type: str = None) -> Dict:
+    """
+    根据代码或者名称查找证券主数据
+    :param symbol: 代码或者名称, 支持 "600000", "sh600000", "1.600000", "600000.SH" 和 "浦发银行"
+    :type symbol: str
+    :param symbol_type: choice of {None, "stock", "etf", "lof", "bond", "index"}, 默认依次查找所有类型
+    :type symbol_type: str
+    :return: 证券主数据
+    :rtype: dict
+    """
+    type_list = _RESOLVE_ORDER if symbol_type is None else [symbol_type]
+    code, qualifier = _split_symbol(symbol)
+    for item in type_list:
+        record = _load(item)["code"].get(code)
+        if record is not None and (
+            qualifier is None or record[qualifier[0]] == qualifier[1]
+        ):
+            return dict(record)
+    for item in type_list:
+        record = _load(item)["name"].get(symbol)
+        if record is not None:
+            return dict(record)
+    raise ValueError(f"未找到证券: {symbol}")
+
+
+def get_secid_em(symbol: str, symbol_type: str = "stock") -> str:
+    """
+    东方财富 secid, 例如 "1.600000"
+    沪深京 A 股在本地没有当天的证券主数据时按代码规则判断, 不会为此下载证券列表
+    :param symbol: 证券代码
+    :type symbol: str
+    :param symbol_type: choice of {"stock", "etf", "lof", "bond", "index"}
+    :type symbol_type: str
+    :return: secid
+    :rtype: str
+    """
+    entry = _load(symbol_type, build=symbol_type != "stock")
+    if entry is not None and symbol in entry["code"]:
+        return entry["code"][symbol]["secid"]
+    return f"{_market_id_by_rule(symbol)}.{symbol}"
+
+
+def get_start_date_tx(symbol: str, refresh: bool = False) -> str:
+    """
+    腾讯证券-历史数据的开始日期, 每只证券只下载一次并保存到本地仓库
+    :param symbol: 带市场标识的代码, 例如 "sh000919"
+    :type symbol: str
+    :param refresh: 是否强制重新下载
+    :type refresh: bool
+    :return: 开始日期, 例如 "2007-01-15"
+    :rtype: str
+    """
+    global _start_date_tx
+    with _lock:
+        if _start_date_tx is None:
+            temp_df = _store.read("tx_start_date")
+            _start_date_tx = (
+                {}
+                if temp_df is None
+                else dict(zip(temp_df["腾讯代码"], temp_df["开始日期"]))
+            )
+        start_date = _start_date_tx.get(symbol)
+    if start_date is not None and not refresh:
+        return start_date
+    # 延迟导入, 避免证券主数据依赖指数模块
+    from akshare.index.index_stock_zh import get_tx_start_year
+
+    start_date = get_tx_start_year(symbol=symbol)
+    with _lock:
+        _start_date_tx[symbol] = start_date
+        _store.append(
+            "tx_start_date",
+            pd.DataFrame({"腾讯代码": [symbol], "开始日期": [start_date]}),
+            subset=["腾讯代码"],
+        )
+    return start_date
+
+
+def get_code_id_dict_em(symbol_type: str) -> Dict[str, int]:
+    """
+    东方财富-证券代码和市场标识映射, 与证券主数据一起缓存, 调用方不要修改返回的字典
+    :param symbol_type: choice of {"stock", "etf", "lof", "bond", "index"}
+    :type symbol_type: str
+    :return: {代码: 市场标识}
+    :rtype: dict
+    """
+    return _load(symbol_type)["code_id"]
+
+
+if __name__ == "__main__":
+    security_master_df = security_master(symbol_type="all")
+    print(security_master_df)
+
+    security_resolve_dict = security_resolve(symbol="sh600000")
+    print(security_resolve_dict)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 16:00
+Desc: 站点凭证缓存
+需要先握手(注册 IP、获取 Cookie、生成 token)才能访问的网站, 将握手结果按站点缓存并设置有效期,
+多线程共享同一份凭证; 请求因凭证失效而失败时重新握手并重试一次
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class SessionCredentialCache:
+    """
+    站点凭证缓存, 每个站点注册一个生成凭证的函数和有效期(秒)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sites: Dict[str, Dict] = {}
+
+    def register(self, site: str, factory: Callable[[], Any], ttl: float) -> None:
+        """
+        注册站点
+        :param site: 站点名称
+        :type site: str
+        :param factory: 生成凭证的函数, 例如返回已登记的 requests.Session 或者 Cookie 字符串
+        :type factory: callable
+        :param ttl: 凭证有效期(秒)
+        :type ttl: float
+        :return: None
+        :rtype: None
+        """
+        with self._lock:
+            self._sites[site] = {
+                "factory": factory,
+                "ttl": ttl,
+                "lock": threading.Lock(),
+                "value": None,
+                "expire_time": 0.0,
+            }
+
+    def _get_site(self, site: str) -> Dict:
+        with self._lock:
+            return self._sites[site]
+
+    def get(self, site: str) -> Any:
+        """
+        获取站点凭证, 不存在或者已过期时重新生成; 同一站点同时只会有一个线程在握手
+        :param site: 站点名称
+        :type site: str
+        :return: 凭证
+        :rtype: Any
+        """
+        state = self._get_site(site)
+        with state["lock"]:
+            if state["value"] is None or time.monotonic() >= state["expire_time"]:
+                state["value"] = state["factory"]()
+                state["expire_time"] = time.monotonic() + state["ttl"]
+            return state["value"]
+
+    def invalidate(self, site: str, value: Optional[Any] = None) -> None:
+        """
+        作废站点凭证
+        :param site: 站点名称
+        :type site: str
+        :param value: 只有当前凭证仍为 value 时才作废, 避免作废其他线程刚刚生成的新凭证
+        :type value: Any
+        :return: None
+        :rtype: None
+        """
+        state = self._get_site(site)
+        with state["lock"]:
+            if value is None or state["value"] is value:
+                state["value"] = None
+                state["expire_time"] = 0.0
+
+    def call(
+        self,
+        site: str,
+        func: Callable[[Any], Any],
+        exceptions: tuple = (Exception,),
+    ) -> Any:
+        """
+        使用站点凭证调用 func, 抛出 exceptions 中的异常时认为凭证失效, 重新握手后重试一次
+        :param site: 站点名称
+        :type site: str
+        :param func: 接收凭证作为唯一参数的函数
+        :type func: callable
+        :param exceptions: 视为凭证失效的异常类型
+        :type exceptions: tuple
+        :return: func 的返回值
+        :rtype: Any
+        """
+        value = self.get(site)
+        try:
+            return func(value)
+        except exceptions:
+            self.invalidate(site, value)
+            return func(self.get(site))
+
+
+# 全局凭证缓存, 各个站点在各自的模块中注册
+session_cache = SessionCredentialCache()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 19:00
+Desc: 请求合并(single-flight)
+多个线程或者协程同时以相同的参数调用同一个接口时, 只有第一个调用真正请求数据,
+其余调用等待并共享它的结果(或者异常); 调用结束后不保留结果, 与缓存不同
+"""
+
+import asyncio
+import copy
+import functools
+import inspect
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+import pandas as pd
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    将参数转换为可哈希的形式
+    :param value: 参数
+    :type value: Any
+    :return: 可哈希的参数
+    :rtype: Hashable
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        frozen = tuple(_freeze(item) for item in value)
+        return tuple(sorted(frozen, key=repr)) if isinstance(value, set) else frozen
+    hash(value)
+    return value
+
+
+def _share(result: Any) -> Any:
+    """
+    等待者得到结果的副本, 避免修改返回的 DataFrame 时相互影响
+    :param result: 结果
+    :type result: Any
+    :return: 结果的副本
+    :rtype: Any
+    """
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return result.copy()
+    if isinstance(result, (dict, list)):
+        return copy.copy(result)
+    return result
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    按键合并同时进行的调用, 线程安全
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        # 每个事件循环各自维护进行中的协程调用
+        self._async_calls: Dict[int, Dict[Hashable, asyncio.Future]] = {}
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        执行 func, 相同键的调用正在进行时等待并共享其结果
+        :param key: 键
+        :type key: Hashable
+        :param func: 无参数的函数
+        :type func: callable
+        :return: func 的返回值
+        :rtype: Any
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return _share(call.result)
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    async def do_async(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        执行协程函数 func, 同一事件循环中相同键的调用正在进行时等待并共享其结果
+        :param key: 键
+        :type key: Hashable
+        :param func: 无参数的协程函数
+        :type func: callable
+        :return: func 的返回值
+        :rtype: Any
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            call_dict = self._async_calls.setdefault(id(loop), {})
+            future = call_dict.get(key)
+            leader = future is None
+            if leader:
+                future = loop.create_future()
+                call_dict[key] = future
+        if not leader:
+            return _share(await asyncio.shield(future))
+        try:
+            result = await func()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # 没有等待者时避免 "exception was never retrieved" 警告
+            future.exception()
+            raise
+        finally:
+            with self._lock:
+                del call_dict[key]
+                if not call_dict:
+                    self._async_calls.pop(id(loop), None)
+
+
+# 全局实例, single_flight 装饰的接口共享
+_single_flight = SingleFlight()
+
+
+def single_flight(func: Callable) -> Callable:
+    """
+    装饰器: 合并同时进行的相同参数的调用, 支持普通函数和协程函数
+    参数按函数签名规范化, 因此 f("a") 和 f(symbol="a") 视为同一个调用; 参数不可哈希时不合并
+    :param func: 接口函数
+    :type func: callable
+    :return: 装饰后的函数
+    :rtype: callable
+    """
+    signature = inspect.signature(func)
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    def _key(args, kwargs) -> Hashable:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        try:
+            return name, _freeze(bound.arguments)
+        except TypeError:
+            return None
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            key = _key(args, kwargs)
+            if key is None:
+                return await func(*args, **kwargs)
+            return await _single_flight.do_async(key, lambda: func(*args, **kwargs))
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = _key(args, kwargs)
+        if key is None:
+            return func(*args, **kwargs)
+        return _single_flight.do(key, lambda: func(*args, **kwargs))
+
+    return wrapper
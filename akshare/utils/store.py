@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 14:00
+Desc: 本地数据仓库
+按命名空间和键保存 pandas.DataFrame, 位于缓存目录的 store 子目录下, 用于增量更新
+"""
+
+import os
+import re
+import threading
+from typing import List, Optional
+
+import pandas as pd
+
+from akshare.utils.context import get_cache_dir
+
+_KEY_PATTERN = re.compile(r"[^\w.\-]")
+
+
+class LocalStore:
+    """
+    本地数据仓库, 每个键对应一个 pickle 文件, 写入时先写临时文件再替换, 保证读到的总是完整数据
+    """
+
+    def __init__(self, namespace: str, root: Optional[str] = None):
+        self.namespace = namespace
+        self.root = root
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.root or get_cache_dir(), "store", self.namespace)
+
+    def _file_path(self, key: str) -> str:
+        return os.path.join(self.path, f"{_KEY_PATTERN.sub('_', str(key))}.pkl")
+
+    def read(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        读取数据
+        :param key: 键
+        :type key: str
+        :return: 数据, 不存在时返回 None
+        :rtype: pandas.DataFrame
+        """
+        file_path = self._file_path(key)
+        if not os.path.exists(file_path):
+            return None
+        return pd.read_pickle(file_path)
+
+    def write(self, key: str, df: pd.DataFrame) -> None:
+        """
+        写入数据, 覆盖已有数据
+        :param key: 键
+        :type key: str
+        :param df: 数据
+        :type df: pandas.DataFrame
+        :return: None
+        :rtype: None
+        """
+        file_path = self._file_path(key)
+        os.makedirs(self.path, exist_ok=True)
+        temp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        df.to_pickle(temp_path)
+        os.replace(temp_path, file_path)
+
+    def modified_time(self, key: str) -> Optional[float]:
+        """
+        数据的最后写入时间
+        :param key: 键
+        :type key: str
+        :return: 时间戳, 不存在时返回 None
+        :rtype: float
+        """
+        file_path = self._file_path(key)
+        if not os.path.exists(file_path):
+            return None
+        return os.path.getmtime(file_path)
+
+    def delete(self, key: str) -> None:
+        """
+        删除数据
+        :param key: 键
+        :type key: str
+        :return: None
+        :rtype: None
+        """
+        file_path = self._file_path(key)
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+    def keys(self) -> List[str]:
+        """
+        所有已保存的键
+        :return: 键列表
+        :rtype: list
+        """
+        if not os.path.isdir(self.path):
+            return []
+        return sorted(
+            item[:-4] for item in os.listdir(self.path) if item.endswith(".pkl")
+        )
+
+    def append(
+        self, key: str, df: pd.DataFrame, subset: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        追加数据, 按 subset 去重(保留新数据), 返回合并后的数据
+        :param key: 键
+        :type key: str
+        :param df: 新数据
+        :type df: pandas.DataFrame
+        :param subset: 去重的字段, 默认为所有字段
+        :type subset: list
+        :return: 合并后的数据
+        :rtype: pandas.DataFrame
+        """
+        with self._lock:
+            old_df = self.read(key)
+            if old_df is not None and not old_df.empty:
+                df = pd.concat([old_df, df], ignore_index=True)
+                df = df.drop_duplicates(subset=subset, keep="last", ignore_index=True)
+            self.write(key, df)
+            return df
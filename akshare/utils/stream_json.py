@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 23:00
+Desc: 东方财富数据中心接口的流式 JSON 解析
+datacenter-web 接口单页可达数万条记录, 整页 r.json() 会同时持有原始响应、解码后的字符串和全部字典;
+此处边下载边解码 result.data 中的记录, 只把需要的字段追加到按列存放的列表中, 已解码的文本随即丢弃
+"""
+
+import codecs
+import json
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+_DATA_PATTERN = re.compile(r'"data"\s*:\s*(\[|null)')
+_META_PATTERN = re.compile(r'"(pages|count)"\s*:\s*(\d+)')
+# 没有数据时接口返回 {"result": null, "success": false, ...}
+_RESULT_NULL_PATTERN = re.compile(r'"result"\s*:\s*null')
+_WHITESPACE = " \t\n\r,"
+
+_decoder = json.JSONDecoder()
+
+
+def _resolve_fields(
+    record: dict, fields: Optional[Sequence[Union[str, int]]]
+) -> List[str]:
+    """
+    确定需要保留的字段; 整数表示第一条记录中的字段位置
+    :param record: 第一条记录
+    :type record: dict
+    :param fields: 字段名称或位置, None 表示保留全部字段
+    :type fields: list
+    :return: 字段名称
+    :rtype: list
+    """
+    key_list = list(record)
+    if fields is None:
+        return key_list
+    return [key_list[item] if isinstance(item, int) else item for item in fields]
+
+
+def decode_records(
+    chunk_iter: Iterable[bytes],
+    fields: Optional[Sequence[Union[str, int]]] = None,
+    columns: Optional[Dict[str, list]] = None,
+) -> Tuple[Dict[str, list], Dict[str, int]]:
+    """
+    流式解析 {"result": {"pages": ..., "data": [...], "count": ...}} 结构的响应
+    :param chunk_iter: 响应内容的字节块, 例如 r.iter_content()
+    :type chunk_iter: iterable
+    :param fields: 需要保留的字段名称或位置, None 表示保留第一条记录的全部字段
+    :type fields: list
+    :param columns: 追加到已有的按列数据中, 用于合并多页
+    :type columns: dict
+    :return: 按列存放的数据和 pages、count 等分页信息; result 或 result.data 为 null 时不追加数据
+    :rtype: tuple
+    :raises ValueError: 响应中没有 result.data, 例如 HTML 错误页, 或者 result.data 不完整
+    """
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    columns = columns or {}
+    column_list = list(columns.values())
+    buffer = ""
+    meta_text = ""
+    in_array = False
+    done = False
+    for chunk in chunk_iter:
+        buffer += text_decoder.decode(chunk)
+        if done:
+            meta_text += buffer
+            buffer = ""
+            continue
+        if not in_array:
+            match = _DATA_PATTERN.search(buffer)
+            if match is None:
+                continue
+            meta_text = buffer[: match.start()]
+            if match.group(1) == "null":
+                done = True
+                meta_text += buffer[match.end() :]
+                buffer = ""
+                continue
+            in_array = True
+            buffer = buffer[match.end() :]
+        pos = 0
+        length = len(buffer)
+        while True:
+            while pos < length and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos == length:
+                break
+            if buffer[pos] == "]":
+                done = True
+                meta_text += buffer[pos + 1 :]
+                pos = length
+                break
+            try:
+                record, end = _decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # 记录被分块截断, 等待下一块
+                break
+            if not columns:
+                columns = {key: [] for key in _resolve_fields(record, fields)}
+                column_list = list(columns.values())
+            for key, value_list in zip(columns, column_list):
+                value_list.append(record.get(key))
+            pos = end
+        buffer = buffer[pos:]
+    text_decoder.decode(b"", final=True)
+    if in_array and not done:
+        raise ValueError("incomplete JSON response: result.data is not closed")
+    if not in_array and not done:
+        if _RESULT_NULL_PATTERN.search(buffer) is None:
+            raise ValueError(
+                f"unexpected response, result.data not found: {buffer[:200]!r}"
+            )
+        meta_text = buffer
+    meta = {key: int(value) for key, value in _META_PATTERN.findall(meta_text)}
+    return columns, meta
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 11:00
+Desc: 同花顺 v 参数(Cookie 或者 hexin-v 请求头)
+ths.js 只在首次使用时加载一次, 生成的 v 参数缓存在站点凭证缓存中, 在时间窗口内复用
+"""
+
+import threading
+
+import py_mini_racer
+
+from akshare.datasets import get_ths_js
+from akshare.utils.instrument import phase
+from akshare.utils.session_cache import session_cache
+
+# v 参数的复用时间窗口(秒)
+V_CODE_WINDOW = 60
+
+_lock = threading.Lock()
+_js_code = None
+
+
+def _get_file_content_ths(file: str = "ths.js") -> str:
+    """
+    获取 JS 文件的内容
+    :param file:  JS 文件名
+    :type file: str
+    :return: 文件内容
+    :rtype: str
+    """
+    setting_file_path = get_ths_js(file)
+    with open(setting_file_path, encoding="utf-8") as f:
+        file_data = f.read()
+    return file_data
+
+
+def _new_ths_v_code() -> str:
+    """
+    同花顺-生成新的 v 参数, JS 上下文只创建一次
+    :return: v 参数
+    :rtype: str
+    """
+    global _js_code
+    with _lock:
+        if _js_code is None:
+            js_code = py_mini_racer.MiniRacer()
+            js_code.eval(_get_file_content_ths("ths.js"))
+            _js_code = js_code
+        with phase("js"):
+            return _js_code.call("v")
+
+
+session_cache.register(site="ths", factory=_new_ths_v_code, ttl=V_CODE_WINDOW)
+
+
+def get_ths_v_code() -> str:
+    """
+    同花顺-v 参数, 在时间窗口内复用, 线程安全
+    :return: v 参数
+    :rtype: str
+    """
+    return session_cache.get("ths")
+
+
+def reset_ths_v_code() -> None:
+    """
+    作废当前的 v 参数, 下次调用时重新生成
+    :return: None
+    :rtype: None
+    """
+    session_cache.invalidate("ths")
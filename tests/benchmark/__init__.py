@@ -0,0 +1,18 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 21:00
+Desc: 性能基准测试
+基准测试默认不收集, 普通的 pytest 只运行 test_cassette.py; 设置 AKSHARE_BENCHMARK=1 后才运行,
+此时缺少录制文件的用例会失败. 录制文件保存在 tests/benchmark/cassettes, 详见该目录的 README.md
+先在能访问外网的机器上录制真实响应, 再提交录制文件:
+    python -m tests.benchmark.record
+    python -m tests.benchmark.record stock_zh_a_hist
+之后离线回放并保存基线:
+    AKSHARE_BENCHMARK=1 pytest tests/benchmark --benchmark-only --benchmark-storage=tests/benchmark/baselines --benchmark-autosave
+与已保存的基线比较, 平均耗时变慢超过 10% 时失败:
+    AKSHARE_BENCHMARK=1 pytest tests/benchmark --benchmark-only --benchmark-storage=tests/benchmark/baselines --benchmark-compare --benchmark-compare-fail=mean:10%
+不需要录制文件的用例(例如 lenient_json)可以单独运行:
+    AKSHARE_BENCHMARK=1 pytest tests/benchmark -k lenient_json --benchmark-only
+没有安装 pytest-benchmark 时不收集基准测试
+"""
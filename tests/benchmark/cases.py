@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 21:00
+Desc: 基准测试用例
+每个用例对应一个录制文件, 参数固定, 录制和回放时调用同一个函数
+"""
+
+import contextlib
+import tempfile
+from typing import Callable, Dict, Iterator
+
+import pandas as pd
+
+from akshare.utils.context import get_cache_dir, set_cache_dir
+
+
+def _fetch_paginated_data() -> pd.DataFrame:
+    from akshare.stock_feature.stock_hist_em import _stock_zh_a_spot_em_request
+    from akshare.utils.func import fetch_paginated_data
+
+    url, params = _stock_zh_a_spot_em_request()
+    return fetch_paginated_data(url, params)
+
+
+def _stock_zh_a_hist() -> pd.DataFrame:
+    from akshare.stock_feature.stock_hist_em import stock_zh_a_hist
+
+    return stock_zh_a_hist(
+        symbol="000001", start_date="20150101", end_date="20241231", adjust="qfq"
+    )
+
+
+def _get_futures_daily() -> pd.DataFrame:
+    from akshare.futures.futures_daily_bar import get_futures_daily
+
+    return get_futures_daily(start_date="20240102", end_date="20240105", market="DCE")
+
+
+def _stock_zh_a_daily() -> pd.DataFrame:
+    from akshare.stock.stock_zh_a_sina import stock_zh_a_daily
+
+    return stock_zh_a_daily(
+        symbol="sh600000", start_date="20150101", end_date="20241231", adjust="qfq"
+    )
+
+
+def _stock_cyq_em() -> pd.DataFrame:
+    from akshare.stock_feature.stock_cyq_em import stock_cyq_em
+
+    return stock_cyq_em(symbol="000001", adjust="qfq")
+
+
+CASES: Dict[str, Callable[[], pd.DataFrame]] = {
+    "fetch_paginated_data": _fetch_paginated_data,
+    "stock_zh_a_hist": _stock_zh_a_hist,
+    "get_futures_daily": _get_futures_daily,
+    "stock_zh_a_daily": _stock_zh_a_daily,
+    "stock_cyq_em": _stock_cyq_em,
+}
+
+
+@contextlib.contextmanager
+def isolated_cache() -> Iterator[str]:
+    """
+    使用临时的缓存目录, 录制和回放时本地缓存状态相同, 发出的请求也相同
+    :return: 临时缓存目录
+    :rtype: str
+    """
+    old_cache_dir = get_cache_dir()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        set_cache_dir(cache_dir)
+        try:
+            yield cache_dir
+        finally:
+            set_cache_dir(old_cache_dir)
@@ -0,0 +1,272 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 21:00
+Desc: HTTP 录制和回放
+录制时保存 requests 的真实响应; 回放时在本地启动一个 HTTP 服务返回录制的响应,
+请求仍然经过 requests/urllib3 和本地 socket, 只是不访问外网
+"""
+
+import base64
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, Iterator, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+
+CASSETTE_DIR = os.path.join(os.path.dirname(__file__), "cassettes")
+
+# 时间戳之类每次请求都不同的参数, 不参与匹配
+VOLATILE_PARAMS = ("_",)
+
+# 回放时不返回的响应头, 录制的是解压后的内容
+_DROP_HEADERS = {
+    "content-encoding",
+    "content-length",
+    "transfer-encoding",
+    "connection",
+}
+
+
+class CassetteMiss(KeyError):
+    """
+    回放时请求没有对应的录制响应
+    """
+
+
+def cassette_path(name: str) -> str:
+    """
+    录制文件路径
+    :param name: 录制名称
+    :type name: str
+    :return: 文件路径
+    :rtype: str
+    """
+    return os.path.join(CASSETTE_DIR, f"{name}.json.gz")
+
+
+def request_key(
+    request: requests.PreparedRequest, ignore_params: Iterable[str] = VOLATILE_PARAMS
+) -> str:
+    """
+    请求的匹配键, 由请求方法、不含查询参数的网址、排序后的查询参数和请求体的哈希组成
+    :param request: 请求
+    :type request: requests.PreparedRequest
+    :param ignore_params: 不参与匹配的查询参数
+    :type ignore_params: iterable
+    :return: 匹配键
+    :rtype: str
+    """
+    parts = urlsplit(request.url)
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in ignore_params
+    )
+    body = request.body or b""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    return json.dumps(
+        [
+            request.method,
+            f"{parts.scheme}://{parts.netloc}{parts.path}",
+            query,
+            hashlib.sha1(body).hexdigest(),
+        ],
+        ensure_ascii=False,
+    )
+
+
+def _digest(key: str) -> str:
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    """
+    一组录制的响应, 以 gzip 压缩的 JSON 保存
+    """
+
+    def __init__(self, name: str, entries: Optional[Dict[str, Dict]] = None):
+        self.name = name
+        self.entries = entries or {}
+
+    @property
+    def path(self) -> str:
+        return cassette_path(self.name)
+
+    @classmethod
+    def load(cls, name: str) -> "Cassette":
+        """
+        读取录制文件
+        :param name: 录制名称
+        :type name: str
+        :return: 录制
+        :rtype: Cassette
+        """
+        with gzip.open(cassette_path(name), "rt", encoding="utf-8") as f:
+            return cls(name, json.load(f)["entries"])
+
+    def save(self) -> None:
+        """
+        保存录制文件
+        :return: None
+        :rtype: None
+        """
+        os.makedirs(CASSETTE_DIR, exist_ok=True)
+        with gzip.open(self.path, "wt", encoding="utf-8") as f:
+            json.dump({"name": self.name, "entries": self.entries}, f)
+
+    def add(self, key: str, response: requests.Response) -> None:
+        """
+        添加一个响应, 相同的请求保留最后一次的响应
+        :param key: 匹配键
+        :type key: str
+        :param response: 响应
+        :type response: requests.Response
+        :return: None
+        :rtype: None
+        """
+        self.entries[_digest(key)] = {
+            "key": key,
+            "status": response.status_code,
+            "headers": {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in _DROP_HEADERS
+            },
+            "body": base64.b64encode(response.content).decode("ascii"),
+        }
+
+    def bodies(self, url_prefix: str = "") -> Iterator[bytes]:
+        """
+        网址以 url_prefix 开头的所有响应内容, 按录制顺序
+        :param url_prefix: 网址前缀
+        :type url_prefix: str
+        :return: 响应内容
+        :rtype: iterator
+        """
+        for entry in self.entries.values():
+            if json.loads(entry["key"])[1].startswith(url_prefix):
+                yield base64.b64decode(entry["body"])
+
+
+def _handler(cassette: Cassette):
+    class ReplayHandler(BaseHTTPRequestHandler):
+        def _reply(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            if length:
+                self.rfile.read(length)
+            entry = cassette.entries.get(self.path.lstrip("/"))
+            if entry is None:
+                self.send_error(404)
+                return
+            body = base64.b64decode(entry["body"])
+            self.send_response(entry["status"])
+            for name, value in entry["headers"].items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = do_POST = _reply
+
+        def log_message(self, format, *args):
+            pass
+
+    return ReplayHandler
+
+
+class ReplayServer:
+    """
+    本地回放服务, 路径为匹配键的哈希
+    """
+
+    def __init__(self, cassette: Cassette):
+        self.cassette = cassette
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(cassette))
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@contextlib.contextmanager
+def record(
+    name: str, ignore_params: Iterable[str] = VOLATILE_PARAMS
+) -> Iterator[Cassette]:
+    """
+    录制上下文, 其中通过 requests 发出的请求和响应保存到名为 name 的录制文件
+    :param name: 录制名称
+    :type name: str
+    :param ignore_params: 不参与匹配的查询参数
+    :type ignore_params: iterable
+    :return: 录制
+    :rtype: Cassette
+    """
+    cassette = Cassette(name)
+    original_send = requests.Session.send
+    lock = threading.Lock()
+
+    def send(session, request, **kwargs):
+        response = original_send(session, request, **kwargs)
+        with lock:
+            cassette.add(request_key(request, ignore_params), response)
+        return response
+
+    requests.Session.send = send
+    try:
+        yield cassette
+    finally:
+        requests.Session.send = original_send
+    cassette.save()
+
+
+@contextlib.contextmanager
+def replay(
+    cassette: Cassette, ignore_params: Iterable[str] = VOLATILE_PARAMS
+) -> Iterator[Cassette]:
+    """
+    回放上下文, 其中通过 requests 发出的请求转发到本地回放服务
+    :param cassette: 录制, 可以通过 Cassette.load 读取
+    :type cassette: Cassette
+    :param ignore_params: 不参与匹配的查询参数
+    :type ignore_params: iterable
+    :return: 录制
+    :rtype: Cassette
+    """
+    server = ReplayServer(cassette).start()
+    original_send = requests.Session.send
+
+    def send(session, request, **kwargs):
+        key = request_key(request, ignore_params)
+        if _digest(key) not in cassette.entries:
+            raise CassetteMiss(key)
+        request = request.copy()
+        request.url = f"{server.url}/{_digest(key)}"
+        kwargs["proxies"] = {}
+        return original_send(session, request, **kwargs)
+
+    requests.Session.send = send
+    try:
+        yield cassette
+    finally:
+        requests.Session.send = original_send
+        server.stop()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 21:00
+Desc: 基准测试配置
+基准测试默认不收集, 设置环境变量 AKSHARE_BENCHMARK=1 后运行, 详见 tests/benchmark/__init__.py
+"""
+
+import os
+
+import pytest
+
+from tests.benchmark.cassette import Cassette, cassette_path
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    collect_ignore = ["test_benchmark.py"]
+else:
+    if os.environ.get("AKSHARE_BENCHMARK", "").strip() not in ("1", "true"):
+        collect_ignore = ["test_benchmark.py"]
+
+
+@pytest.fixture
+def load_cassette():
+    """
+    读取录制文件; 启用基准测试后缺少录制文件视为失败, 而不是跳过
+    :return: 读取函数
+    :rtype: callable
+    """
+
+    def _load(name: str) -> Cassette:
+        if not os.path.exists(cassette_path(name)):
+            pytest.fail(
+                f"没有录制 {name}, 先运行 python -m tests.benchmark.record {name}",
+                pytrace=False,
+            )
+        return Cassette.load(name)
+
+    return _load
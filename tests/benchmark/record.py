@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 21:00
+Desc: 录制基准测试用例的真实响应, 需要访问外网
+python -m tests.benchmark.record                     录制全部用例
+python -m tests.benchmark.record stock_zh_a_hist     录制指定用例
+"""
+
+import argparse
+
+from tests.benchmark.cases import CASES, isolated_cache
+from tests.benchmark.cassette import cassette_path, record
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="录制基准测试用例的真实响应")
+    parser.add_argument("names", nargs="*", help=f"用例名称: {', '.join(CASES)}")
+    args = parser.parse_args()
+    unknown_list = [name for name in args.names if name not in CASES]
+    if unknown_list:
+        parser.error(f"未知的用例: {', '.join(unknown_list)}")
+    for name in args.names or CASES:
+        with isolated_cache(), record(name) as cassette:
+            temp_df = CASES[name]()
+        print(
+            f"{name}: {len(cassette.entries)} 个响应, {temp_df.shape}, "
+            f"已保存到 {cassette_path(name)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
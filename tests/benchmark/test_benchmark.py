@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 21:00
+Desc: 热点接口的性能基准
+end_to_end: 通过本地回放服务调用接口, 包括请求、解析和整理数据的全部耗时
+parse/build: 分别测量解析响应和构建 DataFrame 的耗时
+每个用例额外记录一次调用的内存峰值(extra_info.peak_memory_mb)
+"""
+
+import json
+import os
+import tracemalloc
+
+import pandas as pd
+import pytest
+
+from akshare.stock_feature.stock_hist_em import _stock_zh_a_hist_clean
+from akshare.utils import demjson, lenient_json
+from akshare.utils.func import paginated_data_to_df
+from tests.benchmark.cases import CASES, isolated_cache
+from tests.benchmark.cassette import replay
+
+_CLIST_URL = "https://82.push2.eastmoney.com/api/qt/clist/get"
+_KLINE_URL = "https://push2his.eastmoney.com/api/qt/stock/kline/get"
+# 新浪 Market_Center.getHQNodeData 一页 80 条的响应格式(键名不带引号的 JS 对象字面量)
+_SINA_NODE_DATA_PATH = os.path.join(
+    os.path.dirname(__file__), "payloads", "sina_getHQNodeData.txt"
+)
+
+
+def _measure(benchmark, func, *args):
+    """
+    记录一次调用的内存峰值后进行基准测试
+    :param benchmark: pytest-benchmark 的 benchmark fixture
+    :type benchmark: pytest_benchmark.fixture.BenchmarkFixture
+    :param func: 被测函数
+    :type func: callable
+    :return: 被测函数的返回值
+    :rtype: Any
+    """
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["peak_memory_mb"] = round(peak / 1024**2, 3)
+    return benchmark(func, *args)
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_end_to_end(benchmark, load_cassette, name):
+    cassette = load_cassette(name)
+    benchmark.group = name
+    with isolated_cache(), replay(cassette):
+        temp_df = _measure(benchmark, CASES[name])
+    assert not temp_df.empty
+
+
+def test_fetch_paginated_data_parse(benchmark, load_cassette):
+    body_list = list(load_cassette("fetch_paginated_data").bodies(_CLIST_URL))
+    benchmark.group = "fetch_paginated_data"
+    json_list = _measure(benchmark, lambda: [json.loads(body) for body in body_list])
+    assert json_list
+
+
+def test_fetch_paginated_data_build(benchmark, load_cassette):
+    body_list = load_cassette("fetch_paginated_data").bodies(_CLIST_URL)
+    json_list = [json.loads(body) for body in body_list]
+    benchmark.group = "fetch_paginated_data"
+    temp_df = _measure(
+        benchmark,
+        lambda: paginated_data_to_df(
+            [pd.DataFrame(item["data"]["diff"]) for item in json_list]
+        ),
+    )
+    assert not temp_df.empty
+
+
+def test_stock_zh_a_hist_parse(benchmark, load_cassette):
+    body = next(load_cassette("stock_zh_a_hist").bodies(_KLINE_URL))
+    benchmark.group = "stock_zh_a_hist"
+    assert _measure(benchmark, json.loads, body)
+
+
+def test_stock_zh_a_hist_build(benchmark, load_cassette):
+    data_json = json.loads(next(load_cassette("stock_zh_a_hist").bodies(_KLINE_URL)))
+    benchmark.group = "stock_zh_a_hist"
+    temp_df = _measure(benchmark, _stock_zh_a_hist_clean, data_json, "000001")
+    assert not temp_df.empty
+
+
+@pytest.mark.parametrize(
+    "decode", [lenient_json.decode, demjson.decode], ids=["lenient_json", "demjson"]
+)
+def test_lenient_json_decode(benchmark, decode):
+    with open(_SINA_NODE_DATA_PATH, encoding="utf-8") as f:
+        data_text = f.read()
+    benchmark.group = "lenient_json"
+    data_json = _measure(benchmark, decode, data_text)
+    assert data_json == demjson.decode(data_text)
+    assert len(data_json) == 80
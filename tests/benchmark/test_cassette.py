@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 21:00
+Desc: HTTP 录制和回放测试
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from tests.benchmark import cassette as cassette_module
+from tests.benchmark.cassette import Cassette, CassetteMiss, record, replay
+
+
+class _OriginHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = f'{{"path": "{self.path.split("&_=")[0]}"}}'.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        body = self.rfile.read(length)[::-1]
+        self.send_response(201)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_record_and_replay(tmp_path, monkeypatch):
+    """
+    录制后关闭源服务, 回放得到相同的响应; 忽略时间戳参数, 未录制的请求报错
+    :return: assert result
+    :rtype: assert
+    """
+    monkeypatch.setattr(cassette_module, "CASSETTE_DIR", str(tmp_path))
+    origin = ThreadingHTTPServer(("127.0.0.1", 0), _OriginHandler)
+    threading.Thread(target=origin.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{origin.server_address[1]}/api"
+    with record("demo") as recorded:
+        get_json = requests.get(url, params={"pn": 1, "_": 1}).json()
+        post_text = requests.post(url, data=b"abc").text
+    origin.shutdown()
+    origin.server_close()
+    assert len(recorded.entries) == 2
+
+    with replay(Cassette.load("demo")):
+        assert requests.get(url, params={"_": 2, "pn": 1}).json() == get_json
+        r = requests.post(url, data=b"abc")
+        assert (r.status_code, r.text) == (201, post_text)
+        with pytest.raises(CassetteMiss):
+            requests.get(url, params={"pn": 2})
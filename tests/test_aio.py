@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 20:00
+Desc: 异步接口测试
+"""
+
+import asyncio
+
+import pandas as pd
+
+import akshare.aio as ak_aio
+from akshare.aio import client
+from akshare.stock_a import stock_board_concept_name_em, stock_zh_a_spot
+from akshare.stock_feature import stock_hist_em
+from akshare.utils import func
+
+
+def _fake_spot_page(params: dict) -> dict:
+    page = int(params["pn"])
+    row_list = [
+        {field: f"{page}{j}" for field in params["fields"].split(",") + ["f26", "f27"]}
+        for j in range(2 if page < 3 else 1)
+    ]
+    for j, row in enumerate(row_list):
+        row["f3"] = page * 10 + j
+    return {"data": {"total": 5, "diff": row_list}}
+
+
+class _FakeResponse:
+    def __init__(self, data_json: dict):
+        self.data_json = data_json
+
+    def json(self) -> dict:
+        return self.data_json
+
+
+def test_aio_spot_same_as_sync(monkeypatch):
+    """
+    异步接口并发获取分页, 结果与同步接口一致
+    :return: assert result
+    :rtype: assert
+    """
+    page_list = []
+
+    async def _get_json(url, params=None, headers=None):
+        page_list.append(int(params["pn"]))
+        await asyncio.sleep(0)
+        return _fake_spot_page(params)
+
+    monkeypatch.setattr(client, "get_json", _get_json)
+    monkeypatch.setattr(
+        func.requests,
+        "get",
+        lambda url, params, timeout: _FakeResponse(_fake_spot_page(params)),
+    )
+    async_df = asyncio.run(ak_aio.stock_zh_a_spot_em())
+    sync_df = stock_hist_em.stock_zh_a_spot_em()
+    assert sorted(page_list) == [1, 2, 3]
+    pd.testing.assert_frame_equal(async_df, sync_df)
+    assert async_df["序号"].tolist() == [1, 2, 3, 4, 5]
+
+
+def test_aio_shared_session():
+    """
+    同一事件循环共用一个会话, 关闭后重新创建
+    :return: assert result
+    :rtype: assert
+    """
+
+    async def _main():
+        session = client.get_session()
+        assert client.get_session() is session
+        await ak_aio.close_session()
+        assert session.closed
+        new_session = client.get_session()
+        assert new_session is not session
+        await ak_aio.close_session()
+
+    asyncio.run(_main())
+
+
+def test_aio_empty_pages(monkeypatch):
+    """
+    第一页没有数据时返回空列表, 不会除以零
+    :return: assert result
+    :rtype: assert
+    """
+    response_list = [{"data": {"total": 0, "diff": []}}, {"data": None}]
+
+    async def _get_json(url, params=None, headers=None):
+        return response_list.pop(0)
+
+    monkeypatch.setattr(client, "get_json", _get_json)
+    assert asyncio.run(client.fetch_clist_pages("", {"pn": 1})) == []
+    assert asyncio.run(ak_aio.stock_zh_a_spot_em()).empty
+
+
+def test_aio_legacy_wrappers(monkeypatch):
+    """
+    akshare.stock_a 中的旧接口通过 akshare.aio 共享的会话获取数据, 同步调用结束后关闭会话
+    :return: assert result
+    :rtype: assert
+    """
+    session_list = []
+
+    async def _get_json(url, params=None, headers=None):
+        session_list.append(client.get_session())
+        return _fake_spot_page(params)
+
+    async def _main():
+        temp_df = await ak_aio.stock_zh_a_spot_em()
+        await ak_aio.close_session()
+        return temp_df
+
+    monkeypatch.setattr(client, "get_json", _get_json)
+    async_df = asyncio.run(_main())
+    sync_df = stock_zh_a_spot.stock_zh_a_spot_em()
+    pd.testing.assert_frame_equal(sync_df, async_df)
+    temp_df = stock_board_concept_name_em.stock_board_concept_name_em()
+    assert temp_df["排名"].tolist() == [1, 2, 3, 4, 5]
+    assert temp_df["涨跌幅"].is_monotonic_decreasing
+    assert all(session.closed for session in session_list)
+    assert len(client._sessions) == 0
+
+
+if __name__ == "__main__":
+    test_aio_spot_same_as_sync()
+    test_aio_shared_session()
+    test_aio_empty_pages()
+    test_aio_legacy_wrappers()
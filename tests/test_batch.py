@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 13:00
+Desc: 批量任务调度测试
+"""
+
+import requests
+
+from akshare.utils import batch
+from akshare.utils.batch import HostLimiter, run_batch
+
+
+def _square(x: int) -> int:
+    if x == 3:
+        raise ValueError("bad input")
+    return x * x
+
+
+def test_run_batch():
+    """
+    失败的任务进入错误表, 其余任务正常返回
+    :return: assert result
+    :rtype: assert
+    """
+    result_list, error_df = run_batch(
+        func=_square,
+        task_list=[{"x": x} for x in range(5)],
+        max_workers=2,
+        host="example.com",
+        limiter=HostLimiter(max_concurrency=1),
+        max_retries=1,
+        show_progress=False,
+    )
+    assert result_list == [0, 1, 4, None, 16]
+    assert error_df["x"].tolist() == [3]
+    assert error_df["error_type"].tolist() == ["ValueError"]
+
+
+def _http_error(status_code: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(f"{status_code} Error", response=response)
+
+
+def test_run_batch_retry(monkeypatch):
+    """
+    只重试连接错误、超时、HTTP 5xx 和 429, 其他错误直接记入错误表
+    :return: assert result
+    :rtype: assert
+    """
+    sleep_list = []
+    monkeypatch.setattr(batch.time, "sleep", sleep_list.append)
+    call_dict = {}
+    error_dict = {
+        "timeout": requests.Timeout("read timeout"),
+        "connection": requests.ConnectionError("reset"),
+        "502": _http_error(502),
+        "429": _http_error(429),
+        "404": _http_error(404),
+        "key": KeyError("data"),
+        "value": ValueError("bad symbol"),
+    }
+
+    def _fetch(symbol: str) -> str:
+        call_dict[symbol] = call_dict.get(symbol, 0) + 1
+        # 可重试的错误第二次成功
+        if symbol in error_dict and call_dict[symbol] == 1:
+            raise error_dict[symbol]
+        return symbol
+
+    result_list, error_df = run_batch(
+        func=_fetch,
+        task_list=[{"symbol": symbol} for symbol in error_dict],
+        max_workers=1,
+        show_progress=False,
+    )
+    assert result_list == ["timeout", "connection", "502", "429", None, None, None]
+    assert error_df["symbol"].tolist() == ["404", "key", "value"]
+    assert error_df["error_type"].tolist() == ["HTTPError", "KeyError", "ValueError"]
+    assert call_dict == {
+        "timeout": 2,
+        "connection": 2,
+        "502": 2,
+        "429": 2,
+        "404": 1,
+        "key": 1,
+        "value": 1,
+    }
+    assert sleep_list == [1, 1, 1, 1]
+
+
+if __name__ == "__main__":
+    test_run_batch()
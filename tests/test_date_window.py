@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 17:00
+Desc: 日期窗口拆分测试
+"""
+
+import pandas as pd
+
+from akshare.utils.date_window import date_window, split_date_range
+
+
+def test_split_date_range():
+    """
+    子窗口首尾相接且不超过最大天数
+    :return: assert result
+    :rtype: assert
+    """
+    assert split_date_range("20200101", "20200110", 4) == [
+        ("20200101", "20200104"),
+        ("20200105", "20200108"),
+        ("20200109", "20200110"),
+    ]
+    assert split_date_range("20200101", "20200101", 4) == [("20200101", "20200101")]
+
+
+def test_date_window():
+    """
+    超出跨度的请求被拆分后合并去重
+    :return: assert result
+    :rtype: assert
+    """
+    call_list = []
+
+    @date_window(max_days=3, key_columns=["date"], sort_columns=["date"])
+    def _daily(symbol: str = "a", start_date: str = "", end_date: str = ""):
+        call_list.append((start_date, end_date))
+        date_list = pd.date_range(start_date, end_date).strftime("%Y%m%d")
+        return pd.DataFrame({"date": date_list, "symbol": symbol})
+
+    temp_df = _daily("b", start_date="20200101", end_date="20200107")
+    assert sorted(call_list) == [
+        ("20200101", "20200103"),
+        ("20200104", "20200106"),
+        ("20200107", "20200107"),
+    ]
+    assert temp_df["date"].tolist() == [f"2020010{day}" for day in range(1, 8)]
+    assert set(temp_df["symbol"]) == {"b"}
+
+
+if __name__ == "__main__":
+    test_split_date_range()
+    test_date_window()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 23:00
+Desc: 基金投资组合测试
+"""
+
+import json
+
+from akshare.fund import fund_portfolio_em
+
+_NEWS = "<a href='#'>变动详情</a><a href='#'>股吧</a><a href='#'>行情</a>"
+
+
+def _section(label: str, header: list, row_list: list) -> str:
+    th = "".join(f"<th>{item}</th>" for item in header)
+    tbody = "".join(
+        "<tr>" + "".join(f"<td>{item}</td>" for item in row) + "</tr>"
+        for row in row_list
+    )
+    return (
+        "<div class='boxitem w790'><h4 class='t'><label class='left'>"
+        f"<a href='#'>测试基金</a>&nbsp;&nbsp;{label}</label>"
+        "<label class='right lab2 xq505'>&nbsp;&nbsp;&nbsp;&nbsp;来源：天天基金</label>"
+        f"</h4><table class='w782 comm tzxq'><thead><tr>{th}</tr></thead>"
+        f"<tbody>{tbody}</tbody></table></div>"
+    )
+
+
+def _hold_content(symbol: str, year: str) -> str:
+    header = ["序号", "股票代码", "股票名称", "相关资讯", "占净值<br />比例"]
+    header += ["持股数<br />（万股）", "持仓市值<br />（万元）"]
+    # 最新一个季度多出 最新价 和 涨跌幅 两列
+    return _section(
+        f"{year}年4季度股票投资明细",
+        header[:3] + ["最新价", "涨跌幅"] + header[3:],
+        [
+            ["1", "000001", "平安银行", "", "", _NEWS, "5%", "1,000", "10,000"],
+            ["2", symbol, "其他股票", "", "", _NEWS, "1.00%", "10.00", "100.00"],
+        ],
+    ) + _section(
+        f"{year}年3季度股票投资明细",
+        header,
+        [["1", "000001", "平安银行", _NEWS, "4.00%", "500.00", "5,000.00"]],
+    )
+
+
+def _fake_get(url, params=None, **kwargs):
+    content = _hold_content(params["code"], params["year"])
+    data_text = "var apidata=" + json.dumps({"content": content}) + ";"
+    return type("_FakeResponse", (), {"text": data_text})()
+
+
+def test_fund_portfolio_hold_em(monkeypatch):
+    """
+    按表头名称抽取字段, 较早的季度排在前面
+    :return: assert result
+    :rtype: assert
+    """
+    monkeypatch.setattr(fund_portfolio_em.requests, "get", _fake_get)
+    temp_df = fund_portfolio_em.fund_portfolio_hold_em(symbol="000002", date="2024")
+    assert temp_df.columns.tolist() == [
+        "序号",
+        "股票代码",
+        "股票名称",
+        "占净值比例",
+        "持股数",
+        "持仓市值",
+        "季度",
+    ]
+    assert temp_df["股票代码"].tolist() == ["000001", "000001", "000002"]
+    assert temp_df["持仓市值"].tolist() == [5000.0, 10000.0, 100.0]
+    assert temp_df["季度"].iloc[0] == "2024年3季度股票投资明细"
+
+
+def test_fund_portfolio_hold_all_em(tmp_path, monkeypatch):
+    """
+    按 (基金, 年份) 并发获取并以分类类型保存, 再次运行时只获取当年的数据; 按股票汇总持有基金
+    :return: assert result
+    :rtype: assert
+    """
+    call_list = []
+
+    def _counted_get(url, params=None, **kwargs):
+        call_list.append((params["code"], params["year"]))
+        return _fake_get(url, params=params)
+
+    monkeypatch.setattr(fund_portfolio_em.requests, "get", _counted_get)
+    monkeypatch.setattr(fund_portfolio_em._store, "root", str(tmp_path))
+    this_year = str(fund_portfolio_em.datetime.date.today().year)
+    symbol_list = ["000002", "000003"]
+    temp_df, error_df = fund_portfolio_em.fund_portfolio_hold_all_em(
+        symbol_list=symbol_list, start_year="2024", end_year=this_year
+    )
+    assert error_df.empty
+    assert len(call_list) == 2 * (int(this_year) - 2023)
+    assert str(temp_df["股票代码"].dtype) == "category"
+    assert str(temp_df["持仓市值"].dtype) == "float32"
+    assert set(temp_df["季度"].astype(str)) >= {"2024年3季度", "2024年4季度"}
+    again_df, _ = fund_portfolio_em.fund_portfolio_hold_all_em(
+        symbol_list=symbol_list, start_year="2024", end_year=this_year
+    )
+    assert len(call_list) == 2 * (int(this_year) - 2023) + 2
+    # 重新获取的当年数据替换旧数据, 分区在结束时合并
+    assert len(again_df) == len(temp_df)
+    assert not [key for key in fund_portfolio_em._store.keys() if "_part_" in key]
+    temp_df, _ = fund_portfolio_em.fund_portfolio_hold_all_em(
+        symbol_list=symbol_list, start_year="2024", end_year="2024"
+    )
+    holder_df = fund_portfolio_em.fund_portfolio_stock_holders(temp_df)
+    assert holder_df.values.tolist() == [
+        ["2024年3季度", "000001", "平安银行", 2, 1000.0, 10000.0],
+        ["2024年4季度", "000001", "平安银行", 2, 2000.0, 20000.0],
+        ["2024年4季度", "000002", "其他股票", 1, 10.0, 100.0],
+        ["2024年4季度", "000003", "其他股票", 1, 10.0, 100.0],
+    ]
+    wide_df = fund_portfolio_em.fund_portfolio_stock_holders(
+        temp_df, output="wide", value="持有基金数"
+    )
+    assert wide_df.loc["000001"].tolist() == [2, 2]
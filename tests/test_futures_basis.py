@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 23:00
+Desc: 展期收益率和基差面板测试
+"""
+
+import pandas as pd
+import pytest
+
+from akshare.futures import futures_roll_yield
+from akshare.futures.futures_basis import futures_basis_panel
+
+
+def _fake_daily() -> pd.DataFrame:
+    row_list = [
+        ("20250102", "rb2501", "RB", 98.0, 99.0, 5),
+        ("20250102", "rb2505", "RB", 100.0, 101.0, 50),
+        ("20250102", "rb2510", "RB", 110.0, 111.0, 40),
+        ("20250102", "cu2502", "CU", 200.0, 202.0, 30),
+        ("20250102", "cu2503", "CU", 210.0, 212.0, 20),
+        ("20250102", "IO2501-C-4000", "IO", 10.0, 10.0, 90),
+        ("20250103", "rb2505", "RB", 102.0, 103.0, 50),
+        ("20250103", "rb2510", "RB", 112.0, 113.0, 40),
+    ]
+    return pd.DataFrame(
+        row_list,
+        columns=["date", "symbol", "variety", "close", "settle", "open_interest"],
+    )
+
+
+def _fake_spot() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "date": ["20250102", "20250103"],
+            "symbol": ["RB", "RB"],
+            "spot_price": [100.0, 0.0],
+        }
+    )
+
+
+def test_futures_basis_panel():
+    """
+    一次计算所有品种每天的展期收益率、基差和基差率; 没有现货价格时基差为空
+    :return: assert result
+    :rtype: assert
+    """
+    temp_df = futures_basis_panel(_fake_daily(), _fake_spot())
+    assert temp_df[["date", "variety"]].values.tolist() == [
+        ["20250102", "CU"],
+        ["20250102", "RB"],
+        ["20250103", "RB"],
+    ]
+    rb_row = temp_df.iloc[1]
+    assert (rb_row["near_contract"], rb_row["dom_contract"]) == ("rb2501", "rb2505")
+    assert rb_row["near_basis"] == pytest.approx(-1.0)
+    assert rb_row["dom_basis_rate"] == pytest.approx(0.01)
+    assert rb_row["roll_yield"] == pytest.approx(-0.2287, abs=1e-4)
+    assert temp_df["dom_basis"].isna().tolist() == [True, False, True]
+    wide_df = futures_basis_panel(_fake_daily(), _fake_spot(), output="wide")
+    assert wide_df.shape == (2, 16)
+    assert wide_df.to_numpy().reshape(2, 8, 2).shape == (2, 8, 2)
+    assert wide_df[("dom_price", "RB")].tolist() == [101.0, 103.0]
+
+
+def test_get_roll_yield_bar_var(monkeypatch):
+    """
+    展期收益率横截面按品种一次计算
+    :return: assert result
+    :rtype: assert
+    """
+    monkeypatch.setattr(
+        futures_roll_yield,
+        "get_futures_daily_markets",
+        lambda start_date, end_date: _fake_daily()[lambda x: x["date"] == "20250102"],
+    )
+    temp_df = futures_roll_yield.get_roll_yield_bar(type_method="var", date="20250102")
+    assert temp_df.index.tolist() == ["CU", "RB"]
+    assert temp_df["near_by"].tolist() == ["cu2502", "rb2505"]
+    assert temp_df.loc["CU", "roll_yield"] == pytest.approx(-0.5855, abs=1e-4)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 23:00
+Desc: 期货主力合约连续数据测试
+"""
+
+import pandas as pd
+import pytest
+
+from akshare.futures import futures_roll_yield
+from akshare.futures.futures_continuous import (
+    futures_continuous_daily,
+    futures_main_contract_daily,
+    futures_roll_yield_term_structure,
+)
+
+
+def _fake_panel() -> pd.DataFrame:
+    # 第 2 天 rb2510 持仓量超过 rb2505, 第 3 天短暂回落, 第 4 天之后稳定领先
+    row_list = [
+        ("20250102", "rb2505", 100.0, 50),
+        ("20250102", "rb2510", 110.0, 40),
+        ("20250102", "rb2601", 120.0, 10),
+        ("20250103", "rb2505", 100.0, 40),
+        ("20250103", "rb2510", 110.0, 50),
+        ("20250103", "rb2601", 120.0, 10),
+        ("20250106", "rb2505", 100.0, 55),
+        ("20250106", "rb2510", 110.0, 50),
+        ("20250106", "rb2601", 120.0, 10),
+        ("20250107", "rb2505", 100.0, 30),
+        ("20250107", "rb2510", 121.0, 60),
+        ("20250107", "rb2601", 130.0, 10),
+        ("20250107", "rb2601-efp", 130.0, 90),
+        ("20250107", "SR601", 50.0, 10),
+        ("20250107", "SR509", 40.0, 20),
+    ]
+    temp_df = pd.DataFrame(
+        row_list, columns=["date", "symbol", "close", "open_interest"]
+    )
+    temp_df["variety"] = temp_df["symbol"].str.extract(r"^([A-Za-z]+)")[0].str.upper()
+    temp_df["open"] = temp_df["close"]
+    temp_df["volume"] = 1
+    return temp_df
+
+
+def test_futures_main_contract_daily():
+    """
+    主力合约只向远月切换, 次主力合约为更远交割月中持仓量最大的合约; 郑商所三位代码按交易年份解析
+    :return: assert result
+    :rtype: assert
+    """
+    temp_df = futures_main_contract_daily(_fake_panel())
+    rb_df = temp_df[temp_df["variety"] == "RB"]
+    assert rb_df["main_contract"].tolist() == ["rb2505", "rb2510", "rb2510", "rb2510"]
+    assert rb_df["sub_main_contract"].tolist() == [
+        "rb2510",
+        "rb2601",
+        "rb2601",
+        "rb2601",
+    ]
+    sr_row = temp_df[temp_df["variety"] == "SR"].iloc[0]
+    assert (sr_row["main_contract"], sr_row["sub_main_contract"]) == ("SR509", "SR601")
+    assert sr_row["roll_yield"] == pytest.approx(-0.6694, abs=1e-4)
+    temp_df = futures_main_contract_daily(_fake_panel(), confirm_days=2)
+    rb_df = temp_df[temp_df["variety"] == "RB"]
+    assert rb_df["main_contract"].tolist() == ["rb2505", "rb2505", "rb2505", "rb2505"]
+
+
+def test_futures_continuous_daily():
+    """
+    换月当天之前的价格按新旧合约的收盘价之比或者之差调整
+    :return: assert result
+    :rtype: assert
+    """
+    temp_df = futures_continuous_daily(_fake_panel(), adjust="ratio", variety="rb")
+    assert temp_df["close"].tolist() == pytest.approx([110.0, 110.0, 110.0, 121.0])
+    temp_df = futures_continuous_daily(_fake_panel(), adjust="difference", variety="rb")
+    assert temp_df["close"].tolist() == pytest.approx([110.0, 110.0, 110.0, 121.0])
+    assert temp_df["symbol"].tolist() == ["rb2505", "rb2510", "rb2510", "rb2510"]
+    temp_df = futures_roll_yield_term_structure(_fake_panel())
+    term_df = temp_df[temp_df["date"] == "20250107"]
+    assert term_df["months"].tolist() == [-5, 0, 3, 0, 4]
+    assert term_df["roll_yield"].iloc[2] == pytest.approx(-0.2870, abs=1e-4)
+
+
+def test_get_roll_yield_bar_date(monkeypatch):
+    """
+    展期收益率时间序列只获取一次日线行情
+    :return: assert result
+    :rtype: assert
+    """
+    call_list = []
+
+    def _fake_daily(start_date, end_date, market):
+        call_list.append(market)
+        return _fake_panel()
+
+    monkeypatch.setattr(futures_roll_yield, "get_futures_daily", _fake_daily)
+    temp_df = futures_roll_yield.get_roll_yield_bar(
+        type_method="date", var="RB", start_day="20250102", end_day="20250107"
+    )
+    assert len(call_list) == 1
+    assert temp_df["near_by"].tolist() == ["rb2505", "rb2505", "rb2505", "rb2505"]
+    assert temp_df["deferred"].tolist() == ["rb2510"] * 4
+    assert temp_df["roll_yield"].iloc[0] == pytest.approx(-0.2287, abs=1e-4)
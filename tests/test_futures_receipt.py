@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 23:00
+Desc: 注册仓单批量采集测试
+"""
+
+import pandas as pd
+
+from akshare.futures import receipt
+
+
+class _FakeResponse:
+    def __init__(self, data_json: dict):
+        self._data_json = data_json
+
+    def json(self) -> dict:
+        return self._data_json
+
+
+def test_get_shfe_receipt_2(monkeypatch):
+    """
+    每个品种取最后一行, 同一品种的不同名称合并
+    :return: assert result
+    :rtype: assert
+    """
+    row_list = [
+        {"VARNAME": "铜$$COPPER", "WRTWGHTS": "10", "WRTCHANGE": "1"},
+        {"VARNAME": "铜$$COPPER", "WRTWGHTS": "30", "WRTCHANGE": "3"},
+        {"VARNAME": "国际铜$$BC", "WRTWGHTS": "5", "WRTCHANGE": "0"},
+        {"VARNAME": "铝$$ALUMINIUM", "WRTWGHTS": "7", "WRTCHANGE": "-2"},
+    ]
+    monkeypatch.setattr(
+        receipt,
+        "requests_link",
+        lambda url, encoding, headers: _FakeResponse({"o_cursor": row_list}),
+    )
+    temp_df = receipt.get_shfe_receipt_2(date="20250102", vars_list=["CU", "AL", "BC"])
+    assert temp_df.values.tolist() == [
+        ["CU", 30, 3, "20250102"],
+        ["AL", 7, -2, "20250102"],
+        ["BC", 5, 0, "20250102"],
+    ]
+
+
+def test_futures_receipt_collect(tmp_path, monkeypatch):
+    """
+    按 (交易所, 交易日) 并发获取并保存到本地仓库, 再次运行时不重复获取
+    :return: assert result
+    :rtype: assert
+    """
+    call_list = []
+
+    def _fake_receipt(market: str):
+        def _func(date, vars_list):
+            call_list.append((market, date.strftime("%Y%m%d")))
+            if market == "gfex":
+                return pd.DataFrame()
+            return pd.DataFrame(
+                {
+                    "var": [vars_list[0]],
+                    "receipt": [len(call_list)],
+                    "receipt_chg": [0],
+                    "date": [date.strftime("%Y%m%d")],
+                }
+            )
+
+        return _func
+
+    monkeypatch.setattr(receipt, "get_dce_receipt", _fake_receipt("dce"))
+    monkeypatch.setattr(receipt, "get_shfe_receipt_2", _fake_receipt("shfe"))
+    monkeypatch.setattr(receipt, "get_czce_receipt_3", _fake_receipt("czce"))
+    monkeypatch.setattr(receipt, "get_gfex_receipt", _fake_receipt("gfex"))
+    monkeypatch.setattr(receipt._store, "root", str(tmp_path))
+    temp_df, error_df = receipt.futures_receipt_collect(
+        start_date="20250102", end_date="20250103"
+    )
+    assert len(call_list) == 8
+    assert error_df.empty
+    assert temp_df["date"].tolist() == ["20250102"] * 3 + ["20250103"] * 3
+    temp_df, _ = receipt.futures_receipt_collect(
+        start_date="20250102", end_date="20250106", vars_list=["C"]
+    )
+    assert len(call_list) == 12
+    assert temp_df["date"].tolist() == ["20250102", "20250103", "20250106"]
@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 23:00
+Desc: 分页 HTML 表格批量采集测试
+"""
+
+from io import StringIO
+
+import pandas as pd
+
+from akshare.utils.html_table import html_tables_to_df
+
+_HTML = """
+<table>
+<thead><tr><th>序号</th><th>股票代码</th><th>成交额</th><th>涨跌幅</th><th>名称</th></tr></thead>
+<tbody>
+<tr><td>1</td><td>000001</td><td>1,234</td><td>--</td><td>平安银行</td></tr>
+<tr><td>2</td><td>600000</td><td>12,345.5</td><td>1.5%</td><td>浦发银行</td></tr>
+</tbody>
+</table>
+"""
+
+
+def test_html_tables_to_df():
+    """
+    类型推断与逐页 pd.read_html 再合并的结果一致, 千分位逗号的数字转换为数值
+    :return: assert result
+    :rtype: assert
+    """
+    temp_df = html_tables_to_df([_HTML, _HTML])
+    expected_df = pd.concat([pd.read_html(StringIO(_HTML))[0]] * 2, ignore_index=True)
+    pd.testing.assert_frame_equal(temp_df, expected_df)
+    assert temp_df["成交额"].tolist() == [1234.0, 12345.5] * 2
+    assert temp_df["涨跌幅"].iloc[0] == "--"
+    temp_df = html_tables_to_df([_HTML], converters={"股票代码": str})
+    assert temp_df["股票代码"].tolist() == ["000001", "600000"]
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 23:00
+Desc: 条件请求缓存测试
+"""
+
+import json
+import pickle
+from collections import OrderedDict
+
+from akshare.utils import http_cache
+from akshare.utils.context import get_cache_dir, set_cache_dir
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, content: bytes = b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+def _parse(content: bytes) -> dict:
+    _parse.calls += 1
+    return json.loads(content)
+
+
+def test_fetch_parsed(tmp_path, monkeypatch):
+    """
+    304 时返回缓存的解析结果; 不支持条件请求时内容摘要未变则不再解析
+    :return: assert result
+    :rtype: assert
+    """
+    request_list = []
+    content = b'{"stockList": [1, 2]}'
+
+    def _fake_get(url, headers=None, **kwargs):
+        request_list.append(dict(headers))
+        if url.endswith("etag.json"):
+            if headers.get("If-None-Match") == '"v1"':
+                return _FakeResponse(304)
+            return _FakeResponse(200, content, {"ETag": '"v1"'})
+        return _FakeResponse(200, content)
+
+    monkeypatch.setattr(http_cache.requests, "get", _fake_get)
+    monkeypatch.setattr(http_cache, "_parsed_memo", OrderedDict())
+    old_cache_dir = get_cache_dir()
+    set_cache_dir(str(tmp_path))
+    try:
+        _parse.calls = 0
+        url = "http://www.cninfo.com.cn/new/data/etag.json"
+        value = http_cache.fetch_parsed(url, parser=_parse, namespace="test")
+        assert value == {"stockList": [1, 2]}
+        value["stockList"].append(3)
+        # 进程重启后从本地的解析结果恢复
+        monkeypatch.setattr(http_cache, "_parsed_memo", OrderedDict())
+        value = http_cache.fetch_parsed(url, parser=_parse, namespace="test")
+        assert request_list[-1] == {"If-None-Match": '"v1"'}
+        assert value == {"stockList": [1, 2]}
+        assert _parse.calls == 1
+        assert http_cache.fetch_with_validators(url, namespace="test") == content
+
+        url = "http://www.cninfo.com.cn/new/data/plain.json"
+        http_cache.fetch_parsed(url, parser=_parse, namespace="test")
+        value = http_cache.fetch_parsed(url, parser=_parse, namespace="test")
+        assert request_list[-1] == {}
+        assert value == {"stockList": [1, 2]}
+        assert _parse.calls == 2
+    finally:
+        set_cache_dir(old_cache_dir)
+
+
+class _StaleFrame:
+    def __reduce__(self):
+        # 模拟旧版本写入的解析结果, 反序列化时找不到对应的模块
+        return __import__, ("akshare_removed_module",)
+
+
+def test_fetch_parsed_invalidation(tmp_path, monkeypatch):
+    """
+    pandas 版本变化或者本地文件无法反序列化时重新解析并覆盖; 进程内缓存有数量上限
+    :return: assert result
+    :rtype: assert
+    """
+    content = b'{"stockList": [1, 2]}'
+    monkeypatch.setattr(
+        http_cache.requests,
+        "get",
+        lambda url, **kwargs: _FakeResponse(200, content, {"ETag": '"v1"'}),
+    )
+    monkeypatch.setattr(http_cache, "_parsed_memo", OrderedDict())
+    old_cache_dir = get_cache_dir()
+    set_cache_dir(str(tmp_path))
+    try:
+        _parse.calls = 0
+        url = "http://www.cninfo.com.cn/new/data/szse_stock.json"
+        http_cache.fetch_parsed(url, parser=_parse, namespace="test")
+        monkeypatch.setattr(http_cache, "_parsed_memo", OrderedDict())
+        monkeypatch.setattr(http_cache.pd, "__version__", "99.0.0")
+        http_cache.fetch_parsed(url, parser=_parse, namespace="test")
+        assert _parse.calls == 2
+
+        parsed_path = f"{http_cache._cache_path('test', url)}.pkl"
+        with open(parsed_path, "wb") as f:
+            pickle.dump(_StaleFrame(), f)
+        monkeypatch.setattr(http_cache, "_parsed_memo", OrderedDict())
+        value = http_cache.fetch_parsed(url, parser=_parse, namespace="test")
+        assert value == {"stockList": [1, 2]}
+        assert _parse.calls == 3
+        with open(parsed_path, "rb") as f:
+            assert pickle.load(f)[2] == value
+
+        monkeypatch.setattr(http_cache, "_PARSED_MEMO_SIZE", 2)
+        for i in range(3):
+            http_cache.fetch_parsed(f"{url}?v={i}", parser=_parse, namespace="test")
+        assert [key[1] for key in http_cache._parsed_memo] == [
+            f"{url}?v=1",
+            f"{url}?v=2",
+        ]
+    finally:
+        set_cache_dir(old_cache_dir)
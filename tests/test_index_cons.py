@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 23:00
+Desc: 中证指数成份股批量下载测试
+"""
+
+from io import BytesIO
+
+import pandas as pd
+import requests
+
+from akshare.index import index_cons
+
+
+def _excel_bytes(symbol: str, weight: bool = False) -> bytes:
+    row = ["20261019", symbol, "指数", "Index", "000001", "平安银行", "PAB"]
+    row += ["深圳证券交易所", "SZSE"] + (["1.5"] if weight else [])
+    buffer = BytesIO()
+    pd.DataFrame([row]).to_excel(buffer, index=False)
+    return buffer.getvalue()
+
+
+def _http_error(status_code: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(f"{status_code} Error", response=response)
+
+
+def _fake_fetch(url, namespace="default", session=None, **kwargs):
+    # 000001 没有文件, 000002 服务器错误
+    if "000001" in url:
+        raise _http_error(404)
+    if "000002" in url:
+        raise _http_error(502)
+    symbol = url.rsplit("/", 1)[1][:6]
+    return _excel_bytes(symbol, weight="closeweight" in url)
+
+
+def test_index_stock_cons_csindex_batch(monkeypatch):
+    """
+    404 的指数跳过, 其他下载错误记入错误表
+    :return: assert result
+    :rtype: assert
+    """
+    monkeypatch.setattr(index_cons, "fetch_with_validators", _fake_fetch)
+    monkeypatch.setattr("akshare.utils.batch.time.sleep", lambda seconds: None)
+    symbol_list = ["000300", "000001", "000002", "000905"]
+    temp_df, error_df = index_cons.index_stock_cons_csindex_batch(
+        symbol_list, processes=1
+    )
+    assert temp_df["指数代码"].tolist() == ["000300", "000905"]
+    assert temp_df["成分券代码"].tolist() == ["000001", "000001"]
+    assert error_df["symbol"].tolist() == ["000002"]
+    assert error_df["error_type"].tolist() == ["HTTPError"]
+    temp_df, error_df = index_cons.index_stock_cons_weight_csindex_batch(
+        symbol_list, processes=1
+    )
+    assert temp_df["权重"].tolist() == [1.5, 1.5]
+    assert error_df["symbol"].tolist() == ["000002"]
+    temp_df, error_df = index_cons.index_stock_cons_csindex_batch(
+        ["000001"], processes=1
+    )
+    assert temp_df.empty
+    assert error_df.empty
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 22:00
+Desc: 性能统计测试
+"""
+
+import json
+import time
+
+from akshare.utils import func
+from akshare.utils.batch import run_batch
+from akshare.utils.instrument import (
+    PrometheusCounters,
+    add_hook,
+    incr,
+    instrument,
+    phase,
+    remove_hook,
+)
+
+
+class _FakeResponse:
+    def __init__(self, data_json: dict):
+        self.content = json.dumps(data_json).encode("utf-8")
+
+    def json(self) -> dict:
+        return json.loads(self.content)
+
+
+def _fake_get(url, params, timeout):
+    row_list = [{"f3": int(params["pn"]) * 10 + i, "f12": "0"} for i in range(2)]
+    return _FakeResponse({"data": {"total": 6, "diff": row_list}})
+
+
+def test_instrument_pagination(monkeypatch):
+    """
+    分页接口记录请求次数、字节数、分页数和各阶段耗时, 结束时调用回调
+    :return: assert result
+    :rtype: assert
+    """
+    monkeypatch.setattr(func.requests, "get", _fake_get)
+    counters = PrometheusCounters()
+    add_hook(counters)
+    try:
+        with instrument("stock_zh_a_spot_em") as record:
+            temp_df = func.fetch_paginated_data("http://example.com", {"pn": 1})
+    finally:
+        remove_hook(counters)
+    assert len(temp_df) == 6
+    assert record.counters["requests"] == 3
+    assert record.counters["pages"] == 3
+    assert record.counters["bytes"] > 0
+    assert record.phases["transform"] > 0
+    assert record.wall_time >= sum(record.phases.values())
+    assert 'akshare_pages_total{name="stock_zh_a_spot_em"} 3' in counters.render()
+
+
+def test_instrument_nested_phase_and_threads():
+    """
+    嵌套阶段不重复计时; 线程池中的埋点计入调用方的统计; 没有统计时埋点不报错
+    :return: assert result
+    :rtype: assert
+    """
+    incr("pages")
+    with phase("network"):
+        pass
+
+    def _task(i: int) -> int:
+        incr("pages")
+        return i
+
+    with instrument() as record:
+        with phase("network"):
+            with phase("parse"):
+                time.sleep(0.05)
+        run_batch(_task, [{"i": i} for i in range(5)], max_workers=3)
+    assert record.phases["parse"] >= 0.05
+    assert record.phases["network"] < 0.05
+    assert record.counters["pages"] == 5
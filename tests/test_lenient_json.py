@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 10:00
+Desc: 宽松 JSON 解析测试
+"""
+
+from akshare.utils import demjson, lenient_json
+
+
+def test_lenient_json_decode():
+    """
+    宽松 JSON 解析结果需要与 demjson 保持一致
+    :return: assert result
+    :rtype: assert
+    """
+    text_list = [
+        '{"symbol": "sh600000", "trade": 8.57}',
+        "{symbol:'sh600000',name:'浦发\\'银行',trade:\"8.570\",}",
+        "[{a:1,b:[1,2,],c:'x\"y'},]",
+        "{'k': 'a:b, ]'}",
+        "{a:undefined}",
+    ]
+    for text in text_list:
+        assert lenient_json.decode(text) == demjson.decode(text)
+
+
+if __name__ == "__main__":
+    test_lenient_json_decode()
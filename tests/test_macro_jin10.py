@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 23:00
+Desc: 金十数据中心-经济指标-公共翻页和本地仓库测试
+"""
+
+import datetime
+
+from akshare.economic import macro_bank, macro_constitute, macro_euro, macro_jin10
+
+_PAGE_SIZE = 10
+
+
+class _FakePager:
+    """
+    模拟 list_v2 接口: 按 max_date 从新到旧返回, 每页 _PAGE_SIZE 条
+    """
+
+    def __init__(self, count: int = 25):
+        start = datetime.date(2024, 1, 1)
+        self.value_list = [
+            [(start + datetime.timedelta(days=30 * i)).isoformat(), i, i, i - 1]
+            for i in range(count)
+        ][::-1]
+        self.max_date_list = []
+
+    def page(self, params):
+        max_date = params.get("max_date", "")
+        self.max_date_list.append(max_date)
+        value_list = [
+            item for item in self.value_list if max_date == "" or item[0] <= max_date
+        ]
+        return [list(item) for item in value_list[:_PAGE_SIZE]]
+
+
+def test_macro_jin10_values(monkeypatch):
+    """
+    按 max_date 向前翻页直到返回空页, 指定 min_date 时翻到该日期为止
+    :return: assert result
+    :rtype: assert
+    """
+    pager = _FakePager()
+    monkeypatch.setattr(macro_jin10, "_macro_jin10_page", pager.page)
+    params = {"category": "ec", "attr_id": "1"}
+    temp_df = macro_jin10.macro_jin10_values(params)
+    assert temp_df[0].tolist() == [item[0] for item in pager.value_list]
+    # 每页最后一条的前一天作为下一页的 max_date
+    assert pager.max_date_list == [""] + [
+        (
+            datetime.date.fromisoformat(pager.value_list[i][0])
+            - datetime.timedelta(days=1)
+        ).isoformat()
+        for i in (9, 19, 24)
+    ]
+    assert params == {"category": "ec", "attr_id": "1"}
+
+    pager.max_date_list = []
+    min_date = pager.value_list[5][0]
+    temp_df = macro_jin10.macro_jin10_values(params, min_date=min_date)
+    assert len(temp_df) == _PAGE_SIZE
+    assert pager.max_date_list == [""]
+
+
+def test_macro_jin10_base_values_store(tmp_path, monkeypatch):
+    """
+    启用本地仓库时只翻页到本地最新日期, 最新日期的修订值替换本地数据
+    :return: assert result
+    :rtype: assert
+    """
+    pager = _FakePager()
+    monkeypatch.setattr(macro_jin10, "_macro_jin10_page", pager.page)
+    monkeypatch.setattr(macro_jin10._store, "root", str(tmp_path))
+    monkeypatch.setattr(macro_jin10, "_use_store_default", True)
+    params = {"category": "ec", "attr_id": "1"}
+    macro_jin10.macro_jin10_base_values(params)
+
+    pager.max_date_list = []
+    pager.value_list[0][1] = 100
+    pager.value_list.insert(0, ["2026-01-01", 25, 25, 24])
+    temp_df = macro_jin10.macro_jin10_base_values(params)
+    assert pager.max_date_list == [""]
+    assert len(temp_df) == 26
+    assert temp_df.iloc[:2, :2].values.tolist() == [
+        ["2026-01-01", 25],
+        ["2025-12-21", 100],
+    ]
+    assert macro_jin10._store.read("ec_1").equals(temp_df)
+
+
+def test_macro_jin10_callers(monkeypatch):
+    """
+    欧元区、央行利率和 ETF 持仓报告都通过公共翻页获取完整历史
+    :return: assert result
+    :rtype: assert
+    """
+    pager = _FakePager()
+    monkeypatch.setattr(macro_jin10, "_macro_jin10_page", pager.page)
+    for func in [
+        macro_euro.macro_euro_cpi_yoy,
+        macro_bank.macro_bank_usa_interest_rate,
+        macro_constitute.macro_cons_gold,
+    ]:
+        pager.max_date_list = []
+        temp_df = func()
+        assert len(temp_df) == 25
+        assert temp_df["日期"].is_monotonic_increasing
+        assert len(pager.max_date_list) == 4
+    assert temp_df.columns.tolist() == ["商品", "日期", "总库存", "增持/减持", "总价值"]
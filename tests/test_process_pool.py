@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 23:00
+Desc: 解析进程池测试
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from akshare.utils import process_pool
+from akshare.utils.html_table import html_tables_to_df
+
+
+def test_process_pool():
+    """
+    未启用时在当前进程中执行; 启用后在常驻子进程中执行, 结果与当前进程解析一致
+    :return: assert result
+    :rtype: assert
+    """
+    html_list = [
+        f"<table><tr><th>代码</th><th>价格</th></tr><tr><td>00000{i}</td>"
+        f"<td>{i}.5</td></tr></table>"
+        for i in range(4)
+    ]
+    assert process_pool.get_process_pool() is None
+    assert process_pool.run_in_process_pool(os.getpid) == os.getpid()
+    expected_df = html_tables_to_df(html_list, converters={"代码": str})
+    process_pool.enable_process_pool(max_workers=2)
+    try:
+        executor = process_pool.get_process_pool()
+        result_list = process_pool.map_in_process_pool(abs, [-1, -2])
+        assert result_list == [1, 2]
+        assert process_pool.run_in_process_pool(os.getpid) != os.getpid()
+        temp_df = html_tables_to_df(html_list, converters={"代码": str})
+        assert process_pool.get_process_pool() is executor
+    finally:
+        process_pool.disable_process_pool()
+    pd.testing.assert_frame_equal(temp_df, expected_df)
+    assert temp_df["价格"].tolist() == [0.5, 1.5, 2.5, 3.5]
+
+
+def test_process_pool_fallback(monkeypatch):
+    """
+    进程池已被其他线程关闭时在当前线程中执行; 环境变量无效时忽略
+    :return: assert result
+    :rtype: assert
+    """
+    process_pool.enable_process_pool(max_workers=1)
+    executor = process_pool.get_process_pool()
+    executor.shutdown(wait=True)
+    try:
+        assert process_pool.run_in_process_pool(os.getpid) == os.getpid()
+        assert process_pool.map_in_process_pool(abs, [-1, -2]) == [1, 2]
+    finally:
+        process_pool.disable_process_pool()
+    monkeypatch.setattr(process_pool, "_env_checked", False)
+    monkeypatch.setenv("AKSHARE_PROCESS_POOL", "four")
+    with pytest.warns(RuntimeWarning):
+        assert process_pool.get_process_pool() is None
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 18:00
+Desc: 证券主数据测试
+"""
+
+import pandas as pd
+
+from akshare.utils import security_master as sm
+
+
+def _fake_security_list(url: str, params: dict) -> pd.DataFrame:
+    symbol_type = {value: key for key, value in sm._SYMBOL_TYPE_FS.items()}[
+        params["fs"]
+    ]
+    row_list = {
+        "stock": [("600000", "浦发银行", 1), ("000001", "平安银行", 0)],
+        "index": [("000001", "上证指数", 1), ("H30533", "中国互联网50", 2)],
+    }.get(symbol_type, [])
+    temp_df = pd.DataFrame(row_list, columns=["f12", "f14", "f13"])
+    temp_df["f3"] = 0.0
+    return temp_df
+
+
+def test_security_resolve(tmp_path, monkeypatch):
+    """
+    代码、带市场信息的代码和名称都能解析; 同一天只下载一次
+    :return: assert result
+    :rtype: assert
+    """
+    call_list = []
+
+    def _fetch(url: str, params: dict) -> pd.DataFrame:
+        call_list.append(params["fs"])
+        return _fake_security_list(url, params)
+
+    monkeypatch.setattr(sm, "fetch_paginated_data", _fetch)
+    monkeypatch.setattr(
+        sm,
+        "_fetch_cninfo_org_id",
+        lambda: pd.DataFrame({"code": ["600000"], "orgId": ["gssh0600000"]}),
+    )
+    monkeypatch.setattr(sm._store, "root", str(tmp_path))
+    monkeypatch.setattr(sm, "_cache", {})
+    assert sm.security_resolve("600000")["orgId"] == "gssh0600000"
+    assert sm.security_resolve("sh000001")["名称"] == "上证指数"
+    assert sm.security_resolve("000001.SZ")["名称"] == "平安银行"
+    assert sm.security_resolve("1.000001")["类型"] == "index"
+    assert sm.security_resolve("浦发银行")["新浪代码"] == "sh600000"
+    assert sm.security_resolve("H30533")["secid"] == "2.H30533"
+    sm._cache.clear()
+    assert sm.get_secid_em("600000") == "1.600000"
+    assert len(call_list) == len(sm._RESOLVE_ORDER)
+    code_id_dict = sm.get_code_id_dict_em("index")
+    assert code_id_dict == {"000001": 1, "H30533": 2}
+    assert sm.get_code_id_dict_em("index") is code_id_dict
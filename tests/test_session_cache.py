@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 16:00
+Desc: 站点凭证缓存测试
+"""
+
+from akshare.utils.session_cache import SessionCredentialCache
+
+
+def test_session_cache():
+    """
+    凭证在有效期内复用, 调用失败时重新生成并重试一次
+    :return: assert result
+    :rtype: assert
+    """
+    counter = {"count": 0}
+
+    def _factory() -> int:
+        counter["count"] += 1
+        return counter["count"]
+
+    def _func(value: int) -> int:
+        if value == 1:
+            raise PermissionError("expired")
+        return value
+
+    cache = SessionCredentialCache()
+    cache.register(site="example", factory=_factory, ttl=3600)
+    assert cache.get("example") == 1
+    assert cache.get("example") == 1
+    assert cache.call(site="example", func=_func) == 2
+    assert cache.get("example") == 2
+    assert counter["count"] == 2
+
+
+if __name__ == "__main__":
+    test_session_cache()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 19:00
+Desc: 请求合并测试
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from akshare.utils.single_flight import single_flight
+
+
+def test_single_flight_thread():
+    """
+    多个线程同时以相同参数调用时只执行一次, 不同参数分别执行
+    :return: assert result
+    :rtype: assert
+    """
+    call_list = []
+    lock = threading.Lock()
+
+    @single_flight
+    def _fetch(symbol: str = "a") -> pd.DataFrame:
+        with lock:
+            call_list.append(symbol)
+        time.sleep(0.2)
+        return pd.DataFrame({"symbol": [symbol]})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        future_list = [executor.submit(_fetch) for _ in range(4)]
+        future_list += [executor.submit(_fetch, symbol="a") for _ in range(2)]
+        future_list += [executor.submit(_fetch, "b")]
+        result_list = [future.result() for future in future_list]
+    assert sorted(call_list) == ["a", "b"]
+    assert [temp_df["symbol"].iat[0] for temp_df in result_list] == ["a"] * 6 + ["b"]
+    assert len({id(temp_df) for temp_df in result_list}) == 7
+
+
+def test_single_flight_async():
+    """
+    同一事件循环中的协程同时调用时只执行一次
+    :return: assert result
+    :rtype: assert
+    """
+    call_list = []
+
+    @single_flight
+    async def _fetch(symbol: str = "a") -> str:
+        call_list.append(symbol)
+        await asyncio.sleep(0.1)
+        return symbol
+
+    async def _main():
+        return await asyncio.gather(*[_fetch() for _ in range(5)])
+
+    assert asyncio.run(_main()) == ["a"] * 5
+    assert call_list == ["a"]
+
+
+if __name__ == "__main__":
+    test_single_flight_thread()
+    test_single_flight_async()
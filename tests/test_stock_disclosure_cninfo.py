@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 23:00
+Desc: 巨潮资讯-信息披露公告流式返回测试
+"""
+
+import time
+
+import pandas as pd
+
+from akshare.stock_feature import stock_disclosure_cninfo
+
+# 请求第 2 页和第 3 页之前各有一条新公告, 分页依次后移, 公告 61 和 32 在相邻两页各出现一次
+_PAGE_DICT = {
+    1: range(90, 60, -1),
+    2: range(61, 31, -1),
+    3: range(32, 2, -1),
+}
+
+
+class _FakeResponse:
+    def __init__(self, data_json: dict):
+        self.data_json = data_json
+
+    def json(self) -> dict:
+        return self.data_json
+
+
+def _fake_post(url, data=None, **kwargs):
+    page = int(data["pageNum"])
+    _fake_post.page_list.append(page)
+    if page == 2:
+        # 第 2 页比第 3 页晚返回, 输出仍然按页码顺序
+        time.sleep(0.05)
+    announcement_list = [
+        {
+            "secCode": "000001",
+            "secName": "平安银行",
+            "announcementTitle": f"公告{item}",
+            "announcementTime": 1760832000000 + item * 1000,
+            "announcementId": str(item),
+            "orgId": "gssz0000001",
+        }
+        for item in _PAGE_DICT[page]
+    ]
+    return _FakeResponse({"totalAnnouncement": 90, "announcements": announcement_list})
+
+
+def test_stock_zh_a_disclosure_report_cninfo_stream(monkeypatch):
+    """
+    按页码顺序逐页返回, 分页后移导致的重复公告只返回一次, 遇到 since_id 后不再请求后面的页
+    :return: assert result
+    :rtype: assert
+    """
+    monkeypatch.setattr(stock_disclosure_cninfo.requests, "post", _fake_post)
+    _fake_post.page_list = []
+    df_list = list(
+        stock_disclosure_cninfo.stock_zh_a_disclosure_report_cninfo_stream(
+            start_date="20261019", end_date="20261019"
+        )
+    )
+    assert len(df_list) == 3
+    assert [temp_df["公告ID"].iloc[0] for temp_df in df_list] == ["90", "60", "31"]
+    big_df = pd.concat(df_list, ignore_index=True)
+    assert big_df["公告ID"].tolist() == [str(item) for item in range(90, 2, -1)]
+    assert big_df["公告时间"].is_monotonic_decreasing
+
+    _fake_post.page_list = []
+    df_list = list(
+        stock_disclosure_cninfo.stock_zh_a_disclosure_report_cninfo_stream(
+            start_date="20261019", end_date="20261019", since_id="50", max_workers=1
+        )
+    )
+    big_df = pd.concat(df_list, ignore_index=True)
+    assert big_df["公告ID"].tolist() == [str(item) for item in range(90, 50, -1)]
+    assert _fake_post.page_list == [1, 2]
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 23:00
+Desc: 历史行情增量更新测试
+"""
+
+import datetime
+
+import pandas as pd
+
+from akshare.stock_feature import stock_hist_incremental_em
+
+_DATE_LIST = [datetime.date(2026, 10, day) for day in (12, 13, 14, 15, 16, 19, 20)]
+
+
+class _FakeServer:
+    """
+    模拟前复权行情, 除权后之前所有 K 线的价格都会变化
+    """
+
+    def __init__(self):
+        self.days = 5
+        self.factor = 1.0
+        self.call_list = []
+
+    def stock_zh_a_hist(self, symbol, period, start_date, end_date, adjust, timeout):
+        self.call_list.append(start_date)
+        date_list = _DATE_LIST[: self.days]
+        temp_df = pd.DataFrame({"日期": date_list, "股票代码": symbol})
+        close_list = [10.0 + i for i in range(len(date_list))]
+        for item in ["开盘", "收盘", "最高", "最低"]:
+            temp_df[item] = [price * self.factor for price in close_list]
+        temp_df["成交量"] = 100
+        temp_df["成交额"] = 1000.0
+        start = datetime.datetime.strptime(start_date, "%Y%m%d").date()
+        return temp_df[temp_df["日期"] >= start].reset_index(drop=True)
+
+
+def test_stock_zh_a_hist_incremental(tmp_path, monkeypatch):
+    """
+    只下载边界之后的数据; 边界 K 线被修订(除权后前复权价格变化)时重新下载完整历史并替换本地数据
+    :return: assert result
+    :rtype: assert
+    """
+    server = _FakeServer()
+    monkeypatch.setattr(
+        stock_hist_incremental_em, "stock_zh_a_hist", server.stock_zh_a_hist
+    )
+    monkeypatch.setattr(stock_hist_incremental_em._store, "root", str(tmp_path))
+    kwargs = {"symbol": "000001", "adjust": "qfq"}
+    temp_df = stock_hist_incremental_em.stock_zh_a_hist_incremental(**kwargs)
+    assert len(temp_df) == 5
+    assert server.call_list == ["19700101"]
+
+    server.days = 6
+    temp_df = stock_hist_incremental_em.stock_zh_a_hist_incremental(**kwargs)
+    assert server.call_list[1:] == ["20261015"]
+    assert temp_df["收盘"].tolist() == [10.0, 11.0, 12.0, 13.0, 14.0, 15.0]
+
+    # 除权: 之前所有 K 线按新的复权因子调整
+    server.days = 7
+    server.factor = 0.9
+    temp_df = stock_hist_incremental_em.stock_zh_a_hist_incremental(**kwargs)
+    assert server.call_list[2:] == ["20261016", "19700101"]
+    expected_df = server.stock_zh_a_hist("000001", "daily", "19700101", "", "qfq", None)
+    pd.testing.assert_frame_equal(temp_df, expected_df)
+    pd.testing.assert_frame_equal(
+        stock_hist_incremental_em._store.read("000001_daily_qfq"), expected_df
+    )
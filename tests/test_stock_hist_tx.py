@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 23:00
+Desc: 腾讯证券历史数据测试
+"""
+
+import datetime
+import json
+
+from akshare.index import index_stock_zh
+from akshare.stock_feature import stock_hist_tx
+from akshare.utils import security_master as sm
+
+
+class _FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+        self.content = text.encode("utf-8")
+
+
+def _fake_get(url, params=None, **kwargs):
+    symbol, _, start, end, _, adjust = params["param"].split(",")
+    row_list = [
+        [f"{year}-{month}-15", "1", "2", "3", "0.5", "100"]
+        for year in range(int(start[:4]), int(end[:4]) + 1)
+        for month in ("03", "09")
+    ]
+    data_json = {"data": {symbol: {f"{adjust}day": row_list}}}
+    return _FakeResponse(f"{params['_var']}={json.dumps(data_json)}")
+
+
+def test_stock_zh_a_hist_tx(tmp_path, monkeypatch):
+    """
+    按年度并发获取, 去掉相邻年度的重复数据并截取日期区间; 开始日期只下载一次
+    :return: assert result
+    :rtype: assert
+    """
+    call_list = []
+
+    def _start_year(symbol: str) -> str:
+        call_list.append(symbol)
+        return "2018-06-01"
+
+    monkeypatch.setattr(stock_hist_tx.requests, "get", _fake_get)
+    monkeypatch.setattr(index_stock_zh, "get_tx_start_year", _start_year)
+    monkeypatch.setattr(sm._store, "root", str(tmp_path))
+    monkeypatch.setattr(sm, "_start_date_tx", None)
+    temp_df = stock_hist_tx.stock_zh_a_hist_tx(
+        symbol="sz000001", start_date="20000101", end_date="20210601", adjust="qfq"
+    )
+    assert temp_df["date"].tolist() == [
+        datetime.date(2018, 9, 15),
+        datetime.date(2019, 3, 15),
+        datetime.date(2019, 9, 15),
+        datetime.date(2020, 3, 15),
+        datetime.date(2020, 9, 15),
+        datetime.date(2021, 3, 15),
+    ]
+    assert temp_df["close"].tolist() == [2.0] * 6
+    monkeypatch.setattr(sm, "_start_date_tx", None)
+    stock_hist_tx.stock_zh_a_hist_tx(symbol="sz000001", start_date="2020-01-01")
+    assert call_list == ["sz000001"]
+
+
+def test_stock_zh_a_hist_tx_start_date_format(tmp_path, monkeypatch):
+    """
+    开始日期按日期比较, 与本地保存的开始日期的格式无关
+    :return: assert result
+    :rtype: assert
+    """
+    monkeypatch.setattr(stock_hist_tx.requests, "get", _fake_get)
+    monkeypatch.setattr(index_stock_zh, "get_tx_start_year", lambda symbol: "20190601")
+    monkeypatch.setattr(sm._store, "root", str(tmp_path))
+    monkeypatch.setattr(sm, "_start_date_tx", None)
+    temp_df = stock_hist_tx.stock_zh_a_hist_tx(
+        symbol="sz000001", start_date="19000101", end_date="20200601"
+    )
+    assert temp_df["date"].tolist() == [
+        datetime.date(2019, 9, 15),
+        datetime.date(2020, 3, 15),
+    ]
+    temp_df = stock_hist_tx.stock_zh_a_hist_tx(
+        symbol="sz000001", start_date="2020-01-01", end_date="20200601"
+    )
+    assert temp_df["date"].tolist() == [datetime.date(2020, 3, 15)]
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 23:00
+Desc: 多标的历史行情批量下载测试
+"""
+
+import pandas as pd
+
+from akshare.stock_feature import stock_hist_universe_em
+
+
+def _fake_hist(symbol, period, start_date, end_date, adjust):
+    if symbol == "000002":
+        raise KeyError("klines")
+    return pd.DataFrame({"日期": ["2026-10-16", "2026-10-19"], "收盘": [10.0, 10.5]})
+
+
+def _fake_industry_cons(symbol):
+    raise KeyError("diff")
+
+
+def test_stock_hist_universe_em(monkeypatch):
+    """
+    指数代码和板块名称展开为成份股; long 和 dict 两种输出; 失败的代码进入错误表
+    :return: assert result
+    :rtype: assert
+    """
+    monkeypatch.setitem(
+        stock_hist_universe_em._MARKET_MAP,
+        "a",
+        (_fake_hist, True, "push2his.eastmoney.com"),
+    )
+    monkeypatch.setattr(
+        stock_hist_universe_em,
+        "index_stock_cons_csindex",
+        lambda symbol: pd.DataFrame({"成分券代码": ["000001", "000002", "600000"]}),
+    )
+    monkeypatch.setattr(
+        stock_hist_universe_em, "stock_board_industry_cons_em", _fake_industry_cons
+    )
+    monkeypatch.setattr(
+        stock_hist_universe_em,
+        "stock_board_concept_cons_em",
+        lambda symbol: pd.DataFrame({"代码": ["300750", "000001"]}),
+    )
+    temp_df, error_df = stock_hist_universe_em.stock_hist_universe_em(
+        symbol_list="000300", max_workers=2
+    )
+    assert temp_df.columns.tolist() == ["代码", "日期", "收盘"]
+    assert temp_df["代码"].tolist() == ["000001", "000001", "600000", "600000"]
+    assert error_df["symbol"].tolist() == ["000002"]
+    assert error_df["error_type"].tolist() == ["KeyError"]
+
+    data_dict, error_df = stock_hist_universe_em.stock_hist_universe_em(
+        symbol_list="固态电池", output="dict"
+    )
+    assert list(data_dict) == ["300750", "000001"]
+    assert data_dict["300750"]["收盘"].tolist() == [10.0, 10.5]
+    assert error_df.empty
+
+    data_dict, error_df = stock_hist_universe_em.stock_hist_universe_em(
+        symbol_list=["000002", "000001", "000002"], output="dict"
+    )
+    assert list(data_dict) == ["000001"]
+    assert error_df["symbol"].tolist() == ["000002"]
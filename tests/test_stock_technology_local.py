@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 23:00
+Desc: 技术选股-本地计算测试
+"""
+
+import pandas as pd
+import pytest
+
+from akshare.stock_feature.stock_technology_local import (
+    stock_rank_all_local,
+    stock_rank_local,
+)
+
+_DATE_LIST = pd.bdate_range("2025-01-01", periods=25)
+
+
+def _fake_daily() -> pd.DataFrame:
+    # 000001 每天上涨且放量; 000002 横盘后下跌一天, 最后一天放量突破
+    close_list = [10.0 + i for i in range(25)] + [10.0] * 23 + [9.0, 12.0]
+    temp_df = pd.DataFrame(
+        {
+            "日期": list(_DATE_LIST.date) * 2,
+            "股票代码": ["000001"] * 25 + ["000002"] * 25,
+            "收盘": close_list,
+            "成交量": [100 + i for i in range(25)] + [100] * 24 + [300],
+            "换手率": 1.0,
+        }
+    )
+    temp_df["最高"] = temp_df["收盘"] + 0.5
+    temp_df["最低"] = temp_df["收盘"] - 0.5
+    # 乱序输入
+    return temp_df.sample(frac=1, random_state=0)
+
+
+def test_stock_rank_local():
+    """
+    创新高、连续上涨和均线突破的输出字段与同花顺接口一致
+    :return: assert result
+    :rtype: assert
+    """
+    info_df = pd.DataFrame({"股票代码": ["000001", "000002"], "股票简称": ["甲", "乙"]})
+    temp_df = stock_rank_local(
+        _fake_daily(), indicator="cxg", symbol="创月新高", info_df=info_df
+    )
+    assert temp_df.columns.tolist() == [
+        "序号",
+        "股票代码",
+        "股票简称",
+        "涨跌幅",
+        "换手率",
+        "最新价",
+        "前期高点",
+        "前期高点日期",
+    ]
+    assert temp_df["股票简称"].tolist() == ["甲", "乙"]
+    assert temp_df["前期高点"].tolist() == [33.5, 10.5]
+    assert temp_df["前期高点日期"].tolist() == [
+        _DATE_LIST[23].date(),
+        _DATE_LIST[22].date(),
+    ]
+    temp_df = stock_rank_local(_fake_daily(), indicator="lxsz")
+    assert temp_df["股票代码"].tolist() == ["000001"]
+    row = temp_df.iloc[0]
+    assert (row["连涨天数"], row["最高价"], row["最低价"]) == (24, 34.5, 10.5)
+    assert row["连续涨跌幅"] == pytest.approx(240.0)
+    assert row["累计换手率"] == pytest.approx(24.0)
+    temp_df = stock_rank_local(_fake_daily(), indicator="xstp", symbol="5日均线")
+    assert temp_df["股票代码"].tolist() == ["000002"]
+    assert temp_df["涨跌幅"].iloc[0] == pytest.approx(100 / 3)
+    temp_df = stock_rank_local(
+        _fake_daily(), indicator="lxsz", date=_DATE_LIST[10].strftime("%Y%m%d")
+    )
+    assert temp_df["连涨天数"].tolist() == [10]
+
+
+def test_stock_rank_all_local():
+    """
+    日线行情只整理一次, 计算所有排行
+    :return: assert result
+    :rtype: assert
+    """
+    rank_dict = stock_rank_all_local(_fake_daily())
+    assert len(rank_dict) == 30
+    assert rank_dict["ljqs"]["量价齐升天数"].tolist() == [24]
+    assert rank_dict["cxfl"]["基准日成交量"].tolist() == [100]
+    assert rank_dict["lxxd"].empty
+    assert rank_dict["xxtp_5日均线"].empty
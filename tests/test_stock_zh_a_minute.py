@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 23:00
+Desc: 分钟数据复权测试
+"""
+
+import json
+
+import pytest
+
+from akshare.stock import stock_zh_a_sina
+
+
+class _FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+        self.content = text.encode("utf-8")
+
+    def raise_for_status(self):
+        pass
+
+
+_MINUTE_LIST = [
+    {"day": "2026-10-15 15:00:00", "open": "9.0", "high": "11.0", "low": "9.0",
+     "close": "10.0", "volume": "100"},
+    {"day": "2026-10-16 09:31:00", "open": "10.0", "high": "10.0", "low": "10.0",
+     "close": "10.0", "volume": "200"},
+    {"day": "2026-10-16 15:00:00", "open": "10.0", "high": "12.0", "low": "10.0",
+     "close": "12.0", "volume": "300"},
+]  # fmt: skip
+
+
+@pytest.fixture
+def request_list(monkeypatch):
+    stock_zh_a_sina._stock_zh_a_fq_factor_daily.cache_clear()
+    url_list = []
+
+    def _fake_get(url, params=None, **kwargs):
+        url_list.append(url)
+        if "getKLineData" in url:
+            return _FakeResponse(f"=({json.dumps(_MINUTE_LIST)});")
+        return _FakeResponse(
+            'var sh600000qfq={total:2,data:[{d:"2026-10-16",f:"2"},'
+            '{d:"1900-01-01",f:"4"}]}\n/* comment */'
+        )
+
+    monkeypatch.setattr(stock_zh_a_sina.requests, "get", _fake_get)
+    yield url_list
+    stock_zh_a_sina._stock_zh_a_fq_factor_daily.cache_clear()
+
+
+def test_stock_zh_a_minute_adjust(request_list):
+    """
+    按日期对齐复权因子, 复权因子每天只下载一次
+    :return: assert result
+    :rtype: assert
+    """
+    temp_df = stock_zh_a_sina.stock_zh_a_minute(symbol="sh600000", adjust="qfq")
+    assert temp_df["close"].tolist() == [2.5, 5.0, 6.0]
+    assert temp_df["high"].tolist() == [2.75, 5.0, 6.0]
+    assert temp_df["volume"].tolist() == ["100", "200", "300"]
+    temp_df = stock_zh_a_sina.stock_zh_a_minute(symbol="sh600000", adjust="hfq")
+    assert temp_df["close"].tolist() == [40.0, 20.0, 24.0]
+    stock_zh_a_sina.stock_zh_a_minute(symbol="sh600000", period="5", adjust="qfq")
+    assert len(request_list) == 5
+
+
+def test_stock_zh_a_minute_adjust_error(request_list, monkeypatch):
+    """
+    下载复权因子时的网络错误直接抛出且不缓存; 没有复权因子时返回不复权的数据并缓存
+    :return: assert result
+    :rtype: assert
+    """
+    fake_get = stock_zh_a_sina.requests.get
+
+    def _timeout_get(url, params=None, **kwargs):
+        if "getKLineData" in url:
+            return fake_get(url, params=params, **kwargs)
+        request_list.append(url)
+        raise stock_zh_a_sina.requests.exceptions.Timeout("timeout")
+
+    monkeypatch.setattr(stock_zh_a_sina.requests, "get", _timeout_get)
+    with pytest.raises(stock_zh_a_sina.requests.exceptions.Timeout):
+        stock_zh_a_sina.stock_zh_a_minute(symbol="sh600000", adjust="qfq")
+    monkeypatch.setattr(stock_zh_a_sina.requests, "get", fake_get)
+    temp_df = stock_zh_a_sina.stock_zh_a_minute(symbol="sh600000", adjust="qfq")
+    assert temp_df["close"].tolist() == [2.5, 5.0, 6.0]
+
+    def _empty_get(url, params=None, **kwargs):
+        request_list.append(url)
+        if "getKLineData" in url:
+            return fake_get(url, params=params, **kwargs)
+        return _FakeResponse("var sh000001hfq={total:0,data:[]}\n")
+
+    monkeypatch.setattr(stock_zh_a_sina.requests, "get", _empty_get)
+    for _ in range(2):
+        temp_df = stock_zh_a_sina.stock_zh_a_minute(symbol="sh000001", adjust="hfq")
+        assert temp_df["close"].tolist() == ["10.0", "10.0", "12.0"]
+    assert sum("hfq" in url for url in request_list) == 1
+
+
+def test_stock_zh_a_daily_factor_order(request_list):
+    """
+    复权因子保持新浪返回的顺序(日期从新到旧), 分钟数据复权不改变缓存的复权因子
+    :return: assert result
+    :rtype: assert
+    """
+    temp_df = stock_zh_a_sina.stock_zh_a_daily(symbol="sh600000", adjust="qfq-factor")
+    assert temp_df["date"].dt.strftime("%Y-%m-%d").tolist() == [
+        "2026-10-16",
+        "1900-01-01",
+    ]
+    assert temp_df["qfq_factor"].tolist() == ["2", "4"]
+    stock_zh_a_sina.stock_zh_a_minute(symbol="sh600000", adjust="qfq")
+    factor_df = stock_zh_a_sina._stock_zh_a_fq_factor_daily(
+        "sh600000", "qfq", stock_zh_a_sina.date.today().isoformat()
+    )
+    assert factor_df["qfq_factor"].tolist() == ["2", "4"]
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 23:00
+Desc: 涨停板行情股票池历史数据测试
+"""
+
+import datetime
+
+from akshare.stock_feature import stock_ztb_em
+
+
+class _FakeResponse:
+    def __init__(self, data_json: dict):
+        self._data_json = data_json
+
+    def json(self) -> dict:
+        return self._data_json
+
+
+def test_stock_zt_pool_hist_em(tmp_path, monkeypatch):
+    """
+    按交易日历并发获取, 字段类型统一整理后按年份分区保存, 再次运行时不重复获取
+    :return: assert result
+    :rtype: assert
+    """
+    call_list = []
+
+    def _fake_get(url, params=None, **kwargs):
+        call_list.append(params["date"])
+        if params["date"] == "20250103":
+            return _FakeResponse({"data": None})
+        pool_list = [
+            {
+                "c": code,
+                "m": 0,
+                "n": "测试",
+                "p": 10500,
+                "zdp": "10.0",
+                "amount": 1e8,
+                "ltsz": 1e9,
+                "tshare": 2e9,
+                "hs": 5.5,
+                "lbc": 1,
+                "fbt": 93000,
+                "lbt": 93000,
+                "fund": 1e7,
+                "zbc": 0,
+                "hybk": "银行",
+                "zttj": {"days": 1, "ct": 1},
+            }
+            for code in ("000001", "600000")
+        ]
+        return _FakeResponse({"data": {"pool": pool_list}})
+
+    monkeypatch.setattr(stock_ztb_em.requests, "get", _fake_get)
+    monkeypatch.setattr(stock_ztb_em._store, "root", str(tmp_path))
+    pool_dict, error_df = stock_ztb_em.stock_zt_pool_hist_em(
+        start_date="20241231", end_date="20250106", pool_list=("zt",)
+    )
+    assert error_df.empty
+    assert sorted(call_list) == ["20241231", "20250102", "20250103", "20250106"]
+    assert sorted(stock_ztb_em._store.keys()) == ["fetched", "zt_2024", "zt_2025"]
+    temp_df = pool_dict["zt"]
+    assert temp_df["日期"].tolist() == [
+        datetime.date(2024, 12, 31),
+        datetime.date(2024, 12, 31),
+        datetime.date(2025, 1, 2),
+        datetime.date(2025, 1, 2),
+        datetime.date(2025, 1, 6),
+        datetime.date(2025, 1, 6),
+    ]
+    assert temp_df["序号"].tolist() == [1, 2] * 3
+    assert temp_df["最新价"].tolist() == [10.5] * 6
+    assert temp_df["首次封板时间"].iloc[0] == "093000"
+    assert temp_df["涨停统计"].iloc[0] == "1/1"
+    pool_dict, _ = stock_ztb_em.stock_zt_pool_hist_em(
+        start_date="20250102", end_date="20250107", pool_list=("zt",)
+    )
+    assert sorted(call_list)[4:] == ["20250107"]
+    assert len(pool_dict["zt"]) == 6
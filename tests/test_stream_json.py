@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/19 23:00
+Desc: 数据中心接口流式 JSON 解析测试
+"""
+
+import json
+
+import pytest
+import requests
+
+from akshare.stock_feature.stock_lhb_em import stock_lhb_detail_em
+from akshare.utils import func
+from akshare.utils.stream_json import decode_records
+
+
+def _page_bytes(page: int, pages: int = 2) -> bytes:
+    record_list = [
+        {"CODE": f"{page}0{i}", "NAME": "平安银行", "PRICE": 10.5 + i, "X": None}
+        for i in range(3)
+    ]
+    data_json = {
+        "version": "1",
+        "result": {"pages": pages, "data": record_list, "count": 3 * pages},
+        "success": True,
+    }
+    return json.dumps(data_json, ensure_ascii=False).encode("utf-8")
+
+
+class _FakeResponse:
+    def __init__(self, content: bytes, status_code: int = 200):
+        self._content = content
+        self.status_code = status_code
+        self.closed = False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error")
+
+    def iter_content(self, chunk_size: int = 1):
+        # 每 7 个字节一块, 记录和多字节字符都会被截断
+        for i in range(0, len(self._content), 7):
+            yield self._content[i : i + 7]
+
+    def close(self):
+        self.closed = True
+
+
+def test_decode_records():
+    """
+    分块截断的记录能正确解析, 只保留指定的字段
+    :return: assert result
+    :rtype: assert
+    """
+    content = _page_bytes(1)
+    columns, meta = decode_records(
+        _FakeResponse(content).iter_content(), fields=["NAME", "CODE"]
+    )
+    assert list(columns) == ["NAME", "CODE"]
+    assert columns["CODE"] == ["100", "101", "102"]
+    assert columns["NAME"] == ["平安银行"] * 3
+    assert meta == {"pages": 2, "count": 6}
+    columns, _ = decode_records(_FakeResponse(content).iter_content(), fields=[2])
+    assert columns == {"PRICE": [10.5, 11.5, 12.5]}
+    empty_content = b'{"version":null,"result":null,"success":false,"code":9201}'
+    assert decode_records([empty_content]) == ({}, {})
+    with pytest.raises(ValueError):
+        decode_records([content[:60]])
+    # 不是 JSON 的页面不能当作没有数据
+    with pytest.raises(ValueError, match="result.data not found"):
+        decode_records([b"<html>502 Bad Gateway</html>"], fields=["a"])
+
+
+def test_fetch_datacenter_data(monkeypatch):
+    """
+    第一页只请求一次, 全部页面解析完后一次性构建 DataFrame
+    :return: assert result
+    :rtype: assert
+    """
+    call_list = []
+
+    def _fake_get(url, params=None, **kwargs):
+        assert kwargs["stream"]
+        call_list.append(params["pageNumber"])
+        return _FakeResponse(_page_bytes(params["pageNumber"]))
+
+    monkeypatch.setattr(func.requests, "get", _fake_get)
+    temp_df = func.fetch_datacenter_data(
+        "https://datacenter-web.eastmoney.com/api/data/v1/get",
+        params={"pageNumber": "1"},
+        fields=["CODE", "PRICE", "X"],
+    )
+    assert call_list == [1, 2]
+    assert temp_df.columns.tolist() == ["CODE", "PRICE", "X"]
+    assert temp_df["CODE"].tolist() == ["100", "101", "102", "200", "201", "202"]
+    assert temp_df["PRICE"].dtype == "float64"
+
+
+@pytest.mark.parametrize(
+    "bad_page",
+    [
+        _FakeResponse(b"<html>502 Bad Gateway</html>", status_code=502),
+        _FakeResponse(b"<html>Service Unavailable</html>"),
+    ],
+    ids=["http_error", "not_json"],
+)
+def test_fetch_datacenter_data_bad_page(monkeypatch, bad_page):
+    """
+    中间某一页出错时抛出异常, 而不是返回不完整的数据
+    :return: assert result
+    :rtype: assert
+    """
+
+    def _fake_get(url, params=None, **kwargs):
+        if params["pageNumber"] == 2:
+            return bad_page
+        return _FakeResponse(_page_bytes(params["pageNumber"], pages=3))
+
+    monkeypatch.setattr(func.requests, "get", _fake_get)
+    with pytest.raises((requests.HTTPError, ValueError)):
+        func.fetch_datacenter_data(
+            "https://datacenter-web.eastmoney.com/api/data/v1/get",
+            params={"pageNumber": "1"},
+        )
+    assert bad_page.closed
+
+
+def test_fetch_datacenter_data_result_null(monkeypatch):
+    """
+    "result": null 表示没有数据, 返回空的 DataFrame
+    :return: assert result
+    :rtype: assert
+    """
+    content = (
+        '{"version":null,"result":null,"success":false,'
+        '"message":"返回数据为空","code":9201}'
+    ).encode("utf-8")
+    monkeypatch.setattr(
+        func.requests, "get", lambda url, **kwargs: _FakeResponse(content)
+    )
+    temp_df = func.fetch_datacenter_data(
+        "https://datacenter-web.eastmoney.com/api/data/v1/get",
+        params={"pageNumber": "1"},
+    )
+    assert temp_df.empty
+    assert stock_lhb_detail_em(start_date="20261017", end_date="20261018").empty